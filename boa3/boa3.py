@@ -1,3 +1,7 @@
+from typing import Callable, List, Optional, Union
+
+from boa3.internal.compiler.compilationcache import CompilationCache
+from boa3.internal.compiler.compilationwatcher import CompilationWatcher
 from boa3.internal.compiler.compiler import Compiler
 from boa3.internal.exception.InvalidPathException import InvalidPathException
 
@@ -13,7 +17,7 @@ class Boa3:
     @staticmethod
     def compile(path: str, root_folder: str = None, log_level: str = None,
                 env: str = None, fail_fast: bool = True,
-                optimize: bool = True) -> bytes:
+                optimize: bool = True, use_cache: bool = False) -> bytes:
         """
         Load a Python file to be compiled but don't write the result into a file
 
@@ -21,6 +25,7 @@ class Boa3:
         :param root_folder: the root path of the project
         :param env: specific environment id to compile
         :param fail_fast: if should stop compilation on first error found.
+        :param use_cache: if a cached result can be used when the file and its imports weren't changed. Off by default.
         :return: the bytecode of the compiled .nef file
         """
         if not path.endswith('.py'):
@@ -29,14 +34,15 @@ class Boa3:
         return Compiler().compile(path, root_folder, env,
                                   log_level=log_level,
                                   fail_fast=fail_fast,
-                                  optimize=optimize
+                                  optimize=optimize,
+                                  cache=CompilationCache() if use_cache else None
                                   )
 
     @staticmethod
     def compile_and_save(path: str, output_path: str = None, root_folder: str = None,
                          show_errors: bool = True, log_level: str = None,
                          debug: bool = False, env: str = None, fail_fast: bool = True,
-                         optimize: bool = True):
+                         optimize: bool = True, use_cache: bool = False, profile_path: str = None):
         """
         Load a Python file to be compiled and save the result into the files.
         By default, the resultant .nef file is saved in the same folder of the
@@ -49,6 +55,10 @@ class Boa3:
         :param debug: if nefdbgnfo file should be generated.
         :param env: specific environment id to compile.
         :param fail_fast: if should stop compilation on first error found.
+        :param use_cache: if a cached result can be used when the file and its imports weren't changed. Off by default.
+        :param profile_path: Optional path to save the time, calls and memory of each compilation phase. It's saved in
+                             the folded stacks format if the extension is .folded or .txt and as JSON otherwise. The
+                             cache isn't used when the compilation is profiled.
         """
         if not path.endswith('.py'):
             raise InvalidPathException(path)
@@ -58,6 +68,45 @@ class Boa3:
         elif not output_path.endswith('.nef'):
             raise InvalidPathException(output_path)
 
-        Compiler().compile_and_save(path, output_path, root_folder, show_errors, log_level, debug, env, fail_fast,
-                                    optimize
-                                    )
+        compiler = Compiler(profile=profile_path is not None)
+        compiler.compile_and_save(path, output_path, root_folder, show_errors, log_level, debug, env, fail_fast,
+                                  optimize,
+                                  cache=CompilationCache() if use_cache else None
+                                  )
+        if compiler.profiler is not None:
+            compiler.profiler.save(profile_path)
+
+    @staticmethod
+    def watch(path: Union[str, List[str]], output_path: str = None, root_folder: str = None,
+              show_errors: bool = True, log_level: str = None,
+              debug: bool = False, env: str = None, fail_fast: bool = True,
+              optimize: bool = True, poll_interval: float = 1.0,
+              on_compile: Callable[[str, Optional[Exception]], None] = None):
+        """
+        Compile and save Python files and recompile them each time they or the modules they import are changed.
+        Only the files affected by a change are compiled again. It only returns if the execution is interrupted.
+
+        :param path: the path of the Python file to compile, or a list with the paths of many files
+        :param output_path: Optional path to save the generated files. Can only be used if a single file is compiled.
+        :param root_folder: the root path of the project
+        :param show_errors: if compiler errors should be logged.
+        :param debug: if nefdbgnfo file should be generated.
+        :param env: specific environment id to compile.
+        :param fail_fast: if should stop compilation on first error found.
+        :param poll_interval: the interval in seconds between the verifications of the files
+        :param on_compile: a function called with the path of the file and the compilation error, or None if it was
+                           compiled, after each compilation
+        """
+        paths = [path] if isinstance(path, str) else list(path)
+        for file_path in paths:
+            if not file_path.endswith('.py'):
+                raise InvalidPathException(file_path)
+
+        if output_path is not None and (len(paths) != 1 or not output_path.endswith('.nef')):
+            raise InvalidPathException(output_path)
+
+        entries = {file_path: output_path if output_path is not None else file_path.replace('.py', '.nef')
+                   for file_path in paths}
+
+        CompilationWatcher(entries, root_folder, show_errors, log_level, debug, env, fail_fast,
+                           optimize).watch(poll_interval, on_compile)
@@ -4,13 +4,14 @@ import ast
 from typing import Dict, List, Optional
 
 from boa3.builtin.compile_time import NeoMetadata
-from boa3.internal import constants
+from boa3.internal import constants, helpers
 from boa3.internal.analyser.astanalyser import IAstAnalyser
 from boa3.internal.analyser.astoptimizer import AstOptimizer
 from boa3.internal.analyser.constructanalyser import ConstructAnalyser
 from boa3.internal.analyser.moduleanalyser import ModuleAnalyser
 from boa3.internal.analyser.supportedstandard.standardanalyser import StandardAnalyser
 from boa3.internal.analyser.typeanalyser import TypeAnalyser
+from boa3.internal.compiler.compilationprofiler import CompilationProfiler
 from boa3.internal.compiler.compiledmetadata import CompiledMetadata
 from boa3.internal.exception.CompilerError import CompilerError
 from boa3.internal.exception.CompilerWarning import CompilerWarning
@@ -78,8 +79,8 @@ class Analyser:
         :return: a boolean value that represents if the analysis was successful
         :rtype: Analyser
         """
-        with open(path, 'rb') as source:
-            ast_tree = ast.parse(source.read())
+        with open(path, 'rb') as source, CompilationProfiler.phase('parse'):
+            ast_tree = helpers.parse(source.read())
 
         analyser = Analyser(ast_tree, path, root if isinstance(root, str) else path, env, log, fail_fast)
         CompiledMetadata.set_current_metadata(analyser.metadata)
@@ -100,7 +101,7 @@ class Analyser:
         if not analyser.__check_types():
             return analyser
 
-        analyser.__pos_execute()
+        analyser.__pos_execute(compiler_entry)
         analyser.is_analysed = True
 
         return analyser
@@ -142,7 +143,8 @@ class Analyser:
 
         :return: a boolean value that represents if the analysis was successful
         """
-        type_analyser = TypeAnalyser(self, self.symbol_table, log=self._log, fail_fast=self._fail_fast)
+        with CompilationProfiler.phase('TypeAnalyser'):
+            type_analyser = TypeAnalyser(self, self.symbol_table, log=self._log, fail_fast=self._fail_fast)
         self._update_logs(type_analyser)
         return not type_analyser.has_errors
 
@@ -155,13 +157,14 @@ class Analyser:
         :return: a boolean value that represents if the analysis was successful
         """
         current_metadata = self.metadata
-        module_analyser = ModuleAnalyser(self, self.symbol_table,
-                                         log=self._log,
-                                         fail_fast=self._fail_fast,
-                                         filename=self.filename,
-                                         root_folder=self.root,
-                                         analysed_files=imported_files,
-                                         import_stack=import_stack)
+        with CompilationProfiler.phase('ModuleAnalyser'):
+            module_analyser = ModuleAnalyser(self, self.symbol_table,
+                                             log=self._log,
+                                             fail_fast=self._fail_fast,
+                                             filename=self.filename,
+                                             root_folder=self.root,
+                                             analysed_files=imported_files,
+                                             import_stack=import_stack)
         self.symbol_table.update(module_analyser.global_symbols)
         self.ast_tree.body.extend(module_analyser.imported_nodes)
         self._update_logs(module_analyser)
@@ -178,7 +181,8 @@ class Analyser:
 
         :return: a boolean value that represents if the analysis was successful
         """
-        standards_analyser = StandardAnalyser(self, self.symbol_table, log=self._log, fail_fast=self._fail_fast)
+        with CompilationProfiler.phase('StandardAnalyser'):
+            standards_analyser = StandardAnalyser(self, self.symbol_table, log=self._log, fail_fast=self._fail_fast)
         self._update_logs(standards_analyser)
         return not standards_analyser.has_errors
 
@@ -190,15 +194,20 @@ class Analyser:
         """
         Pre executes the instructions of the ast for optimization
         """
-        self.ast_tree = ConstructAnalyser(self, self.ast_tree, self.symbol_table,
-                                          log=self._log, fail_fast=self._fail_fast
-                                          ).tree
+        with CompilationProfiler.phase('ConstructAnalyser'):
+            self.ast_tree = ConstructAnalyser(self, self.ast_tree, self.symbol_table,
+                                              log=self._log, fail_fast=self._fail_fast
+                                              ).tree
 
-    def __pos_execute(self):
+    def __pos_execute(self, compiler_entry: bool = False):
         """
         Tries to optimize the ast after validations
+
+        :param compiler_entry: Whether this is the entry compiler analyser. False by default.
         """
-        optimizer = AstOptimizer(self, log=self._log, fail_fast=self._fail_fast)
+        with CompilationProfiler.phase('AstOptimizer'):
+            optimizer = AstOptimizer(self, log=self._log, fail_fast=self._fail_fast,
+                                     is_compiler_entry=compiler_entry)
         self._update_logs(optimizer)
 
     def update_symbol_table(self, symbol_table: Dict[str, ISymbol]):
@@ -5,7 +5,7 @@ from abc import ABC
 from inspect import isclass
 from typing import Any, Dict, List, Optional, Sequence, Union
 
-from boa3.internal import constants
+from boa3.internal import constants, helpers
 from boa3.internal.exception.CompilerError import CompilerError, InternalError, UnresolvedReference
 from boa3.internal.exception.CompilerWarning import CompilerWarning
 from boa3.internal.model.attribute import Attribute
@@ -227,7 +227,7 @@ class IAstAnalyser(ABC, ast.NodeVisitor):
         :return: the parsed node
         :rtype: ast.AST or Sequence[ast.AST]
         """
-        node = ast.parse(expression, filename='<{0}>'.format(type(self).__name__))
+        node = helpers.parse(expression, filename='<{0}>'.format(type(self).__name__))
         if origin is not None:
             self.update_line_and_col(node, origin)
 
@@ -1,21 +1,26 @@
 import ast
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import copy
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 from boa3.internal import constants
 from boa3.internal.analyser.astanalyser import IAstAnalyser
 from boa3.internal.analyser.model.optimizer import ScopeValue, Undefined
 from boa3.internal.analyser.model.optimizer.Operation import Operation
+from boa3.internal.compiler.codegenerator.optimizerhelper import OptimizationLevel
+from boa3.internal.compiler.compilationcontext import CompilationContext
 from boa3.internal.exception import CompilerWarning
 from boa3.internal.model.builtin.method.builtinmethod import IBuiltinMethod
 from boa3.internal.model.method import Method
 from boa3.internal.model.module import Module
 from boa3.internal.model.operation.binary.binaryoperation import BinaryOperation
+from boa3.internal.model.operation.operation import IOperation
 from boa3.internal.model.operation.operator import Operator
 from boa3.internal.model.operation.unary.unaryoperation import UnaryOperation
 from boa3.internal.model.property import Property
 from boa3.internal.model.symbol import ISymbol
 from boa3.internal.model.type.classes.userclass import UserClass
 from boa3.internal.model.type.primitive.primitivetype import PrimitiveType
+from boa3.internal.model.variable import Variable
 
 
 class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
@@ -29,7 +34,7 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
     :ivar symbols: a dictionary that maps the global symbols.
     """
 
-    def __init__(self, analyser, log: bool = False, fail_fast: bool = True):
+    def __init__(self, analyser, log: bool = False, fail_fast: bool = True, is_compiler_entry: bool = False):
         super().__init__(analyser.ast_tree, filename=analyser.filename, root_folder=analyser.root,
                          log=log, fail_fast=fail_fast)
         self.modules: Dict[str, Module] = {}
@@ -40,9 +45,40 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
         self.current_scope: ScopeValue = ScopeValue()
 
         self._current_class: UserClass = None
+        self._current_method: Optional[Method] = None
+
+        # the branch pruning and the evaluation of the user functions remove code that the debugger would step into,
+        # so they are only used on the highest optimization level
+        optimization_level = CompilationContext.current().optimization_level
+        self._is_high_level: bool = optimization_level is None or optimization_level > OptimizationLevel.DEBUG
+
+        # the functions defined in the module and how many times each global variable is assigned
+        self._module_functions: Dict[str, ast.FunctionDef] = {}
+        self._module_assigns: Dict[str, int] = {}
+        self._include_module_definitions()
+
+        # the arguments of each function that have the same value in every call of the function
+        self._constant_args: Dict[ast.FunctionDef, Dict[str, Any]] = {}
+        self._constant_names: Dict[str, Any] = {}
+        self._evaluating_functions: Set[ast.FunctionDef] = set()
+
+        # the local variables that had a load replaced by their value in the current function and whether a branch of
+        # it was pruned or a call in it was evaluated
+        self._folded_names: Set[str] = set()
+        self._has_evaluated_code: bool = False
+
+        is_optimizing_calls = is_compiler_entry and self._is_high_level
+        original_calls = self._get_calls(self._tree) if is_optimizing_calls else []
 
         self.analyse_visit(self._tree)
 
+        if is_optimizing_calls:
+            # the calls to the functions of the entry file are all in it, so the arguments of the calls can be
+            # propagated to the functions
+            self._propagate_constant_args()
+            self._remove_propagated_args()
+            self._remove_folded_calls(original_calls)
+
     @property
     def tree(self) -> ast.AST:
         """
@@ -82,9 +118,62 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
 
         return new_node
 
+    def literal_to_node(self, value: Any, origin: ast.AST) -> ast.AST:
+        """
+        Creates an ast with a literal value.
+
+        :param value: the literal value
+        :param origin: an existing ast. The created node will have the same location of origin.
+        :return: the created node
+        """
+        return self.parse_to_node(repr(value), origin)
+
     def reset_state(self):
         self.current_scope.reset()
 
+    def _include_module_definitions(self):
+        for stmt in self._tree.body:
+            if isinstance(stmt, ast.FunctionDef):
+                self._module_functions[stmt.name] = stmt
+
+        # the assignments inside if, for, while and the other blocks of the module are in the module scope too
+        nodes: List[ast.AST] = list(self._tree.body)
+        while len(nodes) > 0:
+            node = nodes.pop()
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)):
+                if not isinstance(node, ast.Lambda):
+                    self._count_module_assign(node.name)
+                self._include_global_assigns(node)
+                continue
+
+            if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Load):
+                self._count_module_assign(node.id)
+            elif isinstance(node, (ast.ExceptHandler, ast.MatchAs, ast.MatchStar)) and node.name:
+                self._count_module_assign(node.name)
+            elif isinstance(node, ast.MatchMapping) and node.rest:
+                self._count_module_assign(node.rest)
+            elif isinstance(node, ast.alias):
+                self._count_module_assign(node.asname if node.asname else node.name.split('.')[0])
+
+            nodes.extend(ast.iter_child_nodes(node))
+
+    def _include_global_assigns(self, node: ast.AST):
+        """
+        Includes the assignments to the variables that are declared as global inside a function or a class
+        """
+        global_names = {name for inner_node in ast.walk(node) if isinstance(inner_node, ast.Global)
+                        for name in inner_node.names}
+        if len(global_names) == 0:
+            return
+
+        for inner_node in ast.walk(node):
+            if (isinstance(inner_node, ast.Name) and not isinstance(inner_node.ctx, ast.Load)
+                    and inner_node.id in global_names):
+                self._count_module_assign(inner_node.id)
+
+    def _count_module_assign(self, var_id: str):
+        self._module_assigns[var_id] = self._module_assigns.get(var_id, 0) + 1
+
     def get_symbol_id(self, node: ast.AST) -> Optional[str]:
         parts = []
         cur_node = node
@@ -117,13 +206,25 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
         if isinstance(method, Method):
             self._is_optimizing = True
             self.has_changes = True
+            self._current_method = method
+            self._constant_names = self._constant_args.get(node, {})
 
+            first_stmt = node.body[0]
             while self.has_changes:
                 self.reset_state()
                 self.has_changes = False
 
                 super().generic_visit(node)
 
+            if self._has_evaluated_code or len(self._constant_names) > 0:
+                # the values known after pruning the branches or evaluating the calls replace the loads of the
+                # variables, so some assignments aren't used anymore
+                self._remove_unused_assignments(node)
+
+            if len(node.body) == 0:
+                # all the statements were removed by the branch pruning or were unused assignments
+                node.body.append(self._get_pass_node(first_stmt))
+
         self.end_function_optimization()
         return node
 
@@ -131,6 +232,77 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
         self.reset_state()
         self.has_changes = False
         self._is_optimizing = False
+        self._current_method = None
+        self._constant_names = {}
+        self._folded_names = set()
+        self._has_evaluated_code = False
+
+    def _remove_unused_assignments(self, node: ast.FunctionDef):
+        """
+        Removes the assignments of literal values to the local variables that aren't loaded, like the ones whose loads
+        were all replaced by their values. The local variables that aren't used anymore are removed from the method.
+        """
+        loaded_names = set()
+        for inner_node in ast.walk(node):
+            if isinstance(inner_node, ast.Name) and not isinstance(inner_node.ctx, ast.Store):
+                loaded_names.add(inner_node.id)
+            elif isinstance(inner_node, ast.AugAssign) and isinstance(inner_node.target, ast.Name):
+                loaded_names.add(inner_node.target.id)
+            elif isinstance(inner_node, (ast.Global, ast.Nonlocal)):
+                loaded_names.update(inner_node.names)
+
+        local_names = set(self._current_method.locals) if isinstance(self._current_method, Method) else set()
+        unused_names = (self._folded_names | local_names) - loaded_names
+        if len(unused_names) == 0:
+            return
+
+        for inner_node in ast.walk(node):
+            for field in ('body', 'orelse', 'finalbody'):
+                statements = getattr(inner_node, field, None)
+                if not isinstance(statements, list):
+                    continue
+
+                kept_statements = [stmt for stmt in statements if not self._is_unused_assignment(stmt, unused_names)]
+                if len(kept_statements) < len(statements):
+                    if len(kept_statements) == 0 and field == 'body' and inner_node is not node:
+                        kept_statements.append(self._get_pass_node(statements[0]))
+                    setattr(inner_node, field, kept_statements)
+
+        used_names = self._get_assigned_names(node) | loaded_names
+        for name in unused_names & local_names:
+            if name not in used_names:
+                # all the assignments were removed, so the variable doesn't need a slot in the method
+                del self._current_method.locals[name]
+
+    def _is_unused_assignment(self, node: ast.AST, unused_names: Set[str]) -> bool:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets = [node.target]
+        else:
+            return False
+
+        # the value is only removed if it's a literal, because other expressions may have side effects
+        return (all(isinstance(target, ast.Name) and target.id in unused_names for target in targets)
+                and self.literal_eval(node.value) is not Undefined)
+
+    def _get_assigned_names(self, node: ast.AST) -> Set[str]:
+        """
+        Gets the names of all the variables and arguments that are assigned inside the given node
+        """
+        local_names = set()
+        for inner_node in ast.walk(node):
+            if isinstance(inner_node, ast.Name) and not isinstance(inner_node.ctx, ast.Load):
+                local_names.add(inner_node.id)
+            elif isinstance(inner_node, ast.arg):
+                local_names.add(inner_node.arg)
+            elif isinstance(inner_node, (ast.ExceptHandler, ast.MatchAs, ast.MatchStar)) and inner_node.name:
+                local_names.add(inner_node.name)
+            elif isinstance(inner_node, ast.MatchMapping) and inner_node.rest:
+                local_names.add(inner_node.rest)
+            elif isinstance(inner_node, (ast.Global, ast.Nonlocal)):
+                local_names.update(inner_node.names)
+        return local_names
 
     def visit_Assign(self, node: ast.Assign) -> ast.AST:
         super().generic_visit(node)
@@ -145,10 +317,9 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
     def visit_AugAssign(self, node: ast.AugAssign) -> ast.AST:
         super().generic_visit(node)
 
-        value = self.parse_to_node("x+y", node)
-        value.left = node.target
-        value.op = node.op
-        value.right = node.value
+        # the operation is built directly, because parsing it would replace its operands by the values in the scope
+        value = ast.BinOp(left=node.target, op=node.op, right=node.value)
+        ast.copy_location(value, node)
 
         self.set_variables_value([node.target], value)
         return node
@@ -161,9 +332,20 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
 
                 if new_value is not Undefined:
                     self.current_scope[target.id] = new_value
+                    if not self._is_optimizing:
+                        self._set_global_value(target.id, new_value)
                 elif target.id in self.current_scope:
                     self.current_scope.remove(target.id)
 
+    def _set_global_value(self, var_id: str, value: Any):
+        """
+        Sets the value of a global variable that is evaluated during compile time, so it doesn't need to be stored
+        """
+        var = self.symbols.get(var_id)
+        if (isinstance(var, Variable) and not var.is_reassigned and self._module_assigns.get(var_id) == 1
+                and isinstance(self.get_type(value), PrimitiveType)):
+            var.set_initial_assign(value)
+
     def visit_BinOp(self, bin_op: ast.BinOp) -> ast.AST:
         """
         Visitor of a binary operation node
@@ -275,7 +457,7 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
         :param un_op: the python ast binary operation node
         """
         try:
-            self.visit(un_op.operand)
+            un_op.operand = self.visit(un_op.operand)
 
             operand_value = ast.literal_eval(un_op.operand)
 
@@ -292,6 +474,9 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
             return un_op
 
     def _evaluate_unary_operation(self, operand: Any, op: Union[ast.operator, UnaryOperation]) -> Optional[Any]:
+        if self._get_operator(op) is Operator.Not:
+            return not operand if isinstance(operand, bool) else None
+
         operator = Operation.get_operation(op)
         try:
             if operator is Operation.Add:
@@ -302,8 +487,126 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
         except BaseException:
             return None
 
+    def visit_Compare(self, compare: ast.Compare) -> ast.AST:
+        """
+        Visitor of a compare operation node
+
+        :param compare: the python ast compare operation node
+        """
+        super().generic_visit(compare)
+
+        values = [self.literal_eval(operand) for operand in [compare.left] + compare.comparators]
+        if any(value is Undefined for value in values):
+            return compare
+
+        result = True
+        for index, op in enumerate(compare.ops):
+            value = self._evaluate_compare_operation(values[index], values[index + 1], op)
+            if value is None:
+                return compare
+            result = result and value
+
+        self.has_changes = True
+        return self.literal_to_node(result, compare)
+
+    def _evaluate_compare_operation(self, left: Any, right: Any, op: Union[ast.cmpop, IOperation]) -> Optional[bool]:
+        # only values with the same type are compared, because the comparisons between different types in the VM
+        # don't always have the same result that they have in Python
+        if type(left) is not type(right) or not isinstance(left, (int, str, bytes)):
+            return None
+
+        operator = self._get_operator(op)
+        if operator is Operator.Eq:
+            return left == right
+        if operator is Operator.NotEq:
+            return left != right
+
+        if isinstance(left, bool) or not isinstance(left, int):
+            return None
+        if operator is Operator.Lt:
+            return left < right
+        if operator is Operator.LtE:
+            return left <= right
+        if operator is Operator.Gt:
+            return left > right
+        if operator is Operator.GtE:
+            return left >= right
+        return None
+
+    def visit_BoolOp(self, bool_op: ast.BoolOp) -> ast.AST:
+        """
+        Visitor of a boolean operation node
+
+        :param bool_op: the python ast boolean operation node
+        """
+        super().generic_visit(bool_op)
+
+        values = [self.literal_eval(operand) for operand in bool_op.values]
+        if not all(isinstance(value, bool) for value in values):
+            return bool_op
+
+        operator = self._get_operator(bool_op.op)
+        if operator is Operator.And:
+            result = all(values)
+        elif operator is Operator.Or:
+            result = any(values)
+        else:
+            return bool_op
+
+        self.has_changes = True
+        return self.literal_to_node(result, bool_op)
+
+    def _get_operator(self, op: Union[ast.AST, Operator, IOperation]) -> Optional[Operator]:
+        if isinstance(op, IOperation):
+            return op.operator
+        if isinstance(op, Operator):
+            return op
+        return Operator.get_operation(op)
+
+    def visit_IfExp(self, if_exp: ast.IfExp) -> ast.AST:
+        if_exp.test = self.visit(if_exp.test)
+
+        test_value = self.literal_eval(if_exp.test)
+        if self._is_high_level and self._is_known_condition(test_value):
+            self.has_changes = True
+            self._has_evaluated_code = True
+            return self.visit(if_exp.body if test_value else if_exp.orelse)
+
+        if_exp.body = self.visit(if_exp.body)
+        if_exp.orelse = self.visit(if_exp.orelse)
+        return if_exp
+
+    def _is_known_condition(self, value: Any) -> bool:
+        # the other types are converted to bool differently in the VM, like b'\x00' that is False
+        return isinstance(value, int)
+
+    def visit_statements(self, statements: List[ast.AST]) -> List[ast.AST]:
+        """
+        Visits a list of statements, replacing each statement by the statements returned by its visitor
+
+        :param statements: the statements that will be visited
+        :return: the updated list of statements
+        """
+        new_statements = []
+        for stmt in statements:
+            new_stmt = self.visit(stmt)
+            if isinstance(new_stmt, ast.AST):
+                new_statements.append(new_stmt)
+            elif isinstance(new_stmt, list):
+                new_statements.extend(new_stmt)
+
+        if len(new_statements) == 0 and len(statements) > 0:
+            # a body can't be empty, so if all the statements were removed, it's replaced by a `pass`
+            new_statements.append(self._get_pass_node(statements[0]))
+        return new_statements
+
+    def _get_pass_node(self, origin: ast.AST) -> ast.AST:
+        pass_node = ast.Pass()
+        self.update_line_and_col(pass_node, origin)
+        return pass_node
+
     def visit_Match(self, match_node: ast.Match) -> ast.AST:
-        self.visit(match_node.subject)
+        match_node.subject = self.visit(match_node.subject)
 
         case_scopes = []
 
@@ -313,28 +616,32 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
             case_scopes.append(match_scope.new_scope())
 
             self.current_scope = case_scopes[-1]
-            for stmt in case.body:
-                self.visit(stmt)
+            case.body = self.visit_statements(case.body)
 
         self.current_scope = match_scope
         self.current_scope.update_values(*case_scopes)
 
         return match_node
 
-    def visit_If(self, node: ast.If) -> ast.AST:
-        self.visit(node.test)
+    def visit_If(self, node: ast.If) -> Union[ast.AST, List[ast.AST]]:
+        node.test = self.visit(node.test)
+
+        test_value = self.literal_eval(node.test)
+        if self._is_optimizing and self._is_high_level and self._is_known_condition(test_value):
+            # only the branch that is executed is kept
+            self.has_changes = True
+            self._has_evaluated_code = True
+            return self.visit_statements(node.body if test_value else node.orelse)
 
         if_scope: ScopeValue = self.current_scope.new_scope()
         else_scope: ScopeValue = self.current_scope.new_scope()
 
         self.current_scope = if_scope
-        for stmt in node.body:
-            self.visit(stmt)
+        node.body = self.visit_statements(node.body)
 
         if len(node.orelse) > 0:
             self.current_scope = else_scope
-            for stmt in node.orelse:
-                self.visit(stmt)
+            node.orelse = self.visit_statements(node.orelse)
 
         self.current_scope = self.current_scope.previous_scope()
         self.current_scope.update_values(if_scope, else_scope)
@@ -350,15 +657,13 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
         loop_scope.reset()
 
         self.current_scope = loop_scope
-        for stmt in node.body:
-            self.visit(stmt)
+        node.body = self.visit_statements(node.body)
 
         if len(node.orelse) > 0:
             else_scope: ScopeValue = self.current_scope.new_scope()
             self.current_scope = else_scope
 
-            for stmt in node.orelse:
-                self.visit(stmt)
+            node.orelse = self.visit_statements(node.orelse)
 
             self.current_scope = else_scope.previous_scope()
             loop_scope.update_values(else_scope, is_loop_scope=True)
@@ -369,17 +674,30 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
         return loop_scope
 
     def visit_For(self, node: ast.For) -> ast.AST:
-        self.visit(node.iter)
+        node.iter = self.visit(node.iter)
 
         for_scope = self.visit_loop_body(node)
         self.current_scope = for_scope.previous_scope()
 
         return node
 
-    def visit_While(self, node: ast.While) -> ast.AST:
-        while_scope = self.visit_loop_body(node)
-        self.visit(node.test)
+    def visit_While(self, node: ast.While) -> Union[ast.AST, List[ast.AST]]:
+        # the condition is evaluated again after each iteration, so it can't use the values from before the loop
+        test_scope: ScopeValue = self.current_scope.new_scope()
+        test_scope.reset()
+
+        self.current_scope = test_scope
+        node.test = self.visit(node.test)
+        self.current_scope = test_scope.previous_scope()
+
+        test_value = self.literal_eval(node.test)
+        if self._is_optimizing and self._is_high_level and self._is_known_condition(test_value) and not test_value:
+            # the loop body is never executed
+            self.has_changes = True
+            self._has_evaluated_code = True
+            return self.visit_statements(node.orelse)
 
+        while_scope = self.visit_loop_body(node)
         self.current_scope = while_scope.previous_scope()
 
         return node
@@ -390,16 +708,14 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
         except_scopes: List[ScopeValue] = []
 
         self.current_scope = try_scope
-        for stmt in node.body:
-            self.visit(stmt)
+        node.body = self.visit_statements(node.body)
 
         if len(node.handlers) > 0:
             for handler in node.handlers:
                 except_scope = outer_scope.new_scope()
                 self.current_scope = except_scope
 
-                for stmt in handler.body:
-                    self.visit(stmt)
+                handler.body = self.visit_statements(handler.body)
 
                 except_scopes.append(except_scope)
 
@@ -407,34 +723,38 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
             else_scope = outer_scope.new_scope()
             self.current_scope = else_scope
 
-            for stmt in node.orelse:
-                self.visit(stmt)
+            node.orelse = self.visit_statements(node.orelse)
 
             except_scopes.append(else_scope)
 
         self.current_scope = self.current_scope.previous_scope()
         self.current_scope.update_values(try_scope, *except_scopes)
 
-        for stmt in node.finalbody:
-            self.visit(stmt)
+        node.finalbody = self.visit_statements(node.finalbody)
 
         return node
 
     def visit_Name(self, node: ast.Name) -> ast.AST:
-        if (isinstance(node.ctx, ast.Load)
-                and node.id in self.current_scope
-                and isinstance(self.get_type(self.current_scope[node.id]), PrimitiveType)):
+        if not isinstance(node.ctx, ast.Load):
+            return node
+
+        if node.id in self.current_scope:
+            value = self.current_scope[node.id]
+        elif node.id in self._constant_names:
+            value = self._constant_names[node.id]
+        else:
+            return node
+
+        if value is not Undefined and isinstance(self.get_type(value), PrimitiveType):
             # only values from int, bool, str and bytes types are going to replace the variable
             # TODO: check if it's worth to replace other types #2kq0zhe
-            value = self.current_scope[node.id]
-            if isinstance(value, str):
-                value = "'{0}'".format(value)
-            return self.parse_to_node(str(value), node)
+            if self._is_optimizing and node.id in self.current_scope:
+                self._folded_names.add(node.id)
+            return self.literal_to_node(value, node)
         return node
 
     def visit_Call(self, node: ast.Call) -> ast.AST:
         # check if the call can be evaluated during compile time
-        # TODO: right now only UInt160 and UInt256 constructors are evaluated #2kq12zd
         literal_args = []
         args_are_literal = True
 
@@ -455,10 +775,9 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
         if args_are_literal:
             # try to get the result
             try:
-                func_id = self.get_symbol_id(node.func)
+                func = self._get_called_symbol(node.func)
             except BaseException:
                 return node
-            func = self.get_symbol(func_id)
 
             if isinstance(func, IBuiltinMethod):
                 try:
@@ -470,4 +789,300 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
                         node.lineno, node.col_offset
                     ))
 
+            elif self._is_high_level and isinstance(func, Method) and len(node.keywords) == 0:
+                result = self._evaluate_function_call(func, literal_args)
+                if result is not Undefined:
+                    self.has_changes = True
+                    self._has_evaluated_code = True
+                    return self.literal_to_node(result, node)
+
         return node
+
+    def _get_called_symbol(self, func: ast.AST) -> Optional[ISymbol]:
+        func_id = self.get_symbol_id(func)
+        symbol = self.get_symbol(func_id)
+
+        if symbol is None and isinstance(func, ast.Attribute):
+            # the function may be from a class or a package, like `CryptoLib.sha256`
+            value_symbol = self.get_symbol(self.get_symbol_id(func.value))
+            if hasattr(value_symbol, 'symbols') and func.attr in value_symbol.symbols:
+                symbol = value_symbol.symbols[func.attr]
+
+        return symbol
+
+    # region Interprocedural optimization
+
+    def _evaluate_function_call(self, method: Method, args: List[Any]) -> Any:
+        """
+        Tries to evaluate the result of a call to a user function during compile time. Only the functions that just
+        return an expression are evaluated.
+
+        :return: the result of the call if it can be evaluated. Otherwise, returns Undefined.
+        """
+        function = method.origin
+        if (not isinstance(function, ast.FunctionDef)
+                or self._module_functions.get(function.name) is not function
+                or function in self._evaluating_functions):
+            return Undefined
+
+        body = function.body
+        if len(body) > 1 and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+            # ignores the docstring
+            body = body[1:]
+        if len(body) != 1 or not isinstance(body[0], ast.Return) or body[0].value is None:
+            return Undefined
+
+        if any(isinstance(node, (ast.NamedExpr, ast.Lambda, ast.comprehension))
+               for node in ast.walk(body[0].value)):
+            return Undefined
+
+        arg_values = self._get_call_args(function, args, {})
+        if arg_values is None or any(value is Undefined for value in arg_values.values()):
+            return Undefined
+
+        # the global variables are replaced too, since the expression is only used to get the result
+        constant_names = self._get_global_values(body[0].value)
+        constant_names.update(arg_values)
+
+        outer_state = (self.current_scope, self.has_changes, self._is_optimizing,
+                       self._current_method, self._constant_names, self._folded_names, self._has_evaluated_code)
+
+        self.current_scope = ScopeValue()
+        self._is_optimizing = True
+        self._current_method = method
+        self._constant_names = constant_names
+        self._folded_names = set()
+        self._evaluating_functions.add(function)
+
+        try:
+            expression = self.visit(self._copy_expression(body[0].value))
+        finally:
+            (self.current_scope, self.has_changes, self._is_optimizing,
+             self._current_method, self._constant_names, self._folded_names, self._has_evaluated_code) = outer_state
+            self._evaluating_functions.remove(function)
+
+        result = self.literal_eval(expression)
+        if (result is Undefined or not isinstance(self.get_type(result), PrimitiveType)
+                or not method.return_type.is_type_of(self.get_type(result))):
+            return Undefined
+        return result
+
+    def _get_global_values(self, node: ast.AST) -> Dict[str, Any]:
+        """
+        Gets the values of the global variables used in the given node that are known during compile time
+        """
+        values = {}
+        for name in ast.walk(node):
+            if isinstance(name, ast.Name) and self._module_assigns.get(name.id) == 1:
+                var = self.symbols.get(name.id)
+                if isinstance(var, Variable) and not var.is_reassigned and var.has_literal_value:
+                    values[name.id] = var._first_assign_value
+        return values
+
+    def _copy_expression(self, node: ast.AST) -> ast.AST:
+        """
+        Copies an expression node and its child nodes. The values that aren't nodes aren't copied, like the operations
+        set by the type checking.
+        """
+        new_node = copy.copy(node)
+        for field, value in ast.iter_fields(node):
+            if isinstance(value, list):
+                setattr(new_node, field, [self._copy_expression(item) if isinstance(item, ast.AST) else item
+                                          for item in value])
+            elif isinstance(value, ast.AST):
+                setattr(new_node, field, self._copy_expression(value))
+        return new_node
+
+    def _get_call_args(self, function: ast.FunctionDef, args: List[Any], keywords: Dict[str, Any]
+                       ) -> Optional[Dict[str, Any]]:
+        """
+        Gets the value of each argument of a function in a call
+
+        :param function: the called function
+        :param args: the values of the positional arguments of the call
+        :param keywords: the values of the keyword arguments of the call
+        :return: a dictionary that maps each argument with its value. None if the arguments can't be matched
+        """
+        arguments = function.args
+        if (arguments.vararg is not None or arguments.kwarg is not None
+                or len(arguments.kwonlyargs) > 0 or len(arguments.posonlyargs) > 0):
+            return None
+
+        params = [arg.arg for arg in arguments.args]
+        if len(args) > len(params):
+            return None
+
+        values = dict(zip(params, args))
+        for name, value in keywords.items():
+            if name not in params or name in values:
+                return None
+            values[name] = value
+
+        first_default = len(params) - len(arguments.defaults)
+        for index, param in enumerate(params):
+            if param not in values:
+                if index < first_default:
+                    return None
+                values[param] = self.literal_eval(arguments.defaults[index - first_default])
+
+        return values
+
+    def _propagate_constant_args(self):
+        """
+        Optimizes again the functions that are always called with the same value in some argument, using these values
+        """
+        constant_args = self._find_constant_args()
+        while any(set(args) != set(self._constant_args.get(function, {})) for function, args in constant_args.items()):
+            changed_functions = [function for function, args in constant_args.items()
+                                 if set(args) != set(self._constant_args.get(function, {}))]
+            self._constant_args = constant_args
+
+            for function in changed_functions:
+                self.visit(function)
+
+            constant_args = self._find_constant_args()
+
+    def _find_constant_args(self) -> Dict[ast.FunctionDef, Dict[str, Any]]:
+        """
+        Finds the arguments of the functions that have the same literal value in all the calls to them.
+
+        Only the functions that aren't public or decorated are included, and only if they aren't used other than
+        being called, since otherwise they can be called from outside the file.
+        """
+        calls: Dict[str, List[ast.Call]] = {}
+        called_names: Set[ast.AST] = set()
+        for node in ast.walk(self._tree):
+            if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+                calls.setdefault(node.func.id, []).append(node)
+                called_names.add(node.func)
+
+        referenced_names = {node.id for node in ast.walk(self._tree)
+                            if isinstance(node, ast.Name) and node not in called_names}
+
+        constant_args = {}
+        for name, function in self._module_functions.items():
+            method = self.symbols.get(name)
+            if (name in referenced_names or name not in calls
+                    or not isinstance(method, Method) or method.origin is not function
+                    or method.is_public or len(function.decorator_list) > 0):
+                continue
+
+            values = self._get_same_call_args(function, calls[name])
+            # the arguments that are changed inside the function aren't constants
+            assigned_names = self._get_assigned_names(ast.Module(body=function.body, type_ignores=[]))
+            values = {arg_id: value for arg_id, value in values.items()
+                      if arg_id not in assigned_names and arg_id in method.args
+                      and method.args[arg_id].type == self.get_type(value)}
+
+            if len(values) > 0:
+                constant_args[function] = values
+
+        return constant_args
+
+    def _remove_propagated_args(self):
+        """
+        Removes the arguments that were propagated to the functions, so the calls don't need to push their values
+        """
+        calls = self._get_calls(self._tree)
+        for function, args in self._constant_args.items():
+            method = self.symbols.get(function.name)
+            arguments = function.args
+            if not isinstance(method, Method) or len(arguments.defaults) > 0 or len(method.defaults) > 0:
+                continue
+
+            used_names = {node.id for node in ast.walk(function) if isinstance(node, ast.Name)}
+            removed_indexes = [index for index, arg in enumerate(arguments.args)
+                               if arg.arg in args and arg.arg not in used_names]
+            if len(removed_indexes) == 0:
+                continue
+
+            removed_names = {arguments.args[index].arg for index in removed_indexes}
+            for call in calls:
+                if isinstance(call.func, ast.Name) and call.func.id == function.name:
+                    # the values are literals, so removing them from the calls doesn't remove any side effect
+                    call.args = [arg for index, arg in enumerate(call.args) if index not in removed_indexes]
+                    call.keywords = [keyword for keyword in call.keywords if keyword.arg not in removed_names]
+
+            arguments.args = [arg for arg in arguments.args if arg.arg not in removed_names]
+            for name in removed_names:
+                del method.args[name]
+
+    def _remove_folded_calls(self, original_calls: List[ast.Call]):
+        """
+        Removes the calls that were evaluated or pruned from the calls of the functions of the module, so the functions
+        that aren't called anymore aren't generated.
+
+        Only the functions that aren't public or decorated are changed, and only if they aren't used other than being
+        called.
+        """
+        called_names = {call.func for call in original_calls}
+        referenced_names = {node.id for node in ast.walk(self._tree)
+                            if isinstance(node, ast.Name) and node not in called_names}
+
+        methods: Dict[str, Method] = {}
+        for name, function in self._module_functions.items():
+            method = self.symbols.get(name)
+            if (isinstance(method, Method) and method.origin is function and not method.is_public
+                    and len(function.decorator_list) == 0 and name not in referenced_names):
+                methods[name] = method
+
+        not_generated: Set[ast.FunctionDef] = set()
+        removed_calls: Set[ast.Call] = set()
+        has_removed = True
+        while has_removed:
+            has_removed = False
+            # the calls in the functions that aren't generated are removed too
+            kept_calls = set(self._get_calls(self._tree, not_generated))
+            for call in original_calls:
+                if call in kept_calls or call in removed_calls:
+                    continue
+                removed_calls.add(call)
+                if isinstance(call.func, ast.Name) and call.func.id in methods:
+                    method = methods[call.func.id]
+                    method.remove_call_origin(call)
+                    if not method.is_called and method.origin not in not_generated:
+                        not_generated.add(method.origin)
+                        has_removed = True
+
+    def _get_calls(self, node: ast.AST, skipped_functions: Set[ast.FunctionDef] = None) -> List[ast.Call]:
+        """
+        Gets the calls inside the given node, except the ones inside the skipped functions
+        """
+        calls = []
+        nodes = [node]
+        while len(nodes) > 0:
+            current = nodes.pop()
+            if skipped_functions is not None and current in skipped_functions:
+                continue
+            if isinstance(current, ast.Call):
+                calls.append(current)
+            nodes.extend(ast.iter_child_nodes(current))
+        return calls
+
+    def _get_same_call_args(self, function: ast.FunctionDef, calls: List[ast.Call]) -> Dict[str, Any]:
+        """
+        Gets the arguments of a function that have the same literal value in all the given calls
+        """
+        values: Optional[Dict[str, Any]] = None
+        for call in calls:
+            if (any(isinstance(arg, ast.Starred) for arg in call.args)
+                    or any(keyword.arg is None for keyword in call.keywords)):
+                return {}
+
+            call_values = self._get_call_args(function,
+                                              [self.literal_eval(arg) for arg in call.args],
+                                              {keyword.arg: self.literal_eval(keyword.value)
+                                               for keyword in call.keywords})
+            if call_values is None:
+                return {}
+
+            if values is None:
+                values = {arg_id: value for arg_id, value in call_values.items()
+                          if value is not Undefined and isinstance(self.get_type(value), PrimitiveType)}
+            else:
+                values = {arg_id: value for arg_id, value in values.items()
+                          if type(call_values[arg_id]) is type(value) and call_values[arg_id] == value}
+
+        return values if values is not None else {}
+
+    # endregion
@@ -2,14 +2,20 @@ import ast
 import importlib.util
 import os
 import sys
+import threading
 from typing import Dict, List, Optional
 
 from boa3.internal import constants
 from boa3.internal.analyser.astanalyser import IAstAnalyser
+from boa3.internal.analyser.moduleanalysiscache import ModuleAnalysisCache
+from boa3.internal.compiler.compilationcontext import CompilationContext
 from boa3.internal.model import imports
 from boa3.internal.model.symbol import ISymbol
 from boa3.internal.model.type.type import Type
 
+# the paths of the modules are found by changing sys.path, that is shared by the compilations running in other threads
+_sys_path_lock = threading.Lock()
+
 
 class ImportAnalyser(IAstAnalyser):
 
@@ -54,16 +60,17 @@ class ImportAnalyser(IAstAnalyser):
             return
 
         importer_file_dir = os.path.dirname(importer_file)
-        sys.path.insert(0, self.root_folder)
-        sys.path.insert(1, importer_file_dir)
-        try:
-            import_spec = importlib.util.find_spec(import_target)
-            module_origin: str = import_spec.origin
-        except BaseException:
-            return
-        finally:
-            sys.path.remove(importer_file_dir)
-            sys.path.remove(self.root_folder)
+        with _sys_path_lock:
+            sys.path.insert(0, self.root_folder)
+            sys.path.insert(1, importer_file_dir)
+            try:
+                import_spec = importlib.util.find_spec(import_target)
+                module_origin: str = import_spec.origin
+            except BaseException:
+                return
+            finally:
+                sys.path.remove(importer_file_dir)
+                sys.path.remove(self.root_folder)
 
         self._importer_file = importer_file
         is_importing_a_module = module_origin is not None
@@ -157,6 +164,7 @@ class ImportAnalyser(IAstAnalyser):
                 try:
                     if self.path in self._imported_files:
                         analyser = self._imported_files[self.path]
+                        ModuleAnalysisCache.instance().add_reference(self.path)
                     else:
                         from boa3.internal.analyser.analyser import Analyser
                         origin = origin_file.replace(os.sep, constants.PATH_SEPARATOR)
@@ -170,14 +178,10 @@ class ImportAnalyser(IAstAnalyser):
                                 analyser.is_analysed = True
                                 self._imported_files[self.path] = analyser
                         else:
-                            analyser = Analyser.analyse(module_origin, root=self.root_folder,
-                                                        imported_files=self._imported_files,
-                                                        import_stack=files,
-                                                        log=self._log, fail_fast=True)
-
-                            if self._fail_fast and len(analyser.errors) > 0:
-                                raise analyser.errors[0]
-                            self._include_inner_packages(analyser)
+                            analyser = ModuleAnalysisCache.instance().get_analysis(
+                                module_origin, self.root_folder, self._imported_files, files, self._log,
+                                lambda: self._analyse_module(module_origin, files)
+                            )
 
                         if analyser.is_analysed:
                             self._imported_files[self.path] = analyser
@@ -188,6 +192,8 @@ class ImportAnalyser(IAstAnalyser):
                             if symbol_id not in Type.all_types():
                                 if not self._get_from_entry:
                                     symbol.defined_by_entry = False
+                                    CompilationContext.current().record_change(symbol, '__setattr__',
+                                                                               'defined_by_entry', False)
                                 self.symbols[symbol_id] = symbol
 
                     self.errors.extend(analyser.errors)
@@ -202,6 +208,18 @@ class ImportAnalyser(IAstAnalyser):
                 if updated_tree is not None:
                     self._tree = updated_tree
 
+    def _analyse_module(self, module_origin: str, import_stack: List[str]):
+        from boa3.internal.analyser.analyser import Analyser
+        analyser = Analyser.analyse(module_origin, root=self.root_folder,
+                                    imported_files=self._imported_files,
+                                    import_stack=import_stack,
+                                    log=self._log, fail_fast=True)
+
+        if self._fail_fast and len(analyser.errors) > 0:
+            raise analyser.errors[0]
+        self._include_inner_packages(analyser)
+        return analyser
+
     def _include_inner_packages(self, analyser) -> bool:
         if self.path.endswith('.py') and self.filename != f'{constants.INIT_METHOD_ID}.py':
             return False
@@ -88,6 +88,9 @@ class UndefinedType:
     def __init__(self):
         pass
 
+    def __deepcopy__(self, memo):
+        return self
+
     @property
     def identifier(self) -> str:
         return 'undefined'
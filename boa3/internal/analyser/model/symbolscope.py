@@ -1,17 +1,24 @@
 from __future__ import annotations
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 from boa3.internal.model.symbol import ISymbol
 
 
 class SymbolScope:
-    def __init__(self, symbols: Dict[str, ISymbol] = None):
-        self._symbols = symbols.copy() if symbols is not None else {}
+    def __init__(self, symbols: Mapping[str, ISymbol] = None):
+        self._symbols: Dict[str, ISymbol] = dict(symbols) if symbols is not None else {}
+        self._symbols_snapshot: Optional[Mapping[str, ISymbol]] = None
 
     @property
-    def symbols(self) -> Dict[str, ISymbol]:
-        return self._symbols.copy()
+    def symbols(self) -> Mapping[str, ISymbol]:
+        """
+        Gets a read-only copy of the symbols in the scope. The copy is reused until the scope is changed.
+        """
+        if self._symbols_snapshot is None:
+            self._symbols_snapshot = MappingProxyType(self._symbols.copy())
+        return self._symbols_snapshot
 
     def copy(self) -> SymbolScope:
         return SymbolScope(self._symbols)
@@ -35,6 +42,7 @@ class SymbolScope:
                 symbol.set_is_reassigned()
 
         self._symbols[symbol_id] = symbol
+        self._symbols_snapshot = None
 
     def remove_symbol(self, symbol_id: str):
         """
@@ -44,6 +52,7 @@ class SymbolScope:
         """
         if symbol_id in self._symbols:
             self._symbols.pop(symbol_id)
+            self._symbols_snapshot = None
 
     def __getitem__(self, item: str) -> ISymbol:
         return self._symbols[item]
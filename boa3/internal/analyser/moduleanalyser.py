@@ -4,7 +4,7 @@ import os
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from boa3.builtin.compile_time import NeoMetadata
-from boa3.internal import constants
+from boa3.internal import constants, helpers
 from boa3.internal.analyser import asthelper
 from boa3.internal.analyser.astanalyser import IAstAnalyser
 from boa3.internal.analyser.importanalyser import ImportAnalyser
@@ -97,7 +97,7 @@ class ModuleAnalyser(IAstAnalyser, ast.NodeVisitor):
         self._scope_stack: List[SymbolScope] = []
 
         self._metadata: NeoMetadata = None
-        self._metadata_node: ast.AST = ast.parse('')
+        self._metadata_node: ast.AST = helpers.parse('')
         self._manifest_symbols: Dict[Tuple[ManifestSymbol, str, int], Callable] = {}
         self.imported_nodes: List[ast.AST] = []
 
@@ -182,6 +182,9 @@ class ModuleAnalyser(IAstAnalyser, ast.NodeVisitor):
                     elif isinstance(source_node, ast.AugAssign):
                         # augmented assignments of global variables shouldn't be evaluated in the module analyser
                         outer_symbol.set_is_reassigned()
+                    else:
+                        # the value of a global variable is known during compile time only if it's assigned once
+                        outer_symbol.reset_initial_assign()
                     self.__set_source_origin(source_node, is_module_scope)
             else:
                 if (not isinstance(source_node, ast.Global) and
@@ -272,20 +275,22 @@ class ModuleAnalyser(IAstAnalyser, ast.NodeVisitor):
                    check_raw_id: bool = False,
                    origin_node: ast.AST = None) -> Optional[ISymbol]:
         for scope in reversed(self._scope_stack):
-            if symbol_id in scope.symbols:
-                return scope.symbols[symbol_id]
+            if symbol_id in scope:
+                return scope[symbol_id]
 
             if check_raw_id:
                 found_symbol = self._search_by_raw_id(symbol_id, list(scope.symbols.values()))
                 if found_symbol is not None:
                     return found_symbol
 
-        if symbol_id in self._current_scope.symbols:
+        current_scope_symbols = self._current_scope.symbols
+        module_symbols = self._current_module.symbols
+        if symbol_id in current_scope_symbols:
             # the symbol exists in the local scope
-            return self._current_scope.symbols[symbol_id]
-        elif symbol_id in self._current_module.symbols:
+            return current_scope_symbols[symbol_id]
+        elif symbol_id in module_symbols:
             # the symbol exists in the module scope
-            return self._current_module.symbols[symbol_id]
+            return module_symbols[symbol_id]
 
         if check_raw_id:
             found_symbol = self._search_by_raw_id(symbol_id, list(self._current_scope.symbols.values()))
@@ -393,7 +398,7 @@ class ModuleAnalyser(IAstAnalyser, ast.NodeVisitor):
                 else:
                     other_instructions.append(node)
 
-            module: ast.Module = ast.parse('')
+            module: ast.Module = helpers.parse('')
             module.body = imports + [function] + other_instructions
             ast.copy_location(module, function)
             namespace = {}
@@ -806,7 +811,7 @@ class ModuleAnalyser(IAstAnalyser, ast.NodeVisitor):
                 self_argument = function.args.args[0]
                 self_annotation = self._current_class.identifier
 
-                self_ast_annotation = ast.parse(self_annotation).body[0].value
+                self_ast_annotation = helpers.parse(self_annotation).body[0].value
                 set_internal_call(self_ast_annotation)
 
                 ast.copy_location(self_ast_annotation, self_argument)
@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+__all__ = [
+    'ModuleAnalysisCache',
+]
+
+
+import copy
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from boa3.internal import constants
+from boa3.internal.compiler.compilationcontext import CompilationContext, ContextAttribute
+
+
+class ModuleAnalysisCache:
+    """
+    A cache of the analysis of the imported modules, that is shared by the compilations in the same process.
+
+    The analysis of a module is found by the real path and the content of the module, the environment and the project
+    root of the compilation. It is kept with the analysis of the modules that were imported for the first time by it,
+    as a copy that isn't changed by the compilation. Each compilation that uses the cached analysis gets its own copy
+    of it, where the builtin symbols are shared and the symbols of the modules that were already imported are the ones
+    of the compilation. The changes that the analysis made in these symbols, like the calls to an imported method, are
+    kept too and are done again when the analysis is copied, so using the cached analysis has the same result of
+    analysing the module again.
+
+    The cached analysis is used only if none of its modules was changed and if the modules it used that were already
+    imported were copied from the same cached analysis. Modules whose analysis has errors aren't cached, so they are
+    still reported. When the cache is full, the least recently used analysis is removed.
+    """
+
+    DEFAULT_MAX_SIZE = 256
+    _MAX_VARIANTS = 8
+
+    _instance: ModuleAnalysisCache = None
+    _instance_lock = threading.Lock()
+
+    # the cached modules that were copied or stored by each compilation, by their path
+    _linked_modules = ContextAttribute(dict)
+    # the modules used by each analysis that is running, from the outermost to the innermost
+    _references_stack = ContextAttribute(list)
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self._max_size = max_size
+        self._entries: OrderedDict[Hashable, List[_CachedAnalysis]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @classmethod
+    def instance(cls) -> ModuleAnalysisCache:
+        """
+        Gets the cache shared by the compilations in this process
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_analysis(self, path: str, root_folder: Optional[str], imported_files: Dict[str, Any],
+                     import_stack: List[str], log: bool, analyse: Callable[[], Any]):
+        """
+        Gets the analysis of an imported module, analysing it only if there isn't a valid one in the cache
+
+        :param path: the path of the imported module
+        :param root_folder: the root path of the project
+        :param imported_files: the modules that were already imported in the compilation. The modules that are
+                               analysed or copied from the cache are included in it.
+        :param import_stack: the paths of the modules that are importing this one
+        :param log: if the warnings of the analysis should be logged when it's found in the cache
+        :param analyse: the function that analyses the module if it's not in the cache
+        :return: the analyser of the module
+        :rtype: boa3.internal.analyser.analyser.Analyser
+        """
+        if not CompilationContext.is_any_active():
+            # the analysis is kept only for the compilations, that have their own symbols
+            return analyse()
+
+        context = CompilationContext.current()
+        key = self._get_key(path, root_folder, context)
+        if key is not None:
+            analyser = self._load(key, imported_files, import_stack, log)
+            if analyser is not None:
+                return analyser
+
+        with self._lock:
+            self.misses += 1
+
+        previous_files = dict(imported_files)
+        references: Set[str] = set()
+        self._references_stack.append(references)
+        try:
+            with context.record_changes() as changes:
+                analyser = analyse()
+        finally:
+            self._references_stack.pop()
+
+        if key is not None:
+            self._store(key, analyser, previous_files, imported_files, references, changes)
+        return analyser
+
+    def add_reference(self, path: str):
+        """
+        Includes an imported module in the modules used by the analyses that are running
+
+        :param path: the path of the module that was already imported
+        """
+        for references in self._references_stack:
+            references.add(path)
+
+    def clear(self):
+        """
+        Removes all the cached analysis
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _get_key(self, path: str, root_folder: Optional[str], context: CompilationContext) -> Optional[Hashable]:
+        digest = _get_digest(path)
+        if digest is None:
+            return None
+
+        root = os.path.realpath(root_folder) if isinstance(root_folder, str) else None
+        return os.path.realpath(path), digest, context.env, root, context.optimization_level
+
+    def _load(self, key: Hashable, imported_files: Dict[str, Any], import_stack: List[str], log: bool):
+        with self._lock:
+            entries = self._entries.get(key)
+            if entries is not None:
+                self._entries.move_to_end(key)
+                entries = entries.copy()
+        if entries is None:
+            return None
+
+        for entry in entries:
+            memo = self._get_load_memo(entry, imported_files, import_stack)
+            if memo is not None:
+                break
+        else:
+            return None
+
+        linked_modules = self._linked_modules
+        analyser, modules, changes = copy.deepcopy((entry.analyser, entry.modules, entry.changes), memo)
+        for module in set(modules.values()) | {analyser}:
+            # the modules that weren't kept with the analysis are the ones imported in this compilation
+            module._imported_files = {module_path: (imported if imported is not None
+                                                    else imported_files[module_path])
+                                      for module_path, imported in module._imported_files.items()
+                                      if imported is not None or module_path in imported_files}
+        for target, method_name, args in changes:
+            getattr(target, method_name)(*args)
+        if log:
+            logger = logging.getLogger(constants.BOA_LOGGING_NAME)
+            for module in dict.fromkeys(modules.values()):
+                for warning in module.warnings:
+                    logger.warning(warning)
+
+        imported_files.update(modules)
+        link = _LinkedAnalysis(entry, modules, memo, is_pristine_to_local=True)
+        for module_path in modules:
+            linked_modules[module_path] = link
+        for module_path in entry.references:
+            self.add_reference(module_path)
+
+        with self._lock:
+            self.hits += 1
+        return analyser
+
+    def _get_load_memo(self, entry: _CachedAnalysis, imported_files: Dict[str, Any],
+                       import_stack: List[str]) -> Optional[Dict[int, Any]]:
+        """
+        Gets the memo to copy a cached analysis in the current compilation
+
+        :return: the map from the cached objects to the ones of the compilation that the copy must use. None if the
+                 analysis can't be used in the current compilation.
+        """
+        if any(module_path in imported_files or module_path in import_stack for module_path in entry.modules):
+            # the modules are already imported or are importing this one, so they must be analysed again
+            return None
+        if any(_get_digest(file_path) != digest for file_path, digest in entry.digests.items()):
+            return None
+
+        memo = {}
+        for link in self._get_reference_links(entry.references, imported_files):
+            if link is None:
+                return None
+            memo.update(link.get_pristine_to_local())
+        return memo
+
+    def _store(self, key: Hashable, analyser, previous_files: Dict[str, Any], imported_files: Dict[str, Any],
+               references: Set[str], changes: List[Tuple[Any, str, tuple]]):
+        modules = {module_path: module for module_path, module in imported_files.items()
+                   if module_path not in previous_files}
+        analysed_modules = set(modules.values())
+        analysed_modules.add(analyser)
+        if any(not module.is_analysed or len(module.errors) > 0 for module in analysed_modules):
+            return
+
+        digests = {}
+        for module in analysed_modules:
+            digest = _get_digest(module.path)
+            if digest is None:
+                return
+            digests[module.path] = digest
+
+        references = {module_path for module_path in references if module_path not in modules}
+        links = self._get_reference_links({module_path: None for module_path in references}, imported_files)
+        if any(link is None for link in links):
+            # it uses modules that aren't cached, whose symbols can't be found in another compilation
+            return
+
+        memo = {}
+        for link in links:
+            memo.update(link.get_local_to_pristine())
+        linked_ids = set(memo)
+        for module_path, module in imported_files.items():
+            if module_path not in modules and id(module) not in memo:
+                # the modules that aren't kept are replaced by the ones of the compilation that uses the analysis
+                memo[id(module)] = None
+
+        from boa3.internal.analyser.analyser import Analyser
+        pristine_analyser, pristine_modules = copy.deepcopy((analyser, modules), memo)
+
+        # the changes in the copied symbols are already in their copies, except the ones kept by context
+        changes = [(target, method_name, args) for target, method_name, args in changes
+                   if (id(target) not in memo
+                       or id(target) in linked_ids
+                       or '_context_values' in getattr(target, '__dict__', {}))]
+        pristine_changes = copy.deepcopy(changes, memo)
+
+        if any(isinstance(copied, Analyser) and copied not in analysed_modules for copied in memo.get(id(memo), [])):
+            # other modules are reachable from the analysis, so it can't be used without them
+            return
+
+        entry = _CachedAnalysis(pristine_analyser, pristine_modules, pristine_changes, digests,
+                                {module_path: self._linked_modules[module_path].entry for module_path in references})
+        with self._lock:
+            entries = self._entries.setdefault(key, [])
+            entries.insert(0, entry)
+            # only the newest analysis of each set of modules is kept
+            entries[1:] = [other for other in entries[1:] if not entry.is_variant_of(other)][:self._MAX_VARIANTS - 1]
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+        link = _LinkedAnalysis(entry, modules, memo, is_pristine_to_local=False)
+        linked_modules = self._linked_modules
+        for module_path in modules:
+            linked_modules[module_path] = link
+
+    def _get_reference_links(self, references: Dict[str, Optional[_CachedAnalysis]],
+                             imported_files: Dict[str, Any]) -> List[Optional[_LinkedAnalysis]]:
+        """
+        Gets the cached analysis of the modules used by an analysis in the current compilation
+
+        :param references: the paths of the used modules, with the cached analysis they must be from. If it's None,
+                           any cached analysis can be used.
+        :return: the analysis of each module. The analysis is None if the module isn't from the cache.
+        """
+        links = []
+        linked_modules = self._linked_modules
+        for module_path, entry in references.items():
+            link = linked_modules.get(module_path)
+            if (link is None
+                    or (entry is not None and link.entry is not entry)
+                    or imported_files.get(module_path) is not link.modules.get(module_path)):
+                links.append(None)
+            elif link not in links:
+                links.append(link)
+        return links
+
+
+class _CachedAnalysis:
+    def __init__(self, analyser, modules: Dict[str, Any], changes: List[Tuple[Any, str, tuple]],
+                 digests: Dict[str, str], references: Dict[str, _CachedAnalysis]):
+        self.analyser = analyser
+        self.modules = modules
+        self.changes = changes
+        self.digests = digests
+        self.references = references
+
+    def is_variant_of(self, other: _CachedAnalysis) -> bool:
+        """
+        Verifies if the other analysis is of the same modules and used the same imported modules
+        """
+        return self.modules.keys() == other.modules.keys() and self.references.keys() == other.references.keys()
+
+
+class _LinkedAnalysis:
+    """
+    The modules of a compilation that were copied from or into a cached analysis, with the map between their objects
+    and the cached ones
+    """
+
+    def __init__(self, entry: _CachedAnalysis, modules: Dict[str, Any], memo: Dict[int, Any],
+                 is_pristine_to_local: bool):
+        self.entry = entry
+        self.modules = modules
+        self._memo = memo
+        self._is_pristine_to_local = is_pristine_to_local
+        self._inverse: Optional[Dict[int, Any]] = None
+
+    def get_pristine_to_local(self) -> Dict[int, Any]:
+        return self._memo if self._is_pristine_to_local else self._get_inverse()
+
+    def get_local_to_pristine(self) -> Dict[int, Any]:
+        return self._get_inverse() if self._is_pristine_to_local else self._memo
+
+    def _get_inverse(self) -> Dict[int, Any]:
+        if self._inverse is None:
+            # deepcopy keeps in the memo the objects that were copied, so they can be mapped from their copies
+            self._inverse = {id(self._memo[id(original)]): original for original in self._memo.get(id(self._memo), [])}
+        return self._inverse
+
+
+def _get_digest(path: str) -> Optional[str]:
+    try:
+        if os.path.isdir(path):
+            # the modules in a package are found by listing its directory
+            content = '\n'.join(sorted(os.listdir(path))).encode()
+        else:
+            with open(path, 'rb') as source:
+                content = source.read()
+            if os.path.basename(path) == '__init__.py':
+                content += '\n'.join(sorted(os.listdir(os.path.dirname(path)))).encode()
+    except OSError:
+        return None
+
+    return hashlib.sha256(content).hexdigest()
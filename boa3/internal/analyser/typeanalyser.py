@@ -6,6 +6,7 @@ from boa3.internal.analyser.astanalyser import IAstAnalyser
 from boa3.internal.analyser.builtinfunctioncallanalyser import BuiltinFunctionCallAnalyser
 from boa3.internal.analyser.model.optimizer import Undefined, UndefinedType
 from boa3.internal.analyser.model.symbolscope import SymbolScope
+from boa3.internal.compiler.compilationcontext import CompilationContext
 from boa3.internal.exception import CompilerError, CompilerWarning
 from boa3.internal.model.attribute import Attribute
 from boa3.internal.model.builtin.builtin import Builtin
@@ -58,6 +59,7 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
         self._scope_stack: List[SymbolScope] = []
 
         self._super_calls: List[IBuiltinMethod] = []
+        self._type_relations = CompilationContext.current().type_relations
         self.analyse_visit(self._tree)
 
     def visit(self, node: ast.AST, get_literal_value: bool = False):
@@ -460,13 +462,14 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
                         can_change_original = True
 
                     if can_change_target_type:
-                        if (not target_type.is_type_of(value_type) and
+                        if (not self._type_relations.is_type_of(target_type, value_type) and
                                 value != target_type.default_value):
                             target_type = value_type
                         self._current_scope.include_symbol(node.id, Variable(value_type),
                                                            reassign_original=can_change_original)
 
-        if not target_type.is_type_of(value_type) and not self._has_only_default_values(value, target_type):
+        if (not self._type_relations.is_type_of(target_type, value_type)
+                and not self._has_only_default_values(value, target_type)):
             if not implicit_cast:
                 self._log_error(
                     CompilerError.MismatchedTypes(
@@ -1524,7 +1527,7 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
 
     def _validate_argument_type(self, param: ast.AST, arg_type: IType, use_metatype: bool = False) -> Optional[IType]:
         param_type = self.get_type(param, use_metatype=use_metatype)
-        if arg_type.is_type_of(param_type):
+        if self._type_relations.is_type_of(arg_type, param_type):
             return param_type
         else:
             self._log_error(
@@ -1,5 +1,9 @@
+from boa3.internal.cli_commands.build_command import BuildCommand
 from boa3.internal.cli_commands.compile_command import CompileCommand
+from boa3.internal.cli_commands.serve_command import ServeCommand
 
 commands = (
     CompileCommand,
+    BuildCommand,
+    ServeCommand,
 )
@@ -0,0 +1,287 @@
+import logging
+import os
+import sys
+import time
+from argparse import _SubParsersAction
+from typing import Any, Dict, List, Optional, Tuple
+
+from boa3.internal.cli_commands.icommand import ICommand
+
+
+class BuildCommand(ICommand):
+
+    def __init__(self, main_parser: _SubParsersAction):
+        super().__init__(main_parser, 'build', 'Compiles all the smart contracts of a project')
+
+    def add_arguments_and_callback(self):
+        self.parser.add_argument("input",
+                                 type=str,
+                                 help="directory, glob pattern or .json project file with the smart contracts")
+        self.parser.add_argument("-db", "--debug",
+                                 action='store_true',
+                                 help="generates the .nefdbgnfo files")
+        self.parser.add_argument("--project-path",
+                                 type=str,
+                                 help="Project root path. Path of each contract by default.")
+        self.parser.add_argument("-e", "--env",
+                                 type=str,
+                                 help="Set the contracts environment for compiling.")
+        self.parser.add_argument("-o", "--output-dir",
+                                 type=str,
+                                 default=None,
+                                 help="Chooses the directory where the compiled files will be generated, "
+                                      "if not specified they will be generated on the same directory of each "
+                                      "python file.")
+        self.parser.add_argument("-j", "--jobs",
+                                 type=int,
+                                 default=None,
+                                 help="Number of contracts compiled at the same time. Number of processors by default.")
+        self.parser.add_argument("--no-failfast",
+                                 action='store_true',
+                                 help="Do not stop on first compile error of each contract")
+        self.parser.add_argument("--log-level",
+                                 type=str,
+                                 help="Log output level")
+        self.parser.add_argument("--cache",
+                                 action='store_true',
+                                 help="Use the cached results of the smart contracts that weren't changed")
+
+        self.parser.set_defaults(func=self.execute_command)
+
+    @staticmethod
+    def execute_command(args: dict):
+        build_input: str = args['input']
+        output_dir: Optional[str] = args['output_dir']
+        jobs: Optional[int] = args['jobs']
+        options = {
+            'debug': args['debug'],
+            'root_folder': args['project_path'],
+            'env': args['env'],
+            'fail_fast': not args['no_failfast'],
+            'log_level': args['log_level'],
+            'use_cache': args['cache']
+        }
+
+        if jobs is not None and jobs < 1:
+            logging.error("Number of jobs must be at least 1")
+            sys.exit(1)
+
+        try:
+            contracts, project_options = find_contracts(build_input)
+        except (OSError, ValueError) as e:
+            logging.error(f"Could not read the project file: {e}")
+            sys.exit(1)
+
+        if len(contracts) == 0:
+            logging.error(f"No smart contracts found in {build_input}")
+            sys.exit(1)
+
+        for option, value in project_options.items():
+            if options.get(option) is None:
+                options[option] = value
+
+        base_dir = os.path.commonpath([os.path.dirname(contract) for contract in contracts])
+        builds = [(contract, get_output_path(contract, base_dir, output_dir), options) for contract in contracts]
+        if jobs is None:
+            jobs = os.cpu_count() or 1
+        jobs = min(jobs, len(builds))
+
+        logging.info(f"Building {len(builds)} smart contract{'s' if len(builds) > 1 else ''} with {jobs} "
+                     f"worker{'s' if jobs > 1 else ''}")
+
+        start = time.perf_counter()
+        failed = []
+        for contract, succeeded, elapsed_time, records in run_builds(builds, jobs):
+            for level, logger_name, message in records:
+                logging.getLogger(logger_name if logger_name != 'root' else None).log(level, message)
+
+            contract_name = os.path.relpath(contract, base_dir)
+            if succeeded:
+                logging.info(f"Compiled {contract_name} in {elapsed_time:.2f}s")
+            else:
+                failed.append(contract_name)
+                logging.error(f"Could not compile {contract_name} ({elapsed_time:.2f}s)")
+
+        elapsed_time = time.perf_counter() - start
+        summary = (f"Built {len(builds) - len(failed)} of {len(builds)} smart contract{'s' if len(builds) > 1 else ''}"
+                   f" in {elapsed_time:.2f}s")
+        if len(failed) > 0:
+            logging.error(f"{summary}, failed: {', '.join(failed)}")
+            sys.exit(1)
+
+        logging.info(summary)
+
+
+def find_contracts(build_input: str) -> Tuple[List[str], Dict[str, Any]]:
+    """
+    Finds the smart contracts that must be compiled
+
+    :param build_input: a directory, a glob pattern or a .json project file
+    :return: the paths of the smart contracts and the compiler options set in the project file
+    """
+    import glob
+
+    if os.path.isfile(build_input) and build_input.endswith('.json'):
+        return _find_contracts_from_project(build_input)
+
+    if os.path.isdir(build_input):
+        paths = glob.glob(os.path.join(build_input, '**', '*.py'), recursive=True)
+    elif os.path.isfile(build_input):
+        return [os.path.realpath(build_input)], {}
+    else:
+        paths = glob.glob(build_input, recursive=True)
+
+    return _filter_contracts(paths), {}
+
+
+def _find_contracts_from_project(project_file: str) -> Tuple[List[str], Dict[str, Any]]:
+    """
+    Reads a project file, that is a json object with the list of the contracts paths or glob patterns, relative to the
+    project file directory, in the 'contracts' key. It can also set the 'project-path' and the 'env' options.
+    """
+    import json
+
+    with open(project_file) as file:
+        project = json.load(file)
+
+    if not isinstance(project, dict) or not isinstance(project.get('contracts'), list):
+        raise ValueError("'contracts' must be a list of paths")
+
+    project_dir = os.path.dirname(os.path.realpath(project_file))
+    contracts = []
+    for pattern in project['contracts']:
+        if not isinstance(pattern, str):
+            raise ValueError("'contracts' must be a list of paths")
+        path = os.path.join(project_dir, pattern)
+        if os.path.isfile(path):
+            contracts.append(os.path.realpath(path))
+        else:
+            contracts.extend(find_contracts(path)[0])
+
+    options = {}
+    if isinstance(project.get('project-path'), str):
+        options['root_folder'] = os.path.join(project_dir, project['project-path'])
+    if isinstance(project.get('env'), str):
+        options['env'] = project['env']
+
+    return list(dict.fromkeys(contracts)), options
+
+
+def _filter_contracts(paths: List[str]) -> List[str]:
+    contracts = []
+    for path in sorted(os.path.realpath(path) for path in paths):
+        if (os.path.isfile(path) and path.endswith('.py') and os.path.basename(path) != '__init__.py'
+                and _is_contract(path)):
+            contracts.append(path)
+    return contracts
+
+
+def _is_contract(path: str) -> bool:
+    """
+    Verifies if the file is the entry of a smart contract, that is if it has a method with the public decorator
+    """
+    import ast
+
+    try:
+        with open(path, 'rb') as source:
+            tree = ast.parse(source.read())
+    except SyntaxError:
+        # it's compiled to report the error
+        return True
+    except (OSError, ValueError):
+        return False
+
+    public_names = {'public'}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            public_names.update(alias.asname for alias in node.names if alias.name == 'public' and alias.asname)
+
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            for decorator in node.decorator_list:
+                if isinstance(decorator, ast.Call):
+                    decorator = decorator.func
+                name = decorator.attr if isinstance(decorator, ast.Attribute) else getattr(decorator, 'id', None)
+                if name in public_names:
+                    return True
+    return False
+
+
+def get_output_path(contract: str, base_dir: str, output_dir: Optional[str]) -> Optional[str]:
+    if output_dir is None:
+        return None
+
+    relative_path = os.path.relpath(contract, base_dir)
+    return os.path.join(os.path.realpath(output_dir), os.path.splitext(relative_path)[0] + '.nef')
+
+
+def run_builds(builds: List[Tuple[str, Optional[str], Dict[str, Any]]], jobs: int):
+    """
+    Compiles the contracts and yields the result of each one when it's finished
+    """
+    if jobs <= 1:
+        for build in builds:
+            yield build_contract(*build)
+        return
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from boa3.internal.compiler.compilationcontext import CompilationContext
+
+    # the compiler is loaded before the workers are created, so they don't need to build the builtin symbols again
+    mp_context = multiprocessing.get_context()
+    if mp_context.get_start_method() == 'fork':
+        CompilationContext.preload()
+    elif mp_context.get_start_method() == 'forkserver':
+        mp_context.set_forkserver_preload(['boa3.internal.compiler.compiler'])
+
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=mp_context) as executor:
+        futures = [executor.submit(build_contract, *build) for build in builds]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def build_contract(contract: str, output_path: Optional[str],
+                   options: Dict[str, Any]) -> Tuple[str, bool, float, List[Tuple[int, str, str]]]:
+    """
+    Compiles a smart contract and saves the generated files
+
+    :return: the path of the contract, if it was compiled, the compilation time and the logs of the compilation
+    """
+    from boa3.boa3 import Boa3
+    from boa3.internal.exception.NotLoadedException import NotLoadedException
+
+    # the logs are returned to be shown by the main process, so the logs of different contracts aren't mixed
+    log_handler = _LogRecordsHandler()
+    root_logger = logging.getLogger()
+    previous_handlers = root_logger.handlers
+    root_logger.handlers = [log_handler]
+
+    start = time.perf_counter()
+    try:
+        Boa3.compile_and_save(contract, output_path=output_path, show_errors=True, **options)
+        succeeded = True
+    except NotLoadedException as e:
+        if len(e.message) > 0:
+            logging.error(e.message)
+        succeeded = False
+    except Exception as e:
+        logging.exception(e)
+        succeeded = False
+    finally:
+        root_logger.handlers = previous_handlers
+
+    return contract, succeeded, time.perf_counter() - start, log_handler.records
+
+
+class _LogRecordsHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: List[Tuple[int, str, str]] = []
+
+    def emit(self, record: logging.LogRecord):
+        message = record.getMessage()
+        if record.exc_info is not None:
+            # the traceback can't be sent to the main process
+            message = f'{message}\n{logging.Formatter().formatException(record.exc_info)}'
+        self.records.append((record.levelno, record.name, message))
@@ -4,9 +4,7 @@ import sys
 from argparse import _SubParsersAction
 from typing import Optional
 
-from boa3.boa3 import Boa3
 from boa3.internal.cli_commands.icommand import ICommand
-from boa3.internal.exception.NotLoadedException import NotLoadedException
 
 
 class CompileCommand(ICommand):
@@ -40,11 +38,30 @@ class CompileCommand(ICommand):
         self.parser.add_argument("--log-level",
                                  type=str,
                                  help="Log output level")
+        self.parser.add_argument("--cache",
+                                 action='store_true',
+                                 help="Use the cached result if the smart contract and its imports weren't changed")
+        self.parser.add_argument("-w", "--watch",
+                                 action='store_true',
+                                 help="Recompile the smart contract when it or its imports are changed")
+        self.parser.add_argument("--profile",
+                                 metavar='PROFILE_OUTPUT',
+                                 type=str,
+                                 nargs='?',
+                                 const='',
+                                 default=None,
+                                 help="Saves the time, calls and memory of each compilation phase. It's saved as JSON "
+                                      "next to the .nef file by default, or in the folded stacks format used by flame "
+                                      "graph tools if the file extension is .folded or .txt.")
 
         self.parser.set_defaults(func=self.execute_command)
 
     @staticmethod
     def execute_command(args: dict):
+        # the compiler is imported only when it's used, so the other commands don't need to load it
+        from boa3.boa3 import Boa3
+        from boa3.internal.exception.NotLoadedException import NotLoadedException
+
         sc_path: str = args['input']
         project_path: str = args['project_path']
         debug: bool = args['debug']
@@ -52,6 +69,9 @@ class CompileCommand(ICommand):
         output_path: Optional[str] = args['output_path']
         fail_fast: bool = not args['no_failfast']
         log_level = args['log_level']
+        use_cache: bool = args['cache']
+        watch: bool = args['watch']
+        profile_path: Optional[str] = args['profile']
 
         if not sc_path.endswith(".py") or not os.path.isfile(sc_path):
             logging.error("Input file is not .py")
@@ -67,6 +87,17 @@ class CompileCommand(ICommand):
 
             path, filename = os.path.split(os.path.realpath(output_path))
 
+        if profile_path is not None:
+            if watch:
+                logging.error("Profiling can't be used with --watch")
+                sys.exit(1)
+            if len(profile_path) == 0:
+                profile_path = os.path.join(path, os.path.splitext(filename)[0] + '.profile.json')
+
+        if watch:
+            CompileCommand._watch(sc_path, output_path, project_path, debug, env, fail_fast, log_level, path, filename)
+            return
+
         try:
             Boa3.compile_and_save(sc_path,
                                   output_path=output_path,
@@ -75,9 +106,13 @@ class CompileCommand(ICommand):
                                   env=env,
                                   fail_fast=fail_fast,
                                   show_errors=True,
-                                  log_level=log_level
+                                  log_level=log_level,
+                                  use_cache=use_cache,
+                                  profile_path=profile_path
                                   )
             logging.info(f"Wrote {filename.replace('.py', '.nef')} to {path}")
+            if profile_path is not None:
+                logging.info(f"Wrote profile to {profile_path}")
         except NotLoadedException as e:
             error_message = e.message
             log_error = 'Could not compile'
@@ -89,3 +124,33 @@ class CompileCommand(ICommand):
         except Exception as e:
             logging.exception(e)
             sys.exit(1)
+
+    @staticmethod
+    def _watch(sc_path: str, output_path: Optional[str], project_path: str, debug: bool, env: str, fail_fast: bool,
+               log_level: str, path: str, filename: str):
+        from boa3.boa3 import Boa3
+        from boa3.internal.exception.NotLoadedException import NotLoadedException
+
+        def log_compilation(_, error: Optional[Exception]):
+            if error is None:
+                logging.info(f"Wrote {filename.replace('.py', '.nef')} to {path}")
+            elif isinstance(error, NotLoadedException):
+                log_error = 'Could not compile'
+                if len(error.message) > 0:
+                    log_error += f': {error.message}'
+                logging.error(log_error)
+            logging.info("Watching for file changes")
+
+        try:
+            Boa3.watch(sc_path,
+                       output_path=output_path,
+                       debug=debug,
+                       root_folder=project_path,
+                       env=env,
+                       fail_fast=fail_fast,
+                       show_errors=True,
+                       log_level=log_level,
+                       on_compile=log_compilation
+                       )
+        except KeyboardInterrupt:
+            logging.info("Stopped watching")
@@ -0,0 +1,59 @@
+import logging
+import sys
+from argparse import _SubParsersAction
+
+from boa3.internal.cli_commands.icommand import ICommand
+
+
+class ServeCommand(ICommand):
+
+    def __init__(self, main_parser: _SubParsersAction):
+        super().__init__(main_parser, 'serve', 'Keeps the compiler running to compile the requested smart contracts')
+
+    def add_arguments_and_callback(self):
+        self.parser.add_argument("--socket",
+                                 type=str,
+                                 default=None,
+                                 help="Path of the Unix socket where the requests are received. "
+                                      "If not specified, the requests are read from the standard input and the "
+                                      "responses are written to the standard output.")
+        self.parser.add_argument("-j", "--jobs",
+                                 type=int,
+                                 default=None,
+                                 help="Number of requests compiled at the same time. Number of processors by default.")
+        self.parser.add_argument("--cache",
+                                 action='store_true',
+                                 help="Use the cached results of the smart contracts that weren't changed")
+
+        self.parser.set_defaults(func=self.execute_command)
+
+    @staticmethod
+    def execute_command(args: dict):
+        from boa3.internal.compiler.compilationserver import CompilationServer
+
+        socket_path: str = args['socket']
+        jobs: int = args['jobs']
+        use_cache: bool = args['cache']
+
+        if jobs is not None and jobs < 1:
+            logging.error("Number of jobs must be at least 1")
+            sys.exit(1)
+
+        server = CompilationServer(jobs=jobs, use_cache=use_cache)
+        try:
+            if socket_path is not None:
+                logging.info(f"Listening on {socket_path}")
+                server.serve_unix_socket(socket_path)
+            else:
+                # the standard output is used only by the responses, anything else that is printed goes to stderr
+                output = sys.stdout
+                sys.stdout = sys.stderr
+                try:
+                    server.serve_stream(sys.stdin, output)
+                finally:
+                    sys.stdout = output
+        except KeyboardInterrupt:
+            pass
+        except OSError as e:
+            logging.error(e)
+            sys.exit(1)
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+__all__ = [
+    'CodeBlock',
+    'CodeBlockGraph'
+]
+
+from typing import Dict, Iterable, List, Optional
+
+from boa3.internal.neo.vm.CallCode import CallCode
+from boa3.internal.neo.vm.TryCode import TryCode
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode import OpcodeHelper
+from boa3.internal.neo.vm.opcode.OpcodeInformation import OpcodeInformation
+
+
+class CodeBlock:
+    """
+    A basic block of instructions, that are always executed from the first to the last one.
+
+    The block works as a label: the jumps target the block instead of its first instruction, so the instructions in it
+    can be removed or replaced without updating the jumps.
+    """
+
+    def __init__(self, label: int):
+        self.label: int = label
+        self.codes: List[VMCode] = []
+        # the block after this one in the bytecode
+        self.next_block: Optional[CodeBlock] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.codes) == 0
+
+    def __repr__(self) -> str:
+        return 'CodeBlock({0}, {1} codes)'.format(self.label, len(self.codes))
+
+
+class CodeBlockGraph:
+    """
+    Splits the instructions in basic blocks, so they can be changed without updating the bytecode addresses.
+
+    The jumps target the blocks by label, and a label of a block whose instructions were all removed targets the next
+    block with instructions. The addresses are only computed again when the graph is linearized, after all the changes
+    are done. The targets of calls and try instructions are kept as instructions, so those targets must not be removed.
+    """
+
+    def __init__(self, codes: Iterable[VMCode]):
+        """
+        :param codes: the instructions in the order they are in the bytecode
+        """
+        self._first_block: Optional[CodeBlock] = None
+        self._blocks_count: int = 0
+        self._code_blocks: Dict[VMCode, CodeBlock] = {}
+        self._jump_labels: Dict[VMCode, CodeBlock] = {}
+
+        self._build(list(codes))
+
+    @property
+    def blocks(self) -> List[CodeBlock]:
+        blocks = []
+        block = self._first_block
+        while block is not None:
+            blocks.append(block)
+            block = block.next_block
+        return blocks
+
+    @property
+    def codes(self) -> List[VMCode]:
+        """
+        Gets the instructions in the order they will be in the bytecode
+        """
+        return [code for block in self.blocks for code in block.codes]
+
+    def get_block(self, code: VMCode) -> Optional[CodeBlock]:
+        """
+        Gets the block that includes the given instruction
+
+        :return: the block if the instruction is in the graph. None otherwise
+        """
+        return self._code_blocks.get(code)
+
+    def get_target(self, code: VMCode) -> Optional[VMCode]:
+        """
+        Gets the instruction that the given instruction targets
+
+        :return: the first instruction of the targeted block, or of the first block after it if it's empty. If the
+                 instruction doesn't have a target, returns None
+        """
+        if code not in self._jump_labels:
+            return code.target
+
+        block = self._jump_labels[code]
+        while block is not None and block.is_empty:
+            block = block.next_block
+        return block.codes[0] if block is not None else None
+
+    def get_next_code(self, code: VMCode) -> Optional[VMCode]:
+        """
+        Gets the instruction that is after the given one in the bytecode
+
+        :return: the next instruction if there's one. None otherwise
+        """
+        block = self._code_blocks.get(code)
+        if block is None:
+            return None
+
+        index = block.codes.index(code) + 1
+        if index < len(block.codes):
+            return block.codes[index]
+
+        block = block.next_block
+        while block is not None and block.is_empty:
+            block = block.next_block
+        return block.codes[0] if block is not None else None
+
+    def get_codes(self, first_code: VMCode, last_code: VMCode) -> List[VMCode]:
+        """
+        Gets the instructions from the first to the last given instructions, including both
+
+        :return: the instructions in the order they are in the bytecode. If the last instruction isn't after the first
+                 one, returns the instructions until the end
+        """
+        codes = []
+        code = first_code if first_code in self._code_blocks else None
+        while code is not None:
+            codes.append(code)
+            if code is last_code:
+                break
+            code = self.get_next_code(code)
+        return codes
+
+    def set_target(self, code: VMCode, target: VMCode):
+        """
+        Changes the target of a jump. If the target isn't the first instruction of a block, its block is split.
+        """
+        if (code not in self._code_blocks or isinstance(code, (CallCode, TryCode))
+                or not OpcodeHelper.has_target(code.opcode) or target not in self._code_blocks):
+            return
+
+        self._jump_labels[code] = self._get_label(target)
+
+    def replace_code(self, code: VMCode, new_codes: List[VMCode]):
+        """
+        Replaces an instruction with a sequence of instructions. The jumps to the replaced instruction target the first
+        new instruction, and the targets of the new jumps must be set with `set_target`.
+        """
+        block = self._code_blocks.pop(code, None)
+        if block is None:
+            return
+        self._jump_labels.pop(code, None)
+
+        index = block.codes.index(code)
+        block.codes[index:index + 1] = new_codes
+        for new_code in new_codes:
+            self._code_blocks[new_code] = block
+
+        # the blocks are split after the new instructions that end a block, so all the blocks are still basic blocks
+        for new_code in new_codes:
+            if OpcodeHelper.ends_basic_block(new_code.opcode):
+                next_code = self.get_next_code(new_code)
+                if next_code is not None:
+                    self._get_label(next_code)
+
+    def update_code(self, code: VMCode, opcode: OpcodeInformation, data: bytes = bytes()):
+        """
+        Updates the information from an instruction in the graph. The addresses aren't updated until it's linearized.
+
+        :param code: code to be updated
+        :param opcode: updated opcode information
+        :param data: updated opcode data
+        """
+        code._info = opcode
+        code._data = data
+
+    def remove_codes(self, codes: Iterable[VMCode]):
+        """
+        Removes the given instructions. The jumps to them target the next instruction that is kept instead.
+        """
+        changed_blocks = {}
+        for code in codes:
+            block = self._code_blocks.pop(code, None)
+            if block is not None:
+                changed_blocks.setdefault(block, set()).add(code)
+            self._jump_labels.pop(code, None)
+
+        for block, removed_codes in changed_blocks.items():
+            block.codes = [code for code in block.codes if code not in removed_codes]
+
+    def linearize(self) -> List[VMCode]:
+        """
+        Sets the jumps targets to the instructions they target in the graph
+
+        :return: the instructions in the order they must be in the bytecode
+        """
+        for code in self._jump_labels:
+            code.set_target(self.get_target(code))
+        return self.codes
+
+    def _build(self, codes: List[VMCode]):
+        if len(codes) == 0:
+            return
+
+        leaders = {codes[0]}
+        jumps = []
+        for index, code in enumerate(codes):
+            opcode = code.opcode
+            if not OpcodeHelper.has_target(opcode):
+                pass
+            elif isinstance(code, TryCode):
+                leaders.update(handler for handler in (code.except_start_code, code.finally_start_code)
+                               if handler is not None)
+            elif code.target is not None:
+                leaders.add(code.target)
+                if not isinstance(code, CallCode):
+                    jumps.append(code)
+
+            if OpcodeHelper.ends_basic_block(opcode) and index + 1 < len(codes):
+                leaders.add(codes[index + 1])
+
+        block = None
+        for code in codes:
+            if code in leaders:
+                previous_block = block
+                block = self._new_block()
+                if previous_block is None:
+                    self._first_block = block
+                else:
+                    previous_block.next_block = block
+            block.codes.append(code)
+            self._code_blocks[code] = block
+
+        for code in jumps:
+            if code.target in self._code_blocks:
+                self._jump_labels[code] = self._code_blocks[code.target]
+
+    def _get_label(self, code: VMCode) -> CodeBlock:
+        """
+        Gets the block that starts with the given instruction, splitting the block that includes it if needed
+        """
+        block = self._code_blocks[code]
+        index = block.codes.index(code)
+        if index == 0:
+            return block
+
+        new_block = self._new_block()
+        new_block.codes = block.codes[index:]
+        block.codes = block.codes[:index]
+        for moved_code in new_block.codes:
+            self._code_blocks[moved_code] = new_block
+
+        new_block.next_block = block.next_block
+        block.next_block = new_block
+        return new_block
+
+    def _new_block(self) -> CodeBlock:
+        block = CodeBlock(self._blocks_count)
+        self._blocks_count += 1
+        return block
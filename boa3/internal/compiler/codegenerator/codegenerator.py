@@ -5,7 +5,7 @@ __all__ = [
 
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
-from boa3.internal import constants
+from boa3.internal import constants, helpers
 from boa3.internal.analyser.analyser import Analyser
 from boa3.internal.analyser.model.symbolscope import SymbolScope
 from boa3.internal.compiler import codegenerator
@@ -13,7 +13,9 @@ from boa3.internal.compiler.codegenerator import optimizerhelper
 from boa3.internal.compiler.codegenerator.codeoptimizer import CodeOptimizer
 from boa3.internal.compiler.codegenerator.engine.stackmemento import NeoStack, StackMemento
 from boa3.internal.compiler.codegenerator.optimizerhelper import OptimizationLevel
+from boa3.internal.compiler.codegenerator.symboltable import SymbolTable
 from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
+from boa3.internal.compiler.compilationprofiler import CompilationProfiler
 from boa3.internal.compiler.compileroutput import CompilerOutput
 from boa3.internal.model.builtin.builtin import Builtin
 from boa3.internal.model.builtin.builtincallable import IBuiltinCallable
@@ -28,6 +30,7 @@ from boa3.internal.model.operation.binaryop import BinaryOp
 from boa3.internal.model.operation.operation import IOperation
 from boa3.internal.model.operation.unaryop import UnaryOp
 from boa3.internal.model.property import Property
+from boa3.internal.model.scopechain import ScopeChain
 from boa3.internal.model.symbol import ISymbol
 from boa3.internal.model.type.classes.classtype import ClassType
 from boa3.internal.model.type.classes.contractinterfaceclass import ContractInterfaceClass
@@ -74,77 +77,78 @@ class CodeGenerator:
 
         from boa3.internal.exception.CompilerError import CompilerError
 
-        try:
-            import ast
-            from boa3.internal.compiler.codegenerator.codegeneratorvisitor import VisitorCodeGenerator
+        with CompilationProfiler.phase('VisitorCodeGenerator'):
+            try:
+                import ast
+                from boa3.internal.compiler.codegenerator.codegeneratorvisitor import VisitorCodeGenerator
 
-            deploy_method = (analyser.symbol_table[constants.DEPLOY_METHOD_ID]
-                             if constants.DEPLOY_METHOD_ID in analyser.symbol_table
-                             else None)
-            deploy_origin_module = analyser.ast_tree
+                deploy_method = (analyser.symbol_table[constants.DEPLOY_METHOD_ID]
+                                 if constants.DEPLOY_METHOD_ID in analyser.symbol_table
+                                 else None)
+                deploy_origin_module = analyser.ast_tree
 
-            if hasattr(deploy_method, 'origin') and deploy_method.origin in analyser.ast_tree.body:
-                analyser.ast_tree.body.remove(deploy_method.origin)
+                if hasattr(deploy_method, 'origin') and deploy_method.origin in analyser.ast_tree.body:
+                    analyser.ast_tree.body.remove(deploy_method.origin)
 
-            visitor = VisitorCodeGenerator(generator, analyser.filename, analyser.root)
-            visitor._root_module = analyser.ast_tree
-            visitor.visit_and_update_analyser(analyser.ast_tree, analyser)
+                visitor = VisitorCodeGenerator(generator, analyser.filename, analyser.root)
+                visitor._root_module = analyser.ast_tree
+                visitor.visit_and_update_analyser(analyser.ast_tree, analyser)
 
-            analyser.update_symbol_table(generator.symbol_table)
-            generator.symbol_table.clear()
-            generator.symbol_table.update(analyser.symbol_table.copy())
+                analyser.update_symbol_table(generator.symbol_table)
+                generator.symbol_table.clear()
+                generator.symbol_table.update(analyser.symbol_table.copy())
 
-            for symbol in all_imports.values():
-                generator.symbol_table.update(symbol.all_symbols)
+                for symbol in all_imports.values():
+                    generator.symbol_table.update(symbol.all_symbols)
 
-                if hasattr(deploy_method, 'origin') and deploy_method.origin in symbol.ast.body:
-                    symbol.ast.body.remove(deploy_method.origin)
-                    deploy_origin_module = symbol.ast
+                    if hasattr(deploy_method, 'origin') and deploy_method.origin in symbol.ast.body:
+                        symbol.ast.body.remove(deploy_method.origin)
+                        deploy_origin_module = symbol.ast
 
-                visitor.set_filename(symbol.origin)
-                visitor.visit_and_update_analyser(symbol.ast, analyser)
+                    visitor.set_filename(symbol.origin)
+                    visitor.visit_and_update_analyser(symbol.ast, analyser)
 
-                analyser.update_symbol_table(symbol.all_symbols)
-                generator.symbol_table.clear()
-                generator.symbol_table.update(analyser.symbol_table.copy())
+                    analyser.update_symbol_table(symbol.all_symbols)
+                    generator.symbol_table.clear()
+                    generator.symbol_table.update(analyser.symbol_table.copy())
 
-            if len(generator._globals) > 0:
-                from boa3.internal.compiler.codegenerator.initstatementsvisitor import InitStatementsVisitor
-                deploy_stmts, static_stmts = InitStatementsVisitor.separate_global_statements(analyser.symbol_table,
-                                                                                              visitor.global_stmts)
+                if len(generator._globals) > 0:
+                    from boa3.internal.compiler.codegenerator.initstatementsvisitor import InitStatementsVisitor
+                    deploy_stmts, static_stmts = InitStatementsVisitor.separate_global_statements(analyser.symbol_table,
+                                                                                                  visitor.global_stmts)
 
-                deploy_method = deploy_method if deploy_method is not None else InnerDeployMethod.instance().copy()
+                    deploy_method = deploy_method if deploy_method is not None else InnerDeployMethod.instance().copy()
 
-                if len(deploy_stmts) > 0:
-                    if_update_body = ast.parse(f"if not {list(deploy_method.args)[1]}: pass").body[0]
-                    if_update_body.body = deploy_stmts
-                    if_update_body.test.op = UnaryOp.Not
-                    deploy_method.origin.body.insert(0, if_update_body)
+                    if len(deploy_stmts) > 0:
+                        if_update_body = helpers.parse(f"if not {list(deploy_method.args)[1]}: pass").body[0]
+                        if_update_body.body = deploy_stmts
+                        if_update_body.test.op = UnaryOp.Not
+                        deploy_method.origin.body.insert(0, if_update_body)
 
-                visitor.global_stmts = static_stmts
+                    visitor.global_stmts = static_stmts
 
-            if hasattr(deploy_method, 'origin'):
-                deploy_ast = ast.parse("")
-                deploy_ast.body = [deploy_method.origin]
+                if hasattr(deploy_method, 'origin'):
+                    deploy_ast = helpers.parse("")
+                    deploy_ast.body = [deploy_method.origin]
 
-                generator.symbol_table[constants.DEPLOY_METHOD_ID] = deploy_method
-                analyser.symbol_table[constants.DEPLOY_METHOD_ID] = deploy_method
-                visitor._tree = deploy_origin_module
-                visitor.visit_and_update_analyser(deploy_ast, analyser)
+                    generator.symbol_table[constants.DEPLOY_METHOD_ID] = deploy_method
+                    analyser.symbol_table[constants.DEPLOY_METHOD_ID] = deploy_method
+                    visitor._tree = deploy_origin_module
+                    visitor.visit_and_update_analyser(deploy_ast, analyser)
 
-                generator.symbol_table.clear()
-                generator.symbol_table.update(analyser.symbol_table.copy())
+                    generator.symbol_table.clear()
+                    generator.symbol_table.update(analyser.symbol_table.copy())
 
-            visitor.set_filename(analyser.filename)
-            generator.can_init_static_fields = True
-            if len(visitor.global_stmts) > 0:
-                global_ast = ast.parse("")
-                global_ast.body = visitor.global_stmts
-                visitor.visit_and_update_analyser(global_ast, analyser)
-                generator.initialized_static_fields = True
+                visitor.set_filename(analyser.filename)
+                generator.can_init_static_fields = True
+                if len(visitor.global_stmts) > 0:
+                    global_ast = helpers.parse("")
+                    global_ast.body = visitor.global_stmts
+                    visitor.visit_and_update_analyser(global_ast, analyser)
+                    generator.initialized_static_fields = True
 
-        except CompilerError:
-            pass
+            except CompilerError:
+                pass
 
         analyser.update_symbol_table(generator.symbol_table)
         if optimization_level > OptimizationLevel.NONE:
@@ -175,7 +179,7 @@ class CodeGenerator:
                  optimization_level: OptimizationLevel = OptimizationLevel.DEFAULT
                  ):
 
-        self.symbol_table: Dict[str, ISymbol] = symbol_table.copy()
+        self.symbol_table: SymbolTable = SymbolTable(symbol_table)
         self._optimization_level = (optimization_level
                                     if isinstance(optimization_level, OptimizationLevel)
                                     else OptimizationLevel.DEFAULT)
@@ -183,6 +187,8 @@ class CodeGenerator:
 
         self._current_method: Method = None
         self._current_class: Method = None
+        # all the methods included in the bytecode, mapped by their ids, so it doesn't depend on the symbol tables
+        self._generated_methods: Dict[int, Method] = {}
 
         self._missing_target: Dict[int, List[VMCode]] = {}  # maps targets with address not included yet
         self._can_append_target: bool = True
@@ -206,6 +212,8 @@ class CodeGenerator:
 
         self._static_vars: Optional[list] = None
         self._global_vars: Optional[list] = None
+        # maps if the variables are modified to the symbol table version, the variables ids and their indexes
+        self._module_variables_layout: Dict[bool, Tuple[Tuple[int, bool], List[str], Dict[str, int]]] = {}
 
     @property
     def bytecode(self) -> bytes:
@@ -236,8 +244,9 @@ class CodeGenerator:
     def get_optimized_output(self, optimization_level: OptimizationLevel) -> CompilerOutput:
         self._remove_opcodes_without_target()
 
-        optimizer = CodeOptimizer(symbol_table=self.symbol_table)
-        optimizer.optimize(optimization_level)
+        optimizer = CodeOptimizer(symbol_table=self.symbol_table, methods=list(self._generated_methods.values()))
+        with CompilationProfiler.phase('CodeOptimizer'):
+            optimizer.optimize(optimization_level)
 
         return VMCodeMapping.instance().result()
 
@@ -321,12 +330,39 @@ class CodeGenerator:
     def _statics(self) -> List[str]:
         return self._module_variables(False)
 
+    @property
+    def _static_slots(self) -> Dict[str, int]:
+        """
+        Gets the index of the static slot of each static variable
+
+        :return: A dictionary that maps the variables names to their slot indexes
+        """
+        self._module_variables(False)
+        return self._module_variables_layout[False][2]
+
     def _module_variables(self, modified_variable: bool) -> List[str]:
         """
         Gets a list with the variables name in the global scope
 
+        The list is computed again only if the symbol table has changed since the last access
+
         :return: A list with the variables names
         """
+        layout_key = (self.symbol_table.version, self.can_init_static_fields)
+        if modified_variable in self._module_variables_layout:
+            last_key, variables_ids, _ = self._module_variables_layout[modified_variable]
+            if last_key == layout_key:
+                return variables_ids
+
+        variables_ids = self._get_module_variables(modified_variable)
+        variables_indexes = {}
+        for index, var_id in enumerate(variables_ids):
+            variables_indexes.setdefault(var_id, index)
+
+        self._module_variables_layout[modified_variable] = (layout_key, variables_ids, variables_indexes)
+        return variables_ids
+
+    def _get_module_variables(self, modified_variable: bool) -> List[str]:
         if modified_variable:
             vars_map = self._global_vars
         else:
@@ -458,9 +494,10 @@ class CodeGenerator:
         :param identifier: id of the symbol
         :return: the symbol if exists. Symbol None otherwise
         """
-        cur_symbol_table = self.symbol_table.copy()
         if isinstance(self.additional_symbols, dict):
-            cur_symbol_table.update(self.additional_symbols)
+            cur_symbol_table = ScopeChain(self.additional_symbols, self.symbol_table)
+        else:
+            cur_symbol_table = self.symbol_table
 
         found_id = None
         found_symbol = None
@@ -471,12 +508,14 @@ class CodeGenerator:
                     break
 
         if found_id is None:
-            if scope is not None and hasattr(scope, 'symbols') and isinstance(scope.symbols, dict):
-                if identifier in scope.symbols and isinstance(scope.symbols[identifier], ISymbol):
-                    found_id, found_symbol = identifier, scope.symbols[identifier]
+            if scope is not None and hasattr(scope, 'symbols') and isinstance(scope.symbols, (dict, ScopeChain)):
+                scope_symbols = scope.symbols
+                if identifier in scope_symbols and isinstance(scope_symbols[identifier], ISymbol):
+                    found_id, found_symbol = identifier, scope_symbols[identifier]
             else:
-                if self._current_method is not None and identifier in self._current_method.symbols:
-                    found_id, found_symbol = identifier, self._current_method.symbols[identifier]
+                method_symbols = self._current_method.symbols if self._current_method is not None else None
+                if method_symbols is not None and identifier in method_symbols:
+                    found_id, found_symbol = identifier, method_symbols[identifier]
                 elif identifier in cur_symbol_table:
                     found_id, found_symbol = identifier, cur_symbol_table[identifier]
                 else:
@@ -508,7 +547,7 @@ class CodeGenerator:
                                 found_id = identifier
 
         if found_id is not None:
-            if isinstance(found_symbol, Variable) and not found_symbol.is_reassigned and found_id not in self._statics:
+            if isinstance(found_symbol, Variable) and not found_symbol.is_reassigned and found_id not in self._static_slots:
                 # verifies if it's a static variable with a unique name
                 for static_id, static_var in self._static_vars:
                     if found_symbol == static_var:
@@ -542,6 +581,7 @@ class CodeGenerator:
 
             init_method = Method(is_public=True)
             init_method.init_bytecode = self.last_code
+            self._generated_methods[id(init_method)] = init_method
             self.symbol_table[constants.INITIALIZE_METHOD_ID] = init_method
 
         return num_static_fields > 0
@@ -570,6 +610,7 @@ class CodeGenerator:
         num_vars: int = len(method.locals)
 
         method.init_address = VMCodeMapping.instance().bytecode_size
+        self._generated_methods[id(method)] = method
         if num_args > 0 or num_vars > 0:
             init_data = bytearray([num_vars, num_args])
             self.__insert1(OpcodeInfo.INITSLOT, init_data)
@@ -1738,8 +1779,8 @@ class CodeGenerator:
             is_arg = False
             local: bool = True
             scope = self._locals
-        elif var_id in self._statics:
-            scope = self._statics
+        elif var_id in self._static_slots:
+            return self._static_slots[var_id], local, is_arg
 
         if scope is not None:
             index: int = scope.index(var_id) if var_id in scope else -1
@@ -1946,7 +1987,7 @@ class CodeGenerator:
         """
         start_address = self.bytecode_size
 
-        if symbol_id in self._statics:
+        if symbol_id in self._static_slots:
             self.convert_load_variable(symbol_id, Variable(class_type))
         else:
             # TODO: change to create an array with the class variables' default values when they are implemented #2kq1vgn
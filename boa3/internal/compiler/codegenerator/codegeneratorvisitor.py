@@ -3,7 +3,7 @@ import os.path
 from inspect import isclass
 from typing import Dict, List, Optional
 
-from boa3.internal import constants
+from boa3.internal import constants, helpers
 from boa3.internal.analyser.astanalyser import IAstAnalyser
 from boa3.internal.compiler.codegenerator.codegenerator import CodeGenerator
 from boa3.internal.compiler.codegenerator.generatordata import GeneratorData
@@ -38,7 +38,7 @@ class VisitorCodeGenerator(IAstAnalyser):
     """
 
     def __init__(self, generator: CodeGenerator, filename: str = None, root: str = None):
-        super().__init__(ast.parse(""), filename=filename, root_folder=root, log=True, fail_fast=True)
+        super().__init__(helpers.parse(""), filename=filename, root_folder=root, log=True, fail_fast=True)
 
         self.generator = generator
         self.current_method: Optional[Method] = None
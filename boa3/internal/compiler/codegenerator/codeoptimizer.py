@@ -2,16 +2,32 @@ __all__ = [
     'CodeOptimizer'
 ]
 
+from boa3.internal.compiler.codegenerator.codeblockgraph import CodeBlockGraph
 from boa3.internal.compiler.codegenerator.engine.executionscript import ExecutionScript
 from boa3.internal.compiler.codegenerator.engine.neoengine import NeoEngine
+from boa3.internal.compiler.codegenerator.methodinliner import MethodInliner
 from boa3.internal.compiler.codegenerator.optimizerhelper import OptimizationLevel
+from boa3.internal.compiler.codegenerator.peepholeoptimizer import PeepholeOptimizer
 from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
 from boa3.internal.model.method import Method
 from boa3.internal.model.symbol import ISymbol
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+from boa3.internal.neo.vm.type.StackItem import StackItemType
+
+
+# the max size in bytes of the methods that are inlined on the highest optimization level
+DEFAULT_INLINE_MAX_SIZE = 16
 
 
 class CodeOptimizer:
-    def __init__(self, symbol_table: dict[str, ISymbol]):
+    def __init__(self, symbol_table: dict[str, ISymbol], methods: list[Method] = None,
+                 inline_max_size: int = DEFAULT_INLINE_MAX_SIZE):
+        """
+        :param symbol_table: the symbols of the compiled code
+        :param methods: all the methods included in the bytecode, including the ones from imported modules
+        :param inline_max_size: the max size in bytes of the body of the methods that are inlined
+        """
         if isinstance(symbol_table, dict):
             # works with a copy to prevent changes on the original symbol table
             symbol_table = symbol_table.copy()
@@ -19,17 +35,93 @@ class CodeOptimizer:
             symbol_table = {}
 
         self.symbol_table = symbol_table
+        self.methods: list[Method] = methods if isinstance(methods, list) else []
+        self.statistics: dict[str, int] = {}
+        self.inline_max_size: int = inline_max_size
         self._map_instance = VMCodeMapping.instance()
 
     def optimize(self, optimization_level: OptimizationLevel = OptimizationLevel.DEFAULT):
+        entry_points = self._get_entry_points()
         engine = NeoEngine()
-        engine.load_script(ExecutionScript.from_code_map(self._map_instance))
+        engine.load_script(ExecutionScript.from_code_map(self._map_instance), entry_points)
 
         executed_instructions_addresses = set()
 
-        # executed the methods to check if there are opcodes that are not executed
-        for method in self.symbol_table.values():
-            if isinstance(method, Method) and method.is_public:
-                executed_instructions = engine.execute(method.start_address)
+        # executes the methods to check if there are opcodes that are not executed
+        for entry_point in entry_points:
+            executed_instructions = engine.execute(entry_point)
+
+            executed_instructions_addresses.update(executed_instructions)
+
+        if optimization_level > OptimizationLevel.NONE:
+            known_types = self._get_known_types(engine)
+
+            # the instructions are changed in a graph of blocks, so the addresses are computed only once in the end
+            graph = CodeBlockGraph(self._map_instance.codes)
+            self._remove_unreachable_codes(graph, executed_instructions_addresses)
+
+            if optimization_level >= OptimizationLevel.HIGH:
+                # the calls to small methods are replaced by their code, so the peephole can optimize them too
+                method_inliner = MethodInliner(graph, self.methods, max_size=self.inline_max_size)
+                self.statistics.update(method_inliner.inline())
+
+            # on debug, the first instruction of each statement is kept, so the debugger can stop in all of them
+            peephole_optimizer = PeepholeOptimizer(graph, self.methods,
+                                                   keep_sequence_points=optimization_level <= OptimizationLevel.DEBUG,
+                                                   known_types=known_types)
+            self.statistics.update(peephole_optimizer.optimize())
+
+            self._map_instance.set_codes(graph.linearize())
+
+    def _get_entry_points(self) -> list[int]:
+        methods = self.methods + [symbol for symbol in self.symbol_table.values()
+                                  if isinstance(symbol, Method) and symbol.is_public]
+
+        entry_points = []
+        for method in methods:
+            if method.init_bytecode is not None and method.start_address not in entry_points:
+                entry_points.append(method.start_address)
+        return entry_points
+
+    def _get_known_types(self, engine: NeoEngine) -> dict[VMCode, StackItemType]:
+        """
+        Gets the type of the converted value in the conversions where it's known at compile time
+        """
+        known_types = {}
+        for address, code in zip(self._map_instance.code_map.addresses, self._map_instance.codes):
+            if code.opcode is not Opcode.CONVERT:
+                continue
+
+            state = engine.get_method_state(address)
+            if state is None or not state.is_balanced:
+                continue
+
+            stack = engine.get_stack(address)
+            if stack and stack[-1].type is not StackItemType.Any:
+                known_types[code] = stack[-1].type
+
+        return known_types
+
+    def _remove_unreachable_codes(self, graph: CodeBlockGraph, executed_instructions_addresses: set[int]):
+        """
+        Removes the instructions that can't be executed from any of the methods
+        """
+        kept_codes = set()
+        for method in self.methods:
+            kept_codes.update(code for code in (method.init_bytecode, method.end_bytecode) if code is not None)
+
+        # the jumps to a removed code target the next code that is kept, so the codes after the last kept one stay
+        unreachable_codes = []
+        not_executed = []
+        for address, code in zip(self._map_instance.code_map.addresses, self._map_instance.codes):
+            if address in executed_instructions_addresses or code in kept_codes:
+                unreachable_codes.extend(not_executed)
+                not_executed.clear()
+            else:
+                not_executed.append(code)
 
-                executed_instructions_addresses.update(executed_instructions)
+        if len(unreachable_codes) > 0:
+            graph.remove_codes(unreachable_codes)
+            for method in self.methods:
+                method.remove_instruction_codes(unreachable_codes)
+            self.statistics['unreachable code'] = len(unreachable_codes)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+__all__ = [
+    'BasicBlock',
+    'ControlFlowGraph'
+]
+
+
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional
+
+from boa3.internal.compiler.codegenerator.engine.executionscript import ExecutionScript
+from boa3.internal.neo.vm.TryCode import TryCode
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode import OpcodeHelper
+
+
+class BasicBlock:
+    """
+    A sequence of instructions that are always executed from the first to the last one, since only the first one can
+    be the target of a jump and only the last one can jump.
+
+    The calls don't split the blocks, because the execution continues in the next instruction after the called method
+    returns.
+    """
+
+    def __init__(self, start_address: int):
+        self.start_address: int = start_address
+        self.addresses: List[int] = []
+
+        self.jump_address: Optional[int] = None
+        self.next_address: Optional[int] = None
+        self.except_address: Optional[int] = None
+        self.finally_address: Optional[int] = None
+
+    @property
+    def last_address(self) -> int:
+        return self.addresses[-1]
+
+    @property
+    def successors(self) -> List[int]:
+        """
+        Gets the addresses of the blocks that can be executed after this one
+        """
+        return [address for address in (self.jump_address, self.next_address, self.except_address,
+                                        self.finally_address)
+                if address is not None]
+
+
+class ControlFlowGraph:
+    """
+    Splits the instructions of a script in basic blocks, linked by the jumps between them
+    """
+
+    def __init__(self, script: ExecutionScript, entry_points: Iterable[int] = ()):
+        """
+        :param script: the script with the instructions
+        :param entry_points: addresses where the execution can start, besides the targets of the instructions
+        """
+        self._script = script
+        self._blocks: Dict[int, BasicBlock] = {}
+        self._block_addresses: List[int] = []
+
+        self._build(set(entry_points))
+
+    @property
+    def blocks(self) -> List[BasicBlock]:
+        return [self._blocks[address] for address in self._block_addresses]
+
+    def get_block(self, start_address: int) -> Optional[BasicBlock]:
+        """
+        Gets the block that starts in the given address
+
+        :return: the block if there's one that starts in the address. None otherwise
+        """
+        return self._blocks.get(start_address)
+
+    def get_block_with_address(self, address: int) -> Optional[BasicBlock]:
+        """
+        Gets the block that includes the instruction in the given address
+        """
+        position = bisect_right(self._block_addresses, address) - 1
+        if position < 0:
+            return None
+
+        block = self._blocks[self._block_addresses[position]]
+        return block if address <= block.last_address else None
+
+    def _build(self, entry_points: set[int]):
+        script = self._script
+        addresses = list(script.addresses)
+        if len(addresses) == 0:
+            return
+
+        leaders = {addresses[0]}
+        leaders.update(address for address in entry_points if address in script)
+        for address in addresses:
+            code = script.get_instruction(address)
+            if isinstance(code, TryCode):
+                leaders.update(self._get_address(handler) for handler in (code.except_start_code,
+                                                                          code.finally_start_code)
+                               if handler is not None)
+            elif code.target is not None:
+                leaders.add(self._get_address(code.target))
+
+            if OpcodeHelper.ends_basic_block(code.opcode):
+                leaders.add(script.next_address(address))
+
+        block = None
+        for address in addresses:
+            if address in leaders or block is None:
+                block = BasicBlock(address)
+                self._blocks[address] = block
+                self._block_addresses.append(address)
+            block.addresses.append(address)
+
+        for block in self._blocks.values():
+            self._link(block)
+
+    def _link(self, block: BasicBlock):
+        script = self._script
+        last_code = script.get_instruction(block.last_address)
+        next_address = script.next_address(block.last_address)
+        if next_address not in script:
+            next_address = None
+
+        opcode = last_code.opcode
+        if isinstance(last_code, TryCode):
+            block.next_address = next_address
+            if last_code.except_start_code is not None:
+                block.except_address = self._get_address(last_code.except_start_code)
+            if last_code.finally_start_code is not None:
+                block.finally_address = self._get_address(last_code.finally_start_code)
+
+        elif OpcodeHelper.is_unconditional_jump(opcode):
+            block.jump_address = self._get_address(last_code.target)
+
+        elif OpcodeHelper.is_jump(opcode):
+            block.jump_address = self._get_address(last_code.target)
+            block.next_address = next_address
+
+        elif not OpcodeHelper.ends_execution(opcode):
+            block.next_address = next_address
+
+    def _get_address(self, code: VMCode) -> Optional[int]:
+        return self._script.get_address(code)
@@ -5,46 +5,70 @@ __all__ = [
 ]
 
 
+from bisect import bisect_right
+from collections.abc import Mapping, Sequence
+from typing import Dict, Optional
+
+from boa3.internal.compiler.codegenerator.vmcodemap import VMCodeAddressView
 from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
 from boa3.internal.neo.vm.VMCode import VMCode
 from boa3.internal.neo3.contracts.nef import MethodToken
 
 
 class ExecutionScript:
-    def __init__(self, code_map: dict[int, VMCode], tokens: list[MethodToken]):
-        self._addresses = tuple(code_map.keys())
-        self._instructions = tuple(code_map.values())
-
-        self._last_address = self._addresses[-1] if len(self._addresses) else -1
-        self._last_instruction_size = self._instructions[-1].size if len(self._instructions) else 0
+    def __init__(self, code_map: Mapping[int, VMCode], tokens: list[MethodToken]):
+        self._code_map = code_map
+        if isinstance(code_map, VMCodeAddressView):
+            # the view is kept up-to-date by the code map, there's no need to copy the addresses
+            self._addresses: Sequence[int] = code_map.addresses
+        else:
+            self._addresses: Sequence[int] = tuple(code_map.keys())
 
         self._tokens = tokens
+        self._code_addresses: Optional[Dict[VMCode, int]] = None
 
     @classmethod
     def from_code_map(cls, instance: VMCodeMapping) -> ExecutionScript:
         obj = ExecutionScript(instance.code_map, instance._method_tokens.to_list())
         return obj
 
+    @property
+    def _end_address(self) -> int:
+        if len(self._addresses) == 0:
+            return -1
+        last_address = self._addresses[-1]
+        return last_address + self._code_map[last_address].size
+
+    @property
+    def addresses(self) -> Sequence[int]:
+        return self._addresses
+
     def get_instruction(self, address) -> VMCode:
-        if address not in self._addresses:
+        if address not in self._code_map:
             raise IndexError
-        index = self._addresses.index(address)
-        return self._instructions[index]
+        return self._code_map[address]
 
-    def next_address(self, address) -> int:
-        if address in self._addresses:
-            address_index = self._addresses.index(address)
-            if address < self._last_address:
-                next_address = self._addresses[address_index + 1]
-            else:
-                next_address = self._last_address + self._last_instruction_size
-        else:
-            next_address = next((instr_address
-                                 for instr_address in self._addresses
-                                 if instr_address > address),
-                                self._last_address + self._last_instruction_size)
+    def get_address(self, code: VMCode) -> Optional[int]:
+        """
+        Gets the address of the given instruction
+
+        :return: the address of the instruction if it's in the script. None otherwise
+        """
+        if self._code_addresses is None:
+            # the script must not change while it's executed, so the addresses are mapped only once
+            self._code_addresses = {self._code_map[address]: address for address in self._addresses}
+        return self._code_addresses.get(code)
 
-        return next_address
+    def get_method_token(self, token_id: int) -> Optional[MethodToken]:
+        if 0 <= token_id < len(self._tokens):
+            return self._tokens[token_id]
+        return None
+
+    def next_address(self, address) -> int:
+        index = bisect_right(self._addresses, address)
+        if index < len(self._addresses):
+            return self._addresses[index]
+        return self._end_address
 
     def __contains__(self, obj) -> bool:
-        return obj in self._addresses
+        return obj in self._code_map
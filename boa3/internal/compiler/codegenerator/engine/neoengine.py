@@ -1,23 +1,59 @@
+from __future__ import annotations
+
 __all__ = [
     'NeoEngine',
-    'NeoEngineState'
+    'NeoEngineState',
+    'StackItem'
 ]
 
-from typing import Any
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
 
+from boa3.internal.compiler.codegenerator.engine.controlflowgraph import BasicBlock, ControlFlowGraph
 from boa3.internal.compiler.codegenerator.engine.executionscript import ExecutionScript
 from boa3.internal.compiler.codegenerator.engine.istack import IStack
+from boa3.internal.neo import cryptography
+from boa3.internal.neo.vm.TryCode import TryCode
 from boa3.internal.neo.vm.VMCode import VMCode
 from boa3.internal.neo.vm.opcode.Opcode import Opcode
+from boa3.internal.neo.vm.type.Integer import Integer
 from boa3.internal.neo.vm.type.StackItem import StackItemType
+from boa3.internal.neo.vm.type.String import String
 from boa3.internal.neo3.vm import VMState
 
 
 class StackItem:
-    def __init__(self, value: Any, stack_item_type: StackItemType):
+    """
+    An item in the simulated stack. The value is only known if the item is a constant, and the type is Any if it isn't
+    known at compile time.
+    """
+
+    __slots__ = ('value', 'type')
+
+    def __init__(self, value: Any = None, stack_item_type: StackItemType = StackItemType.Any):
         self.value = value
         self.type = stack_item_type
 
+    def join(self, other: StackItem) -> StackItem:
+        """
+        Gets an item that describes both this item and the other one
+
+        :return: this item if both are equal. Otherwise, an item with only what they have in common
+        """
+        if self == other:
+            return self
+        return StackItem(self.value if self.value == other.value else None,
+                         self.type if self.type == other.type else StackItemType.Any)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, StackItem) and self.type == other.type and self.value == other.value
+
+    def __hash__(self) -> int:
+        return hash((self.value, self.type))
+
+    def __repr__(self) -> str:
+        return '{0}({1})'.format(self.type.name, '' if self.value is None else repr(self.value))
+
 
 class NeoStack(IStack):
     def __init__(self):
@@ -27,57 +63,547 @@ class NeoStack(IStack):
         return tuple()
 
 
+# the items in the stack, from the bottom to the top. None if the stack depth isn't known
+SimulatedStack = Optional[Tuple[StackItem, ...]]
+
+
 class NeoEngineState:
-    def __init__(self,
-                 entry_point: int,
-                 ):
+    """
+    The result of the execution of a method
+    """
 
+    def __init__(self, entry_point: int, args_count: int = 0):
         self.entry_point: int = entry_point
-        self.current_instruction: int = entry_point
-        self.result_stack: list[IStack] = []
+        # the arguments are in the stack when the method starts
+        self.args_count: int = args_count
+
+        # the number of items in the stack when the method returns. None if it isn't known
+        self.return_count: Optional[int] = None
+        self.returns: bool = False
+
+        self.blocks: Set[int] = set()
+        self.callees: Set[int] = set()
+        self.errors: List[str] = []
+
         self.vm_state: VMState = VMState.NONE
 
+    @property
+    def is_balanced(self) -> bool:
+        """
+        Gets whether the stack depth was the same in all the paths of the method
+        """
+        return self.vm_state is not VMState.FAULT
+
 
 class NeoEngine:
+    """
+    Abstract interpreter of the generated bytecode.
+
+    Instead of running the instructions with real values, the engine runs them over the control flow graph of the
+    script, simulating the depth of the stack and the types of its items in each basic block. The blocks are executed
+    with a worklist until the stacks in the start of every block that can be reached stop changing, joining the stacks
+    of the paths that reach the same block.
+
+    The stack of each method is simulated from the items the method receives, so the items of the caller aren't
+    included. A call uses the number of items the called method leaves in the stack when it returns, and the blocks
+    after a call are only executed once the called method is known to return.
+    """
+
     def __init__(self):
         self._script: ExecutionScript = None
-        self._state_stack: list[NeoEngineState] = []
+        self._graph: ControlFlowGraph = None
 
-    @property
-    def current_state(self) -> NeoEngineState | None:
-        if self._state_stack:
-            return self._state_stack[-1]
-        else:
-            return None
+        self._states: Dict[int, NeoEngineState] = {}
+        self._block_stacks: Dict[int, SimulatedStack] = {}
+        self._block_states: Dict[int, NeoEngineState] = {}
+        # the blocks that are waiting for a method to return, by the method entry point
+        self._callers: Dict[int, Set[int]] = {}
+
+        self._worklist: Deque[int] = deque()
+        self._queued: Set[int] = set()
 
-    def load_script(self, script: ExecutionScript):
+    def load_script(self, script: ExecutionScript, entry_points: Iterable[int] = ()):
+        """
+        Loads the script that will be executed
+
+        :param script: the script with the instructions
+        :param entry_points: addresses where the execution can start, besides the targets of the instructions
+        """
         self._script = script
+        self._graph = ControlFlowGraph(script, entry_points)
+        self._states.clear()
+        self._block_stacks.clear()
+        self._block_states.clear()
+        self._callers.clear()
+
+    @property
+    def control_flow_graph(self) -> ControlFlowGraph:
+        return self._graph
 
     def execute(self, entry_point: int) -> set[int]:
-        executed_instructions_addresses = set()
+        """
+        Executes the method that starts in the given address
 
+        :return: the addresses of the instructions that can be executed, including the ones of the called methods
+        """
         if not isinstance(self._script, ExecutionScript):
             raise ValueError('Script was not loaded')
 
         if entry_point not in self._script:
             raise ValueError('Invalid address given as entry point')
 
-        cur_address = entry_point
-        self._state_stack.append(NeoEngineState(cur_address))
-        while self._state_stack and cur_address in self._script:
-            self._execute_instruction(self._script.get_instruction(cur_address))
+        if self._graph.get_block(entry_point) is None:
+            # the execution can start in the middle of a block, so the graph must be split in the entry point
+            entry_points = set(self._states)
+            entry_points.add(entry_point)
+            self.load_script(self._script, entry_points)
+            for state_entry_point in entry_points:
+                self._start_method(state_entry_point)
 
-            executed_instructions_addresses.add(cur_address)
-            cur_address = self._script.next_address(cur_address)
+        self._start_method(entry_point)
+        self._run()
 
-        if self._state_stack:
-            self._state_stack.clear()
+        executed_instructions_addresses = set()
+        methods = [entry_point]
+        visited = set(methods)
+        while methods:
+            state = self._states[methods.pop()]
+            for block_address in state.blocks:
+                block = self._graph.get_block(block_address)
+                executed_instructions_addresses.update(self._get_executed_addresses(block))
+            for callee in state.callees - visited:
+                visited.add(callee)
+                methods.append(callee)
 
         return executed_instructions_addresses
 
-    def _execute_instruction(self, current_opcode: VMCode):
-        match current_opcode.opcode:
-            case Opcode.INITSLOT | Opcode.INITSSLOT:
-                print()
-            case Opcode.RET:
-                self._state_stack.pop()
+    def get_state(self, entry_point: int) -> Optional[NeoEngineState]:
+        """
+        Gets the result of the execution of the method that starts in the given address
+
+        :return: the state of the method if it was executed. None otherwise
+        """
+        return self._states.get(entry_point)
+
+    def get_method_state(self, address: int) -> Optional[NeoEngineState]:
+        """
+        Gets the result of the execution of the method that includes the instruction in the given address
+
+        :return: the state of the method if the instruction was executed. None otherwise
+        """
+        block = self._graph.get_block_with_address(address)
+        if block is None:
+            return None
+        return self._block_states.get(block.start_address)
+
+    def get_stack(self, address: int) -> SimulatedStack:
+        """
+        Gets the simulated stack before the instruction in the given address is executed
+
+        :return: the items in the stack, from the bottom to the top, if the instruction can be executed and the stack
+                 depth is known. None otherwise
+        """
+        block = self._graph.get_block_with_address(address)
+        if block is None or block.start_address not in self._block_stacks:
+            return None
+
+        stack = self._block_stacks[block.start_address]
+        for instruction_address in block.addresses:
+            if instruction_address == address or stack is None:
+                break
+            try:
+                stack = self._execute_instruction(self._script.get_instruction(instruction_address), stack)
+            except (_StackFault, _NotReturned):
+                return None
+        return stack
+
+    # region Worklist
+
+    def _run(self):
+        while self._worklist:
+            block_address = self._worklist.popleft()
+            self._queued.discard(block_address)
+            self._execute_block(self._graph.get_block(block_address))
+
+        for state in self._states.values():
+            if state.vm_state is VMState.NONE:
+                state.vm_state = VMState.HALT
+
+    def _get_executed_addresses(self, block: BasicBlock) -> List[int]:
+        """
+        Gets the addresses of the instructions in the block that can be executed. The calls don't split the blocks, so
+        the instructions after a call to a method that never returns are in the same block, but can't be executed
+        """
+        for index, address in enumerate(block.addresses):
+            callee_address = self._get_callee_address(self._script.get_instruction(address))
+            if callee_address is not None and not self._states[callee_address].returns:
+                return block.addresses[:index + 1]
+        return block.addresses
+
+    def _enqueue(self, block_address: int):
+        if block_address not in self._queued:
+            self._queued.add(block_address)
+            self._worklist.append(block_address)
+
+    def _start_method(self, entry_point: int) -> NeoEngineState:
+        state = self._states.get(entry_point)
+        if state is None:
+            entry_code = self._script.get_instruction(entry_point)
+            args_count = entry_code.data[1] if entry_code.opcode is Opcode.INITSLOT else 0
+
+            state = NeoEngineState(entry_point, args_count)
+            self._states[entry_point] = state
+            self._include_stack(state, entry_point, (StackItem(),) * args_count)
+        return state
+
+    def _execute_block(self, block: BasicBlock):
+        state = self._block_states[block.start_address]
+        stack = self._block_stacks[block.start_address]
+        code = None
+
+        for address in block.addresses:
+            code = self._script.get_instruction(address)
+            callee_address = self._get_callee_address(code)
+            if callee_address is not None:
+                callee = self._start_method(callee_address)
+                state.callees.add(callee.entry_point)
+                if not callee.returns:
+                    # the next instructions are executed only if the called method returns
+                    self._callers.setdefault(callee.entry_point, set()).add(block.start_address)
+                    return
+
+            try:
+                stack = self._execute_instruction(code, stack)
+            except _StackFault as fault:
+                self._fault(state, address, str(fault))
+                stack = None
+
+            if code.opcode is Opcode.RET:
+                self._return(state, address, stack)
+
+        if isinstance(code, TryCode):
+            self._include_stack(state, block.next_address, stack)
+            if block.except_address is not None:
+                # the exception is pushed when it's caught
+                self._include_stack(state, block.except_address, stack + (StackItem(),) if stack is not None else None)
+            if block.finally_address is not None:
+                self._include_stack(state, block.finally_address, stack)
+        else:
+            for successor in block.successors:
+                self._include_stack(state, successor, stack)
+
+    def _include_stack(self, state: NeoEngineState, block_address: Optional[int], stack: SimulatedStack):
+        """
+        Joins the stack in one of the paths that reach a block with the stacks of the other paths
+        """
+        if block_address is None:
+            return
+
+        if block_address not in self._block_stacks:
+            self._block_stacks[block_address] = stack
+            self._block_states[block_address] = state
+            state.blocks.add(block_address)
+            self._enqueue(block_address)
+            return
+
+        current_stack = self._block_stacks[block_address]
+        if current_stack is None:
+            return
+
+        if stack is None:
+            joined_stack = None
+        elif len(stack) != len(current_stack):
+            self._fault(state, block_address,
+                        'stack depth mismatch, {0} and {1} items'.format(len(current_stack), len(stack)))
+            joined_stack = None
+        else:
+            joined_stack = tuple(current.join(item) for current, item in zip(current_stack, stack))
+
+        if joined_stack != current_stack:
+            self._block_stacks[block_address] = joined_stack
+            self._enqueue(block_address)
+
+    def _return(self, state: NeoEngineState, address: int, stack: SimulatedStack):
+        return_count = len(stack) if stack is not None else None
+        if return_count is not None and return_count > 1:
+            self._fault(state, address, 'method returns {0} items'.format(return_count))
+
+        if state.returns:
+            if state.return_count == return_count:
+                return
+            if state.return_count is not None and return_count is not None:
+                self._fault(state, address, 'method returns {0} and {1} items'.format(state.return_count,
+                                                                                     return_count))
+            return_count = None
+
+        state.returns = True
+        state.return_count = return_count
+        for caller in self._callers.pop(state.entry_point, ()):
+            self._enqueue(caller)
+
+    def _fault(self, state: NeoEngineState, address: int, message: str):
+        error = '{0} at address {1}'.format(message, address)
+        if error not in state.errors:
+            state.errors.append(error)
+        state.vm_state = VMState.FAULT
+
+    # endregion
+
+    # region Instructions
+
+    def _execute_instruction(self, code: VMCode, stack: SimulatedStack) -> SimulatedStack:
+        """
+        Simulates the changes an instruction makes in the stack
+
+        :return: the stack after the instruction is executed
+        """
+        if stack is None:
+            return None
+
+        opcode = code.opcode
+        effect = _STACK_EFFECTS.get(opcode)
+        if effect is not None:
+            pop_count, push_types = effect
+            stack = _pop(stack, pop_count)[0]
+            return stack + tuple(StackItem(stack_item_type=push_type) for push_type in push_types)
+
+        if opcode in _INTEGER_PUSHES:
+            return stack + (StackItem(_INTEGER_PUSHES[opcode], StackItemType.Integer),)
+
+        match opcode:
+            case Opcode.PUSHINT8 | Opcode.PUSHINT16 | Opcode.PUSHINT32 | Opcode.PUSHINT64 | Opcode.PUSHINT128 | \
+                 Opcode.PUSHINT256:
+                return stack + (StackItem(Integer.from_bytes(code.data, signed=True), StackItemType.Integer),)
+            case Opcode.PUSHT | Opcode.PUSHF:
+                return stack + (StackItem(opcode is Opcode.PUSHT, StackItemType.Boolean),)
+            case Opcode.PUSHDATA1 | Opcode.PUSHDATA2 | Opcode.PUSHDATA4:
+                return stack + (StackItem(stack_item_type=StackItemType.ByteString),)
+            case Opcode.CONVERT:
+                stack = _pop(stack, 1)[0]
+                return stack + (StackItem(stack_item_type=StackItemType(bytes(code.data))),)
+
+            case Opcode.DUP:
+                return stack + _pop(stack, 1)[1]
+            case Opcode.OVER:
+                return stack + _pop(stack, 2)[1][:1]
+            case Opcode.NIP:
+                stack, items = _pop(stack, 2)
+                return stack + items[1:]
+            case Opcode.SWAP:
+                stack, items = _pop(stack, 2)
+                return stack + items[::-1]
+            case Opcode.TUCK:
+                stack, items = _pop(stack, 2)
+                return stack + items[1:] + items
+            case Opcode.ROT:
+                stack, items = _pop(stack, 3)
+                return stack + items[1:] + items[:1]
+            case Opcode.REVERSE3 | Opcode.REVERSE4:
+                stack, items = _pop(stack, 3 if opcode is Opcode.REVERSE3 else 4)
+                return stack + items[::-1]
+            case Opcode.PICK | Opcode.XDROP | Opcode.ROLL | Opcode.REVERSEN:
+                stack, count = _pop_count(stack)
+                if count is None:
+                    return None
+                stack, items = _pop(stack, count + 1 if opcode is not Opcode.REVERSEN else count)
+                if opcode is Opcode.PICK:
+                    return stack + items + items[:1]
+                if opcode is Opcode.XDROP:
+                    return stack + items[1:]
+                if opcode is Opcode.ROLL:
+                    return stack + items[1:] + items[:1]
+                return stack + items[::-1]
+            case Opcode.CLEAR:
+                return ()
+
+            case Opcode.INITSLOT:
+                return _pop(stack, code.data[1])[0]
+            case Opcode.PACK | Opcode.PACKSTRUCT | Opcode.PACKMAP:
+                stack, count = _pop_count(stack)
+                if count is None:
+                    return None
+                if opcode is Opcode.PACKMAP:
+                    return _pop(stack, count * 2)[0] + (StackItem(stack_item_type=StackItemType.Map),)
+                result_type = StackItemType.Array if opcode is Opcode.PACK else StackItemType.Struct
+                return _pop(stack, count)[0] + (StackItem(stack_item_type=result_type),)
+
+            case Opcode.CALL | Opcode.CALL_L:
+                callee_address = self._get_callee_address(code)
+                if callee_address is None:
+                    return None
+                callee = self._states.get(callee_address)
+                if callee is None or not callee.returns:
+                    raise _NotReturned
+                return self._call_result(stack, callee.args_count, callee.return_count)
+            case Opcode.CALLT:
+                token = self._script.get_method_token(Integer.from_bytes(code.data))
+                if token is None:
+                    return None
+                return self._call_result(stack, token.parameters_count, 1 if token.has_return_value else 0)
+            case Opcode.SYSCALL:
+                interop_effect = _INTEROP_STACK_EFFECTS.get(bytes(code.data))
+                if interop_effect is None:
+                    return None
+                return self._call_result(stack, *interop_effect)
+
+            case _:
+                # the stack can't be simulated after instructions like UNPACK or CALLA
+                return None
+
+    def _get_callee_address(self, code: VMCode) -> Optional[int]:
+        if code.opcode not in (Opcode.CALL, Opcode.CALL_L) or code.target is None:
+            return None
+        return self._script.get_address(code.target)
+
+    @staticmethod
+    def _call_result(stack: Tuple[StackItem, ...], args_count: int, return_count: Optional[int]) -> SimulatedStack:
+        stack = _pop(stack, args_count)[0]
+        if return_count is None:
+            return None
+        return stack + (StackItem(),) * return_count
+
+    # endregion
+
+
+class _StackFault(Exception):
+    pass
+
+
+class _NotReturned(Exception):
+    pass
+
+
+def _pop(stack: Tuple[StackItem, ...], count: int) -> Tuple[Tuple[StackItem, ...], Tuple[StackItem, ...]]:
+    """
+    Removes items from the top of the stack
+
+    :return: the stack without the items and the removed items, from the bottom to the top
+    """
+    if count > len(stack):
+        raise _StackFault('stack underflow, {0} items expected but {1} found'.format(count, len(stack)))
+    if count == 0:
+        return stack, ()
+    return stack[:-count], stack[-count:]
+
+
+def _pop_count(stack: Tuple[StackItem, ...]) -> Tuple[Tuple[StackItem, ...], Optional[int]]:
+    """
+    Removes the number of items used by instructions like PICK and PACK from the top of the stack
+
+    :return: the stack without the number and the number if it's a constant. None otherwise
+    """
+    stack, items = _pop(stack, 1)
+    count = items[0].value
+    if not isinstance(count, int) or isinstance(count, bool) or count < 0:
+        return stack, None
+    return stack, count
+
+
+def _interop_hash(method_name: str) -> bytes:
+    return cryptography.sha256(String(method_name).to_bytes())[:4]
+
+
+# region Opcode tables
+
+_INTEGER_PUSHES: Dict[Opcode, int] = {
+    opcode: Integer.from_bytes(opcode) - Integer.from_bytes(Opcode.PUSH0)
+    for opcode in Opcode if Opcode.PUSHM1 <= opcode <= Opcode.PUSH16
+}
+
+# the number of items each instruction removes from the stack and the types of the items it includes
+_STACK_EFFECTS: Dict[Opcode, Tuple[int, Tuple[StackItemType, ...]]] = {
+    Opcode.PUSHA: (0, (StackItemType.Pointer,)),
+    Opcode.PUSHNULL: (0, (StackItemType.Any,)),
+    Opcode.DEPTH: (0, (StackItemType.Integer,)),
+    Opcode.DROP: (1, ()),
+
+    **{opcode: (0, ()) for opcode in (Opcode.NOP, Opcode.JMP, Opcode.JMP_L, Opcode.TRY, Opcode.TRY_L, Opcode.ENDTRY,
+                                      Opcode.ENDTRY_L, Opcode.ENDFINALLY, Opcode.RET, Opcode.ABORT, Opcode.INITSSLOT)},
+    **{opcode: (1, ()) for opcode in (Opcode.JMPIF, Opcode.JMPIF_L, Opcode.JMPIFNOT, Opcode.JMPIFNOT_L, Opcode.THROW,
+                                      Opcode.ASSERT, Opcode.ABORTMSG)},
+    **{opcode: (2, ()) for opcode in Opcode if Opcode.JMPEQ <= opcode <= Opcode.JMPLE_L},
+    Opcode.ASSERTMSG: (2, ()),
+
+    **{opcode: (0, (StackItemType.Any,)) for opcode in Opcode
+       if Opcode.LDSFLD0 <= opcode <= Opcode.LDSFLD or Opcode.LDLOC0 <= opcode <= Opcode.LDLOC
+       or Opcode.LDARG0 <= opcode <= Opcode.LDARG},
+    **{opcode: (1, ()) for opcode in Opcode
+       if Opcode.STSFLD0 <= opcode <= Opcode.STSFLD or Opcode.STLOC0 <= opcode <= Opcode.STLOC
+       or Opcode.STARG0 <= opcode <= Opcode.STARG},
+
+    Opcode.NEWBUFFER: (1, (StackItemType.Buffer,)),
+    Opcode.MEMCPY: (5, ()),
+    Opcode.CAT: (2, (StackItemType.Buffer,)),
+    Opcode.SUBSTR: (3, (StackItemType.Buffer,)),
+    Opcode.LEFT: (2, (StackItemType.Buffer,)),
+    Opcode.RIGHT: (2, (StackItemType.Buffer,)),
+
+    **{opcode: (1, (StackItemType.Integer,)) for opcode in (Opcode.INVERT, Opcode.SIGN, Opcode.ABS, Opcode.NEGATE,
+                                                            Opcode.INC, Opcode.DEC, Opcode.SQRT, Opcode.SIZE)},
+    **{opcode: (2, (StackItemType.Integer,)) for opcode in (Opcode.AND, Opcode.OR, Opcode.XOR, Opcode.ADD, Opcode.SUB,
+                                                            Opcode.MUL, Opcode.DIV, Opcode.MOD, Opcode.POW, Opcode.SHL,
+                                                            Opcode.SHR, Opcode.MIN, Opcode.MAX)},
+    **{opcode: (3, (StackItemType.Integer,)) for opcode in (Opcode.MODMUL, Opcode.MODPOW)},
+
+    **{opcode: (1, (StackItemType.Boolean,)) for opcode in (Opcode.NOT, Opcode.NZ, Opcode.ISNULL, Opcode.ISTYPE)},
+    **{opcode: (2, (StackItemType.Boolean,)) for opcode in (Opcode.EQUAL, Opcode.NOTEQUAL, Opcode.BOOLAND,
+                                                            Opcode.BOOLOR, Opcode.NUMEQUAL, Opcode.NUMNOTEQUAL,
+                                                            Opcode.LT, Opcode.LE, Opcode.GT, Opcode.GE, Opcode.HASKEY)},
+    Opcode.WITHIN: (3, (StackItemType.Boolean,)),
+
+    Opcode.NEWARRAY0: (0, (StackItemType.Array,)),
+    Opcode.NEWARRAY: (1, (StackItemType.Array,)),
+    Opcode.NEWARRAY_T: (1, (StackItemType.Array,)),
+    Opcode.NEWSTRUCT0: (0, (StackItemType.Struct,)),
+    Opcode.NEWSTRUCT: (1, (StackItemType.Struct,)),
+    Opcode.NEWMAP: (0, (StackItemType.Map,)),
+    Opcode.KEYS: (1, (StackItemType.Array,)),
+    Opcode.VALUES: (1, (StackItemType.Array,)),
+    Opcode.PICKITEM: (2, (StackItemType.Any,)),
+    Opcode.POPITEM: (1, (StackItemType.Any,)),
+    Opcode.APPEND: (2, ()),
+    Opcode.SETITEM: (3, ()),
+    Opcode.REMOVE: (2, ()),
+    Opcode.REVERSEITEMS: (1, ()),
+    Opcode.CLEARITEMS: (1, ()),
+}
+
+# the number of arguments and of return values of the interop methods
+_INTEROP_STACK_EFFECTS: Dict[bytes, Tuple[int, int]] = {
+    _interop_hash(method_name): effect for method_name, effect in {
+        'System.Contract.Call': (4, 1),
+        'System.Contract.CreateMultisigAccount': (2, 1),
+        'System.Contract.CreateStandardAccount': (1, 1),
+        'System.Contract.GetCallFlags': (0, 1),
+        'System.Crypto.CheckMultisig': (2, 1),
+        'System.Crypto.CheckSig': (2, 1),
+        'System.Iterator.Next': (1, 1),
+        'System.Iterator.Value': (1, 1),
+        'System.Runtime.BurnGas': (1, 0),
+        'System.Runtime.CheckWitness': (1, 1),
+        'System.Runtime.GasLeft': (0, 1),
+        'System.Runtime.GetAddressVersion': (0, 1),
+        'System.Runtime.GetCallingScriptHash': (0, 1),
+        'System.Runtime.GetEntryScriptHash': (0, 1),
+        'System.Runtime.GetExecutingScriptHash': (0, 1),
+        'System.Runtime.GetInvocationCounter': (0, 1),
+        'System.Runtime.GetNetwork': (0, 1),
+        'System.Runtime.GetNotifications': (1, 1),
+        'System.Runtime.GetRandom': (0, 1),
+        'System.Runtime.GetScriptContainer': (0, 1),
+        'System.Runtime.GetTime': (0, 1),
+        'System.Runtime.GetTrigger': (0, 1),
+        'System.Runtime.Log': (1, 0),
+        'System.Runtime.Notify': (2, 0),
+        'System.Runtime.Platform': (0, 1),
+        'System.Storage.AsReadOnly': (1, 1),
+        'System.Storage.Delete': (2, 0),
+        'System.Storage.Find': (3, 1),
+        'System.Storage.Get': (2, 1),
+        'System.Storage.GetContext': (0, 1),
+        'System.Storage.GetReadOnlyContext': (0, 1),
+        'System.Storage.Put': (3, 0),
+    }.items()
+}
+
+# endregion
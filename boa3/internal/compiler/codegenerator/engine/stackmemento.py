@@ -6,7 +6,8 @@ __all__ = [
 ]
 
 
-from typing import Dict, List, Tuple
+from bisect import bisect_left, insort
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from boa3.internal.compiler.codegenerator.engine.istack import IStack
 from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
@@ -17,54 +18,94 @@ from boa3.internal.neo.vm.VMCode import VMCode
 class StackMemento:
     """
     This class is responsible for managing the simulation of the blockchain stack during the code generation
+
+    Each state is mapped to the instruction that changed the stack and is indexed by the instruction address, so the
+    states are found with binary search instead of iterating over all of them.
     """
 
     def __init__(self):
-        self._stacks: List[Tuple[VMCode, NeoStack]] = []
+        self._stacks: Dict[VMCode, NeoStack] = {}
+        # sorted by address, the order in which the states were included is used to untie states in the same address
+        self._address_index: List[Tuple[int, int, VMCode]] = []
+        self._address_index_version: int = VMCodeMapping.instance().addresses_version
+        self._states_count: int = 0
+
         self._current_stack: NeoStack = NeoStack()
 
+    def _get_address_index(self) -> List[Tuple[int, int, VMCode]]:
+        vm_code_mapping = VMCodeMapping.instance()
+        if self._address_index_version != vm_code_mapping.addresses_version:
+            # the instructions addresses changed since the last time the index was sorted
+            self._address_index = sorted((vm_code_mapping.get_start_address(vmcode), order, vmcode)
+                                         for _, order, vmcode in self._address_index)
+            self._address_index_version = vm_code_mapping.addresses_version
+
+        return self._address_index
+
+    def _get_state_in_address(self, address: int) -> Optional[NeoStack]:
+        """
+        Gets the last included state in the given address
+
+        :return: the state if there is one in the address. None otherwise
+        """
+        address_index = self._get_address_index()
+        position = bisect_left(address_index, (address + 1,)) - 1
+        if position >= 0 and address_index[position][0] == address:
+            return self._stacks[address_index[position][2]]
+        return None
+
+    def _include_state(self, code: VMCode, stack: NeoStack):
+        address = VMCodeMapping.instance().get_start_address(code)
+        insort(self._get_address_index(), (address, self._states_count, code))
+        self._states_count += 1
+
+        self._stacks[code] = stack
+        self._current_stack = stack
+
     @property
     def stack_map(self) -> Dict[int, NeoStack]:
-        vm_code_mapping = VMCodeMapping.instance()
-        return {vm_code_mapping.get_start_address(vmcode): stack for vmcode, stack in self._stacks}
+        return {address: self._stacks[vmcode] for address, _, vmcode in self._get_address_index()}
 
     def get_state(self, code_address: int) -> NeoStack:
-        stacks = self.stack_map
-        index = None
-        for address, stack in sorted(stacks.items()):
-            if address >= code_address:
-                break
-            index = address
-
-        if index is None or index not in stacks:
+        address_index = self._get_address_index()
+        position = bisect_left(address_index, (code_address,)) - 1
+
+        if position < 0:
             return NeoStack()
         else:
-            return stacks[index]
+            return self._stacks[address_index[position][2]]
 
     @property
     def current_stack(self) -> NeoStack:
         return self._current_stack
 
     def restore_state(self, code_address):
-        stacks = self.stack_map
-        latest_stack = None
-        for address, stack in reversed(sorted(stacks.items())):
-            if address < code_address:
-                latest_stack = stack
-                break
+        address_index = self._get_address_index()
+        first_position = bisect_left(address_index, (code_address,))
+        vm_code_mapping = VMCodeMapping.instance()
 
-            vm_code = VMCodeMapping.instance().get_code(address)
-            if (vm_code, stack) in self._stacks:
-                self._stacks.remove((vm_code, stack))
+        kept_states = []
+        last_address = None
+        for position in range(len(address_index) - 1, first_position - 1, -1):
+            address, _, vmcode = address_index[position]
+            if address != last_address:
+                # only the last included state in each address is removed, if its code is still in that address
+                last_address = address
+                if vm_code_mapping.get_code(address) is vmcode:
+                    self._stacks.pop(vmcode)
+                    continue
+            kept_states.append(address_index[position])
 
-        if latest_stack is not None:
-            self._current_stack = latest_stack
+        kept_states.reverse()
+        address_index[first_position:] = kept_states
+
+        if first_position > 0:
+            self._current_stack = self._stacks[address_index[first_position - 1][2]]
 
     def append(self, value: IType, code: VMCode):
-        states = self.stack_map
-        index = VMCodeMapping.instance().get_start_address(code)
-        if index in states:
-            states[index].append(value)
+        stack = self._get_state_in_address(VMCodeMapping.instance().get_start_address(code))
+        if stack is not None:
+            stack.append(value)
 
         else:
             if self._current_stack is not None:
@@ -73,31 +114,126 @@ class StackMemento:
                 stack = NeoStack()
             stack.append(value)
 
-            self._stacks.append((code, stack))
-            self._current_stack = stack
+            self._include_state(code, stack)
 
     def pop(self, code: VMCode, index: int = -1):
-        states = self.stack_map
-        stack_index = VMCodeMapping.instance().get_start_address(code)
-        if stack_index in states:
-            stack = states[stack_index]
-        else:
+        stack = self._get_state_in_address(VMCodeMapping.instance().get_start_address(code))
+        if stack is None:
             if self._current_stack is not None:
                 stack = self._current_stack.copy()
             else:
                 stack = NeoStack()
 
-            self._stacks.append((code, stack))
-            self._current_stack = stack
+            self._include_state(code, stack)
 
         if len(stack) > 0:
             return stack.pop(index)
 
 
+class _StackNode:
+    __slots__ = ('value', 'previous', 'size')
+
+    def __init__(self, value: IType, previous: Optional[_StackNode]):
+        self.value = value
+        self.previous = previous
+        self.size = 1 if previous is None else previous.size + 1
+
+
 class NeoStack(IStack):
+    """
+    The items are stored in a persistent linked list, so a copy of the stack shares its items with the original stack
+    and changing one of them doesn't change the other.
+    """
+
     def __init__(self):
         from boa3.internal.model.type.itype import IType
         super().__init__(stack_type=IType)
+        self._top: Optional[_StackNode] = None
 
     def _default_constructor_args(self) -> tuple:
         return tuple()
+
+    def _get_node(self, index: int) -> Optional[_StackNode]:
+        """
+        Gets the node of the item in the given position, counting from the bottom of the stack
+        """
+        node = self._top
+        for _ in range(len(self) - 1 - index):
+            node = node.previous
+        return node
+
+    def _normalize_index(self, index: int) -> int:
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError('stack index out of range')
+        return index
+
+    def append(self, value: IType):
+        self._top = _StackNode(value, self._top)
+
+    def clear(self):
+        self._top = None
+
+    def copy(self) -> NeoStack:
+        new_stack = self.__class__(*self._default_constructor_args())
+        new_stack._top = self._top
+        return new_stack
+
+    def pop(self, index: int = -1) -> IType:
+        index = self._normalize_index(index)
+
+        # the items above the removed one are included again, the ones below are shared with the previous version
+        items_above = []
+        node = self._top
+        for _ in range(len(self) - 1 - index):
+            items_above.append(node.value)
+            node = node.previous
+
+        value = node.value
+        node = node.previous
+        for item in reversed(items_above):
+            node = _StackNode(item, node)
+
+        self._top = node
+        return value
+
+    def __len__(self) -> int:
+        return self._top.size if self._top is not None else 0
+
+    def __getitem__(self, index_or_slice: Union[int, slice]):
+        if isinstance(index_or_slice, slice):
+            return list(self)[index_or_slice]
+
+        return self._get_node(self._normalize_index(index_or_slice)).value
+
+    def __iter__(self) -> Iterator[IType]:
+        items = []
+        node = self._top
+        while node is not None:
+            items.append(node.value)
+            node = node.previous
+        return reversed(items)
+
+    def reverse(self, start: int = 0, end: int = None, *, rotate: bool = False):
+        items = list(self)
+        if end is None:
+            end = len(items)
+
+        if rotate:
+            reverse = items[start:end]
+            reverse.append(reverse.pop(0))
+        else:
+            reverse = list(reversed(items[start:end]))
+
+        first_index, last_index, _ = slice(start, end).indices(len(items))
+        if first_index >= last_index:
+            return
+        items[start:end] = reverse
+
+        # only the changed items are included again
+        node = self._get_node(first_index - 1) if first_index > 0 else None
+        for item in items[first_index:]:
+            node = _StackNode(item, node)
+        self._top = node
@@ -1,7 +1,7 @@
 import ast
 from typing import Dict, List, Tuple
 
-from boa3.internal import constants
+from boa3.internal import constants, helpers
 from boa3.internal.analyser.astanalyser import IAstAnalyser
 from boa3.internal.model.symbol import ISymbol
 
@@ -17,7 +17,7 @@ class InitStatementsVisitor(IAstAnalyser):
     """
 
     def __init__(self, symbols: Dict[str, ISymbol], fail_fast: bool = True):
-        super().__init__(ast.parse(""), log=True, fail_fast=fail_fast)
+        super().__init__(helpers.parse(""), log=True, fail_fast=fail_fast)
         self.symbols = symbols.copy()
 
         self._deploy_instructions: List[ast.AST] = []
@@ -30,7 +30,7 @@ class InitStatementsVisitor(IAstAnalyser):
 
         visitor = InitStatementsVisitor(symbol_table)
 
-        root_ast = ast.parse("")
+        root_ast = helpers.parse("")
         root_ast.body = statements
         visitor.visit(root_ast)
 
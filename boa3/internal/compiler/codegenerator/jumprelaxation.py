@@ -0,0 +1,66 @@
+from itertools import accumulate
+from typing import Dict, List
+
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode import OpcodeHelper
+from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+from boa3.internal.neo.vm.opcode.OpcodeInformation import OpcodeInformation
+
+
+class JumpRelaxation:
+    """
+    Finds the instructions that must be replaced by their larger opcode because their target offset doesn't fit in
+    the opcode data.
+
+    The instructions sizes are kept in an array, so the addresses are computed with a prefix sum instead of being
+    updated in the code map for each replaced instruction. Replacing an opcode only increases the distance between the
+    other instructions and their targets, so the instructions found in one pass are never undone and it stops when a
+    pass doesn't find any new instruction.
+    """
+
+    def __init__(self, codes: List[VMCode]):
+        self._codes: List[VMCode] = codes
+        self._indexes: Dict[VMCode, int] = {code: index for index, code in enumerate(codes)}
+        self._sizes: List[int] = [code.size for code in codes]
+        self._addresses: List[int] = []
+
+    def _get_start_address(self, vm_code: VMCode) -> int:
+        index = self._indexes.get(vm_code)
+        if index is None:
+            return 0
+        return self._addresses[index]
+
+    def _update_addresses(self):
+        self._addresses = list(accumulate(self._sizes[:-1], initial=0)) if len(self._sizes) > 0 else []
+
+    def get_larger_codes(self) -> Dict[VMCode, OpcodeInformation]:
+        """
+        Gets the instructions that don't fit in their current opcode
+
+        :return: a dictionary that maps each instruction to the opcode information it must be updated to, ordered by
+                 the instructions addresses
+        """
+        small_codes = [index for index, code in enumerate(self._codes) if OpcodeHelper.has_larger_opcode(code.opcode)]
+        larger_codes: Dict[int, OpcodeInformation] = {}
+
+        while len(small_codes) > 0:
+            self._update_addresses()
+
+            still_small_codes = []
+            has_changed = False
+            for index in small_codes:
+                code = self._codes[index]
+                if len(code.encode_raw_data(self._get_start_address)) > code.info.max_data_len:
+                    info = OpcodeInfo.get_info(OpcodeHelper.get_larger_opcode(code.opcode))
+                    larger_codes[index] = info
+                    # the data is cleared when the opcode is updated, so it has the opcode data length
+                    self._sizes[index] = len(info.opcode) + info.data_len
+                    has_changed = True
+                else:
+                    still_small_codes.append(index)
+
+            if not has_changed:
+                break
+            small_codes = still_small_codes
+
+        return {self._codes[index]: larger_codes[index] for index in sorted(larger_codes)}
@@ -0,0 +1,423 @@
+from __future__ import annotations
+
+__all__ = [
+    'MethodInliner'
+]
+
+import copy
+from typing import Dict, FrozenSet, List, Optional, Set
+
+from boa3.internal.compiler.codegenerator.codeblockgraph import CodeBlockGraph
+from boa3.internal.model.debuginstruction import DebugInstruction
+from boa3.internal.model.method import Method
+from boa3.internal.neo.vm.CallCode import CallCode
+from boa3.internal.neo.vm.TryCode import TryCode
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode import OpcodeHelper
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+
+
+class MethodInliner:
+    """
+    Replaces the calls to small methods with a copy of the called method's instructions.
+
+    The arguments of the inlined method are stored in new local variables of the calling method, so only methods
+    without local variables are inlined, because the local variables are cleared in each call. Methods that call
+    themselves, that have try blocks or that are from other files are never inlined.
+
+    A call is inlined only if it doesn't make the bytecode bigger: the copy must not be bigger than the call, unless
+    it's the only call to the method. The methods that aren't public and whose calls were all inlined are removed from
+    the bytecode.
+    """
+
+    def __init__(self, graph: CodeBlockGraph, methods: List[Method], max_size: int = 0):
+        """
+        :param graph: the instructions where the calls are replaced
+        :param methods: the methods in the bytecode
+        :param max_size: the max size in bytes of the body of the methods that are inlined
+        """
+        self._graph: CodeBlockGraph = graph
+        self._methods: List[Method] = methods
+        self._max_size: int = max_size
+
+        self._methods_by_init: Dict[VMCode, Method] = {method.init_bytecode: method for method in methods
+                                                       if method.init_bytecode is not None}
+        self._calls_count: Dict[Method, int] = {}
+        self._referenced_methods: Set[Method] = set()
+
+        self.statistics: Dict[str, int] = {}
+
+    def inline(self) -> Dict[str, int]:
+        """
+        Inlines the calls to the methods that are small enough
+
+        :return: a dictionary with the number of inlined calls, the number of removed methods and the GAS saved in each
+                 call site
+        """
+        if self._max_size <= 0:
+            return self.statistics
+
+        self._count_references()
+
+        # the calls that are the target of other instructions than jumps can't be replaced
+        pinned_codes = set(self._methods_by_init)
+        for code in self._graph.codes:
+            if isinstance(code, TryCode):
+                pinned_codes.update((code.except_start_code, code.finally_start_code))
+
+        calls: Dict[Method, Dict[VMCode, Optional[int]]] = {}
+        for method in self._methods:
+            if method.init_bytecode is not None and method.end_bytecode is not None and method not in calls:
+                calls[method] = self._get_calls(method, pinned_codes)
+
+        for method in self._sort_by_calls(calls):
+            # the inlined methods are never executed at the same time, so all of them use the same local variables
+            first_slot = self._get_locals_count(method)
+            for call_code, line in calls[method].items():
+                callee = self._methods_by_init.get(self._graph.get_target(call_code))
+                if callee is None:
+                    continue
+
+                inlined_size = self._get_inlined_size(method, callee, first_slot)
+                if inlined_size is not None and self._is_size_kept(call_code, callee, inlined_size):
+                    self._inline_call(method, call_code, callee, first_slot)
+                    self._count_inlined_call(method, call_code, callee, line)
+
+        self._remove_not_called_methods(calls)
+        return self.statistics
+
+    def _count_references(self):
+        """
+        Counts the calls to each method and finds the methods that are referenced by other instructions than calls
+        """
+        for code in self._graph.codes:
+            method = self._methods_by_init.get(self._graph.get_target(code))
+            if method is None:
+                continue
+            if code.opcode in (Opcode.CALL, Opcode.CALL_L):
+                self._calls_count[method] = self._calls_count.get(method, 0) + 1
+            else:
+                self._referenced_methods.add(method)
+
+    def _is_removable(self, method: Method) -> bool:
+        """
+        Verifies if the method can be removed from the bytecode once it isn't called anymore
+        """
+        return not method.is_public and method not in self._referenced_methods
+
+    def _is_size_kept(self, call_code: VMCode, callee: Method, inlined_size: int) -> bool:
+        """
+        Verifies if inlining the call doesn't make the bytecode bigger
+        """
+        call_size = len(call_code.info.opcode) + call_code.info.data_len
+        if inlined_size <= call_size:
+            return True
+
+        # if it's the only call, the method is removed after it's inlined, so the copy replaces the original code
+        return self._calls_count.get(callee, 0) == 1 and self._is_removable(callee)
+
+    def _remove_not_called_methods(self, calls: Dict[Method, Dict[VMCode, Optional[int]]]):
+        """
+        Removes the methods whose calls were all inlined
+        """
+        removed_methods = set()
+        has_removed = True
+        while has_removed:
+            has_removed = False
+            for method in calls:
+                if (method in removed_methods or self._calls_count.get(method, 0) > 0
+                        or method not in self._calls_count or not self._is_removable(method)):
+                    continue
+
+                codes = self._graph.get_codes(method.init_bytecode, method.end_bytecode)
+                for code in codes:
+                    if code.opcode in (Opcode.CALL, Opcode.CALL_L):
+                        callee = self._methods_by_init.get(self._graph.get_target(code))
+                        if callee is not None:
+                            self._calls_count[callee] -= 1
+
+                self._graph.remove_codes(codes)
+                method.remove_instruction_codes(codes)
+                method.init_address = None
+                method.init_bytecode = None
+                method.end_bytecode = None
+
+                removed_methods.add(method)
+                has_removed = True
+
+        if len(removed_methods) > 0:
+            self.statistics['removed methods'] = len(removed_methods)
+
+    def _get_calls(self, method: Method, pinned_codes: Set[VMCode]) -> Dict[VMCode, Optional[int]]:
+        """
+        Gets the calls in the method that can be replaced
+
+        :return: a dictionary that maps each call to the line of the statement that includes it
+        """
+        statement_lines = {instruction.code: instruction.start_line for instruction in method.debug_map()}
+        calls = {}
+        line = None
+        for code in self._graph.get_codes(method.init_bytecode, method.end_bytecode):
+            line = statement_lines.get(code, line)
+            if code.opcode in (Opcode.CALL, Opcode.CALL_L) and code not in pinned_codes:
+                calls[code] = line
+        return calls
+
+    def _sort_by_calls(self, calls: Dict[Method, Dict[VMCode, Optional[int]]]) -> List[Method]:
+        """
+        Sorts the methods so the called methods are before the methods that call them, so the calls in the inlined
+        methods are inlined too
+        """
+        callees: Dict[Method, List[Method]] = {}
+        for method, method_calls in calls.items():
+            targets = (self._methods_by_init.get(self._graph.get_target(call_code)) for call_code in method_calls)
+            callees[method] = [callee for callee in targets if callee in calls]
+
+        sorted_methods = []
+        visited = set()
+        for method in callees:
+            if method in visited:
+                continue
+            visited.add(method)
+            # it's not recursive because the chain of calls can be longer than the recursion limit
+            stack = [(method, iter(callees[method]))]
+            while len(stack) > 0:
+                current, next_callees = stack[-1]
+                callee = next(next_callees, None)
+                if callee is None:
+                    stack.pop()
+                    sorted_methods.append(current)
+                elif callee not in visited:
+                    visited.add(callee)
+                    stack.append((callee, iter(callees[callee])))
+        return sorted_methods
+
+    def _get_inlined_size(self, caller: Method, callee: Method, first_slot: int) -> Optional[int]:
+        """
+        Gets the size of the instructions that replace a call to the method
+
+        :return: the size in bytes if the method can be inlined in the calling method. None otherwise
+        """
+        if callee is caller or callee.end_bytecode is None or callee.file_origin != caller.file_origin:
+            return None
+
+        args_count = self._get_args_count(callee)
+        if args_count is None:
+            return None
+        if args_count > 0 and caller.init_bytecode.opcode is not Opcode.INITSLOT:
+            # the arguments need new local variables in the calling method
+            return None
+        if first_slot + args_count > _MAX_SLOTS:
+            return None
+
+        codes = self._graph.get_codes(callee.init_bytecode, callee.end_bytecode)
+        if len(codes) == 0 or codes[-1] is not callee.end_bytecode:
+            return None
+
+        body = codes[1:-1] if callee.init_bytecode.opcode is Opcode.INITSLOT else codes[:-1]
+        size = 0
+        inlined_size = sum(self._get_slot_code_size(first_slot + arg) for arg in range(args_count))
+        for code in body:
+            if isinstance(code, TryCode) or code.opcode in _NOT_INLINED_OPCODES or code.opcode in _LOCAL_SLOT_OPCODES:
+                return None
+
+            target = self._graph.get_target(code)
+            if target is callee.init_bytecode and isinstance(code, CallCode):
+                # it's recursive
+                return None
+            if target is not None and not isinstance(code, CallCode) and target not in codes:
+                return None
+
+            # the jumps are counted with their short size, since the addresses aren't computed yet
+            code_size = ((len(code.info.opcode) + code.info.data_len) if OpcodeHelper.has_target(code.opcode)
+                         else code.size)
+            size += code_size
+            if size > self._max_size:
+                return None
+
+            if code.opcode is Opcode.RET:
+                # the returns before the last one are replaced by jumps
+                inlined_size += len(OpcodeInfo.JMP.opcode) + OpcodeInfo.JMP.data_len
+            elif code.opcode in _ARG_SLOT_INDEXES:
+                inlined_size += self._get_slot_code_size(first_slot + self._get_slot_index(code))
+            else:
+                inlined_size += code_size
+
+        return inlined_size
+
+    def _inline_call(self, caller: Method, call_code: VMCode, callee: Method, first_slot: int):
+        graph = self._graph
+        continuation = graph.get_next_code(call_code)
+        if continuation is None:
+            return
+
+        callee_codes = graph.get_codes(callee.init_bytecode, callee.end_bytecode)
+        args_count = self._get_args_count(callee)
+
+        new_codes: List[VMCode] = []
+        copied_codes: Dict[VMCode, VMCode] = {}
+
+        # the arguments are in the stack in the order they are popped by INITSLOT
+        for arg in range(args_count):
+            new_codes.append(self._get_slot_code(first_slot + arg, is_store=True))
+
+        body = callee_codes[1:] if callee.init_bytecode.opcode is Opcode.INITSLOT else callee_codes
+        for index, code in enumerate(body):
+            if code.opcode is Opcode.RET:
+                if index == len(body) - 1:
+                    # the last return continues in the next instruction of the calling method
+                    copied_codes[code] = continuation
+                    continue
+                new_code = VMCode(OpcodeInfo.JMP)
+            elif code.opcode in _ARG_SLOT_INDEXES:
+                new_code = self._get_slot_code(first_slot + self._get_slot_index(code),
+                                               is_store=code.opcode in _STORE_ARG_OPCODES)
+            else:
+                new_code = copy.copy(code)
+                new_code.clear_encoding_cache()
+
+            copied_codes[code] = new_code
+            new_codes.append(new_code)
+
+        if len(new_codes) > 0:
+            copied_codes[callee.init_bytecode] = new_codes[0]
+        else:
+            copied_codes[callee.init_bytecode] = continuation
+
+        graph.replace_code(call_code, new_codes)
+        self._calls_count[callee] -= 1
+        for new_code in new_codes:
+            if new_code.opcode in (Opcode.CALL, Opcode.CALL_L):
+                called_method = self._methods_by_init.get(graph.get_target(new_code))
+                if called_method is not None:
+                    self._calls_count[called_method] = self._calls_count.get(called_method, 0) + 1
+        for code, new_code in copied_codes.items():
+            if new_code is continuation or isinstance(code, (CallCode, TryCode)):
+                continue
+            if code.opcode is Opcode.RET:
+                graph.set_target(new_code, continuation)
+            elif OpcodeHelper.has_target(code.opcode):
+                graph.set_target(new_code, copied_codes[graph.get_target(code)])
+
+        if args_count > 0:
+            self._set_locals_count(caller, first_slot + args_count)
+
+        # the debugger can still stop in the statements of the inlined method
+        caller.replace_instruction_codes({call_code: copied_codes[callee.init_bytecode]})
+        caller.include_copied_instructions(
+            DebugInstruction(copied_codes[instruction.code], instruction.start_line, instruction.start_col,
+                             instruction.end_line, instruction.end_col)
+            for instruction in callee.debug_map()
+            if instruction.code in copied_codes and copied_codes[instruction.code] is not continuation
+        )
+
+    def _count_inlined_call(self, caller: Method, call_code: VMCode, callee: Method, line: Optional[int]):
+        args_count = self._get_args_count(callee)
+        callee_codes = self._graph.get_codes(callee.init_bytecode, callee.end_bytecode)
+        returns_count = len([code for code in callee_codes if code.opcode is Opcode.RET])
+
+        saved_price = (_OPCODE_PRICES[call_code.opcode] + _OPCODE_PRICES[Opcode.RET]
+                       - args_count * _OPCODE_PRICES[Opcode.STLOC])
+        if callee.init_bytecode.opcode is Opcode.INITSLOT:
+            saved_price += _OPCODE_PRICES[Opcode.INITSLOT]
+        if returns_count > 1:
+            # the returns before the last one are replaced by jumps
+            saved_price -= _OPCODE_PRICES[Opcode.JMP]
+
+        call_site = 'inlined {0} in {1}'.format(self._get_method_name(callee), self._get_method_name(caller))
+        if line is not None:
+            call_site += ' line {0}'.format(line)
+
+        site_key = '{0} (GAS)'.format(call_site)
+        count = 1
+        while site_key in self.statistics:
+            count += 1
+            site_key = '{0} #{1} (GAS)'.format(call_site, count)
+
+        self.statistics['inlined calls'] = self.statistics.get('inlined calls', 0) + 1
+        self.statistics[site_key] = saved_price * _DEFAULT_EXEC_FEE_FACTOR
+
+    @staticmethod
+    def _get_method_name(method: Method) -> str:
+        name = getattr(method.origin, 'name', None)
+        return name if isinstance(name, str) else 'method'
+
+    @staticmethod
+    def _get_args_count(method: Method) -> Optional[int]:
+        """
+        Gets the number of arguments of the method if it can be inlined
+
+        :return: the number of arguments if the method doesn't have local variables. None otherwise
+        """
+        init_code = method.init_bytecode
+        if init_code.opcode is not Opcode.INITSLOT:
+            return 0
+        locals_count, args_count = init_code.data[0], init_code.data[1]
+        return args_count if locals_count == 0 else None
+
+    @staticmethod
+    def _get_locals_count(method: Method) -> int:
+        init_code = method.init_bytecode
+        return init_code.data[0] if init_code.opcode is Opcode.INITSLOT else 0
+
+    def _set_locals_count(self, method: Method, locals_count: int):
+        init_code = method.init_bytecode
+        if locals_count > self._get_locals_count(method):
+            self._graph.update_code(init_code, init_code.info, bytes([locals_count, init_code.data[1]]))
+
+    @staticmethod
+    def _get_slot_index(code: VMCode) -> int:
+        index = _ARG_SLOT_INDEXES[code.opcode]
+        return index if index is not None else code.data[0]
+
+    @staticmethod
+    def _get_slot_code_size(index: int) -> int:
+        # the loads and stores of the local variables have short versions without data for the first indexes
+        return 1 if index < 7 else 2
+
+    @staticmethod
+    def _get_slot_code(index: int, is_store: bool) -> VMCode:
+        opcode = (OpcodeHelper.get_store(index, local=True) if is_store
+                  else OpcodeHelper.get_load(index, local=True))
+        data = bytes([index]) if opcode in (Opcode.STLOC, Opcode.LDLOC) else None
+        return VMCode(OpcodeInfo.get_info(opcode), data)
+
+
+# region Opcode tables
+
+_MAX_SLOTS = 255
+
+# the price of the opcodes in the Neo VM, that is multiplied by the execution fee factor. The compiler doesn't keep the
+# prices of the opcodes elsewhere, so these are the values of the OpCodePriceTable of the Neo N3 ApplicationEngine
+_OPCODE_PRICES: Dict[Opcode, int] = {
+    Opcode.CALL: 1 << 9,
+    Opcode.CALL_L: 1 << 9,
+    Opcode.INITSLOT: 1 << 6,
+    Opcode.RET: 0,
+    Opcode.JMP: 1 << 1,
+    Opcode.STLOC: 1 << 1,
+}
+# the default value of the execution fee factor of the Policy native contract, that the network can change
+_DEFAULT_EXEC_FEE_FACTOR = 30
+
+# maps the argument slot opcodes to their index. The index of the opcodes with data is None
+_ARG_SLOT_INDEXES: Dict[Opcode, Optional[int]] = {
+    **{OpcodeHelper.get_load(index, local=True, is_arg=True): index for index in range(7)},
+    **{OpcodeHelper.get_store(index, local=True, is_arg=True): index for index in range(7)},
+    Opcode.LDARG: None,
+    Opcode.STARG: None,
+}
+_STORE_ARG_OPCODES: FrozenSet[Opcode] = frozenset(
+    [OpcodeHelper.get_store(index, local=True, is_arg=True) for index in range(7)] + [Opcode.STARG]
+)
+_LOCAL_SLOT_OPCODES: FrozenSet[Opcode] = frozenset(
+    [OpcodeHelper.get_load(index, local=True) for index in range(8)]
+    + [OpcodeHelper.get_store(index, local=True) for index in range(8)]
+)
+
+# the opcodes that depend on the context of the method, so the methods that use them aren't inlined
+_NOT_INLINED_OPCODES: FrozenSet[Opcode] = frozenset((Opcode.INITSLOT, Opcode.PUSHA, Opcode.TRY, Opcode.TRY_L,
+                                                     Opcode.ENDTRY, Opcode.ENDTRY_L, Opcode.ENDFINALLY))
+
+# endregion
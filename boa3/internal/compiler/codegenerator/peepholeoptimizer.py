@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+__all__ = [
+    'PeepholeOptimizer'
+]
+
+from typing import Dict, FrozenSet, List, Optional, Set
+
+from boa3.internal.compiler.codegenerator.codeblockgraph import CodeBlockGraph
+from boa3.internal.model.method import Method
+from boa3.internal.neo.vm.CallCode import CallCode
+from boa3.internal.neo.vm.TryCode import TryCode
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode import OpcodeHelper
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+from boa3.internal.neo.vm.type.StackItem import StackItemType
+
+
+class PeepholeOptimizer:
+    """
+    Replaces short sequences of instructions with equivalent ones that are cheaper to run.
+
+    Each pass threads the jumps that target unconditional jumps and then rewrites the instructions with a window over
+    the last instructions that were kept, so a rewrite can enable another one with the instructions before it in the
+    same pass. The passes are repeated until nothing changes.
+
+    An instruction that is the target of a jump can only be the first of a rewritten sequence, and the jumps to an
+    instruction that is removed are moved to the next instruction that is kept. The first and last instructions of the
+    methods and the first instructions of the except and finally blocks are never removed, because they are referenced
+    by offsets that aren't updated with the jumps.
+
+    The instructions are changed in a CodeBlockGraph, so the addresses are not updated while rewriting them.
+    """
+
+    def __init__(self, graph: CodeBlockGraph, methods: List[Method], keep_sequence_points: bool = False,
+                 known_types: Dict[VMCode, StackItemType] = None):
+        """
+        :param graph: the instructions that will be rewritten
+        :param methods: the methods in the bytecode, whose boundaries and debug information are kept valid
+        :param keep_sequence_points: if the first instruction of each Python statement must be kept, so the debugger
+                                     can still stop in every statement
+        :param known_types: the type of the item in the top of the stack before each instruction, for the instructions
+                            where it's known at compile time
+        """
+        self._methods: List[Method] = methods
+        self._keep_sequence_points: bool = keep_sequence_points
+        self._known_types: Dict[VMCode, StackItemType] = known_types if isinstance(known_types, dict) else {}
+        self._graph: CodeBlockGraph = graph
+
+        self._entries: Set[VMCode] = set()
+        self._pinned: Set[VMCode] = set()
+        self._kept: List[VMCode] = []
+        self._pending: List[VMCode] = []
+        self._replaced: Dict[VMCode, VMCode] = {}
+
+        self.statistics: Dict[str, int] = {}
+
+    def optimize(self) -> Dict[str, int]:
+        """
+        Rewrites the instructions until there's nothing else to change
+
+        :return: a dictionary that maps each rewrite to the number of times it was applied
+        """
+        while self._optimize_once():
+            pass
+        return self.statistics
+
+    def _optimize_once(self) -> bool:
+        has_changed = self._thread_jumps()
+        self._find_entries()
+
+        self._kept = []
+        self._pending = []
+        self._replaced = {}
+        for code in self._graph.codes:
+            for removed_code in self._pending:
+                self._replace(removed_code, code)
+            self._pending.clear()
+
+            self._kept.append(code)
+            while self._rewrite_last_codes():
+                has_changed = True
+
+        # the codes removed at the end don't have a code to replace them, so they are kept
+        self._pending.clear()
+        if len(self._replaced) > 0:
+            replaced_codes = {code: self._get_replacement(code) for code in self._replaced}
+            self._graph.remove_codes(replaced_codes)
+            for method in self._methods:
+                method.replace_instruction_codes(replaced_codes)
+
+        return has_changed
+
+    def _thread_jumps(self) -> bool:
+        """
+        Changes the jumps that target an unconditional jump to target the final destination instead
+        """
+        has_changed = False
+        graph = self._graph
+        for code in graph.codes:
+            if not OpcodeHelper.is_jump(code.opcode):
+                continue
+            current_target = graph.get_target(code)
+            if current_target is None:
+                continue
+
+            target = current_target
+            visited = {code}
+            while (target.opcode in _UNCONDITIONAL_JUMPS and graph.get_target(target) is not None
+                   and target not in visited):
+                visited.add(target)
+                target = graph.get_target(target)
+
+            if target is not current_target and target is not code:
+                graph.set_target(code, target)
+                self._count('jump threading')
+                has_changed = True
+
+        return has_changed
+
+    def _find_entries(self):
+        """
+        Finds the instructions where the execution can start without running the instruction before them
+        """
+        entries = set()
+        pinned = set()
+        for code in self._graph.codes:
+            if isinstance(code, TryCode):
+                pinned.update(handler for handler in (code.except_start_code, code.finally_start_code)
+                              if handler is not None)
+            elif isinstance(code, CallCode):
+                if code.target is not None:
+                    pinned.add(code.target)
+            elif OpcodeHelper.has_target(code.opcode):
+                target = self._graph.get_target(code)
+                if target is not None:
+                    entries.add(target)
+
+        for method in self._methods:
+            pinned.update(code for code in (method.init_bytecode, method.init_defaults_bytecode, method.end_bytecode)
+                          if code is not None)
+            if self._keep_sequence_points:
+                pinned.update(instruction.code for instruction in method.debug_map())
+
+        entries.update(pinned)
+        self._entries = entries
+        self._pinned = pinned
+
+    def _rewrite_last_codes(self) -> bool:
+        """
+        Rewrites the last instructions that were kept if they match any of the patterns
+
+        :return: whether the instructions were changed
+        """
+        kept = self._kept
+        if len(kept) < 2:
+            return False
+
+        last = kept[-1]
+        previous = kept[-2]
+
+        if (previous.opcode in _UNCONDITIONAL_JUMPS and previous not in self._pinned
+                and self._get_replacement(self._graph.get_target(previous)) is last):
+            # JMP to the next instruction
+            kept.pop(-2)
+            self._replace(previous, last)
+            self._count('jump to next')
+            return True
+
+        if (last.opcode is Opcode.RET and len(kept) > 2 and previous not in self._entries
+                and kept[-3] not in self._pinned and self._is_dead_store(kept[-3], previous)):
+            # STLOC n; LDLOC n; RET or DUP; STLOC n; RET, the local is discarded when the method returns
+            store_codes = kept[-3:-1]
+            del kept[-3:-1]
+            for code in store_codes:
+                self._replace(code, last)
+            self._count('dead store before return')
+            return True
+
+        if last in self._entries:
+            # it can be executed without the previous instructions
+            return False
+
+        if last.opcode is Opcode.DROP and previous.opcode in _PUSH_OPCODES and previous not in self._pinned:
+            # PUSH x; DROP or DUP; DROP
+            del kept[-2:]
+            self._pending.extend((previous, last))
+            self._count('push and drop')
+            return True
+
+        if previous.opcode is Opcode.NOT and last.opcode in _NEGATED_JUMPS and previous not in self._pinned:
+            # NOT; JMPIF -> JMPIFNOT
+            kept.pop(-2)
+            self._replace(previous, last)
+            last.set_opcode(OpcodeInfo.get_info(_NEGATED_JUMPS[last.opcode]))
+            self._count('negated jump')
+            return True
+
+        if (last.opcode is Opcode.CONVERT
+                and last.data in (self._get_result_type(previous), self._known_types.get(last))):
+            # the value already has the type it's converted to
+            kept.pop()
+            self._pending.append(last)
+            self._count('redundant convert')
+            return True
+
+        if (last.opcode is Opcode.ISTYPE and previous.opcode in _CONSTANT_TYPES and previous not in self._pinned
+                and last.data != StackItemType.Any):
+            # the type of a constant is known at compile time
+            kept.pop(-2)
+            self._replace(previous, last)
+            is_type = _CONSTANT_TYPES[previous.opcode] == last.data
+            self._graph.update_code(last, OpcodeInfo.PUSHT if is_type else OpcodeInfo.PUSHF)
+            self._count('constant type check')
+            return True
+
+        if (previous.opcode in _LONG_STORE_OPCODES and OpcodeHelper.get_store_from_load(last.opcode) is previous.opcode
+                and last.data == previous.data):
+            # STLOC n; LDLOC n -> DUP; STLOC n, it's only shorter when the slot index is in the opcode data
+            store_info = previous.info
+            store_data = previous.raw_data
+            self._graph.update_code(previous, OpcodeInfo.DUP)
+            self._graph.update_code(last, store_info, store_data)
+            self._count('store and load')
+            return True
+
+        return False
+
+    def _is_dead_store(self, first: VMCode, second: VMCode) -> bool:
+        if first.opcode is Opcode.DUP:
+            return second.opcode in _LOCAL_STORE_OPCODES
+        return (first.opcode in _LOCAL_STORE_OPCODES
+                and OpcodeHelper.get_store_from_load(second.opcode) is first.opcode
+                and first.data == second.data)
+
+    @staticmethod
+    def _get_result_type(code: VMCode) -> Optional[bytes]:
+        if code.opcode is Opcode.CONVERT:
+            return code.data
+        result_type = _RESULT_TYPES.get(code.opcode)
+        return result_type.value if result_type is not None else None
+
+    def _replace(self, code: VMCode, replacement: VMCode):
+        self._replaced[code] = replacement
+        if code in self._entries:
+            self._entries.add(replacement)
+
+    def _get_replacement(self, code: Optional[VMCode]) -> Optional[VMCode]:
+        while code in self._replaced:
+            code = self._replaced[code]
+        return code
+
+    def _count(self, rewrite: str):
+        self.statistics[rewrite] = self.statistics.get(rewrite, 0) + 1
+
+
+# region Opcode tables
+
+_UNCONDITIONAL_JUMPS: FrozenSet[Opcode] = frozenset((Opcode.JMP, Opcode.JMP_L))
+
+_NEGATED_JUMPS: Dict[Opcode, Opcode] = {
+    Opcode.JMPIF: Opcode.JMPIFNOT,
+    Opcode.JMPIF_L: Opcode.JMPIFNOT_L,
+    Opcode.JMPIFNOT: Opcode.JMPIF,
+    Opcode.JMPIFNOT_L: Opcode.JMPIF_L,
+}
+
+# the type of the values pushed by the opcodes that push constants
+_CONSTANT_TYPES: Dict[Opcode, StackItemType] = {
+    **{opcode: StackItemType.Integer for opcode in Opcode if Opcode.PUSHINT8 <= opcode <= Opcode.PUSHINT256},
+    **{opcode: StackItemType.Integer for opcode in Opcode if Opcode.PUSHM1 <= opcode <= Opcode.PUSH16},
+    Opcode.PUSHT: StackItemType.Boolean,
+    Opcode.PUSHF: StackItemType.Boolean,
+    **{opcode: StackItemType.ByteString for opcode in Opcode if Opcode.PUSHDATA1 <= opcode <= Opcode.PUSHDATA4},
+}
+
+# the opcodes that only push a value, without changing anything else
+_PUSH_OPCODES: FrozenSet[Opcode] = frozenset(
+    [Opcode.PUSHNULL, Opcode.DUP, Opcode.OVER]
+    + list(_CONSTANT_TYPES)
+    + [opcode for opcode in Opcode if OpcodeHelper.is_load_slot(opcode)]
+)
+
+# the type of the result of the opcodes that always push the same type
+_RESULT_TYPES: Dict[Opcode, StackItemType] = {
+    **_CONSTANT_TYPES,
+    **{opcode: StackItemType.Boolean for opcode in (Opcode.NOT, Opcode.BOOLAND, Opcode.BOOLOR, Opcode.NZ,
+                                                    Opcode.EQUAL, Opcode.NOTEQUAL, Opcode.NUMEQUAL,
+                                                    Opcode.NUMNOTEQUAL, Opcode.LT, Opcode.LE, Opcode.GT, Opcode.GE,
+                                                    Opcode.WITHIN, Opcode.ISNULL, Opcode.ISTYPE, Opcode.HASKEY)},
+    **{opcode: StackItemType.Integer for opcode in (Opcode.INVERT, Opcode.AND, Opcode.OR, Opcode.XOR, Opcode.SIGN,
+                                                    Opcode.ABS, Opcode.NEGATE, Opcode.INC, Opcode.DEC, Opcode.ADD,
+                                                    Opcode.SUB, Opcode.MUL, Opcode.DIV, Opcode.MOD, Opcode.POW,
+                                                    Opcode.SQRT, Opcode.MODMUL, Opcode.MODPOW, Opcode.SHL, Opcode.SHR,
+                                                    Opcode.MIN, Opcode.MAX, Opcode.SIZE, Opcode.DEPTH)},
+    **{opcode: StackItemType.Buffer for opcode in (Opcode.CAT, Opcode.SUBSTR, Opcode.LEFT, Opcode.RIGHT,
+                                                   Opcode.NEWBUFFER)},
+}
+
+# the store opcodes that have the slot index in their data
+_LONG_STORE_OPCODES: FrozenSet[Opcode] = frozenset((Opcode.STLOC, Opcode.STARG, Opcode.STSFLD))
+
+# the store opcodes of the slots that are discarded when the method returns
+_LOCAL_STORE_OPCODES: FrozenSet[Opcode] = frozenset(
+    [OpcodeHelper.get_store(index, local=True, is_arg=is_arg) for index in range(8) for is_arg in (False, True)]
+)
+
+# endregion
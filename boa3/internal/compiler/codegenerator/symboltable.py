@@ -0,0 +1,47 @@
+class SymbolTable(dict):
+    """
+    A dictionary of symbols that counts its changes, so the values computed from the symbols can be reused while the
+    table isn't changed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._version: int = 0
+
+    @property
+    def version(self) -> int:
+        """
+        Gets the number of times the table was changed
+        """
+        return self._version
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._version += 1
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._version += 1
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self._version += 1
+        return result
+
+    def setdefault(self, key, default=None):
+        result = super().setdefault(key, default)
+        self._version += 1
+        return result
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._version += 1
+
+    def clear(self):
+        super().clear()
+        self._version += 1
@@ -1,15 +1,37 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator, Mapping
 from typing import List, Dict, Optional
 
 from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode import OpcodeHelper
 
 
 class VMCodeMap:
+    """
+    Stores the generated instructions ordered by their address in the bytecode.
+
+    The addresses are kept in a sorted list, so address lookups are done with binary search, and each instruction is
+    mapped to its position in the list, so instruction lookups don't need to iterate over the codes.
+    """
+
     def __init__(self):
         self._vm_code_list: List[VMCode] = []
         self._vm_code_addresses: List[int] = []
 
+        # maps each instruction with its index in the lists, VMCode uses identity for hashing and equality
+        self._vm_code_indexes: Dict[VMCode, int] = {}
+
         # optimization so it's not needed to iterate over everything in search of targets
-        self._vm_code_with_target: List[VMCode] = []
+        # it's a dict instead of a list to remove the codes in constant time, the values are not used
+        self._vm_code_with_target: Dict[VMCode, None] = {}
+
+        # incremented every time an address changes, so cached data that depends on the layout can be invalidated
+        self._version: int = 0
+        # incremented only when the address of an instruction that was already included changes
+        self._addresses_version: int = 0
+        self._code_map_view = VMCodeAddressView(self)
 
     def __len__(self) -> int:
         return self._vm_code_list.__len__()
@@ -17,16 +39,34 @@ class VMCodeMap:
     def clear(self):
         self._vm_code_addresses.clear()
         self._vm_code_list.clear()
-
-    def get_code_map(self) -> Dict[int, VMCode]:
-        size = len(self)
-        return {self._vm_code_addresses[index]: self._vm_code_list[index] for index in range(size)}
+        self._vm_code_indexes.clear()
+        self._vm_code_with_target.clear()
+        self._version += 1
+        self._addresses_version += 1
+
+    @property
+    def version(self) -> int:
+        """
+        Gets the current version of the instructions layout. It changes every time an instruction address changes.
+        """
+        return self._version
+
+    @property
+    def addresses_version(self) -> int:
+        """
+        Gets the current version of the instructions addresses. Unlike the layout version, it doesn't change when an
+        instruction is included in the end of the map.
+        """
+        return self._addresses_version
+
+    def get_code_map(self) -> VMCodeAddressView:
+        return self._code_map_view
 
     def get_code_list(self) -> List[VMCode]:
         return self._vm_code_list
 
     def get_code_with_target_list(self) -> List[VMCode]:
-        return self._vm_code_with_target
+        return list(self._vm_code_with_target)
 
     def get_bytecode_size(self) -> int:
         if len(self) < 1:
@@ -35,59 +75,85 @@ class VMCodeMap:
         return self._vm_code_addresses[-1] + self._vm_code_list[-1].size
 
     def insert_code(self, vm_code: VMCode, has_target: bool = False):
-        if vm_code not in self._vm_code_list:
+        if vm_code not in self._vm_code_indexes:
+            self._vm_code_indexes[vm_code] = len(self._vm_code_list)
             self._vm_code_addresses.append(self.get_bytecode_size())
             self._vm_code_list.append(vm_code)
+            self._version += 1
 
             if has_target:
-                self._vm_code_with_target.append(vm_code)
+                self._vm_code_with_target[vm_code] = None
+
+    def set_codes(self, codes: List[VMCode]):
+        """
+        Replaces all the instructions, computing their addresses only once
+
+        :param codes: the instructions in the order they are in the bytecode
+        """
+        self._vm_code_list = list(codes)
+        self._vm_code_indexes = {code: index for index, code in enumerate(self._vm_code_list)}
+        self._vm_code_with_target = {code: None for code in self._vm_code_list
+                                     if OpcodeHelper.has_target(code.opcode)}
+        self._update_addresses_from_index(0)
+
+    def _get_index(self, address: int) -> Optional[int]:
+        """
+        Gets the index of the instruction that starts in the given address
+
+        :return: the index of the instruction if there is one starting at the address. None otherwise
+        """
+        index = bisect_left(self._vm_code_addresses, address)
+        if index < len(self._vm_code_addresses) and self._vm_code_addresses[index] == address:
+            return index
+        return None
 
     def get_code(self, address: int) -> Optional[VMCode]:
-        try:
-            index = self._vm_code_addresses.index(address)
-        except ValueError:
-            # the address is not int the list
-            if address >= self.get_bytecode_size():
-                # the address is not in the bytecode
-                return None
-
-            # if the address is not the start of a instruction, gets the last instruction before given address
-            code_address = 0
-            for addr in self._vm_code_addresses:
-                if addr > address:
-                    break
-                code_address = addr
-
-            index = self._vm_code_addresses.index(code_address)
+        if len(self) < 1 or address >= self.get_bytecode_size():
+            # the address is not in the bytecode
+            return None
+
+        # if the address is not the start of a instruction, gets the last instruction before given address
+        index = bisect_right(self._vm_code_addresses, address) - 1
+        if index < 0:
+            index = 0
 
         return self._vm_code_list[index]
 
     def get_start_address(self, vm_code: VMCode) -> int:
-        try:
-            index = self._vm_code_list.index(vm_code)
-            return self._vm_code_addresses[index]
-        except ValueError:
+        index = self._vm_code_indexes.get(vm_code)
+        if index is None:
             return 0
+        return self._vm_code_addresses[index]
 
     def get_end_address(self, vm_code: VMCode) -> int:
-        try:
-            index = self._vm_code_list.index(vm_code) + 1
-            if index == len(self._vm_code_list):
-                return self.get_bytecode_size()
-            else:
-                return self._vm_code_addresses[index] - 1
-        except ValueError:
+        index = self._vm_code_indexes.get(vm_code)
+        if index is None:
             return 0
 
+        index += 1
+        if index == len(self._vm_code_list):
+            return self.get_bytecode_size()
+        else:
+            return self._vm_code_addresses[index] - 1
+
+    def get_next_address(self, address: int) -> int:
+        """
+        Gets the address of the first instruction after the given address
+
+        :return: the address of the next instruction. If there isn't one, returns the bytecode size
+        """
+        index = bisect_right(self._vm_code_addresses, address)
+        if index < len(self._vm_code_addresses):
+            return self._vm_code_addresses[index]
+        return self.get_bytecode_size()
+
     def get_addresses(self, start_address: int, end_address: int) -> List[int]:
         if start_address > end_address:
             start_address, end_address = end_address, start_address
 
-        addresses = []
-        for address in range(start_address, end_address + 1):
-            if address in self._vm_code_addresses:
-                addresses.append(address)
-        return addresses
+        first_index = bisect_left(self._vm_code_addresses, start_address)
+        last_index = bisect_right(self._vm_code_addresses, end_address)
+        return self._vm_code_addresses[first_index:last_index]
 
     def get_addresses_from_codes(self, codes: List[VMCode]) -> List[int]:
         if len(codes) < 1:
@@ -95,11 +161,9 @@ class VMCodeMap:
 
         addresses = []
         for vm_code in codes:
-            try:
-                index = self._vm_code_list.index(vm_code)
+            index = self._vm_code_indexes.get(vm_code)
+            if index is not None:
                 addresses.append(self._vm_code_addresses[index])
-            except ValueError:
-                continue
 
         return addresses
 
@@ -107,40 +171,62 @@ class VMCodeMap:
         codes = []
 
         for address in sorted(addresses):
-            try:
-                index = self._vm_code_addresses.index(address)
+            index = self._get_index(address)
+            if index is not None:
                 codes.append(self._vm_code_list[index])
-            except ValueError:
-                # address not in list
-                continue
 
         return codes
 
     def update_addresses(self, start_address: int = 0):
-        next_address = -1
-        final_size = len(self._vm_code_list)
+        # the addresses list is always sorted, even if it's outdated
+        first_index = bisect_left(self._vm_code_addresses, start_address)
+        self._update_addresses_from_index(first_index)
+
+    def _update_addresses_from_index(self, first_index: int):
+        """
+        Recalculates the addresses of the instructions starting at the given index. The addresses before it must be
+        up-to-date.
 
+        :param first_index: the index of the first instruction that may have changed its address
+        """
+        final_size = len(self._vm_code_list)
         if len(self._vm_code_addresses) > final_size:
-            self._vm_code_addresses = self._vm_code_addresses[:final_size]
+            del self._vm_code_addresses[final_size:]
 
-        for index in range(final_size):
-            address = self._vm_code_addresses[index]
+        if first_index >= final_size:
+            self._version += 1
+            self._addresses_version += 1
+            return
 
-            if address >= start_address:
-                if next_address < 0:
-                    if index > 0:
-                        new_address = self._vm_code_addresses[index - 1]
-                        next_address = new_address + self._vm_code_list[index - 1].size
-                    else:
-                        next_address = 0
+        if first_index > 0:
+            next_address = self._vm_code_addresses[first_index - 1] + self._vm_code_list[first_index - 1].size
+        else:
+            first_index = 0
+            next_address = 0
+
+        addresses = self._vm_code_addresses
+        codes = self._vm_code_list
+        for index in range(first_index, final_size):
+            if index < len(addresses):
+                addresses[index] = next_address
+            else:
+                addresses.append(next_address)
+            next_address += codes[index].size
+
+        # changes the version only after all the addresses are updated, so anything cached during the update is discarded
+        self._version += 1
+        self._addresses_version += 1
 
-                if next_address != address:
-                    if index < len(self._vm_code_addresses):
-                        self._vm_code_addresses[index] = next_address
-                    else:
-                        self._vm_code_addresses.append(next_address)
+    def _update_indexes_from_index(self, first_index: int):
+        """
+        Updates the instruction to index mapping after the instructions starting at the given index were moved
 
-                next_address += self._vm_code_list[index].size
+        :param first_index: the index of the first instruction that may have been moved
+        """
+        indexes = self._vm_code_indexes
+        codes = self._vm_code_list
+        for index in range(first_index, len(codes)):
+            indexes[codes[index]] = index
 
     def move_to_end(self, first_code_address: int, last_code_address: int) -> Optional[int]:
         if last_code_address < first_code_address:
@@ -151,40 +237,84 @@ class VMCodeMap:
             # there's nothing to change if it's moving the all the codes
             return
 
-        first_index = -1
-        last_index = 0
-        for index, address in enumerate(self._vm_code_addresses):
-            if first_code_address <= address and first_index < 0:
-                first_index = index
-            elif address > last_code_address:
-                last_index = index
-                break
+        size = len(self._vm_code_addresses)
+        first_index = bisect_left(self._vm_code_addresses, first_code_address)
 
-        if first_index >= 0:
-            # if the first index was not set, there's nothing to move
-            if last_index < first_index:
-                last_index = len(self._vm_code_addresses)
+        if first_index < size:
+            # if there isn't an instruction after the first address, there's nothing to move
+            # the first instruction found is always moved, even if it starts after the last address
+            last_index = max(bisect_right(self._vm_code_addresses, last_code_address), first_index + 1)
 
             self._vm_code_list[first_index:] = (self._vm_code_list[last_index:] +
                                                 self._vm_code_list[first_index:last_index])
-            self.update_addresses(first_code_address)
+            self._update_indexes_from_index(first_index)
+            self._update_addresses_from_index(first_index)
 
         index = self.get_bytecode_size()
         return index
 
     def remove_opcodes_by_addresses(self, addresses: List[int]):
-        was_changed = False
-        # reversed so we only need to update addresses once after all are removed
-        for code_address in sorted(addresses, reverse=True):
-            try:
-                index = self._vm_code_addresses.index(code_address)
-                code = self._vm_code_list.pop(index)
-
-                was_changed = True
-                self._vm_code_with_target.remove(code)
-            except ValueError:
-                # don't stop the loop if an address is not found
-                continue
-
-        if was_changed:
-            self.update_addresses(min(addresses))
+        indexes_to_remove = set()
+        for code_address in addresses:
+            index = self._get_index(code_address)
+            # don't stop if an address is not found
+            if index is not None:
+                indexes_to_remove.add(index)
+
+        if len(indexes_to_remove) == 0:
+            return
+
+        first_index = min(indexes_to_remove)
+        remaining_codes = []
+        for index in range(first_index, len(self._vm_code_list)):
+            code = self._vm_code_list[index]
+            if index in indexes_to_remove:
+                self._vm_code_indexes.pop(code, None)
+                self._vm_code_with_target.pop(code, None)
+            else:
+                remaining_codes.append(code)
+
+        # only need to update addresses once after all are removed
+        self._vm_code_list[first_index:] = remaining_codes
+        self._update_indexes_from_index(first_index)
+        self._update_addresses_from_index(first_index)
+
+
+class VMCodeAddressView(Mapping):
+    """
+    A read-only view that maps each address to the instruction that starts in it.
+
+    The view is backed by the code map, so it's always up-to-date with the instructions layout without being rebuilt.
+    """
+
+    def __init__(self, code_map: VMCodeMap):
+        self._code_map = code_map
+
+    @property
+    def version(self) -> int:
+        return self._code_map.version
+
+    @property
+    def addresses(self) -> List[int]:
+        """
+        Gets the instructions' addresses in ascending order. It must not be modified.
+        """
+        return self._code_map._vm_code_addresses
+
+    def next_address(self, address: int) -> int:
+        return self._code_map.get_next_address(address)
+
+    def __getitem__(self, address: int) -> VMCode:
+        index = self._code_map._get_index(address) if isinstance(address, int) else None
+        if index is None:
+            raise KeyError(address)
+        return self._code_map._vm_code_list[index]
+
+    def __contains__(self, address) -> bool:
+        return isinstance(address, int) and self._code_map._get_index(address) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._code_map._vm_code_addresses)
+
+    def __len__(self) -> int:
+        return len(self._code_map)
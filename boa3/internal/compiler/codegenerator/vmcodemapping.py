@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional, Union
 
+from boa3.internal.compiler.codegenerator.jumprelaxation import JumpRelaxation
 from boa3.internal.compiler.codegenerator.methodtokencollection import MethodTokenCollection
-from boa3.internal.compiler.codegenerator.vmcodemap import VMCodeMap
+from boa3.internal.compiler.codegenerator.vmcodemap import VMCodeAddressView, VMCodeMap
+from boa3.internal.compiler.compilationcontext import CompilationContext
+from boa3.internal.compiler.compilationprofiler import CompilationProfiler
 from boa3.internal.compiler.compileroutput import CompilerOutput
 from boa3.internal.model.builtin.method import IBuiltinMethod
 from boa3.internal.neo.vm.VMCode import VMCode
@@ -16,16 +19,13 @@ class VMCodeMapping:
     """
     This class is responsible for managing the Neo VM instruction during the bytecode generation.
     """
-    _instance: VMCodeMapping = None
 
     @classmethod
-    def instance(cls):
+    def instance(cls) -> VMCodeMapping:
         """
-        :return: the singleton instance
+        :return: the instance of the active compilation context
         """
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        return CompilationContext.current().vm_code_mapping
 
     def __init__(self):
         self._code_map: VMCodeMap = VMCodeMap()
@@ -36,9 +36,9 @@ class VMCodeMapping:
         """
         Resets the map to the first state
         """
-        if cls._instance is not None:
-            cls._instance._code_map.clear()
-            cls._instance._method_tokens.clear()
+        instance = cls.instance()
+        instance._code_map.clear()
+        instance._method_tokens.clear()
 
     def add_method_token(self, method: IBuiltinMethod, call_flag: CallFlags) -> Optional[int]:
         """
@@ -68,14 +68,30 @@ class VMCodeMapping:
         return self._code_map.get_code_list()
 
     @property
-    def code_map(self) -> Dict[int, VMCode]:
+    def code_map(self) -> VMCodeAddressView:
         """
-        Gets a dictionary that maps each vm code with its address.
+        Gets a read-only mapping of each vm code with its address. It's a live view, so it's updated when the
+        instructions change and it's not needed to get it again.
 
-        :return: a dictionary that maps each instruction with its address. The keys are ordered by the address.
+        :return: a mapping of each instruction with its address. The keys are ordered by the address.
         """
         return self._code_map.get_code_map()
 
+    @property
+    def layout_version(self) -> int:
+        """
+        Gets the current version of the instructions layout. It changes every time an instruction address changes.
+        """
+        return self._code_map.version
+
+    @property
+    def addresses_version(self) -> int:
+        """
+        Gets the current version of the instructions addresses. It changes every time the address of an instruction
+        that was already inserted changes.
+        """
+        return self._code_map.addresses_version
+
     def targeted_address(self) -> Dict[int, List[int]]:
         """
         Gets a dictionary that maps each address to the opcodes that targets it
@@ -100,7 +116,8 @@ class VMCodeMapping:
         :return: the generated bytecode
         """
         self._remove_empty_targets()
-        self._update_larger_codes()
+        with CompilationProfiler.phase('update_larger_codes'):
+            self._update_larger_codes()
 
         bytecode = bytearray()
         for code in self.codes:
@@ -123,6 +140,14 @@ class VMCodeMapping:
     def insert_code(self, vm_code: VMCode):
         return self._code_map.insert_code(vm_code, has_target=OpcodeHelper.has_target(vm_code.opcode))
 
+    def set_codes(self, codes: List[VMCode]):
+        """
+        Replaces the included instructions with the given ones, like after they are changed in a CodeBlockGraph
+
+        :param codes: the instructions ordered by their address in the bytecode
+        """
+        self._code_map.set_codes(codes)
+
     def get_code(self, address: int) -> Optional[VMCode]:
         """
         Gets the VM Opcode at the given position
@@ -181,45 +206,29 @@ class VMCodeMapping:
 
     def _update_targets(self):
         from boa3.internal.neo.vm.type.Integer import Integer
+        code_map = self.code_map
         for code in self._code_map.get_code_with_target_list():
             if code.target is None:
                 relative = Integer.from_bytes(code.data)
                 absolute = self._code_map.get_start_address(code) + relative
-                if absolute in self.code_map:
-                    code.set_target(self.code_map[absolute])
+                if absolute in code_map:
+                    code.set_target(code_map[absolute])
 
     def _update_larger_codes(self):
         """
         Checks if each instruction data fits in its opcode maximum size and updates the opcode from those that don't
         """
-        # gets a list with all instructions which its opcode has a larger equivalent, ordered by its address
-        instr_with_small_codes = [code for code in self._code_map.get_code_list() if OpcodeHelper.has_larger_opcode(code.opcode)]
-        instr_with_small_codes.sort(key=lambda code: self.get_start_address(code), reverse=True)
-
-        from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
-        # total_len is initialized with zero because the loop must run at least once
-        total_len = 0
-        current_size = self.bytecode_size
-
-        # if any instruction is updated, the following instruction addresses and the total size will change as well
-        # with the change, previous instruction data may have overflowed the opcode maximum value
-        # to make sure, it must check the opcodes that haven't changed again
-        while total_len != current_size:
-            total_len = current_size
-
-            # verifies each instruction data length
-            for code in instr_with_small_codes.copy():  # it's a copy because the list may change during the iteration
-                if len(code.raw_data) > code.info.max_data_len:
-                    # gets the shortest opcode equivalent that fits the instruction data
-                    info = OpcodeInfo.get_info(OpcodeHelper.get_larger_opcode(code.opcode))
-                    while len(code.raw_data) > info.max_data_len and OpcodeHelper.has_larger_opcode(info.opcode):
-                        info = OpcodeInfo.get_info(OpcodeHelper.get_larger_opcode(code.opcode))
-
-                    self.update_vm_code(code, info)
-                    if info.opcode == OpcodeHelper.get_larger_opcode(info.opcode):
-                        # if it's the largest equivalent, it won't be updated anymore
-                        instr_with_small_codes.remove(code)
-            current_size = self.bytecode_size
+        larger_codes = JumpRelaxation(self._code_map.get_code_list()).get_larger_codes()
+        if len(larger_codes) == 0:
+            return
+
+        for code, info in larger_codes.items():
+            code._info = info
+            code._data = bytes()
+
+        # the codes are ordered by address, so it's only needed to update the addresses once from the first one
+        first_code = next(iter(larger_codes))
+        self._update_addresses(self.get_start_address(first_code))
 
     def _validate_targets(self, code_or_address: Union[int, VMCode]):
         if isinstance(code_or_address, int):
@@ -266,16 +275,42 @@ class VMCodeMapping:
             self._validate_targets(address)
         return self._code_map.remove_opcodes_by_addresses(addresses_to_remove)
 
+    def remove_replaced_codes(self, replaced_codes: Dict[VMCode, VMCode]):
+        """
+        Removes instructions that were replaced by others, moving the jumps that target them to their replacements
+
+        :param replaced_codes: a dictionary that maps each instruction to be removed to the instruction that replaces it
+        """
+        if len(replaced_codes) == 0:
+            return
+
+        for code in self._code_map.get_code_with_target_list():
+            if code.target in replaced_codes:
+                code.set_target(replaced_codes[code.target])
+
+        addresses_to_remove = self._code_map.get_addresses_from_codes(list(replaced_codes))
+        self._code_map.remove_opcodes_by_addresses(addresses_to_remove)
+
     def _remove_empty_targets(self):
         """
         Checks if each instruction that requires a target has one set and remove those that don't
         """
-        addresses_to_remove = []
-        for code in self._code_map.get_code_with_target_list():
-            if code.target is None or code.target is code:
-                address = self.get_start_address(code)
-                self._validate_targets(address)
-                addresses_to_remove.append(address)
+        empty_codes = {code for code in self._code_map.get_code_with_target_list()
+                       if code.target is None or code.target is code}
+        if len(empty_codes) == 0:
+            return
 
-        if len(addresses_to_remove) > 0:
-            self._code_map.remove_opcodes_by_addresses(addresses_to_remove)
+        # the jumps to a removed code are moved to the next code that is kept
+        replaced_codes = {}
+        removed_codes = []
+        for code in self.codes:
+            if code in empty_codes:
+                removed_codes.append(code)
+            else:
+                for removed_code in removed_codes:
+                    replaced_codes[removed_code] = code
+                removed_codes.clear()
+
+        self.remove_replaced_codes(replaced_codes)
+        if len(removed_codes) > 0:
+            self.remove_opcodes_by_code(removed_codes)
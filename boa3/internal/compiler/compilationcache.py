@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+__all__ = [
+    'CompilationCache',
+]
+
+
+import functools
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Dict, Iterable, List, Optional
+
+from boa3.internal import constants
+from boa3.internal.compiler.codegenerator.optimizerhelper import OptimizationLevel
+
+
+class CompilationCache:
+    """
+    A persistent cache of the compiled files, stored in the file system.
+
+    The results are found by a request key, that is the hash of the entry file path, the compiler options and the
+    compiler source files, so the results of a changed compiler aren't used. Each request keeps the hashes of the files
+    that were used in the compilation, the entry file and all the modules imported by it, so a cached result is used
+    only if none of these files was changed. The results are stored by the hash of the request and the files contents,
+    and the least recently used ones are removed when the cache exceeds its maximum size.
+    """
+
+    DEFAULT_MAX_SIZE = 256 * 1024 * 1024  # 256 MiB
+    _MAX_RESULTS_PER_REQUEST = 8
+
+    def __init__(self, cache_dir: str = None, max_size: int = DEFAULT_MAX_SIZE):
+        if cache_dir is None:
+            cache_dir = self.default_cache_dir()
+
+        self._cache_dir = os.path.abspath(cache_dir)
+        self._requests_dir = os.path.join(self._cache_dir, 'requests')
+        self._results_dir = os.path.join(self._cache_dir, 'results')
+        self._max_size = max_size
+
+    @staticmethod
+    def default_cache_dir() -> str:
+        base_dir = os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache'))
+        return os.path.join(base_dir, 'neo3-boa')
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    def get_request_key(self, path: str, root_folder: Optional[str], env: Optional[str],
+                        optimization_level: OptimizationLevel, outputs: Iterable[str]) -> str:
+        """
+        Gets the key of a compilation request
+
+        :param path: the path of the Python file to compile
+        :param root_folder: the root path of the project
+        :param env: specific environment id to compile
+        :param optimization_level: the level of optimization used in the compilation
+        :param outputs: the names of the files that are generated in the compilation
+        """
+        request = [
+            constants.COMPILER_VERSION,
+            self.get_compiler_hash(),
+            '{0}.{1}'.format(constants.SYS_VERSION_INFO.major, constants.SYS_VERSION_INFO.minor),
+            os.path.realpath(path),
+            os.path.realpath(root_folder) if isinstance(root_folder, str) else None,
+            env,
+            int(optimization_level),
+            sorted(outputs)
+        ]
+        return hashlib.sha256(json.dumps(request).encode()).hexdigest()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_compiler_hash() -> str:
+        """
+        Gets the hash of the source files of the compiler. It's computed once for each process.
+        """
+        import boa3
+        package_dir = os.path.dirname(os.path.abspath(boa3.__file__))
+
+        source_paths = []
+        for dir_path, dir_names, file_names in os.walk(package_dir):
+            dir_names[:] = [dir_name for dir_name in dir_names if dir_name != '__pycache__']
+            source_paths.extend(os.path.join(dir_path, file_name) for file_name in file_names
+                                if file_name.endswith('.py'))
+
+        compiler_hash = hashlib.sha256()
+        for source_path in sorted(source_paths):
+            compiler_hash.update(os.path.relpath(source_path, package_dir).encode())
+            with open(source_path, 'rb') as source_file:
+                compiler_hash.update(hashlib.sha256(source_file.read()).digest())
+        return compiler_hash.hexdigest()
+
+    def load(self, request_key: str, outputs: Iterable[str]) -> Optional[Dict[str, bytes]]:
+        """
+        Gets the cached files of a compilation request
+
+        :param request_key: the key of the compilation request
+        :param outputs: the names of the files that must be in the cached result
+        :return: a dictionary that maps each file name to its content if a valid result is found. None otherwise.
+        """
+        files_hashes: Dict[str, Optional[str]] = {}
+
+        for result in self._get_request_results(request_key):
+            dependencies: Dict[str, str] = result['dependencies']
+            for file_path in dependencies:
+                if file_path not in files_hashes:
+                    files_hashes[file_path] = self._hash_file(file_path)
+
+            if any(files_hashes[file_path] != file_hash for file_path, file_hash in dependencies.items()):
+                continue
+
+            result_dir = os.path.join(self._results_dir, result['key'])
+            try:
+                cached_files = {}
+                for output in outputs:
+                    with open(os.path.join(result_dir, output), 'rb') as cached_file:
+                        cached_files[output] = cached_file.read()
+                # the modified time is used to find the least recently used results
+                os.utime(result_dir)
+            except OSError:
+                continue
+
+            return cached_files
+
+        return None
+
+    def store(self, request_key: str, dependencies: List[str], files: Dict[str, bytes]):
+        """
+        Includes the files of a compilation in the cache
+
+        :param request_key: the key of the compilation request
+        :param dependencies: the paths of the Python files that were used in the compilation
+        :param files: a dictionary that maps each file name to its content
+        """
+        dependencies_hashes = {}
+        for file_path in sorted(set(dependencies)):
+            file_hash = self._hash_file(file_path)
+            if file_hash is None:
+                return
+            dependencies_hashes[file_path] = file_hash
+
+        result_key = hashlib.sha256(json.dumps([request_key, dependencies_hashes]).encode()).hexdigest()
+
+        try:
+            os.makedirs(self._results_dir, exist_ok=True)
+            os.makedirs(self._requests_dir, exist_ok=True)
+
+            result_dir = os.path.join(self._results_dir, result_key)
+            if not os.path.isdir(result_dir):
+                temp_dir = tempfile.mkdtemp(dir=self._results_dir, prefix='.tmp')
+                for file_name, content in files.items():
+                    with open(os.path.join(temp_dir, file_name), 'wb') as cached_file:
+                        cached_file.write(content)
+                try:
+                    os.replace(temp_dir, result_dir)
+                except OSError:
+                    # other compilation has stored the same result
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+
+            results = [result for result in self._get_request_results(request_key) if result['key'] != result_key]
+            results.insert(0, {'key': result_key, 'dependencies': dependencies_hashes})
+            self._write_request_results(request_key, results[:self._MAX_RESULTS_PER_REQUEST])
+
+            self._evict()
+        except OSError:
+            # the cache is only an optimization, failing to write it must not fail the compilation
+            pass
+
+    def clear(self):
+        """
+        Removes all the cached results
+        """
+        shutil.rmtree(self._cache_dir, ignore_errors=True)
+
+    def _get_request_results(self, request_key: str) -> List[dict]:
+        try:
+            with open(os.path.join(self._requests_dir, request_key + '.json')) as request_file:
+                results = json.load(request_file)
+        except (OSError, ValueError):
+            return []
+
+        return results if isinstance(results, list) else []
+
+    def _write_request_results(self, request_key: str, results: List[dict]):
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self._requests_dir, prefix='.tmp')
+        with os.fdopen(file_descriptor, 'w') as request_file:
+            json.dump(results, request_file)
+        os.replace(temp_path, os.path.join(self._requests_dir, request_key + '.json'))
+
+    def _evict(self):
+        """
+        Removes the least recently used results until the cache size is lower than the maximum size
+        """
+        results = []
+        total_size = 0
+        for entry in os.scandir(self._results_dir):
+            if not entry.is_dir() or entry.name.startswith('.'):
+                continue
+            size = sum(result_file.stat().st_size for result_file in os.scandir(entry.path))
+            results.append((entry.stat().st_mtime, size, entry.path))
+            total_size += size
+
+        results.sort()
+        for _, size, result_dir in results:
+            if total_size <= self._max_size:
+                break
+            shutil.rmtree(result_dir, ignore_errors=True)
+            total_size -= size
+
+    @staticmethod
+    def _hash_file(file_path: str) -> Optional[str]:
+        try:
+            with open(file_path, 'rb') as source_file:
+                return hashlib.sha256(source_file.read()).hexdigest()
+        except OSError:
+            return None
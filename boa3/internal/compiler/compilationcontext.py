@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+__all__ = [
+    'CompilationContext',
+    'ContextAttribute',
+]
+
+
+import threading
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class CompilationContext:
+    """
+    Keeps the state of a single compilation.
+
+    The objects that used to be process-wide singletons are created for each context, and the `instance()` method of
+    their classes returns the one in the active context. A context is active only in the thread or task that activated
+    it, so different contexts can be used by concurrent compilations in the same process. If no context is active, the
+    default context is used, which keeps the behavior of the singletons.
+    """
+
+    _default_context: CompilationContext = None
+    _shared_symbols_lock = threading.Lock()
+    _is_shared_symbols_prepared: bool = False
+
+    def __init__(self, env: str = None, profiler=None, optimization_level=None):
+        """
+        :param env: specific environment id of the compilation.
+        :param profiler: the profiler that records the phases of the compilation. If it's None, it isn't profiled.
+        :type profiler: boa3.internal.compiler.compilationprofiler.CompilationProfiler
+        :param optimization_level: the level of optimization of the compilation. If it's None, the default level is
+                                   used.
+        :type optimization_level: boa3.internal.compiler.codegenerator.optimizerhelper.OptimizationLevel
+        """
+        self.env: Optional[str] = env
+        self.profiler = profiler
+        self.optimization_level = optimization_level
+
+        self._vm_code_mapping = None
+        self._compiler_builtin = None
+        self._compiled_metadata = None
+        self._inner_deploy_method = None
+        self._type_relations = None
+
+        # the types built in this context, so structurally equal types are the same object
+        self.interned_types: Dict[Tuple[type, Any], Any] = {}
+
+        # the lists where the changes are being recorded, see `record_changes`
+        self._change_records: List[List[Tuple[Any, str, tuple]]] = []
+
+    @classmethod
+    def current(cls) -> CompilationContext:
+        """
+        Gets the active context
+
+        :return: the context activated in the current thread or task. The default context if none is active.
+        """
+        context = _CURRENT_CONTEXT.get()
+        if context is None:
+            context = CompilationContext._default_context
+        return context
+
+    @classmethod
+    def is_any_active(cls) -> bool:
+        """
+        Verifies if a context was activated in the current thread or task
+        """
+        return _CURRENT_CONTEXT.get() is not None
+
+    def set_as_default(self):
+        """
+        Makes this context the one used when no context is active.
+
+        It's used to keep the state of the last compilation available to the code that doesn't activate a context.
+        """
+        CompilationContext._default_context = self
+
+    @contextmanager
+    def activate(self) -> Iterator[CompilationContext]:
+        """
+        Makes this context the active one until the end of the `with` block
+        """
+        self._prepare_shared_symbols()
+        token = _CURRENT_CONTEXT.set(self)
+        try:
+            yield self
+        finally:
+            _CURRENT_CONTEXT.reset(token)
+
+    @contextmanager
+    def record_changes(self) -> Iterator[List[Tuple[Any, str, tuple]]]:
+        """
+        Records the changes made with `record_change` until the end of the `with` block.
+
+        It's used to replay in another compilation the changes that an analysis made to symbols that it didn't create.
+
+        :return: the list of the recorded changes, in the order they were made
+        """
+        records = []
+        self._change_records.append(records)
+        try:
+            yield records
+        finally:
+            self._change_records.pop()
+
+    def record_change(self, target: Any, method_name: str, *args: Any):
+        """
+        Records a change if any `record_changes` block is running in this context
+
+        :param target: the object that was changed
+        :param method_name: the name of the method of `target` that replays the change
+        :param args: the arguments of the method
+        """
+        for records in self._change_records:
+            records.append((target, method_name, args))
+
+    @property
+    def vm_code_mapping(self):
+        """
+        :rtype: boa3.internal.compiler.codegenerator.vmcodemapping.VMCodeMapping
+        """
+        if self._vm_code_mapping is None:
+            from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
+            self._vm_code_mapping = VMCodeMapping()
+        return self._vm_code_mapping
+
+    @property
+    def compiler_builtin(self):
+        """
+        :rtype: boa3.internal.model.imports.builtin.CompilerBuiltin
+        """
+        if self._compiler_builtin is None:
+            from boa3.internal.model.imports.builtin import CompilerBuiltin
+            self._compiler_builtin = CompilerBuiltin()
+        return self._compiler_builtin
+
+    @property
+    def compiled_metadata(self):
+        """
+        :rtype: boa3.internal.compiler.compiledmetadata.CompiledMetadata
+        """
+        if self._compiled_metadata is None:
+            from boa3.internal.compiler.compiledmetadata import CompiledMetadata
+            self._compiled_metadata = CompiledMetadata()
+        return self._compiled_metadata
+
+    @property
+    def inner_deploy_method(self):
+        """
+        :rtype: boa3.internal.model.builtin.internal.innerdeploymethod.InnerDeployMethod
+        """
+        if self._inner_deploy_method is None:
+            from boa3.internal.model.builtin.internal.innerdeploymethod import InnerDeployMethod
+            self._inner_deploy_method = InnerDeployMethod()
+        return self._inner_deploy_method
+
+    @property
+    def type_relations(self):
+        """
+        :rtype: boa3.internal.model.type.typerelationcache.TypeRelationCache
+        """
+        if self._type_relations is None:
+            from boa3.internal.model.type.typerelationcache import TypeRelationCache
+            self._type_relations = TypeRelationCache()
+        return self._type_relations
+
+    @classmethod
+    def preload(cls):
+        """
+        Loads the compiler modules and initializes the builtin symbols that are shared by all the contexts.
+
+        The processes that are forked after it start with the builtin symbols ready, instead of building them again.
+        """
+        import boa3.internal.compiler.compiler  # the builtin symbols are created when their modules are loaded
+        cls._prepare_shared_symbols()
+
+    @classmethod
+    def _prepare_shared_symbols(cls):
+        """
+        Initializes the symbols of the builtin classes, that are shared by all the contexts.
+
+        They are lazily initialized when they are used for the first time. Doing it before any compilation starts
+        ensures that a concurrent compilation won't use a class while its symbols are being included.
+        """
+        if cls._is_shared_symbols_prepared:
+            return
+
+        with cls._shared_symbols_lock:
+            if cls._is_shared_symbols_prepared:
+                return
+
+            from boa3.internal.model.imports.package import Package
+            from boa3.internal.model.type.classes.classtype import ClassType
+
+            visited = set()
+            symbols = [symbol
+                       for package in cls.current().compiler_builtin.packages
+                       for symbol in package.symbols.values()]
+            while len(symbols) > 0:
+                symbol = symbols.pop()
+                if id(symbol) in visited:
+                    continue
+                visited.add(id(symbol))
+
+                if isinstance(symbol, Package):
+                    symbols.extend(symbol.symbols.values())
+                elif isinstance(symbol, ClassType):
+                    symbols.extend(symbol.symbols.values())
+                    symbols.extend(symbol.instance_variables.values())
+                    symbols.extend(symbol.instance_methods.values())
+                    symbols.extend(symbol.properties.values())
+                    symbol.constructor_method()
+                elif hasattr(symbol, 'type') and isinstance(symbol.type, ClassType):
+                    symbols.append(symbol.type)
+
+            cls._is_shared_symbols_prepared = True
+
+
+_CURRENT_CONTEXT: ContextVar[Optional[CompilationContext]] = ContextVar('compilation_context', default=None)
+
+# created when the module is loaded, so concurrent compilations don't race to create it
+CompilationContext._default_context = CompilationContext()
+
+
+class ContextAttribute:
+    """
+    An attribute that keeps a different value for each compilation context.
+
+    It's used for the state that shared symbols, like the builtin methods, change during a compilation, so concurrent
+    compilations don't change each other's values. Each context starts with the default value of the attribute.
+    """
+
+    def __init__(self, default_factory: Callable[[], Any] = None):
+        self._default_factory = default_factory
+
+    def __set_name__(self, owner, name: str):
+        self._name = name
+
+    def _get_values(self, obj) -> weakref.WeakKeyDictionary:
+        obj_values: Optional[weakref.WeakKeyDictionary] = obj.__dict__.get('_context_values')
+        if obj_values is None:
+            obj_values = obj.__dict__.setdefault('_context_values', weakref.WeakKeyDictionary())
+
+        context = CompilationContext.current()
+        values = obj_values.get(context)
+        if values is None:
+            values = obj_values.setdefault(context, {})
+        return values
+
+    def __get__(self, obj, objtype=None) -> Any:
+        if obj is None:
+            return self
+
+        values = self._get_values(obj)
+        if self._name not in values:
+            values[self._name] = self._default_factory() if self._default_factory is not None else None
+        return values[self._name]
+
+    def __set__(self, obj, value: Any):
+        self._get_values(obj)[self._name] = value
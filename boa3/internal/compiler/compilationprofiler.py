@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+__all__ = [
+    'CompilationProfiler',
+]
+
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+from boa3.internal.compiler.compilationcontext import CompilationContext
+
+
+class CompilationProfiler:
+    """
+    Records the wall time, the number of calls and the memory allocated in each phase of a compilation.
+
+    The phases can be nested, like the analysis of an imported module inside the module analysis of the file that
+    imports it. The time of a phase includes its inner phases and its self time doesn't. The memory is traced with
+    tracemalloc, which makes the compilation slower, so the times are only comparable with other profiled compilations.
+    If other threads are running, their allocations are counted in the phases too.
+    """
+
+    def __init__(self, trace_memory: bool = True):
+        """
+        :param trace_memory: if the memory allocated in each phase should be recorded
+        """
+        self._trace_memory = trace_memory
+
+        # the stats of each phase, by its path in the nested phases
+        self._stats: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        self._stack: List[str] = []
+        self._inner_time: List[float] = []
+
+        self.total_time: float = 0.0
+        self.peak_memory: Optional[int] = None
+
+    @classmethod
+    def phase(cls, name: str) -> ContextManager:
+        """
+        Records a phase in the profiler of the active compilation, if it's profiled
+
+        :param name: the name of the phase
+        """
+        profiler: Optional[CompilationProfiler] = CompilationContext.current().profiler
+        if profiler is None:
+            return nullcontext()
+        return profiler.record(name)
+
+    @contextmanager
+    def record(self, name: str) -> Iterator[None]:
+        """
+        Records the execution of a `with` block as a phase
+
+        :param name: the name of the phase
+        """
+        self._stack.append(name)
+        self._inner_time.append(0.0)
+        start_memory = self._get_traced_memory()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            memory = self._get_traced_memory() - start_memory
+            inner_time = self._inner_time.pop()
+            path = tuple(self._stack)
+            self._stack.pop()
+
+            if len(self._inner_time) > 0:
+                self._inner_time[-1] += elapsed
+
+            stats = self._stats.get(path)
+            if stats is None:
+                stats = {'calls': 0, 'time': 0.0, 'self_time': 0.0, 'memory': 0}
+                self._stats[path] = stats
+            stats['calls'] += 1
+            stats['time'] += elapsed
+            stats['self_time'] += elapsed - inner_time
+            stats['memory'] += memory
+
+    @contextmanager
+    def profile(self) -> Iterator[CompilationProfiler]:
+        """
+        Profiles the compilation steps that run in the `with` block. Its time is added to the total time and, if the
+        memory is recorded, it's traced until the end of the block.
+        """
+        started_tracing = self._trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.total_time += time.perf_counter() - start
+            if self._trace_memory and tracemalloc.is_tracing():
+                peak_memory = tracemalloc.get_traced_memory()[1]
+                self.peak_memory = max(peak_memory, self.peak_memory or 0)
+            if started_tracing:
+                tracemalloc.stop()
+
+    def get_phases(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Gets the stats of each phase, adding the executions of the phase in all the places it was nested
+
+        :return: a dictionary that maps each phase name to its number of calls, total time and self time in seconds and
+                 memory allocated in bytes that wasn't released by the end of the phase. The time of a phase that is
+                 nested in itself is counted only once.
+        """
+        phases: Dict[str, Dict[str, Any]] = {}
+        for path, stats in self._stats.items():
+            name = path[-1]
+            phase = phases.get(name)
+            if phase is None:
+                phase = {'calls': 0, 'time': 0.0, 'self_time': 0.0}
+                if self._trace_memory:
+                    phase['memory'] = 0
+                phases[name] = phase
+
+            phase['calls'] += stats['calls']
+            phase['self_time'] += stats['self_time']
+            if name not in path[:-1]:
+                phase['time'] += stats['time']
+                if self._trace_memory:
+                    phase['memory'] += stats['memory']
+
+        return dict(sorted(phases.items(), key=lambda item: item[1]['time'], reverse=True))
+
+    def to_json(self) -> Dict[str, Any]:
+        """
+        Gets the profile in a format that can be serialized to JSON
+        """
+        profile = {
+            'total_time': self.total_time,
+            'phases': self.get_phases(),
+            'stacks': [{'path': list(path), **stats} for path, stats in self._stats.items()]
+        }
+        if self.peak_memory is not None:
+            profile['peak_memory'] = self.peak_memory
+        return profile
+
+    def to_folded_stacks(self) -> str:
+        """
+        Gets the profile in the folded stacks format, that is used by flame graph tools like flamegraph.pl and
+        speedscope. The value of each stack is its self time in microseconds.
+        """
+        lines = []
+        for path, stats in self._stats.items():
+            self_time = round(stats['self_time'] * 1_000_000)
+            if self_time > 0:
+                lines.append('{0} {1}'.format(';'.join(path), self_time))
+        return '\n'.join(lines) + '\n'
+
+    def save(self, output_path: str):
+        """
+        Saves the profile in a file. If the file extension is .folded or .txt, it's saved in the folded stacks format.
+        Otherwise, it's saved as JSON.
+
+        :param output_path: the path of the file
+        """
+        if output_path.endswith(('.folded', '.txt')):
+            content = self.to_folded_stacks()
+        else:
+            content = json.dumps(self.to_json(), indent=4) + '\n'
+
+        with open(output_path, 'w') as profile_file:
+            profile_file.write(content)
+
+    def _get_traced_memory(self) -> int:
+        if self._trace_memory and tracemalloc.is_tracing():
+            return tracemalloc.get_traced_memory()[0]
+        return 0
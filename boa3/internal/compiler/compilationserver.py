@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+__all__ = [
+    'CompilationServer',
+]
+
+
+import base64
+import json
+import logging
+import os
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, IO, List, Optional
+
+from boa3.internal import constants
+from boa3.internal.compiler.compilationcache import CompilationCache
+from boa3.internal.compiler.compilationcontext import CompilationContext
+from boa3.internal.compiler.compiler import Compiler
+from boa3.internal.exception.NotLoadedException import NotLoadedException
+
+
+class CompilationServer:
+    """
+    A long-lived compiler that receives compilation requests.
+
+    The requests and the responses are JSON-RPC 2.0 messages, one for each line, and they can be sent through a
+    stream, like the standard input and output, or a Unix socket. The compilations run concurrently in a pool of
+    threads of the same process, so the compiler modules and the builtin symbols are loaded only once and reused by all
+    the requests.
+
+    Methods:
+        - compile: compiles a smart contract. The params are 'path' and the optional 'project_path', 'env',
+          'optimize', 'debug' and 'fail_fast'. The result has 'success', 'diagnostics' and, if it was compiled, the
+          'nef' file encoded in base64, the 'manifest' and the 'debug_info' if 'debug' is true.
+        - version: gets the compiler version.
+        - shutdown: stops the server after the pending requests are finished.
+    """
+
+    PARSE_ERROR = -32700
+    INVALID_REQUEST = -32600
+    METHOD_NOT_FOUND = -32601
+    INVALID_PARAMS = -32602
+    INTERNAL_ERROR = -32603
+
+    def __init__(self, jobs: int = None, use_cache: bool = False):
+        """
+        :param jobs: the number of requests that are compiled at the same time. The number of processors by default.
+        :param use_cache: if the cache of compiled files can be used. False by default.
+        """
+        self._jobs: int = jobs if isinstance(jobs, int) and jobs > 0 else (os.cpu_count() or 1)
+        self._use_cache = use_cache
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._is_shutting_down = threading.Event()
+        self._unix_server = None
+
+        self._methods = {
+            'compile': self._compile,
+            'version': self._version,
+            'shutdown': self._shutdown,
+        }
+
+    def handle_request(self, request: Any) -> Optional[Dict[str, Any]]:
+        """
+        Executes a JSON-RPC request
+
+        :param request: the decoded JSON-RPC request
+        :return: the JSON-RPC response. None if the request is a notification.
+        """
+        if (not isinstance(request, dict) or request.get('jsonrpc') != '2.0'
+                or not isinstance(request.get('method'), str)):
+            return self._error_response(request.get('id') if isinstance(request, dict) else None,
+                                        self.INVALID_REQUEST, 'Invalid request')
+
+        request_id = request.get('id')
+        is_notification = 'id' not in request
+        method = self._methods.get(request['method'])
+        params = request.get('params', {})
+
+        if method is None:
+            response = self._error_response(request_id, self.METHOD_NOT_FOUND, f"Method not found: {request['method']}")
+        elif not isinstance(params, dict):
+            response = self._error_response(request_id, self.INVALID_PARAMS, 'Params must be an object')
+        else:
+            try:
+                response = {'jsonrpc': '2.0', 'id': request_id, 'result': method(params)}
+            except _InvalidParamsError as e:
+                response = self._error_response(request_id, self.INVALID_PARAMS, str(e))
+            except Exception as e:
+                logging.exception(e)
+                response = self._error_response(request_id, self.INTERNAL_ERROR, str(e))
+
+        return None if is_notification else response
+
+    def serve_stream(self, input_stream: IO[str], output_stream: IO[str]):
+        """
+        Reads the requests from a stream until it's closed or a shutdown is requested
+
+        :param input_stream: the stream where the requests are read from
+        :param output_stream: the stream where the responses are written to
+        """
+        write_lock = threading.Lock()
+
+        def write_response(response: Optional[Dict[str, Any]]):
+            if response is not None:
+                with write_lock:
+                    output_stream.write(json.dumps(response) + '\n')
+                    output_stream.flush()
+
+        with self._start_executor():
+            for line in iter(input_stream.readline, ''):
+                self._dispatch(line, write_response)
+                if self._is_shutting_down.is_set():
+                    break
+
+    def serve_unix_socket(self, socket_path: str):
+        """
+        Accepts connections in a Unix socket and reads the requests of each one until a shutdown is requested
+
+        :param socket_path: the path of the socket file
+        """
+        import socketserver
+
+        if not hasattr(socketserver, 'ThreadingUnixStreamServer'):
+            raise OSError('Unix sockets are not supported in this platform')
+
+        server = self
+
+        class RequestHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                write_lock = threading.Lock()
+
+                def write_response(response: Optional[Dict[str, Any]]):
+                    if response is not None:
+                        with write_lock:
+                            try:
+                                self.wfile.write((json.dumps(response) + '\n').encode())
+                                self.wfile.flush()
+                            except OSError:
+                                # the client closed the connection
+                                pass
+
+                for line in self.rfile:
+                    server._dispatch(line.decode(), write_response)
+                    if server._is_shutting_down.is_set():
+                        break
+
+        self._remove_stale_socket(socket_path)
+
+        with self._start_executor(), socketserver.ThreadingUnixStreamServer(socket_path, RequestHandler) as unix_server:
+            unix_server.daemon_threads = True
+            self._unix_server = unix_server
+            socket_stat = os.lstat(socket_path)
+            try:
+                unix_server.serve_forever()
+            finally:
+                self._unix_server = None
+                try:
+                    current_stat = os.lstat(socket_path)
+                    # the file is removed only if it's still the socket created by this server
+                    if (current_stat.st_dev, current_stat.st_ino) == (socket_stat.st_dev, socket_stat.st_ino):
+                        os.remove(socket_path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _remove_stale_socket(socket_path: str):
+        """
+        Removes the socket file left by a server that isn't running anymore
+
+        :raise FileExistsError: if the path exists and is not a socket, or if there is a server listening on it
+        """
+        import socket
+
+        try:
+            file_stat = os.lstat(socket_path)
+        except FileNotFoundError:
+            return
+
+        if not stat.S_ISSOCK(file_stat.st_mode):
+            raise FileExistsError(f'{socket_path} already exists and is not a socket')
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            try:
+                client.connect(socket_path)
+            except OSError:
+                # no server is listening on the socket
+                os.remove(socket_path)
+            else:
+                raise FileExistsError(f'{socket_path} is already used by a running server')
+
+    def _start_executor(self) -> ThreadPoolExecutor:
+        # the builtin symbols are prepared before any request, so the first compilations don't need to wait for them
+        CompilationContext.preload()
+        self._is_shutting_down.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self._jobs, thread_name_prefix='neo3-boa-compiler')
+        return self._executor
+
+    def _dispatch(self, line: str, write_response):
+        if len(line.strip()) == 0:
+            return
+
+        try:
+            request = json.loads(line)
+        except ValueError:
+            write_response(self._error_response(None, self.PARSE_ERROR, 'Parse error'))
+            return
+
+        if isinstance(request, dict) and request.get('method') == 'shutdown':
+            # answered only after the pending requests, so the client knows that everything was finished
+            self._is_shutting_down.set()
+            self._executor.shutdown(wait=True)
+            write_response(self.handle_request(request))
+            return
+
+        try:
+            self._executor.submit(lambda: write_response(self.handle_request(request)))
+        except RuntimeError:
+            # other connection requested the shutdown
+            request_id = request.get('id') if isinstance(request, dict) else None
+            write_response(self._error_response(request_id, self.INTERNAL_ERROR, 'The server is shutting down'))
+
+    def _compile(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        path = params.get('path')
+        if not isinstance(path, str) or not path.endswith('.py'):
+            raise _InvalidParamsError("'path' must be the path of a .py file")
+        if not os.path.isfile(path):
+            raise _InvalidParamsError(f'File not found: {path}')
+
+        debug = bool(params.get('debug', False))
+        compiler = Compiler()
+        result: Dict[str, Any] = {'success': False}
+        try:
+            files = compiler.compile_files(path,
+                                           root_folder=params.get('project_path'),
+                                           log=False,
+                                           debug=debug,
+                                           env=params.get('env'),
+                                           fail_fast=bool(params.get('fail_fast', True)),
+                                           optimize=bool(params.get('optimize', True)),
+                                           cache=CompilationCache() if self._use_cache else None
+                                           )
+            result['success'] = True
+            result['nef'] = base64.b64encode(files['nef']).decode()
+            result['manifest'] = json.loads(files['manifest.json'])
+            if debug:
+                result['debug_info'] = json.loads(files['debug.json'])
+            diagnostics = self._get_diagnostics(compiler)
+        except NotLoadedException as e:
+            diagnostics = self._get_diagnostics(compiler)
+            if len(diagnostics) == 0:
+                message = e.message if len(e.message) > 0 else 'Could not compile'
+                diagnostics.append({'severity': 'error', 'message': message})
+        except SyntaxError as e:
+            diagnostics = [{'severity': 'error', 'type': type(e).__name__, 'message': e.msg,
+                            'line': e.lineno, 'column': e.offset, 'path': os.path.realpath(path)}]
+
+        result['diagnostics'] = diagnostics
+        return result
+
+    def _version(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {'version': constants.BOA_VERSION, 'python': constants.SYS_VERSION}
+
+    def _shutdown(self, params: Dict[str, Any]) -> None:
+        if self._unix_server is not None:
+            # shutdown blocks until the server stops, so it can't be called by the thread that runs the server
+            threading.Thread(target=self._unix_server.shutdown).start()
+        return None
+
+    @staticmethod
+    def _get_diagnostics(compiler: Compiler) -> List[Dict[str, Any]]:
+        diagnostics = []
+        for severity, issues in (('error', compiler.errors), ('warning', compiler.warnings)):
+            for issue in issues:
+                diagnostics.append({'severity': severity,
+                                    'type': type(issue).__name__,
+                                    'message': issue.message,
+                                    'line': issue.line,
+                                    'column': issue.col,
+                                    'path': issue.filepath})
+        return diagnostics
+
+    @staticmethod
+    def _error_response(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+        return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}}
+
+
+class _InvalidParamsError(Exception):
+    pass
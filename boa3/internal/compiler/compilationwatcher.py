@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+__all__ = [
+    'CompilationWatcher',
+]
+
+
+import logging
+import os
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from boa3.internal.compiler.compiler import Compiler
+from boa3.internal.exception.NotLoadedException import NotLoadedException
+
+
+class CompilationWatcher:
+    """
+    Recompiles smart contracts when their files change.
+
+    The files used by each entry contract, the entry file and the modules imported by it, are found in its last
+    compilation. When one of them changes, only the entries that use that file are compiled again. The imported
+    modules that didn't change aren't analysed again, their analysis is copied from the ModuleAnalysisCache.
+    """
+
+    def __init__(self, entries: Dict[str, str], root_folder: str = None,
+                 log: bool = True, log_level: str = None,
+                 debug: bool = False, env: str = None, fail_fast: bool = True,
+                 optimize: bool = True):
+        """
+        :param entries: a dictionary that maps the path of each entry contract to the path of its .nef output
+        :param root_folder: the root path of the project
+        :param log: if compiler errors should be logged.
+        :param debug: if nefdbgnfo file should be generated.
+        :param env: specific environment id to compile.
+        :param fail_fast: if should stop compilation on first error found.
+        :param optimize: if the generated bytecode should be optimized as possible. True by default.
+        """
+        self._entries: Dict[str, str] = {os.path.realpath(path): output_path for path, output_path in entries.items()}
+        self._root_folder = root_folder
+        self._log = log
+        self._log_level = log_level
+        self._debug = debug
+        self._env = env
+        self._fail_fast = fail_fast
+        self._optimize = optimize
+
+        self._dependencies: Dict[str, Set[str]] = {entry: {entry} for entry in self._entries}
+        self._files_state: Dict[str, Optional[Tuple[int, int]]] = {}
+
+    @property
+    def watched_files(self) -> List[str]:
+        """
+        Gets the paths of the files that are used by any of the entry contracts
+        """
+        return sorted(set().union(*self._dependencies.values()))
+
+    def compile_all(self) -> Dict[str, Optional[Exception]]:
+        """
+        Compiles all the entry contracts
+
+        :return: a dictionary that maps each entry to the error of its compilation, or None if it was compiled
+        """
+        return self._compile_entries(list(self._entries))
+
+    def update(self) -> Dict[str, Optional[Exception]]:
+        """
+        Compiles the entry contracts that use a file that was changed since the last verification
+
+        :return: a dictionary that maps each compiled entry to the error of its compilation, or None if it was compiled
+        """
+        changed_files = self.get_changed_files()
+        if len(changed_files) == 0:
+            return {}
+
+        affected_entries = [entry for entry, dependencies in self._dependencies.items()
+                            if not dependencies.isdisjoint(changed_files)]
+        return self._compile_entries(affected_entries)
+
+    def get_changed_files(self) -> Set[str]:
+        """
+        Gets the watched files that were changed, created or removed since the last time their state was saved
+        """
+        return {file_path for file_path in self.watched_files
+                if self._get_file_state(file_path) != self._files_state.get(file_path)}
+
+    def watch(self, poll_interval: float = 1.0,
+              on_compile: Callable[[str, Optional[Exception]], None] = None):
+        """
+        Compiles all the entry contracts and keeps recompiling them when their files change. It only returns if the
+        execution is interrupted.
+
+        :param poll_interval: the interval in seconds between the verifications of the files
+        :param on_compile: a function called with the entry path and the compilation error after each compilation
+        """
+        results = self.compile_all()
+        while True:
+            if on_compile is not None:
+                for entry, error in results.items():
+                    on_compile(entry, error)
+
+            time.sleep(poll_interval)
+            results = self.update()
+
+    def _compile_entries(self, entries: List[str]) -> Dict[str, Optional[Exception]]:
+        results = {}
+        for entry in entries:
+            # the state is saved before compiling, so changes made during the compilation are found in the next update
+            dependencies = self._dependencies[entry]
+            for file_path in dependencies:
+                self._files_state[file_path] = self._get_file_state(file_path)
+
+            compiler = Compiler()
+            try:
+                compiler.compile_and_save(entry, self._entries[entry], self._root_folder, self._log, self._log_level,
+                                          self._debug, self._env, self._fail_fast, self._optimize)
+                results[entry] = None
+            except NotLoadedException as e:
+                results[entry] = e
+            except Exception as e:
+                if self._log:
+                    logging.exception(e)
+                results[entry] = e
+
+            compiled_dependencies = {entry, *compiler.get_dependencies()}
+            if results[entry] is not None:
+                # if the compilation failed, the imports that couldn't be analysed are the files of the previous
+                # compilation, so they are still watched until the entry is compiled again
+                compiled_dependencies.update(dependencies)
+            self._dependencies[entry] = compiled_dependencies
+            for file_path in compiled_dependencies.difference(dependencies):
+                self._files_state[file_path] = self._get_file_state(file_path)
+
+        return results
+
+    @staticmethod
+    def _get_file_state(file_path: str) -> Optional[Tuple[int, int]]:
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return None
+        return file_stat.st_mtime_ns, file_stat.st_size
@@ -4,17 +4,15 @@ from typing import Union
 
 from boa3.builtin.compile_time import NeoMetadata
 from boa3.internal import constants
+from boa3.internal.compiler.compilationcontext import CompilationContext
 from boa3.internal.neo3.core.types import UInt160
 
 
 class CompiledMetadata:
-    _instance = None
 
     @classmethod
     def instance(cls) -> CompiledMetadata:
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        return CompilationContext.current().compiled_metadata
 
     def __init__(self):
         self._metadata = NeoMetadata()
@@ -25,6 +23,7 @@ class CompiledMetadata:
 
     @classmethod
     def set_current_metadata(cls, metadata: NeoMetadata):
+        CompilationContext.current().record_change(cls, 'set_current_metadata', metadata)
         cls.instance()._metadata = metadata
 
     def add_contract_permission(self, contract: Union[UInt160, bytes, str], method: str = None):
@@ -3,32 +3,105 @@ __all__ = ['Compiler']
 
 import logging
 import os
+import threading
+from contextlib import nullcontext
+from contextvars import ContextVar, Token
+from typing import ContextManager, Dict, List, Optional, Union
 
 from boa3.internal import constants
 from boa3.internal.analyser.analyser import Analyser
 from boa3.internal.compiler.codegenerator.codegenerator import CodeGenerator
 from boa3.internal.compiler.codegenerator.optimizerhelper import OptimizationLevel
+from boa3.internal.compiler.compilationcache import CompilationCache
+from boa3.internal.compiler.compilationcontext import CompilationContext
+from boa3.internal.compiler.compilationprofiler import CompilationProfiler
 from boa3.internal.compiler.compileroutput import CompilerOutput
 from boa3.internal.compiler.filegenerator.filegenerator import FileGenerator
 from boa3.internal.exception.NotLoadedException import NotLoadedException
 
 
+class _CompilationLogLevels(logging.Filter):
+    """
+    The log levels of the compilations that are running.
+
+    The level of the neo3-boa logger is shared by all the threads, so while there are compilations running it's the
+    lowest of their levels, and the records that are below the level of the compilation that logged them are filtered.
+    When the last compilation finishes, the logger gets back the level it had before them.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._levels: Dict[int, int] = {}
+        self._tokens: Dict[int, Token] = {}
+        self._previous_logger_level: int = logging.NOTSET
+        self._current_level: ContextVar[Optional[int]] = ContextVar('compilation_log_level', default=None)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        level = self._current_level.get()
+        return level is None or record.levelno >= level
+
+    def change(self, compiler, log_level: Union[int, str]):
+        if isinstance(log_level, str):
+            level = logging.getLevelName(log_level)
+            if not isinstance(level, int):
+                raise ValueError(f'Unknown level: {log_level!r}')
+        else:
+            level = log_level
+
+        logger = logging.getLogger(constants.BOA_LOGGING_NAME)
+        with self._lock:
+            if len(self._levels) == 0:
+                self._previous_logger_level = logger.level
+            self._levels[id(compiler)] = level
+            if id(compiler) in self._tokens:
+                self._current_level.set(level)
+            else:
+                self._tokens[id(compiler)] = self._current_level.set(level)
+            logger.setLevel(min(self._levels.values()))
+
+    def restore(self, compiler):
+        logger = logging.getLogger(constants.BOA_LOGGING_NAME)
+        with self._lock:
+            if id(compiler) not in self._levels:
+                return
+            del self._levels[id(compiler)]
+            self._current_level.reset(self._tokens.pop(id(compiler)))
+            logger.setLevel(min(self._levels.values()) if len(self._levels) > 0 else self._previous_logger_level)
+
+
+_log_levels = _CompilationLogLevels()
+logging.getLogger(constants.BOA_LOGGING_NAME).addFilter(_log_levels)
+
+
 class Compiler:
     """
     The main compiler class.
 
+    Each compilation runs in its own compilation context, so different compilers can be used concurrently.
+
     :ivar result: the compiled file as a byte array. Empty by default.
+    :ivar profiler: the time, calls and memory of each phase of the last compilation, if the compiler was created with
+                    `profile=True`. None otherwise.
     """
 
-    def __init__(self):
+    def __init__(self, profile: bool = False):
+        """
+        :param profile: if the phases of the compilations should be profiled. The profiled compilations don't use the
+                        cache of compiled files, so all the phases are executed.
+        """
         self.result: CompilerOutput = CompilerOutput(bytearray())
+        self.profiler: Optional[CompilationProfiler] = None
+        self._profile = profile
         self._analyser: Analyser = None
         self._entry_smart_contract: str = ''
+        self._context: CompilationContext = CompilationContext()
 
     def compile(self, path: str, root_folder: str = None, env: str = None,
                 log: bool = True, log_level: str = None,
                 fail_fast: bool = True,
-                optimize: bool = True
+                optimize: bool = True,
+                cache: CompilationCache = None
                 ) -> bytes:
         """
         Load a Python file and tries to compile it
@@ -40,45 +113,68 @@ class Compiler:
         :param fail_fast: if should stop compilation on first error found.
         :return: the bytecode of the compiled .nef file
         :param optimize: if the generated bytecode should be optimized as possible. True by default.
+        :param cache: the cache of compiled files. If it's None, the file is always compiled.
         """
         optimization_level = OptimizationLevel.DEFAULT if optimize else OptimizationLevel.NONE
-
-        result = self._internal_compile(path, root_folder, env, log, log_level, fail_fast, optimization_level).bytecode
-        self._restore_log_level()
+        if self._profile:
+            cache = None
+
+        outputs = ['script']
+        request_key = None
+        if cache is not None:
+            request_key = cache.get_request_key(path, root_folder, env, optimization_level, outputs)
+            cached_files = self._load_from_cache(cache, request_key, path, outputs, log_level)
+            if cached_files is not None:
+                return cached_files['script']
+
+        try:
+            result = self._internal_compile(path, root_folder, env, log, log_level, fail_fast,
+                                            optimization_level).bytecode
+            if cache is not None:
+                self._store_in_cache(cache, request_key, {'script': result})
+        finally:
+            self._restore_log_level()
         return result
 
-    def _internal_compile(self, path: str, root_folder: str = None, env: str = None,
-                          log: bool = True, log_level: str = None,
-                          fail_fast: bool = True,
-                          optimization_level: OptimizationLevel = OptimizationLevel.DEFAULT
-                          ) -> CompilerOutput:
-        fullpath = os.path.realpath(path)
-        filepath, filename = os.path.split(fullpath)
+    def _log_start(self, path: str, log_level: str = None):
+        filepath, filename = os.path.split(path)
 
         logger = logging.getLogger(constants.BOA_LOGGING_NAME)
         if log_level:
             # raise error if log level is invalid
-            logger.setLevel(log_level)
+            self._change_log_level(log_level)
 
-        logger.setLevel(logging.INFO)  # just to show initial message
+        self._change_log_level(logging.INFO)  # just to show initial message
         logger.info(f'neo3-boa v{constants.BOA_VERSION}\tPython {constants.SYS_VERSION}')
         logger.info(f'Started compiling\t{filename}')
         self._change_log_level(log_level)
 
+    def _internal_compile(self, path: str, root_folder: str = None, env: str = None,
+                          log: bool = True, log_level: str = None,
+                          fail_fast: bool = True,
+                          optimization_level: OptimizationLevel = OptimizationLevel.DEFAULT
+                          ) -> CompilerOutput:
+        fullpath = os.path.realpath(path)
+        filepath, filename = os.path.split(fullpath)
+
+        self._log_start(fullpath, log_level)
         self._entry_smart_contract = os.path.splitext(filename)[0]
 
-        from boa3.internal.compiler.compiledmetadata import CompiledMetadata
-        from boa3.internal.model.imports.builtin import CompilerBuiltin
-        CompilerBuiltin.reset()
-        CompiledMetadata.reset()
+        self.profiler = CompilationProfiler() if self._profile else None
+        self._context = CompilationContext(env=env, profiler=self.profiler, optimization_level=optimization_level)
+        if not CompilationContext.is_any_active():
+            # keeps the compiled symbols available to the code that doesn't use compilation contexts
+            self._context.set_as_default()
 
-        self._analyse(fullpath, root_folder, env, log, fail_fast)
-        return self._compile(optimization_level)
+        with self._context.activate(), self._profile_steps():
+            self._analyse(fullpath, root_folder, env, log, fail_fast)
+            return self._compile(optimization_level)
 
     def compile_and_save(self, path: str, output_path: str, root_folder: str = None,
                          log: bool = True, log_level: str = None,
                          debug: bool = False, env: str = None, fail_fast: bool = True,
-                         optimize: bool = True
+                         optimize: bool = True,
+                         cache: CompilationCache = None
                          ):
         """
         Save the compiled file and the metadata files
@@ -91,30 +187,120 @@ class Compiler:
         :param env: specific environment id to compile.
         :param fail_fast: if should stop compilation on first error found.
         :param optimize: if the generated bytecode should be optimized as possible. True by default.
+        :param cache: the cache of compiled files. If it's None, the file is always compiled.
+        """
+        files = self.compile_files(path, root_folder, log, log_level, debug, env, fail_fast, optimize, cache)
+
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        self._write_files(output_path, files['nef'], files['manifest.json'], files['debug.json'] if debug else None)
+
+    def compile_files(self, path: str, root_folder: str = None,
+                      log: bool = True, log_level: str = None,
+                      debug: bool = False, env: str = None, fail_fast: bool = True,
+                      optimize: bool = True,
+                      cache: CompilationCache = None
+                      ) -> Dict[str, bytes]:
+        """
+        Compile the file and generate the content of the compiled file and the metadata files, without saving them
+
+        :param path: the path of the Python file to compile
+        :param root_folder: the root path of the project
+        :param log: if compiler errors should be logged.
+        :param debug: if the debug information should be generated.
+        :param env: specific environment id to compile.
+        :param fail_fast: if should stop compilation on first error found.
+        :param optimize: if the generated bytecode should be optimized as possible. True by default.
+        :param cache: the cache of compiled files. If it's None, the file is always compiled.
+        :return: a dictionary that maps the name of each file, 'nef', 'manifest.json' and 'debug.json' if debug is
+                 True, to its content
         """
         if optimize:
             optimization_level = OptimizationLevel.DEBUG if debug else OptimizationLevel.DEFAULT
         else:
             optimization_level = OptimizationLevel.NONE
+        if self._profile:
+            cache = None
 
-        self.result = self._internal_compile(path, root_folder, env, log, log_level, fail_fast, optimization_level)
-        self._save(output_path, debug)
-        self._restore_log_level()
+        outputs = ['nef', 'manifest.json']
+        if debug:
+            outputs.append('debug.json')
+
+        request_key = None
+        if cache is not None:
+            request_key = cache.get_request_key(path, root_folder, env, optimization_level, outputs)
+            cached_files = self._load_from_cache(cache, request_key, path, outputs, log_level)
+            if cached_files is not None:
+                return cached_files
+
+        try:
+            self.result = self._internal_compile(path, root_folder, env, log, log_level, fail_fast,
+                                                 optimization_level)
+            files = self._generate_files(debug)
+            if cache is not None:
+                self._store_in_cache(cache, request_key, files)
+        finally:
+            self._restore_log_level()
+        return files
+
+    def _load_from_cache(self, cache: CompilationCache, request_key: str, path: str, outputs: List[str],
+                         log_level: str = None) -> Optional[Dict[str, bytes]]:
+        cached_files = cache.load(request_key, outputs)
+        if cached_files is not None:
+            self._log_start(os.path.realpath(path), log_level)
+            logging.getLogger(constants.BOA_LOGGING_NAME).info(f'Using cached compilation from {cache.cache_dir}')
+            self._restore_log_level()
+
+        return cached_files
+
+    def _store_in_cache(self, cache: CompilationCache, request_key: str, files: Dict[str, bytes]):
+        if len(self._analyser.warnings) > 0:
+            # the warnings are logged only when the file is compiled
+            return
+
+        cache.store(request_key, self.get_dependencies(), files)
+
+    @property
+    def errors(self) -> list:
+        """
+        Gets the compiler errors found in the last compilation
+        """
+        return self._analyser.errors if self._analyser is not None else []
+
+    @property
+    def warnings(self) -> list:
+        """
+        Gets the compiler warnings found in the last compilation
+        """
+        return self._analyser.warnings if self._analyser is not None else []
+
+    def get_dependencies(self) -> List[str]:
+        """
+        Gets the Python files used in the last compilation, the entry file and all the modules imported by it
+
+        :return: the real paths of the files. An empty list if no file was analysed.
+        """
+        if self._analyser is None:
+            return []
+
+        dependencies: List[str] = [self._analyser.path]
+        analysers = self._analyser.get_imports()
+        while len(analysers) > 0:
+            imported = analysers.pop()
+            if imported.path not in dependencies:
+                dependencies.append(imported.path)
+                analysers.extend(imported.get_imports())
+
+        return [os.path.realpath(file_path) for file_path in dependencies]
 
     def _change_log_level(self, log_level: str = None):
         if not log_level:
             log_level = logging.ERROR
 
-        logger = logging.getLogger(constants.BOA_LOGGING_NAME)
-        self._previous_logger_level = logger.level
-
-        logger.setLevel(log_level)
+        # the level is kept only by this compilation, the compilations running in other threads keep their levels
+        _log_levels.change(self, log_level)
 
     def _restore_log_level(self):
-        if hasattr(self, '_previous_logger_level'):
-            logger = logging.getLogger(constants.BOA_LOGGING_NAME)
-            logger.setLevel(self._previous_logger_level)
-            del self._previous_logger_level
+        _log_levels.restore(self)
 
     def _analyse(self, path: str, root_folder: str = None, env: str = None,
                  log: bool = True, fail_fast: bool = True):
@@ -156,13 +342,13 @@ class Compiler:
 
         return result
 
-    def _save(self, output_path: str, debug: bool):
+    def _generate_files(self, debug: bool) -> Dict[str, bytes]:
         """
-        Save the compiled file and the metadata files
+        Generate the content of the compiled file and the metadata files
 
-        :param output_path: the path to save the generated files
         :raise NotLoadedException: raised if no file were compiled
         :param debug: if nefdbgnfo file should be generated.
+        :return: a dictionary that maps the name of each generated file to its content
         """
         is_bytecode_empty = len(self.result.bytecode) == 0
         if (self._analyser is None
@@ -170,27 +356,33 @@ class Compiler:
                 or is_bytecode_empty):
             raise NotLoadedException(empty_script=is_bytecode_empty)
 
-        if not os.path.isdir(output_path):
-            output_folder = os.path.abspath(os.path.dirname(output_path))
-        else:
-            output_folder = os.path.abspath(output_path)
+        with self._context.activate(), self._profile_steps():
+            generator = FileGenerator(self.result, self._analyser, self._entry_smart_contract)
+
+            generated_files = {}
+            with CompilationProfiler.phase('FileGenerator.nef'):
+                generated_files['nef'] = generator.generate_nef_file()
+            with CompilationProfiler.phase('FileGenerator.manifest'):
+                generated_files['manifest.json'] = generator.generate_manifest_file()
+            if debug:
+                with CompilationProfiler.phase('FileGenerator.debug'):
+                    generated_files['debug.json'] = generator.generate_nefdbgnfo_file()
 
-        generator = FileGenerator(self.result, self._analyser, self._entry_smart_contract)
+        return generated_files
 
-        generator.create_folder(output_folder)
+    def _profile_steps(self) -> ContextManager:
+        return self.profiler.profile() if self.profiler is not None else nullcontext()
 
+    def _write_files(self, output_path: str, nef_bytes: bytes, manifest_bytes: bytes, debug_bytes: Optional[bytes]):
         with open(output_path, 'wb+') as nef_file:
-            nef_bytes = generator.generate_nef_file()
             nef_file.write(nef_bytes)
             nef_file.close()
 
         with open(output_path.replace('.nef', '.manifest.json'), 'wb+') as manifest_file:
-            manifest_bytes = generator.generate_manifest_file()
             manifest_file.write(manifest_bytes)
             manifest_file.close()
 
-        if debug:
+        if debug_bytes is not None:
             from zipfile import ZipFile, ZIP_DEFLATED
             with ZipFile(output_path.replace('.nef', '.nefdbgnfo'), 'w', ZIP_DEFLATED) as nef_debug_info:
-                debug_bytes = generator.generate_nefdbgnfo_file()
                 nef_debug_info.writestr(os.path.basename(output_path.replace('.nef', '.debug.json')), debug_bytes)
@@ -41,6 +41,7 @@ class FileGenerator:
         self.__all_imports: List[Import] = None
         self._all_methods: Dict[str, Method] = None
         self._all_static_vars: Dict[str, Variable] = None
+        self._static_vars_slot_indexes: Dict[str, int] = None
 
         self._inner_methods = None
         self._inner_events = None
@@ -681,10 +682,9 @@ class FileGenerator:
         return '{0}.{1}'.format(imports_unique_ids[-1], variable_original_id)
 
     def _get_static_var_slot_index(self, variable_id) -> Optional[int]:
-        module_globals = list(self._static_variables.keys())
-        if variable_id in module_globals:
-            return module_globals.index(variable_id)
-        return None
+        if self._static_vars_slot_indexes is None:
+            self._static_vars_slot_indexes = {var_id: index for index, var_id in enumerate(self._static_variables)}
+        return self._static_vars_slot_indexes.get(variable_id)
 
     def _get_imports_unique_ids(self, imported_symbols: Dict[str, Import],
                                 importing_methods: bool,
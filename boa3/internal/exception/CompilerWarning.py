@@ -27,6 +27,10 @@ class CompilerWarning(ABC, BaseException):
             return False
         return self.message == other.message
 
+    def __deepcopy__(self, memo):
+        # warnings aren't changed after they are reported, so the copies of an analysis can share them
+        return self
+
 
 class DeprecatedSymbol(CompilerWarning):
     """
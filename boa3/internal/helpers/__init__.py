@@ -1,4 +1,5 @@
 import ast
+import threading
 
 
 def get_auxiliary_name(node: ast.AST, aux_symbol_id: str) -> str:
@@ -10,3 +11,21 @@ def get_auxiliary_name(node: ast.AST, aux_symbol_id: str) -> str:
     :return: the unique name to the symbol.
     """
     return "{0}_{1}".format(aux_symbol_id, id(node))
+
+
+_parse_lock = threading.Lock()
+
+
+def parse(source: str, filename: str = '<unknown>') -> ast.Module:
+    """
+    Parses Python code into an abstract syntax tree.
+
+    Python 3.11 can raise a SystemError when trees are built by more than one thread at the same time, so the concurrent
+    compilations build their trees one at a time.
+
+    :param source: the Python code to parse
+    :param filename: the name of the file, used in the syntax errors
+    :return: the module node of the parsed code
+    """
+    with _parse_lock:
+        return ast.parse(source, filename=filename)
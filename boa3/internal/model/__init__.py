@@ -1,7 +1,27 @@
 import ast
+import functools
+
+from boa3.internal import helpers
 
 
 def set_internal_call(node: ast.AST) -> ast.AST:
     node.is_internal_call = True
     node._fields += ('is_internal_call',)
     return node
+
+
+@functools.lru_cache(maxsize=None)
+def get_default_value_node(source: str, internal_call: bool = False) -> ast.AST:
+    """
+    Gets the node of a default argument value of a builtin method.
+
+    The node is parsed only once for each source and it's shared by all the methods with the same default value. They
+    must not be changed, the default values are cloned when they are included in a call.
+
+    :param source: the Python code of the value
+    :param internal_call: if the value should be marked as an internal call
+    """
+    node = helpers.parse(source).body[0].value
+    if internal_call:
+        node = set_internal_call(node)
+    return node
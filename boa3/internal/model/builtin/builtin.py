@@ -34,18 +34,34 @@ class BoaPackage(str, Enum):
 class Builtin:
     @classmethod
     def get_symbol(cls, symbol_id: str) -> Optional[Callable]:
-        for method in cls._python_builtins:
-            if isinstance(method, IBuiltinCallable) and method.identifier == symbol_id:
-                return method
+        if cls._python_builtins_by_id is None:
+            # the index is built only once and it's reused by every compilation
+            builtins_by_id = {}
+            for method in cls._python_builtins:
+                if isinstance(method, IBuiltinCallable) and method.identifier not in builtins_by_id:
+                    builtins_by_id[method.identifier] = method
+            cls._python_builtins_by_id = builtins_by_id
+
+        return cls._python_builtins_by_id.get(symbol_id)
 
     @classmethod
     def get_by_self(cls, symbol_id: str, self_type: IType) -> Optional[Callable]:
-        for name, method in vars(cls).items():
-            if (isinstance(method, IBuiltinMethod)
-                    and method.identifier == symbol_id
-                    and method.validate_self(self_type)):
+        if cls._methods_by_id is None:
+            methods_by_id = {}
+            for name, method in vars(cls).items():
+                if isinstance(method, IBuiltinMethod):
+                    if method.identifier not in methods_by_id:
+                        methods_by_id[method.identifier] = []
+                    methods_by_id[method.identifier].append(method)
+            cls._methods_by_id = methods_by_id
+
+        for method in cls._methods_by_id.get(symbol_id, ()):
+            if method.validate_self(self_type):
                 return method
 
+    _python_builtins_by_id: Optional[Dict[str, IBuiltinCallable]] = None
+    _methods_by_id: Optional[Dict[str, List[IBuiltinMethod]]] = None
+
     # builtin method
     Abs = AbsMethod()
     Exit = ExitMethod()
@@ -2,6 +2,7 @@ import ast
 from abc import ABC
 from typing import Dict, List, Optional, Tuple
 
+from boa3.internal.compiler.compilationcontext import ContextAttribute
 from boa3.internal.model.builtin.builtinsymbol import IBuiltinSymbol
 from boa3.internal.model.callable import Callable
 from boa3.internal.model.type.itype import IType
@@ -10,6 +11,10 @@ from boa3.internal.neo.vm.opcode.Opcode import Opcode
 
 
 class IBuiltinCallable(Callable, IBuiltinSymbol, ABC):
+    # builtin symbols are shared by all compilations, so the values changed during a compilation are kept by context
+    _self_calls = ContextAttribute(set)
+    _generated_opcode = ContextAttribute()
+
     def __init__(self, identifier: str, args: Dict[str, Variable] = None,
                  vararg: Optional[Tuple[str, Variable]] = None,
                  kwargs: Optional[Dict[str, Variable]] = None,
@@ -1,7 +1,6 @@
-import ast
 from typing import Dict
 
-from boa3.internal.model import set_internal_call
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.classmethod.countmethod import CountMethod
 from boa3.internal.model.variable import Variable
 
@@ -17,10 +16,8 @@ class CountStrMethod(CountMethod):
             'end': Variable(Type.union.build([Type.int, Type.none])),
         }
 
-        start_default = set_internal_call(ast.parse("{0}".format(Type.int.default_value)
-                                                    ).body[0].value)
-        end_default = set_internal_call(ast.parse("{0}".format(Type.none.default_value)
-                                                  ).body[0].value)
+        start_default = get_default_value_node("{0}".format(Type.int.default_value), internal_call=True)
+        end_default = get_default_value_node("{0}".format(Type.none.default_value), internal_call=True)
 
         super().__init__(args, [start_default, end_default])
 
@@ -1,6 +1,6 @@
-import ast
 from typing import Dict, Optional
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.classmethod.indexmethod import IndexMethod
 from boa3.internal.model.expression import IExpression
 from boa3.internal.model.type.primitive.bytestype import BytesType
@@ -23,10 +23,8 @@ class IndexBytesStringMethod(IndexMethod):
             'end': Variable(Type.optional.build(Type.int)),
         }
 
-        start_default = ast.parse("{0}".format(0)
-                                  ).body[0].value
-        end_default = ast.parse("{0}".format(Type.none.default_value)
-                                ).body[0].value
+        start_default = get_default_value_node("{0}".format(0))
+        end_default = get_default_value_node("{0}".format(Type.none.default_value))
 
         super().__init__(args, defaults=[start_default, end_default])
 
@@ -1,6 +1,7 @@
 import ast
 from typing import Dict, Optional
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.classmethod.indexmethod import IndexMethod
 from boa3.internal.model.expression import IExpression
 from boa3.internal.model.type.collection.sequence.sequencetype import SequenceType
@@ -25,8 +26,7 @@ class IndexSequenceMethod(IndexMethod):
             'end': Variable(Type.int),
         }
 
-        start_default = ast.parse("{0}".format(0)
-                                  ).body[0].value
+        start_default = get_default_value_node("{0}".format(0))
         end_default = ast.parse("-1").body[0].value.operand
         end_default.n = -1
 
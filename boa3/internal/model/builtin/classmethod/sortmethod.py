@@ -1,6 +1,6 @@
-import ast
 from typing import Any, Dict, Optional
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.method import IBuiltinMethod
 from boa3.internal.model.operation.binaryop import BinaryOp
 from boa3.internal.model.type.itype import IType
@@ -24,7 +24,7 @@ class SortMethod(IBuiltinMethod):
         kwargs = {
             'reverse': Variable(Type.bool)
         }
-        reverse_default = ast.parse(str(Type.bool.default_value)).body[0].value
+        reverse_default = get_default_value_node(str(Type.bool.default_value))
 
         super().__init__(identifier, args, kwargs=kwargs, defaults=[reverse_default])
 
@@ -1,6 +1,6 @@
-import ast
 from typing import Any, Dict, Optional
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.method.builtinmethod import IBuiltinMethod
 from boa3.internal.model.type.primitive.ibytestringtype import IByteStringType
 from boa3.internal.model.variable import Variable
@@ -22,10 +22,8 @@ class StartsWithMethod(IBuiltinMethod):
             'end': Variable(Type.optional.build(Type.int)),
         }
 
-        start_default = ast.parse("{0}".format(0)
-                                  ).body[0].value
-        end_default = ast.parse("{0}".format(Type.none.default_value)
-                                ).body[0].value
+        start_default = get_default_value_node("{0}".format(0))
+        end_default = get_default_value_node("{0}".format(Type.none.default_value))
 
         super().__init__(identifier, args, defaults=[start_default, end_default], return_type=Type.bool)
 
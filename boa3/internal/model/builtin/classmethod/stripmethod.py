@@ -1,6 +1,6 @@
-import ast
 from typing import Any, Dict, Optional
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.method.builtinmethod import IBuiltinMethod
 from boa3.internal.model.type.primitive.ibytestringtype import IByteStringType
 from boa3.internal.model.variable import Variable
@@ -28,9 +28,9 @@ class StripMethod(IBuiltinMethod):
         whitespace_chars = [char.encode('unicode-escape').decode() for char in whitespace]
 
         if Type.str.is_type_of(self_type):
-            chars_default = ast.parse("'{0}'".format(''.join(whitespace_chars))).body[0].value
+            chars_default = get_default_value_node("'{0}'".format(''.join(whitespace_chars)))
         else:
-            chars_default = ast.parse("b'{0}'".format(''.join(whitespace_chars))).body[0].value
+            chars_default = get_default_value_node("b'{0}'".format(''.join(whitespace_chars)))
 
         super().__init__(identifier, args, defaults=[chars_default], return_type=self_type)
 
@@ -1,5 +1,6 @@
 from typing import Dict, Optional, Any, Sequence
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.method.builtinmethod import IBuiltinMethod
 from boa3.internal.model.type.itype import IType
 from boa3.internal.model.variable import Variable
@@ -20,7 +21,7 @@ class AbortMethod(IBuiltinMethod):
                 'msg': Variable(Type.optional.build(message_type))
             }
             defaults = [
-                ast.parse(f'{Type.none.default_value}').body[0].value
+                get_default_value_node(f'{Type.none.default_value}')
             ]
 
         else:
@@ -1,6 +1,6 @@
-import ast
 from typing import Dict
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.contract.nep17_interface_methods.nep17interfacemethod import Nep17InterfaceMethod
 from boa3.internal.model.builtin.interop.contract import ContractType
 from boa3.internal.model.variable import Variable
@@ -20,7 +20,6 @@ class Nep17InterfaceTransferMethod(Nep17InterfaceMethod):
             'data': Variable(Type.any),
         }
 
-        data_default = ast.parse("{0}".format(Type.any.default_value)
-                                 ).body[0].value
+        data_default = get_default_value_node("{0}".format(Type.any.default_value))
 
         super().__init__(args, 'transfer', return_type=Type.bool, defaults=[data_default])
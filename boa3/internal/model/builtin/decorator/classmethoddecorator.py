@@ -1,6 +1,7 @@
 import ast
 from typing import Optional
 
+from boa3.internal import helpers
 from boa3.internal.model import set_internal_call
 from boa3.internal.model.builtin.decorator.builtindecorator import IBuiltinDecorator
 from boa3.internal.model.symbol import ISymbol
@@ -22,7 +23,7 @@ class ClassMethodDecorator(IBuiltinDecorator):
                                    if isinstance(cls_type, metatype.MetaType)
                                    else cls_type.identifier)
 
-            cls_ast_annotation = ast.parse(cls_type_annotation).body[0].value
+            cls_ast_annotation = helpers.parse(cls_type_annotation).body[0].value
             cls_ast_annotation = set_internal_call(cls_ast_annotation)
             args.args[0].annotation = cls_ast_annotation
 
@@ -1,6 +1,7 @@
 import ast
 from typing import Any, Dict, List, Optional, Sized
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.decorator.builtindecorator import IBuiltinDecorator
 from boa3.internal.model.type.type import Type
 from boa3.internal.model.variable import Variable
@@ -13,8 +14,8 @@ class PublicDecorator(IBuiltinDecorator):
                                      'safe': Variable(Type.bool),
                                      }
 
-        name_default = ast.parse("'{0}'".format(Type.str.default_value)).body[0].value
-        safe_default = ast.parse("{0}".format(Type.bool.default_value)).body[0].value
+        name_default = get_default_value_node("'{0}'".format(Type.str.default_value))
+        safe_default = get_default_value_node("{0}".format(Type.bool.default_value))
 
         defaults = [name_default, safe_default]
         super().__init__(identifier, args, defaults)
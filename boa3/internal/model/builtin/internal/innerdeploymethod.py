@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import ast
 from typing import Dict, Optional
 
-from boa3.internal import constants
+from boa3.internal import constants, helpers
+from boa3.internal.compiler.compilationcontext import CompilationContext
 from boa3.internal.model import set_internal_call
 from boa3.internal.model.builtin.internal.internalmethod import IInternalMethod
 from boa3.internal.model.builtin.method.builtinmethod import IBuiltinMethod
@@ -16,7 +16,7 @@ class InnerDeployMethod(IInternalMethod):
 
     @classmethod
     def instance(cls) -> InnerDeployMethod:
-        return _INNER_DEPLOY_METHOD
+        return CompilationContext.current().inner_deploy_method
 
     def __init__(self):
         from boa3.internal.model.type.type import Type
@@ -28,7 +28,7 @@ class InnerDeployMethod(IInternalMethod):
         super().__init__(identifier, args, return_type=Type.none)
 
         self.is_public = True
-        self._origin_node = set_internal_call(ast.parse(self._body).body[0])
+        self._origin_node = set_internal_call(helpers.parse(self._body).body[0])
 
     @property
     def _body(self) -> Optional[str]:
@@ -57,7 +57,7 @@ class InnerDeployMethod(IInternalMethod):
             if not symbol.is_public:
                 return False
 
-            reference_args = list(_INNER_DEPLOY_METHOD.args.values())
+            reference_args = list(cls.instance().args.values())
             from boa3.internal.model.type.type import Type
             if symbol.return_type is not Type.none:
                 return False
@@ -71,5 +71,3 @@ class InnerDeployMethod(IInternalMethod):
 
         return True
 
-
-_INNER_DEPLOY_METHOD = InnerDeployMethod()
@@ -1,7 +1,6 @@
-import ast
 from typing import Dict, List
 
-from boa3.internal.model import set_internal_call
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.interop.interopmethod import InteropMethod
 from boa3.internal.model.variable import Variable
 
@@ -22,11 +21,10 @@ class CallMethod(InteropMethod):
             'args': Variable(Type.sequence),  # TODO: change when *args is implemented #2kq1hzg
             'call_flags': Variable(call_flags)
         }
-        args_default = ast.parse("{0}".format(Type.sequence.default_value)
-                                 ).body[0].value
-        call_flags_default = set_internal_call(ast.parse("{0}.{1}".format(call_flags.identifier,
-                                                                          call_flags.default_value.name)
-                                                         ).body[0].value)
+        args_default = get_default_value_node("{0}".format(Type.sequence.default_value))
+        call_flags_default = get_default_value_node("{0}.{1}".format(call_flags.identifier,
+                                                                     call_flags.default_value.name),
+                                                    internal_call=True)
 
         super().__init__(identifier, syscall, args, defaults=[args_default, call_flags_default], return_type=Type.any)
 
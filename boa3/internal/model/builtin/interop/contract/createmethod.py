@@ -1,6 +1,6 @@
-import ast
 from typing import Dict
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.interop.contract.contracttype import ContractType
 from boa3.internal.model.builtin.interop.nativecontract import ContractManagementMethod
 from boa3.internal.model.variable import Variable
@@ -17,7 +17,6 @@ class CreateMethod(ContractManagementMethod):
             'manifest': Variable(Type.bytes),
             'data': Variable(Type.any)
         }
-        data_default = ast.parse("{0}".format(Type.any.default_value)
-                                 ).body[0].value
+        data_default = get_default_value_node("{0}".format(Type.any.default_value))
 
         super().__init__(identifier, syscall, args, defaults=[data_default], return_type=contract_type)
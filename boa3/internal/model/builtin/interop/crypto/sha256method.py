@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Any, Dict
 
 from boa3.internal.model.builtin.interop.nativecontract import CryptoLibMethod
 from boa3.internal.model.variable import Variable
@@ -11,3 +11,14 @@ class Sha256Method(CryptoLibMethod):
         native_identifier = 'sha256'
         args: Dict[str, Variable] = {'key': Variable(Type.any)}
         super().__init__(identifier, native_identifier, args, return_type=Type.bytes)
+
+    def evaluate_literal(self, *args: Any) -> Any:
+        if len(args) == 1:
+            arg = args[0]
+            if isinstance(arg, str):
+                arg = arg.encode('utf-8')
+            if isinstance(arg, bytes):
+                import hashlib
+                return hashlib.sha256(arg).digest()
+
+        return super().evaluate_literal(*args)
@@ -40,10 +40,18 @@ class InteropPackage(str, Enum):
 class Interop:
     @classmethod
     def get_symbol(cls, symbol_id: str) -> Optional[IdentifiedSymbol]:
-        for pkg_symbols in cls._interop_symbols.values():
-            for method in pkg_symbols:
-                if method.identifier == symbol_id:
-                    return method
+        if cls._interop_symbols_by_id is None:
+            # the index is built only once and it's reused by every compilation
+            symbols_by_id = {}
+            for pkg_symbols in cls._interop_symbols.values():
+                for method in pkg_symbols:
+                    if method.identifier not in symbols_by_id:
+                        symbols_by_id[method.identifier] = method
+            cls._interop_symbols_by_id = symbols_by_id
+
+        return cls._interop_symbols_by_id.get(symbol_id)
+
+    _interop_symbols_by_id: Optional[Dict[str, IdentifiedSymbol]] = None
 
     @classmethod
     def interop_symbols(cls, package: str = None) -> List[IdentifiedSymbol]:
@@ -1,6 +1,7 @@
 import ast
 from typing import Dict, List, Optional
 
+from boa3.internal.compiler.compilationcontext import ContextAttribute
 from boa3.internal.compiler.compiledmetadata import CompiledMetadata
 from boa3.internal.model.builtin.interop.contractgethashmethod import ContractGetHashMethod
 from boa3.internal.model.builtin.interop.interopmethod import InteropMethod
@@ -9,6 +10,9 @@ from boa3.internal.model.variable import Variable
 
 
 class NativeContractMethod(InteropMethod):
+    _added_to_permissions = ContextAttribute(bool)
+    _pack_arguments = ContextAttribute()
+    _method_token_id = ContextAttribute()
 
     def __init__(self, native_contract_script_hash_method: ContractGetHashMethod, identifier: str, syscall: str,
                  args: Dict[str, Variable] = None, defaults: List[ast.AST] = None, return_type: IType = None,
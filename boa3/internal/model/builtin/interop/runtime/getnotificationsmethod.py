@@ -1,7 +1,6 @@
-import ast
 from typing import Dict
 
-from boa3.internal.model import set_internal_call
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.interop.interopmethod import InteropMethod
 from boa3.internal.model.builtin.interop.runtime.notificationtype import NotificationType
 from boa3.internal.model.variable import Variable
@@ -18,8 +17,7 @@ class GetNotificationsMethod(InteropMethod):
         uint160 = UInt160Type.build()
 
         args: Dict[str, Variable] = {'script_hash': Variable(Type.optional.build(uint160))}
-        args_default = set_internal_call(ast.parse("{0}".format(Type.none.default_value)
-                                                   ).body[0].value)
+        args_default = get_default_value_node("{0}".format(Type.none.default_value), internal_call=True)
 
         super().__init__(identifier, syscall, args, [args_default],
                          return_type=Type.list.build([notification_type]))
@@ -1,5 +1,6 @@
 from typing import Dict
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.interop.interopevent import InteropEvent
 from boa3.internal.model.variable import Variable
 
@@ -16,8 +17,7 @@ class NotifyMethod(InteropEvent):
                                      self._event_name_key: Variable(Type.str)
                                      }
         import ast
-        event_name_default = ast.parse("'{0}'".format(identifier)
-                                       ).body[0].value
+        event_name_default = get_default_value_node("'{0}'".format(identifier))
         super().__init__(identifier, syscall, args, defaults=[event_name_default])
 
     @property
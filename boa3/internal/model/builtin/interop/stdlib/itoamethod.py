@@ -1,6 +1,6 @@
-import ast
 from typing import Dict
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.interop.nativecontract import StdLibMethod
 from boa3.internal.model.variable import Variable
 
@@ -15,7 +15,7 @@ class ItoaMethod(StdLibMethod):
             'value': Variable(Type.int),
             'base': Variable(Type.int)
         }
-        args_default = ast.parse("{0}".format(10)).body[0].value
+        args_default = get_default_value_node("{0}".format(10))
 
         super().__init__(identifier, syscall, args, defaults=[args_default], return_type=Type.str,
                          internal_call_args=internal_call_args)
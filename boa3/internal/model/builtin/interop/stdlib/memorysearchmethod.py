@@ -1,7 +1,6 @@
-import ast
 from typing import Dict
 
-from boa3.internal.model import set_internal_call
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.interop.nativecontract import StdLibMethod
 from boa3.internal.model.variable import Variable
 
@@ -22,10 +21,8 @@ class MemorySearchMethod(StdLibMethod):
             'backward': Variable(Type.bool),
         }
 
-        start_default = set_internal_call(ast.parse("{0}".format(Type.int.default_value)
-                                                    ).body[0].value)
-        backward_default = set_internal_call(ast.parse("{0}".format(Type.bool.default_value)
-                                                       ).body[0].value)
+        start_default = get_default_value_node("{0}".format(Type.int.default_value), internal_call=True)
+        backward_default = get_default_value_node("{0}".format(Type.bool.default_value), internal_call=True)
 
         super().__init__(identifier, native_identifier, args,
                          defaults=[start_default, backward_default],
@@ -1,7 +1,6 @@
-import ast
 from typing import Any, Dict, Iterable, List, Sized
 
-from boa3.internal.model import set_internal_call
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.interop.interopmethod import InteropMethod
 from boa3.internal.model.builtin.interop.storage import FindOptionsType
 from boa3.internal.model.builtin.method.builtinmethod import IBuiltinMethod
@@ -33,11 +32,10 @@ class StorageFindMethod(InteropMethod):
 
         from boa3.internal.model.builtin.interop.storage.storagegetcontextmethod import StorageGetContextMethod
         default_id = StorageGetContextMethod(context_type).identifier
-        context_default = set_internal_call(ast.parse("{0}()".format(default_id)
-                                                      ).body[0].value)
-        options_default = set_internal_call(ast.parse("{0}.{1}".format(find_options_type.identifier,
-                                                                       find_options_type.default_value.name)
-                                                      ).body[0].value)
+        context_default = get_default_value_node("{0}()".format(default_id), internal_call=True)
+        options_default = get_default_value_node("{0}.{1}".format(find_options_type.identifier,
+                                                                  find_options_type.default_value.name),
+                                                 internal_call=True)
 
         defaults = [context_default, options_default]
 
@@ -1,7 +1,6 @@
-import ast
 from typing import Any, Dict, Iterable, List, Sized
 
-from boa3.internal.model import set_internal_call
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.interop.interopmethod import InteropMethod
 from boa3.internal.model.builtin.method.builtinmethod import IBuiltinMethod
 from boa3.internal.model.expression import IExpression
@@ -24,8 +23,7 @@ class StorageGetMethod(InteropMethod):
 
         from boa3.internal.model.builtin.interop.storage.storagegetcontextmethod import StorageGetContextMethod
         default_id = StorageGetContextMethod(context_type).identifier
-        context_default = set_internal_call(ast.parse("{0}()".format(default_id)
-                                                      ).body[0].value)
+        context_default = get_default_value_node("{0}()".format(default_id), internal_call=True)
         super().__init__(identifier, syscall, args, defaults=[context_default], return_type=Type.bytes)
 
     def generate_internal_opcodes(self, code_generator):
@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 from boa3.internal.model.builtin.method.builtinmethod import IBuiltinMethod
 from boa3.internal.model.variable import Variable
@@ -13,6 +13,15 @@ class SqrtMethod(IBuiltinMethod):
         args: Dict[str, Variable] = {'val': Variable(Type.int)}
         super().__init__(identifier, args, return_type=Type.int)
 
+    def evaluate_literal(self, *args: Any) -> Any:
+        if len(args) == 1:
+            arg = args[0]
+            if isinstance(arg, int) and not isinstance(arg, bool) and arg >= 0:
+                import math
+                return math.isqrt(arg)
+
+        return super().evaluate_literal(*args)
+
     def generate_internal_opcodes(self, code_generator):
         code_generator.insert_opcode(Opcode.SQRT)
 
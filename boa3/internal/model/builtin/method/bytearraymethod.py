@@ -1,6 +1,6 @@
-import ast
 from typing import Any, Dict, Optional, Union
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.method.builtinmethod import IBuiltinMethod
 from boa3.internal.model.expression import IExpression
 from boa3.internal.model.type.collection.sequence.sequencetype import SequenceType
@@ -24,8 +24,7 @@ class ByteArrayMethod(IBuiltinMethod):
                 argument_type = Type.none
 
             args: Dict[str, Variable] = {'object': Variable(argument_type)}
-            object_default = ast.parse(f"{Type.int.default_value}"
-                                       ).body[0].value
+            object_default = get_default_value_node(f"{Type.int.default_value}")
             defaults = [object_default]
 
         super().__init__(identifier, args, defaults=defaults, return_type=Type.bytearray)
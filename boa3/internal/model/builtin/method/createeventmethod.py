@@ -1,5 +1,6 @@
 from typing import Any, Optional
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.method.builtinmethod import IBuiltinMethod
 from boa3.internal.model.expression import IExpression
 from boa3.internal.model.type.itype import IType
@@ -16,8 +17,7 @@ class CreateEventMethod(IBuiltinMethod):
             'arguments': Variable(Type.list.build(Type.tuple)),
             'event_name': Variable(Type.str)
         }
-        event_name_default = ast.parse("'{0}'".format(Type.str.default_value)
-                                       ).body[0].value
+        event_name_default = get_default_value_node("'{0}'".format(Type.str.default_value))
         super().__init__(identifier, args, defaults=[event_name_default], return_type=EventType)
 
     def validate_parameters(self, *params: IExpression) -> bool:
@@ -1,6 +1,6 @@
-import ast
 from typing import Any, Dict, Optional
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.method.builtinmethod import IBuiltinMethod
 from boa3.internal.model.expression import IExpression
 from boa3.internal.model.type.itype import IType
@@ -18,8 +18,7 @@ class ExceptionMethod(IBuiltinMethod):
         identifier = '-Exception'
         args: Dict[str, Variable] = {'message': Variable(argument_type)}
         default_message = "'{0}'".format(self.default_message) if argument_type is Type.str else "{0}"
-        default = ast.parse(default_message.format(argument_type.default_value)
-                            ).body[0].value
+        default = get_default_value_node(default_message.format(argument_type.default_value))
         super().__init__(identifier, args, [default], return_type=Type.exception)
 
     @property
@@ -1,6 +1,6 @@
-import ast
 from typing import Dict
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.method.intmethod import IntMethod
 from boa3.internal.model.variable import Variable
 from boa3.internal.neo.vm.opcode.Opcode import Opcode
@@ -19,11 +19,9 @@ class IntByteStringMethod(IntMethod):
             'base': Variable(Type.int)
         }
 
-        value_default = ast.parse("{0}".format(Type.int.default_value)
-                                  ).body[0].value
+        value_default = get_default_value_node("{0}".format(Type.int.default_value))
 
-        base_default = ast.parse("{0}".format(10)
-                                 ).body[0].value
+        base_default = get_default_value_node("{0}".format(10))
 
         super().__init__(args, [value_default, base_default])
 
@@ -1,6 +1,6 @@
-import ast
 from typing import Dict
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.method.intmethod import IntMethod
 from boa3.internal.model.variable import Variable
 
@@ -13,8 +13,7 @@ class IntIntMethod(IntMethod):
             'value': Variable(Type.int),
         }
 
-        value_default = ast.parse("{0}".format(Type.int.default_value)
-                                  ).body[0].value
+        value_default = get_default_value_node("{0}".format(Type.int.default_value))
 
         super().__init__(args, [value_default])
 
@@ -27,6 +27,17 @@ class LenMethod(IBuiltinMethod):
             return False
         return isinstance(params[0].type, SequenceType)
 
+    def evaluate_literal(self, *args: Any) -> Any:
+        if len(args) == 1:
+            arg = args[0]
+            if isinstance(arg, str):
+                # the size of a string in the VM is the length of its encoded bytes
+                return len(arg.encode('utf-8'))
+            if isinstance(arg, (bytes, list, tuple, dict)):
+                return len(arg)
+
+        return super().evaluate_literal(*args)
+
     def generate_internal_opcodes(self, code_generator):
         code_generator.insert_opcode(Opcode.SIZE)
 
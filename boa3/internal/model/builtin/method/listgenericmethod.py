@@ -1,6 +1,6 @@
-import ast
 from typing import Dict
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.method.listmethod import ListMethod
 from boa3.internal.model.type.itype import IType
 from boa3.internal.model.variable import Variable
@@ -18,8 +18,7 @@ class ListGenericMethod(ListMethod):
             'value': Variable(value),
         }
 
-        value_default = ast.parse("{0}".format(Type.sequence.default_value)
-                                  ).body[0].value
+        value_default = get_default_value_node("{0}".format(Type.sequence.default_value))
 
         return_value = Type.any if value is Type.any else []
 
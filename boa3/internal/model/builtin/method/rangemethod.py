@@ -1,6 +1,6 @@
-import ast
 from typing import Any, Dict, List, Optional, Union
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.method.builtinmethod import IBuiltinMethod
 from boa3.internal.model.expression import IExpression
 from boa3.internal.model.type.itype import IType
@@ -27,9 +27,8 @@ class RangeMethod(IBuiltinMethod):
             'start': start,
             'step': step
         }
-        start_default = ast.parse("{0}".format(Type.int.default_value)
-                                  ).body[0].value
-        step_default = ast.parse("1").body[0].value
+        start_default = get_default_value_node("{0}".format(Type.int.default_value))
+        step_default = get_default_value_node("1")
         super().__init__(identifier, args, defaults=[start_default, step_default], return_type=Type.range)
 
     @property
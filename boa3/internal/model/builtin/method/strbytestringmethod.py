@@ -1,6 +1,6 @@
-import ast
 from typing import Dict
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.method.strmethod import StrMethod
 from boa3.internal.model.variable import Variable
 
@@ -13,7 +13,7 @@ class StrBytesMethod(StrMethod):
         args: Dict[str, Variable] = {
             'object': Variable(Type.union.build([Type.bytes, Type.str])),
         }
-        object_default = ast.parse("'{0}'".format(Type.str.default_value)).body[0].value
+        object_default = get_default_value_node("'{0}'".format(Type.str.default_value))
 
         super().__init__(args, [object_default])
 
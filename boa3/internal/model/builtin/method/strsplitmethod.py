@@ -1,6 +1,7 @@
 import ast
 from typing import Dict, List
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.interop.nativecontract import StdLibMethod
 from boa3.internal.model.variable import Variable
 from boa3.internal.neo.vm.opcode.Opcode import Opcode
@@ -17,7 +18,7 @@ class StrSplitMethod(StdLibMethod):
             'maxsplit': Variable(Type.int)
         }
         # whitespace is the default separator
-        separator_default = ast.parse("' '").body[0].value
+        separator_default = get_default_value_node("' '")
         # maxsplit the default value is -1
         maxsplit_default = ast.parse("-1").body[0].value.operand
         maxsplit_default.n = -1
@@ -1,6 +1,6 @@
-import ast
 from typing import Dict, Optional
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.method.builtinmethod import IBuiltinMethod
 from boa3.internal.model.variable import Variable
 from boa3.internal.neo.vm.opcode.Opcode import Opcode
@@ -14,8 +14,7 @@ class SumMethod(IBuiltinMethod):
         args: Dict[str, Variable] = {'__iterable': Variable(Type.sequence.build_collection(Type.int)),
                                      '__start': Variable(Type.int)}
 
-        start_default = ast.parse("{0}".format(Type.int.default_value)
-                                  ).body[0].value
+        start_default = get_default_value_node("{0}".format(Type.int.default_value))
         super().__init__(identifier, args, defaults=[start_default], return_type=Type.int)
 
     def generate_internal_opcodes(self, code_generator):
@@ -82,6 +82,17 @@ class IntToBytesMethod(ToBytesMethod):
             return IntToBytesMethod(value)
         return super().build(value)
 
+    def evaluate_literal(self, *args: Any) -> Any:
+        if len(args) == 1:
+            arg = args[0]
+            if isinstance(arg, int) and not isinstance(arg, bool):
+                if arg == 0:
+                    return b'\x00'
+                from boa3.internal.neo.vm.type.Integer import Integer
+                return Integer(arg).to_byte_array(signed=True)
+
+        return super().evaluate_literal(*args)
+
     def generate_internal_opcodes(self, code_generator):
         code_generator.duplicate_stack_top_item()
         code_generator.insert_opcode(Opcode.NZ)
@@ -105,6 +116,12 @@ class StrToBytesMethod(ToBytesMethod):
             self_type = Type.str
         super().__init__(self_type)
 
+    def evaluate_literal(self, *args: Any) -> Any:
+        if len(args) == 1 and isinstance(args[0], str):
+            return args[0].encode('utf-8')
+
+        return super().evaluate_literal(*args)
+
     def generate_internal_opcodes(self, code_generator):
         # string and bytes' stack item are the same
         pass
@@ -1,7 +1,7 @@
-import ast
 from typing import Any, Dict, Optional
 
 from boa3.internal import constants
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.method.builtinmethod import IBuiltinMethod
 from boa3.internal.model.expression import IExpression
 from boa3.internal.model.type.collection.sequence.uint256type import UInt256Type
@@ -20,8 +20,7 @@ class UInt256Method(IBuiltinMethod):
         identifier = 'UInt256'
         args: Dict[str, Variable] = {'object': Variable(argument_type)}
 
-        args_default = ast.parse("{0}".format(Type.int.default_value)
-                                 ).body[0].value
+        args_default = get_default_value_node("{0}".format(Type.int.default_value))
 
         super().__init__(identifier, args, [args_default], return_type=return_type)
 
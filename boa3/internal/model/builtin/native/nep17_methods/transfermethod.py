@@ -1,6 +1,6 @@
-import ast
 from typing import Dict
 
+from boa3.internal.model import get_default_value_node
 from boa3.internal.model.builtin.interop.nativecontract import Nep17Method
 from boa3.internal.model.variable import Variable
 
@@ -20,8 +20,7 @@ class TransferMethod(Nep17Method):
             'data': Variable(Type.any),
         }
 
-        data_default = ast.parse("{0}".format(Type.any.default_value)
-                                 ).body[0].value
+        data_default = get_default_value_node("{0}".format(Type.any.default_value))
 
         super().__init__(identifier, native_identifier, args, defaults=[data_default],
                          return_type=Type.bool, script_hash=contract_script_hash)
@@ -4,6 +4,8 @@ import ast
 from abc import ABC
 from typing import Dict, List, Optional, Set, Tuple
 
+from boa3.internal import helpers
+from boa3.internal.compiler.compilationcontext import CompilationContext
 from boa3.internal.model import set_internal_call
 from boa3.internal.model.expression import IExpression
 from boa3.internal.model.type.type import IType, Type
@@ -52,7 +54,7 @@ class Callable(IExpression, ABC):
             else:
                 default_code = "{0}".format(Type.tuple.default_value)
 
-            default_value = set_internal_call(ast.parse(default_code).body[0].value)
+            default_value = set_internal_call(helpers.parse(default_code).body[0].value)
 
             self.args[vararg_id] = Variable(Type.tuple.build_collection([vararg_var.type]))
             self.defaults.append(default_value)
@@ -176,12 +178,17 @@ class Callable(IExpression, ABC):
         return self.start_address is not None and self.end_address is not None
 
     def add_call_origin(self, origin: ast.AST) -> bool:
+        CompilationContext.current().record_change(self, 'add_call_origin', origin)
         try:
             self._self_calls.add(origin)
             return True
         except BaseException:
             return False
 
+    def remove_call_origin(self, origin: ast.AST):
+        CompilationContext.current().record_change(self, 'remove_call_origin', origin)
+        self._self_calls.discard(origin)
+
     def __str__(self) -> str:
         args_types: List[str] = [str(arg.type) for arg in self.args.values()]
         if self.return_type is not Type.none:
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Dict, List, Optional, Tuple, Union
 
 from boa3.internal import constants
+from boa3.internal.compiler.compilationcontext import CompilationContext
 from boa3.internal.model.builtin.builtin import Builtin, BoaPackage
 from boa3.internal.model.builtin.interop.interop import Interop
 from boa3.internal.model.builtin.native.nativecontract import NativeContract
@@ -28,13 +29,10 @@ def get_internal_symbol(symbol_id: str) -> Optional[ISymbol]:
 
 
 class CompilerBuiltin:
-    _instance = None
 
     @classmethod
     def instance(cls) -> CompilerBuiltin:
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        return CompilationContext.current().compiler_builtin
 
     def __init__(self):
         self.packages: List[Package] = []
@@ -54,9 +52,8 @@ class CompilerBuiltin:
 
     @classmethod
     def reset(cls):
-        if cls._instance is not None:
-            for event in cls._instance._events:
-                event.reset_calls()
+        for event in cls.instance()._events:
+            event.reset_calls()
 
     @classmethod
     def update_with_analyser(cls, analyser):
@@ -104,7 +101,7 @@ class CompilerBuiltin:
     def get_package(self, package_full_path: str) -> Optional[Package]:
         package_ids = package_full_path.split(constants.ATTRIBUTE_NAME_SEPARATOR)
 
-        cur_package: Package = next((root_package for root_package in self._instance.packages
+        cur_package: Package = next((root_package for root_package in self.packages
                                      if root_package.identifier == package_ids[0]),
                                     None)
         if cur_package is None:
@@ -120,7 +117,7 @@ class CompilerBuiltin:
 
     def get_internal_symbol(self, symbol_id: str) -> Optional[ISymbol]:
         packages_stack: List[Tuple[list, int]] = []
-        current_list = self._instance.packages
+        current_list = self.packages
         current_index = 0
 
         while len(current_list) > current_index or len(packages_stack) > 0:
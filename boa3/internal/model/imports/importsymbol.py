@@ -2,6 +2,7 @@ import ast
 from typing import Dict
 
 from boa3.internal.analyser.importanalyser import ImportAnalyser
+from boa3.internal.compiler.compilationcontext import CompilationContext
 from boa3.internal.model.builtin.builtincallable import IBuiltinCallable
 from boa3.internal.model.method import Method
 from boa3.internal.model.symbol import ISymbol
@@ -39,6 +40,7 @@ class Import(ISymbol):
             if not isinstance(method, IBuiltinCallable) and hasattr(method, 'defined_by_entry'):
                 # methods imported are treated as methods defined in the entry file
                 method.defined_by_entry = True
+                CompilationContext.current().record_change(method, '__setattr__', 'defined_by_entry', True)
 
         self.analyser = import_analyser.analyser
         self.origin: str = origin
@@ -127,5 +127,23 @@ class Package(IdentifiedSymbol):
             for pkg in self._packages:
                 pkg.update_with_analyser(analyser)
 
+    def __deepcopy__(self, memo):
+        if self.origin is None and not self._is_shared:
+            # the builtin packages are created for each compilation, so the ones of the current compilation are used
+            from boa3.internal import constants
+            from boa3.internal.model.imports.builtin import get_package
+
+            package_ids = []
+            package = self
+            while package is not None:
+                package_ids.insert(0, package.raw_identifier)
+                package = package.parent
+
+            builtin_package = get_package(constants.ATTRIBUTE_NAME_SEPARATOR.join(package_ids))
+            if builtin_package is not None:
+                return builtin_package
+
+        return super().__deepcopy__(memo)
+
     def __repr__(self) -> str:
         return self.identifier
@@ -1,12 +1,14 @@
 import ast
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from boa3.internal.model.callable import Callable
 from boa3.internal.model.debuginstruction import DebugInstruction
+from boa3.internal.model.scopechain import ScopeChain
 from boa3.internal.model.symbol import ISymbol
 from boa3.internal.model.type.classes.classtype import ClassType
 from boa3.internal.model.type.type import IType, Type
 from boa3.internal.model.variable import Variable
+from boa3.internal.neo.vm.VMCode import VMCode
 
 
 class Method(Callable):
@@ -64,17 +66,13 @@ class Method(Callable):
                 self.locals[var_id] = var
 
     @property
-    def symbols(self) -> Dict[str, Variable]:
+    def symbols(self) -> ScopeChain:
         """
         Gets all the symbols in the method
 
-        :return: a dictionary that maps each symbol in the module with its name
+        :return: a read-only mapping of each symbol in the method with its name
         """
-        symbols = self._symbols.copy()
-        symbols.update(self.imported_symbols)
-        symbols.update(self.args)
-        symbols.update(self.locals)
-        return symbols
+        return ScopeChain(self.locals, self.args, self.imported_symbols, self._symbols)
 
     def include_symbol(self, symbol_id: str, symbol: ISymbol, is_global: bool = False):
         """
@@ -120,6 +118,20 @@ class Method(Callable):
                 self._debug_map.remove(existing_instr_info)
             self._debug_map.append(instr_info)
 
+    def include_copied_instructions(self, instructions: Iterable[DebugInstruction]):
+        """
+        Includes the debug info of instructions copied from another method, like when it's inlined. Unlike
+        `include_instruction`, it keeps instructions in the same position of the code, since they are in different
+        copies of the code. The instructions mapped to a code that is mapped already are not included.
+
+        :param instructions: debug information from the copied instructions
+        """
+        mapped_codes = {info.code for info in self._debug_map}
+        for instr_info in instructions:
+            if instr_info.code not in mapped_codes:
+                self._debug_map.append(instr_info)
+                mapped_codes.add(instr_info.code)
+
     def remove_instruction(self, start_line: int, start_col: int):
         """
         Removes a instruction from the debug info at the given position if it exists
@@ -133,6 +145,35 @@ class Method(Callable):
         if instruction is not None:
             self._debug_map.remove(instruction)
 
+    def replace_instruction_codes(self, replaced_codes: Dict[VMCode, VMCode]):
+        """
+        Updates the debug info after instructions were replaced in the bytecode. The instructions mapped to a replaced
+        code are mapped to its replacement instead, unless there is another instruction mapped to it already.
+
+        :param replaced_codes: a dictionary that maps each replaced code to the code that replaced it
+        """
+        mapped_codes = {info.code for info in self._debug_map}
+        debug_map = []
+        for info in self._debug_map:
+            if info.code in replaced_codes:
+                replacement = replaced_codes[info.code]
+                if replacement in mapped_codes:
+                    continue
+                info.code = replacement
+                mapped_codes.add(replacement)
+            debug_map.append(info)
+
+        self._debug_map = debug_map
+
+    def remove_instruction_codes(self, removed_codes: Iterable[VMCode]):
+        """
+        Removes the debug info of instructions that were removed from the bytecode
+
+        :param removed_codes: the codes that were removed
+        """
+        removed_codes = set(removed_codes)
+        self._debug_map = [info for info in self._debug_map if info.code not in removed_codes]
+
     def args_to_be_generated(self) -> List[int]:
         """
         Gets the indexes of the arguments that must be generated.
@@ -2,6 +2,7 @@ from typing import Dict
 
 from boa3.internal.model.callable import Callable
 from boa3.internal.model.method import Method
+from boa3.internal.model.scopechain import ScopeChain
 from boa3.internal.model.symbol import ISymbol
 from boa3.internal.model.type.classes.classtype import ClassType
 from boa3.internal.model.variable import Variable
@@ -110,16 +111,10 @@ class Module(ISymbol):
                 self.imported_symbols[symbol_id] = symbol
 
     @property
-    def symbols(self) -> Dict[str, ISymbol]:
+    def symbols(self) -> ScopeChain:
         """
         Gets all the symbols in the module
 
-        :return: a dictionary that maps each symbol in the module with its name
+        :return: a read-only mapping of each symbol in the module with its name
         """
-        symbols = {}
-        symbols.update(self.imported_symbols)
-        symbols.update(self.variables)
-        symbols.update(self.methods)
-        symbols.update(self.callables)
-        symbols.update(self.classes)
-        return symbols
+        return ScopeChain(self.classes, self.callables, self.methods, self.variables, self.imported_symbols)
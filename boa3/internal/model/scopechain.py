@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from collections.abc import ItemsView, Iterator, KeysView, Mapping, ValuesView
+from typing import Any, Dict, Optional
+
+from boa3.internal.model.symbol import ISymbol
+
+
+class ScopeChain(Mapping):
+    """
+    A read-only view of a sequence of symbol scopes, similar to a ChainMap.
+
+    The scopes are searched in the given order, so a symbol in a scope shadows the symbols with the same id in the
+    following scopes. Looking up a symbol doesn't create a merged dictionary of the scopes. It's only created when
+    the view is iterated or copied, and it has the same order of a dictionary updated with the scopes from the last
+    to the first.
+    """
+
+    def __init__(self, *scopes: Optional[Mapping[str, ISymbol]]):
+        self._scopes = tuple(scope for scope in scopes if scope is not None)
+
+    def __getitem__(self, symbol_id: str) -> ISymbol:
+        for scope in self._scopes:
+            if symbol_id in scope:
+                return scope[symbol_id]
+        raise KeyError(symbol_id)
+
+    def __contains__(self, symbol_id: Any) -> bool:
+        for scope in self._scopes:
+            if symbol_id in scope:
+                return True
+        return False
+
+    def get(self, symbol_id: str, default: Any = None) -> Any:
+        for scope in self._scopes:
+            if symbol_id in scope:
+                return scope[symbol_id]
+        return default
+
+    def copy(self) -> Dict[str, ISymbol]:
+        """
+        Gets a dictionary with all the symbols in the scopes
+
+        :return: a new dictionary, changing it doesn't change the scopes
+        """
+        symbols = {}
+        for scope in reversed(self._scopes):
+            symbols.update(scope)
+        return symbols
+
+    # iterating uses a snapshot of the scopes, so they can be changed during the iteration
+    def keys(self) -> KeysView:
+        return self.copy().keys()
+
+    def values(self) -> ValuesView:
+        return self.copy().values()
+
+    def items(self) -> ItemsView:
+        return self.copy().items()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.copy())
+
+    def __len__(self) -> int:
+        return len(self.copy())
+
+    def __repr__(self) -> str:
+        return self.copy().__repr__()
@@ -1,9 +1,30 @@
+import copy
 from abc import ABC, abstractmethod
 
+from boa3.internal.compiler.compilationcontext import CompilationContext
+
 
 class ISymbol(ABC):
     defined_by_entry: bool = False
 
+    def __new__(cls, *args, **kwargs):
+        symbol = super().__new__(cls)
+        # the symbols created out of a compilation, like the builtins, are shared by all the compilations
+        symbol._is_shared = not CompilationContext.is_any_active()
+        return symbol
+
+    def __deepcopy__(self, memo):
+        if self._is_shared:
+            return self
+
+        copied = object.__new__(type(self))
+        memo[id(self)] = copied
+        for name, value in self.__dict__.items():
+            # the values of the context attributes are kept only in the compilation that set them
+            if name != '_context_values':
+                copied.__dict__[name] = copy.deepcopy(value, memo)
+        return copied
+
     @property
     @abstractmethod
     def shadowing_name(self) -> str:
@@ -65,7 +65,7 @@ class UnionType(IType):
                     types = types.union(x._union_types)
             if len(types) == 1:
                 return list(types)[0]
-            return cls(types)
+            return cls._intern(cls(types))
 
     def except_type(self, other_type: IType) -> IType:
         """
@@ -89,7 +89,7 @@ class UnionType(IType):
             from boa3.internal.model.type.type import Type
             return Type.none if len(new_union) == 0 else new_union[0]
         else:
-            return UnionType(set(new_union))
+            return self._intern(UnionType(set(new_union)))
 
     def intersect_type(self, other_type: IType) -> IType:
         if self.is_type_of(other_type):
@@ -158,4 +158,4 @@ class ICollectionType(PythonClass, ABC):
                 argument = {arg}
             params.append(argument)
 
-        return cls(*params)
+        return cls._intern(cls(*params))
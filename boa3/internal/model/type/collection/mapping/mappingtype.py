@@ -68,7 +68,7 @@ class MappingType(ICollectionType, ABC):
             v_types = set(value.value_type for value in values_type)
 
             if all(isinstance(x, mapping_type) for x in values_type):
-                values_type = {mapping_type(keys_type=k_types, values_type=v_types)}
+                values_type = {mapping_type._intern(mapping_type(keys_type=k_types, values_type=v_types))}
             else:
                 from boa3.internal.model.type.type import Type
                 generic_type: IType = Type.get_generic_type(*values_type)
@@ -93,7 +93,7 @@ class MappingType(ICollectionType, ABC):
 
             keys_types: Set[IType] = cls.get_types(keys)
             values_types: Set[IType] = cls.get_types(values)
-            return cls(keys_types, values_types)
+            return cls._intern(cls(keys_types, values_types))
 
         elif isinstance(value, Sized) and len(value) == 2:
             # value is a tuple with two lists of types for contructing the map
@@ -110,6 +110,6 @@ class MappingType(ICollectionType, ABC):
                 values_types = set(values_type)
 
             if all(isinstance(k, IType) for k in keys_type) and all(isinstance(v, IType) for v in values_types):
-                return cls(keys_type, values_type)
+                return cls._intern(cls(keys_type, values_type))
 
         return super(MappingType, cls).build(value)
@@ -38,5 +38,10 @@ class DictType(MutableMappingType):
         for instance_method in instance_methods:
             self._instance_methods[instance_method.raw_identifier] = instance_method.build(self)
 
+    def __eq__(self, other) -> bool:
+        if type(self) != type(other):
+            return False
+        return self.key_type == other.key_type and self.value_type == other.value_type
+
     def __hash__(self):
         return hash(self.identifier)
@@ -44,7 +44,7 @@ class ListType(MutableSequenceType):
     @classmethod
     def build(cls, value: Any) -> IType:
         values_types: Set[IType] = cls.get_types(value)
-        return cls(values_types)
+        return cls._intern(cls(values_types))
 
     @classmethod
     def _is_type_of(cls, value: Any):
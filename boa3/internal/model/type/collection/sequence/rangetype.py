@@ -34,7 +34,7 @@ class RangeType(SequenceType):
     def build(cls, value: Any) -> IType:
         if cls._is_type_of(value):
             from boa3.internal.model.type.type import Type
-            return cls(Type.int)
+            return cls._intern(cls(Type.int))
 
     @classmethod
     def _is_type_of(cls, value: Any):
@@ -26,7 +26,7 @@ class ReversedType(SequenceType):
     def build(cls, value: Any) -> IType:
         if cls._is_type_of(value):
             from boa3.internal.model.type.type import Type
-            return cls(Type.reversed)
+            return cls._intern(cls(Type.reversed))
 
     def is_valid_key(self, key_type: IType) -> bool:
         return key_type == self.valid_key
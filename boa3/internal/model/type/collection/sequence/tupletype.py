@@ -30,7 +30,7 @@ class TupleType(SequenceType):
     def build(cls, value: Any) -> IType:
         if cls._is_type_of(value):
             values_types: Set[IType] = cls.get_types(value)
-            return cls(values_types)
+            return cls._intern(cls(values_types))
 
     @classmethod
     def _is_type_of(cls, value: Any):
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+from boa3.internal.compiler.compilationcontext import CompilationContext
 from boa3.internal.model.identifiedsymbol import IdentifiedSymbol
 from boa3.internal.model.symbol import ISymbol
 from boa3.internal.neo.vm.type.AbiType import AbiType
@@ -95,6 +96,28 @@ class IType(IdentifiedSymbol):
         """
         pass
 
+    @classmethod
+    def _intern(cls, new_type: Optional[IType]) -> Optional[IType]:
+        """
+        Gets the instance of the given type that is shared in the current compilation.
+
+        The types built from the same values are equal, but they were different objects. Using the first instance of
+        each one makes equal types the same object, so they can be compared by identity and the values computed for
+        them, like their class symbols, are computed once.
+
+        :param new_type: the type that was built
+        :return: the first instance built of a type equal to `new_type` in the current compilation
+        """
+        if new_type is None:
+            return None
+
+        try:
+            # the class is in the key because subclasses may be equal to their base classes, like Optional and Union
+            return CompilationContext.current().interned_types.setdefault((type(new_type), new_type), new_type)
+        except AttributeError:
+            # the types built from invalid values may be incomplete, they are reported by the analysers later
+            return new_type
+
     def generate_is_instance_type_check(self, code_generator):
         """
         Generates the opcodes to check if a value is of this type
@@ -122,7 +145,8 @@ class IType(IdentifiedSymbol):
         :rtype: IType
         """
         from boa3.internal.model.type.annotation.uniontype import UnionType
-        return UnionType.build((self, other_type))
+        return CompilationContext.current().type_relations.get_result('union_type', (self, other_type),
+                                                                      lambda *types: UnionType.build(types))
 
     def except_type(self, other_type: IType) -> IType:
         """
@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from boa3.internal.model.type.annotation.optionaltype import OptionalType
 from boa3.internal.model.type.annotation.uniontype import UnionType
@@ -47,7 +47,9 @@ class Type:
 
     @classmethod
     def all_types(cls) -> Dict[str, IType]:
-        return {tpe._identifier: tpe for tpe in vars(cls).values() if isinstance(tpe, IType)}
+        if cls._all_types is None:
+            cls._all_types = {tpe._identifier: tpe for tpe in vars(cls).values() if isinstance(tpe, IType)}
+        return cls._all_types.copy()
 
     @classmethod
     def get_type(cls, value: Any) -> IType:
@@ -57,16 +59,28 @@ class Type:
         :param value: value to get the type
         :return: Returns the type of the value. `Type.none` by default.
         """
-        val: IType = None
-        for type in vars(cls).values():
-            if isinstance(type, IType) and type.is_type_of(value):
-                val = type.build(value)
-                break
+        if isinstance(value, IType):
+            # the type of a type may depend on its attributes, like the values type of collections
+            value_type = cls._find_type_of(value)
+        else:
+            value_type = cls._types_by_value_type.get(type(value))
+            if value_type is None:
+                value_type = cls._find_type_of(value)
+                cls._types_by_value_type[type(value)] = value_type
+
+        val: IType = value_type.build(value) if value_type is not None else None
 
         if val is not None:
             return val
         return cls.none
 
+    @classmethod
+    def _find_type_of(cls, value: Any) -> Optional[IType]:
+        if cls._indexed_types is None:
+            cls._indexed_types = tuple(tpe for tpe in vars(cls).values() if isinstance(tpe, IType))
+
+        return next((tpe for tpe in cls._indexed_types if tpe.is_type_of(value)), None)
+
     @classmethod
     def get_generic_type(cls, *types: IType) -> IType:
         """
@@ -75,6 +89,11 @@ class Type:
         :param types: list of type to be compared
         :return: Returns the common generic type of the values if exist. `Type.any` otherwise.
         """
+        from boa3.internal.compiler.compilationcontext import CompilationContext
+        return CompilationContext.current().type_relations.get_result('generic_type', types, cls._get_generic_type)
+
+    @classmethod
+    def _get_generic_type(cls, *types: IType) -> IType:
         generic = cls.any
         if len(types) > 0:
             generic_types = [cls.mutableSequence, cls.mapping, cls.sequence]
@@ -123,3 +142,9 @@ class Type:
     union = UnionType()
     optional = OptionalType()
     any = anyType
+
+    _all_types: Dict[str, IType] = None
+
+    # the types in the order they are verified by `get_type`, and the type found for each Python value type
+    _indexed_types: Tuple[IType, ...] = None
+    _types_by_value_type: Dict[type, IType] = {}
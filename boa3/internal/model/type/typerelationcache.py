@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+__all__ = [
+    'TypeRelationCache',
+]
+
+
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from boa3.internal.model.type.itype import IType
+
+
+class TypeRelationCache:
+    """
+    Keeps the results of the relations between types that the type checking evaluates many times, like if a type is
+    the type of another and the generic type of a list of types.
+
+    The results are found by the identity of the types. Since equal types are built as the same object in a
+    compilation, the relations of types that are equal are computed once. The types are kept in the cache with their
+    results, so their ids aren't reused by other objects while they are cached. When the cache is full, the oldest
+    results are removed.
+    """
+
+    DEFAULT_MAX_SIZE = 4096
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self._max_size = max_size
+        self._results: Dict[Hashable, Tuple[Tuple[Any, ...], Any]] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def is_type_of(self, expected_type: IType, value: Any) -> bool:
+        """
+        Validates if `expected_type` is the type of the given value. The result is cached only if the value is a type.
+
+        :param expected_type: the type that is expected
+        :param value: value to check the type
+        """
+        if not isinstance(value, IType):
+            return expected_type.is_type_of(value)
+        return self.get_result('is_type_of', (expected_type, value), lambda tpe, other: tpe.is_type_of(other))
+
+    def get_result(self, relation: str, types: Tuple[IType, ...], compute: Callable[..., Any]) -> Any:
+        """
+        Gets the result of a relation between types, computing it if it isn't in the cache
+
+        :param relation: the name of the relation
+        :param types: the types that are related, in the order they are passed to `compute`
+        :param compute: the function that computes the relation if the result isn't cached
+        :return: the result of the relation
+        """
+        key = (relation, *(id(tpe) for tpe in types))
+        cached = self._results.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        result = compute(*types)
+        if len(self._results) >= self._max_size:
+            del self._results[next(iter(self._results))]
+        self._results[key] = (types, result)
+        return result
+
+    def clear(self):
+        self._results.clear()
+        self.hits = 0
+        self.misses = 0
@@ -3,6 +3,7 @@ from __future__ import annotations
 import ast
 from typing import Any, Optional, Union
 
+from boa3.internal.compiler.compilationcontext import CompilationContext
 from boa3.internal.model.expression import IExpression
 from boa3.internal.model.type.itype import IType
 
@@ -67,11 +68,18 @@ class Variable(IExpression):
         self._var_type = var_type
 
     def set_is_reassigned(self):
+        CompilationContext.current().record_change(self, 'set_is_reassigned')
         if not self.is_reassigned:
             self.is_reassigned = True
         if hasattr(self._origin_variable, 'set_is_reassigned'):
             self._origin_variable.set_is_reassigned()
 
     def set_initial_assign(self, first_value: Any):
+        CompilationContext.current().record_change(self, 'set_initial_assign', first_value)
         if not self.has_literal_value:
             self._first_assign_value = first_value
+
+    def reset_initial_assign(self):
+        from boa3.internal.analyser.model.optimizer import Undefined
+        CompilationContext.current().record_change(self, 'reset_initial_assign')
+        self._first_assign_value = Undefined
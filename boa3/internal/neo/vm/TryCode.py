@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Callable, Optional, Tuple
 
 from boa3.internal.neo.vm.VMCode import VMCode
 from boa3.internal.neo.vm.type.Integer import Integer
@@ -26,6 +26,14 @@ class TryCode(VMCode):
     def target(self) -> VMCode:
         return self._except_start_code if self._finally_start_code is None else self._finally_start_code
 
+    @property
+    def except_start_code(self) -> Optional[VMCode]:
+        return self._except_start_code
+
+    @property
+    def finally_start_code(self) -> Optional[VMCode]:
+        return self._finally_start_code
+
     def set_except_code(self, except_code: VMCode):
         if self._except_start_code is None and except_code is not None:
             self._except_start_code = except_code
@@ -41,16 +49,38 @@ class TryCode(VMCode):
 
         :return: the formatted data in bytes of the code.
         """
-        catch_data: bytes = self._get_raw_data(self._except_start_code)
-        finally_data: bytes = self._get_raw_data(self._finally_start_code)
+        return self._get_encoded_data()[1]
+
+    def _encoding_key(self) -> tuple:
+        return self._info, self._except_start_code, self._finally_start_code
+
+    def _has_fixed_size(self) -> bool:
+        # both catch and finally data are always formatted to the opcode data length
+        return True
+
+    def _encode_data(self) -> Tuple[bytes, bytes]:
+        from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
+        get_start_address = VMCodeMapping.instance().get_start_address
+        catch_data: bytes = self._get_raw_data(self._except_start_code, get_start_address)
+        finally_data: bytes = self._get_raw_data(self._finally_start_code, get_start_address)
 
         min_data_len = self._info.data_len // 2
         max_data_len = self._info.max_data_len // 2
+        data = (self._format_target_data(catch_data, min_data_len, max_data_len)
+                + self._format_target_data(finally_data, min_data_len, max_data_len))
 
-        return (self._format_data(catch_data, min_data_len, max_data_len)
-                + self._format_data(finally_data, min_data_len, max_data_len))
+        return self._join_raw_data(catch_data, finally_data), data
 
-    def _format_data(self, data: bytes, min_data_len: int, max_data_len: int = -1) -> bytes:
+    def encode_raw_data(self, get_start_address: Callable[[VMCode], int]) -> bytes:
+        catch_data: bytes = self._get_raw_data(self._except_start_code, get_start_address)
+        finally_data: bytes = self._get_raw_data(self._finally_start_code, get_start_address)
+        return self._join_raw_data(catch_data, finally_data)
+
+    def _join_raw_data(self, catch_data: bytes, finally_data: bytes) -> bytes:
+        size = max(len(catch_data), len(finally_data))
+        return self._format_target_data(catch_data, size) + self._format_target_data(finally_data, size)
+
+    def _format_target_data(self, data: bytes, min_data_len: int, max_data_len: int = -1) -> bytes:
         if max_data_len < min_data_len:
             max_data_len = min_data_len
         mutable_data = bytearray(data)
@@ -61,7 +91,7 @@ class TryCode(VMCode):
             mutable_data = mutable_data[:max_data_len]
         return bytes(mutable_data)
 
-    def _get_raw_data(self, opcode: VMCode) -> bytes:
+    def _get_raw_data(self, opcode: VMCode, get_start_address: Callable[[VMCode], int]) -> bytes:
         """
         Gets the Neo VM raw data of the code
 
@@ -71,19 +101,12 @@ class TryCode(VMCode):
         if opcode is None:
             return bytes(min_len)
         else:
-            from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
-            code_mapping = VMCodeMapping.instance()
-            self_start = code_mapping.get_start_address(self)
-            target_start = code_mapping.get_start_address(opcode)
+            self_start = get_start_address(self)
+            target_start = get_start_address(opcode)
 
             return (Integer(target_start - self_start)
                     .to_byte_array(signed=True, min_length=min_len))
 
     @property
     def raw_data(self) -> bytes:
-        catch_data: bytes = self._get_raw_data(self._except_start_code)
-        finally_data: bytes = self._get_raw_data(self._finally_start_code)
-
-        size = max(len(catch_data), len(finally_data))
-
-        return self._format_data(catch_data, size) + self._format_data(finally_data, size)
+        return self._get_encoded_data()[0]
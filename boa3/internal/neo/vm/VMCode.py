@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Callable, Optional, Tuple
 
 from boa3.internal.neo.vm.opcode import OpcodeHelper
 from boa3.internal.neo.vm.opcode.Opcode import Opcode
@@ -27,6 +27,10 @@ class VMCode:
         self._target: Optional[VMCode] = None
         self._data: bytes = data
 
+        # the encoded data of codes with target depends on the addresses, so it's cached until the layout changes
+        self._encoding_cache: Optional[Tuple[int, tuple, bytes, bytes]] = None
+        self._size_cache: Optional[Tuple[tuple, int]] = None
+
     @property
     def info(self) -> OpcodeInformation:
         """
@@ -43,7 +47,12 @@ class VMCode:
 
         :return: the formatted data in bytes of the code.
         """
-        data: bytearray = bytearray(self.raw_data)
+        if self.target is None:
+            return self._format_data(self._data)
+        return self._get_encoded_data()[1]
+
+    def _format_data(self, raw_data: bytes) -> bytes:
+        data: bytearray = bytearray(raw_data)
         info = self.info
 
         if len(data) < info.data_len:
@@ -61,21 +70,92 @@ class VMCode:
         """
         if self.target is None:
             return self._data
-        else:
-            from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
-            code_mapping = VMCodeMapping.instance()
-            self_start = code_mapping.get_start_address(self)
-            target_start = code_mapping.get_start_address(self.target)
+        return self._get_encoded_data()[0]
+
+    def _get_encoded_data(self) -> Tuple[bytes, bytes]:
+        """
+        Gets the raw and the formatted data of the code, computing them only if the instructions layout or the code
+        information have changed since the last time they were computed
+
+        :return: a tuple with the unformatted and the formatted data
+        """
+        from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
+        layout_version = VMCodeMapping.instance().layout_version
+        encoding_key = self._encoding_key()
+
+        cache = self._encoding_cache
+        if cache is None or cache[0] != layout_version or cache[1] != encoding_key:
+            cache = (layout_version, encoding_key) + self._encode_data()
+            self._encoding_cache = cache
 
-            if self_start == target_start:
-                return self._data
+        return cache[2], cache[3]
 
-            return (Integer(target_start - self_start)
-                    .to_byte_array(signed=True, min_length=self._info.data_len))
+    def clear_encoding_cache(self):
+        """
+        Discards the cached encoded data, so it's computed again when it's used. It's needed when the code is copied,
+        since the encoded data of the copy is relative to its own address
+        """
+        self._encoding_cache = None
+
+    def _encoding_key(self) -> tuple:
+        """
+        Gets the values that the encoded data depends on, besides the instructions addresses
+        """
+        return self._info, self.target, self._data
+
+    def _encode_data(self) -> Tuple[bytes, bytes]:
+        """
+        Computes the raw and the formatted data of a code with target, relative to the target address
+        """
+        from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
+        raw_data = self.encode_raw_data(VMCodeMapping.instance().get_start_address)
+        return raw_data, self._format_data(raw_data)
+
+    def encode_raw_data(self, get_start_address: Callable[[VMCode], int]) -> bytes:
+        """
+        Computes the raw data of the code using the given instructions addresses, instead of the current ones
+
+        :param get_start_address: a function that returns the start address of an instruction
+        :return: the unformatted data in bytes of the code.
+        """
+        if self.target is None:
+            return self._data
+
+        self_start = get_start_address(self)
+        target_start = get_start_address(self.target)
+
+        if self_start == target_start:
+            return self._data
+
+        return (Integer(target_start - self_start)
+                .to_byte_array(signed=True, min_length=self._info.data_len))
 
     @property
     def size(self) -> int:
-        return len(self._info.opcode) + len(self.data)
+        size_key = (self._info, self._data)
+        cache = self._size_cache
+        if cache is not None and cache[0] == size_key:
+            return cache[1]
+
+        if self._has_fixed_size():
+            # the data of codes with target is formatted to the opcode data length, so it's not needed to encode it
+            data_len = self._info.data_len if self.target is not None else len(self.data)
+            size = len(self._info.opcode) + data_len
+            self._size_cache = (size_key, size)
+        else:
+            size = len(self._info.opcode) + len(self.data)
+        return size
+
+    def _has_fixed_size(self) -> bool:
+        """
+        Verifies if the size of the code doesn't depend on the instructions layout. The data of opcodes with target
+        has a fixed length, unless it's using a data shorter than the opcode data length
+        """
+        if not OpcodeHelper.has_target(self._info.opcode):
+            return True
+
+        info = self._info
+        return info.data_len == info.max_data_len and (len(self._data) == 0 or len(self._data) >= info.data_len)
 
     @property
     def opcode(self) -> Opcode:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, Optional, Tuple, Union
+from typing import Dict, FrozenSet, Optional, Tuple, Union
 
 from boa3.internal.constants import FOUR_BYTES_MAX_VALUE
 from boa3.internal.neo.vm.opcode.Opcode import Opcode
@@ -56,8 +56,7 @@ def get_literal_push(integer: int) -> Optional[Opcode]:
     :rtype: Opcode or None
     """
     if -1 <= integer <= 16:
-        opcode_value: int = Integer.from_bytes(Opcode.PUSH0) + integer
-        return Opcode(Integer(opcode_value).to_byte_array())
+        return _literal_push_opcodes[integer + 1]
     else:
         return None
 
@@ -108,7 +107,7 @@ def get_larger_opcode(opcode: Opcode):
     """
     if opcode in _larger_opcode:
         return _larger_opcode[opcode]
-    elif opcode in _larger_opcode.values():
+    elif opcode in _largest_opcodes:
         return opcode
     else:
         return None
@@ -128,10 +127,33 @@ _larger_opcode: Dict[Opcode, Opcode] = {
     Opcode.TRY: Opcode.TRY_L,
     Opcode.ENDTRY: Opcode.ENDTRY_L
 }
+_largest_opcodes: FrozenSet[Opcode] = frozenset(_larger_opcode.values())
 
 
 def is_jump(opcode: Opcode) -> bool:
-    return Opcode.JMP <= opcode <= Opcode.JMPLE_L
+    return opcode in _jump_opcodes
+
+
+def is_unconditional_jump(opcode: Opcode) -> bool:
+    """
+    Verifies if the opcode always jumps to its target, so the execution never continues in the next instruction
+    """
+    return opcode in _unconditional_jump_opcodes
+
+
+def ends_execution(opcode: Opcode) -> bool:
+    """
+    Verifies if the execution doesn't continue in the same method after the opcode, without jumping to a target
+    """
+    return opcode in _terminator_opcodes
+
+
+def ends_basic_block(opcode: Opcode) -> bool:
+    """
+    Verifies if the opcode is always the last instruction of a basic block, because the next instruction isn't always
+    executed after it
+    """
+    return opcode in _basic_block_end_opcodes
 
 
 def get_try_and_data(except_target: int, finally_target: int = 0, jump_through: bool = False) -> Tuple[Opcode, bytes]:
@@ -191,7 +213,7 @@ def get_jump_and_data(opcode: Opcode, integer: int, jump_through: bool = False)
 
 
 def has_target(opcode: Opcode) -> bool:
-    return Opcode.JMP <= opcode <= Opcode.CALL_L or Opcode.TRY <= opcode < Opcode.ENDFINALLY
+    return opcode in _opcodes_with_target
 
 
 def get_drop(position: int) -> Optional[Opcode]:
@@ -274,12 +296,11 @@ def get_store(index: int, local: bool, is_arg: bool = False) -> Opcode:
 
     if 0 <= index <= 6:
         if is_arg:
-            opcode_value: int = Integer.from_bytes(Opcode.STARG0) + index
+            return _store_arg_opcodes[index]
         elif local:
-            opcode_value: int = Integer.from_bytes(Opcode.STLOC0) + index
+            return _store_local_opcodes[index]
         else:
-            opcode_value: int = Integer.from_bytes(Opcode.STSFLD0) + index
-        return Opcode(Integer(opcode_value).to_byte_array())
+            return _store_static_opcodes[index]
     else:
         if is_arg:
             return Opcode.STARG
@@ -304,12 +325,11 @@ def get_load(index: int, local: bool, is_arg: bool = False) -> Opcode:
 
     if 0 <= index <= 6:
         if is_arg:
-            opcode_value: int = Integer.from_bytes(Opcode.LDARG0) + index
+            return _load_arg_opcodes[index]
         elif local:
-            opcode_value: int = Integer.from_bytes(Opcode.LDLOC0) + index
+            return _load_local_opcodes[index]
         else:
-            opcode_value: int = Integer.from_bytes(Opcode.LDSFLD0) + index
-        return Opcode(Integer(opcode_value).to_byte_array())
+            return _load_static_opcodes[index]
     else:
         if is_arg:
             return Opcode.LDARG
@@ -320,9 +340,7 @@ def get_load(index: int, local: bool, is_arg: bool = False) -> Opcode:
 
 
 def is_load_slot(opcode: Opcode) -> bool:
-    return (Opcode.LDSFLD0 <= opcode <= Opcode.LDSFLD
-            or Opcode.LDLOC0 <= opcode <= Opcode.LDLOC
-            or Opcode.LDARG0 <= opcode <= Opcode.LDARG)
+    return opcode in _store_from_load
 
 
 def get_store_from_load(load_opcode) -> Optional[Opcode]:
@@ -334,6 +352,46 @@ def get_store_from_load(load_opcode) -> Optional[Opcode]:
     :return: equivalent store opcode if the given opcode is a load slot. Otherwise, returns None
     :rtype: Opcode or None
     """
-    if is_load_slot(load_opcode):
-        opcode_value: int = Integer.from_bytes(load_opcode) + 8
-        return Opcode(Integer(opcode_value).to_byte_array())
+    return _store_from_load.get(load_opcode)
+
+
+# region Opcode tables
+# the opcodes properties are computed only once, so the helper functions don't need to compare or convert the opcodes
+
+def _opcode_sequence(first_opcode: Opcode, last_opcode: Opcode) -> Tuple[Opcode, ...]:
+    first_value = Integer.from_bytes(first_opcode)
+    last_value = Integer.from_bytes(last_opcode)
+    return tuple(Opcode(bytes([value])) for value in range(first_value, last_value + 1))
+
+
+def _opcode_range(first_opcode: Opcode, last_opcode: Opcode) -> FrozenSet[Opcode]:
+    return frozenset(opcode for opcode in Opcode if first_opcode <= opcode <= last_opcode)
+
+
+_literal_push_opcodes: Tuple[Opcode, ...] = _opcode_sequence(Opcode.PUSHM1, Opcode.PUSH16)
+
+_load_arg_opcodes: Tuple[Opcode, ...] = _opcode_sequence(Opcode.LDARG0, Opcode.LDARG6)
+_load_local_opcodes: Tuple[Opcode, ...] = _opcode_sequence(Opcode.LDLOC0, Opcode.LDLOC6)
+_load_static_opcodes: Tuple[Opcode, ...] = _opcode_sequence(Opcode.LDSFLD0, Opcode.LDSFLD6)
+_store_arg_opcodes: Tuple[Opcode, ...] = _opcode_sequence(Opcode.STARG0, Opcode.STARG6)
+_store_local_opcodes: Tuple[Opcode, ...] = _opcode_sequence(Opcode.STLOC0, Opcode.STLOC6)
+_store_static_opcodes: Tuple[Opcode, ...] = _opcode_sequence(Opcode.STSFLD0, Opcode.STSFLD6)
+
+_store_from_load: Dict[Opcode, Opcode] = {
+    load_opcode: Opcode(bytes([Integer.from_bytes(load_opcode) + 8]))
+    for load_opcode in (_opcode_range(Opcode.LDSFLD0, Opcode.LDSFLD)
+                        | _opcode_range(Opcode.LDLOC0, Opcode.LDLOC)
+                        | _opcode_range(Opcode.LDARG0, Opcode.LDARG))
+}
+
+_jump_opcodes: FrozenSet[Opcode] = _opcode_range(Opcode.JMP, Opcode.JMPLE_L)
+_unconditional_jump_opcodes: FrozenSet[Opcode] = frozenset((Opcode.JMP, Opcode.JMP_L, Opcode.ENDTRY, Opcode.ENDTRY_L))
+_terminator_opcodes: FrozenSet[Opcode] = frozenset((Opcode.RET, Opcode.THROW, Opcode.ABORT, Opcode.ABORTMSG,
+                                                    Opcode.ENDFINALLY))
+_basic_block_end_opcodes: FrozenSet[Opcode] = (_jump_opcodes | _unconditional_jump_opcodes | _terminator_opcodes
+                                                | {Opcode.TRY, Opcode.TRY_L})
+_opcodes_with_target: FrozenSet[Opcode] = frozenset(opcode for opcode in Opcode
+                                                    if Opcode.JMP <= opcode <= Opcode.CALL_L
+                                                    or Opcode.TRY <= opcode < Opcode.ENDFINALLY)
+
+# endregion
@@ -1,4 +1,5 @@
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 from boa3.internal import constants
 from boa3.internal.neo.vm.opcode.Opcode import Opcode
@@ -15,9 +16,16 @@ class OpcodeInfo:
         :return: The opcode info if it exists. None otherwise
         :rtype: OpcodeInformation or None
         """
-        for id, op in vars(cls).items():
-            if isinstance(op, OpcodeInformation) and op.opcode is opcode:
-                return op
+        if cls._opcodes_info is None:
+            opcodes_info = {}
+            for id, op in vars(cls).items():
+                if isinstance(op, OpcodeInformation) and op.opcode not in opcodes_info:
+                    opcodes_info[op.opcode] = op
+            cls._opcodes_info = MappingProxyType(opcodes_info)
+
+        return cls._opcodes_info.get(opcode)
+
+    _opcodes_info: Optional[Mapping[Opcode, OpcodeInformation]] = None
 
     # region Constants
 
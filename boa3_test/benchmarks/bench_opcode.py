@@ -0,0 +1,43 @@
+"""
+Measures the time of the opcode lookups that are used during the code generation.
+
+Run it from the project root with ``python -m boa3_test.benchmarks.bench_opcode``.
+"""
+import argparse
+import timeit
+
+from boa3.internal.neo.vm.opcode import OpcodeHelper
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=100000, help='number of calls in each measure')
+    parser.add_argument('--repeat', type=int, default=5, help='number of times each measure is repeated')
+    args = parser.parse_args()
+
+    opcodes = list(Opcode)
+    last_opcode = Opcode.ASSERTMSG  # the last info declared in OpcodeInfo
+
+    measures = {
+        'OpcodeInfo.get_info': lambda: OpcodeInfo.get_info(last_opcode),
+        'OpcodeHelper.has_target': lambda: OpcodeHelper.has_target(Opcode.LDLOC0),
+        'OpcodeHelper.is_jump': lambda: OpcodeHelper.is_jump(Opcode.LDLOC0),
+        'OpcodeHelper.get_literal_push': lambda: OpcodeHelper.get_literal_push(10),
+        'OpcodeHelper.get_push_and_data': lambda: OpcodeHelper.get_push_and_data(10),
+        'OpcodeHelper.get_load': lambda: OpcodeHelper.get_load(3, local=True),
+        'OpcodeHelper.get_store': lambda: OpcodeHelper.get_store(3, local=False),
+        'OpcodeHelper.get_store_from_load': lambda: OpcodeHelper.get_store_from_load(Opcode.LDARG2),
+        'OpcodeHelper.get_jump_and_data': lambda: OpcodeHelper.get_jump_and_data(Opcode.JMPIF, 10),
+        'all opcodes info': lambda: [OpcodeInfo.get_info(opcode) for opcode in opcodes],
+    }
+
+    for name, function in measures.items():
+        number = args.number if name != 'all opcodes info' else max(args.number // len(opcodes), 1)
+        time = min(timeit.repeat(function, number=number, repeat=args.repeat))
+        print(f'{name:35} {time / number * 1_000_000:10.3f} us per call')
+
+
+if __name__ == '__main__':
+    main()
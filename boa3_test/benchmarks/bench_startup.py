@@ -0,0 +1,70 @@
+"""
+Measures the cold start time of the command line interface and of the compiler imports, each one in a new process.
+
+Run it from the project root with ``python -m boa3_test.benchmarks.bench_startup``. Use ``--import-time`` to show the
+modules that take longer to import in each measure.
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+from boa3_test.tests.cli_tests.utils import get_path_from_boa3_test
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=10, help='number of times each measure is repeated')
+    parser.add_argument('--import-time', type=int, default=0, metavar='N',
+                        help='shows the N modules with the highest cumulative import time of each measure')
+    args = parser.parse_args()
+
+    contract_path = get_path_from_boa3_test('test_sc', 'math_test', 'SqrtFromMath.py')
+    measures = {
+        'neo3-boa -v': ['-m', 'boa3.cli', '-v'],
+        'neo3-boa compile -h': ['-m', 'boa3.cli', 'compile', '-h'],
+        'import boa3.boa3': ['-c', 'import boa3.boa3'],
+        'import builtin symbols': ['-c', 'import boa3.internal.model.imports.builtin'],
+        'neo3-boa compile': ['-m', 'boa3.cli', 'compile', contract_path,
+                             '-o', os.path.join(os.path.dirname(contract_path), 'bench_startup.nef')],
+    }
+
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+    try:
+        for name, command in measures.items():
+            times = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                subprocess.run([sys.executable, *command], env=env, check=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                times.append(time.perf_counter() - start)
+
+            print(f'{name:25} min {min(times) * 1000:8.1f} ms   median {statistics.median(times) * 1000:8.1f} ms')
+            if args.import_time > 0:
+                _print_import_time(command, env, args.import_time)
+    finally:
+        for extension in ('.nef', '.manifest.json'):
+            output_path = os.path.join(os.path.dirname(contract_path), 'bench_startup' + extension)
+            if os.path.isfile(output_path):
+                os.remove(output_path)
+
+
+def _print_import_time(command, env, count: int):
+    result = subprocess.run([sys.executable, '-X', 'importtime', *command], env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+
+    imports = []
+    for line in result.stderr.splitlines():
+        match = re.match(r'import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)', line)
+        if match is not None:
+            imports.append((int(match.group(1)), match.group(3)))
+
+    for cumulative_time, module in sorted(imports, reverse=True)[:count]:
+        print(f'    {module:60} {cumulative_time / 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
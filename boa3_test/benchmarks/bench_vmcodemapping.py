@@ -0,0 +1,69 @@
+"""
+Measures the time to generate the bytecode of a large synthetic instruction map with many jumps.
+
+Run it from the project root with ``python -m boa3_test.benchmarks.bench_vmcodemapping``.
+"""
+import argparse
+import timeit
+
+from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+
+
+def build_code_map(blocks: int) -> VMCodeMapping:
+    """
+    Fills the instruction map with blocks of a forward jump followed by some instructions, where every fourth jump
+    targets the last instruction, so it must be converted to its larger version
+    """
+    VMCodeMapping.reset()
+    mapping = VMCodeMapping.instance()
+
+    jumps = []
+    for index in range(blocks):
+        jump = VMCode(OpcodeInfo.JMPIF)
+        mapping.insert_code(jump)
+        jumps.append(jump)
+        for _ in range(3):
+            mapping.insert_code(VMCode(OpcodeInfo.NOP))
+
+    last_code = VMCode(OpcodeInfo.RET)
+    mapping.insert_code(last_code)
+
+    codes = mapping.codes
+    for index, jump in enumerate(jumps):
+        if index % 4 == 0:
+            jump.set_target(last_code)
+        else:
+            # targets the start of the next block
+            jump.set_target(codes[min((index + 1) * 4, len(codes) - 1)])
+
+    return mapping
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--blocks', type=int, default=5000, help='number of jump blocks in the instruction map')
+    parser.add_argument('--repeat', type=int, default=5, help='number of times each measure is repeated')
+    args = parser.parse_args()
+
+    def generate_bytecode():
+        build_code_map(args.blocks).bytecode()
+
+    def query_sizes():
+        mapping = VMCodeMapping.instance()
+        for code in mapping.codes:
+            if code.opcode == Opcode.JMPIF_L or code.opcode == Opcode.JMPIF:
+                _ = code.size, code.data
+
+    generate_time = min(timeit.repeat(generate_bytecode, number=1, repeat=args.repeat))
+    query_time = min(timeit.repeat(query_sizes, number=1, repeat=args.repeat))
+
+    print(f'instructions: {len(VMCodeMapping.instance().codes)}')
+    print(f'bytecode():           {generate_time * 1000:10.2f} ms')
+    print(f'jump size/data query: {query_time * 1000:10.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
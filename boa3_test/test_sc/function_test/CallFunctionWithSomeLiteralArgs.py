@@ -0,0 +1,11 @@
+from boa3.builtin.compile_time import public
+
+
+@public
+def Main(x: int, y: int) -> int:
+    return TestAdd(10, x) + TestAdd(10, y)
+
+
+def TestAdd(a: int, b: int) -> int:
+    c = a * 2
+    return c + b
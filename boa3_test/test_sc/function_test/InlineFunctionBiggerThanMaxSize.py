@@ -0,0 +1,10 @@
+from boa3.builtin.compile_time import public
+
+
+@public
+def Main(a: int, b: int) -> int:
+    return Polynomial(a, b)
+
+
+def Polynomial(a: int, b: int) -> int:
+    return a * a * a + a * a * b + a * b * b + b * b * b
@@ -0,0 +1,10 @@
+from boa3.builtin.compile_time import public
+
+
+@public
+def Main(a: int, b: int) -> int:
+    return TestAdd(a, b) * TestAdd(b, 1)
+
+
+def TestAdd(a: int, b: int) -> int:
+    return a + b
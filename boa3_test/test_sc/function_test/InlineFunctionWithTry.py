@@ -0,0 +1,14 @@
+from boa3.builtin.compile_time import public
+
+
+@public
+def Main(a: int, b: int) -> int:
+    return Divide(a, b)
+
+
+def Divide(a: int, b: int) -> int:
+    try:
+        a = a // b
+    except:
+        a = 0
+    return a
@@ -0,0 +1,11 @@
+from boa3.builtin.compile_time import public
+
+
+@public
+def Main(a: int, b: int) -> int:
+    return TestAdd(a, b)
+
+
+@public
+def TestAdd(a: int, b: int) -> int:
+    return a + b
@@ -0,0 +1,14 @@
+from boa3.builtin.compile_time import public
+
+a = 1
+for x in [1, 2]:
+    a = a + x
+
+
+def get_a() -> int:
+    return a
+
+
+@public
+def Main() -> int:
+    return get_a()
@@ -75,8 +75,10 @@ class BoaTest(TestCase):
 
     def get_all_imported_methods(self, compiler: Compiler) -> Dict[str, Method]:
         from boa3.internal.compiler.filegenerator.filegenerator import FileGenerator
-        generator = FileGenerator(compiler.result, compiler._analyser, compiler._entry_smart_contract)
-        return {constants.VARIABLE_NAME_SEPARATOR.join(name): value for name, value in generator._methods_with_imports.items()}
+        with compiler._context.activate():
+            generator = FileGenerator(compiler.result, compiler._analyser, compiler._entry_smart_contract)
+            return {constants.VARIABLE_NAME_SEPARATOR.join(name): value
+                    for name, value in generator._methods_with_imports.items()}
 
     def assertCompilerLogs(self, expected_logged_exception, path) -> Union[bytes, str]:
         output, error_msg = self._assert_compiler_logs_error(expected_logged_exception, path)
@@ -259,11 +261,12 @@ class BoaTest(TestCase):
     def compile(self, path: str, root_folder: str = None, fail_fast: bool = False, **kwargs) -> bytes:
         from boa3.boa3 import Boa3
 
-        with _COMPILER_LOCK:
-            result = Boa3.compile(path, root_folder=root_folder, fail_fast=fail_fast,
-                                  log_level=logging.getLevelName(logging.INFO),
-                                  optimize=kwargs['optimize'] if 'optimize' in kwargs else True
-                                  )
+        # each compilation uses its own context, it doesn't need to wait for the other compilations
+        result = Boa3.compile(path, root_folder=root_folder, fail_fast=fail_fast,
+                              log_level=logging.getLevelName(logging.INFO),
+                              optimize=kwargs['optimize'] if 'optimize' in kwargs else True,
+                              use_cache=False
+                              )
 
         return result
 
@@ -298,7 +301,8 @@ class BoaTest(TestCase):
                                   env=env, debug=debug,
                                   show_errors=log,
                                   log_level=logging.getLevelName(logging.INFO),
-                                  optimize=kwargs['optimize'] if 'optimize' in kwargs else True
+                                  optimize=kwargs['optimize'] if 'optimize' in kwargs else True,
+                                  use_cache=False
                                   )
 
         get_raw_nef = kwargs['get_raw_nef'] if 'get_raw_nef' in kwargs else False
@@ -0,0 +1,60 @@
+import os.path
+import tempfile
+
+from boa3_test.tests.cli_tests.cli_test import BoaCliTest  # needs to be the first import to avoid circular imports
+
+from boa3_test.tests.cli_tests.utils import neo3_boa_cli, get_path_from_boa3_test
+
+OUTPUT_DIR = os.path.join(tempfile.gettempdir(), 'neo3-boa-build-test')
+
+
+class TestCliBuild(BoaCliTest):
+
+    @neo3_boa_cli('build', '-h')
+    def test_cli_build_help(self):
+        cli_output, _, system_exit = self.get_cli_output(get_exit_code=True)
+
+        self.assertEqual(self.EXIT_CODE_SUCCESS, system_exit.exception.code)
+        self.assertIn('usage: neo3-boa build [-h] [-db] '
+                      '[--project-path PROJECT_PATH] [-e ENV] '
+                      '[-o OUTPUT_DIR] [-j JOBS] [--no-failfast] '
+                      '[--log-level LOG_LEVEL] [--cache] '
+                      'input',
+                      cli_output)
+
+    @neo3_boa_cli('build', get_path_from_boa3_test('test_sc', 'math_test', '*FromMath.py'),
+                  '-o', OUTPUT_DIR, '-j', '2')
+    def test_cli_build(self):
+        sc_names = ['PowFromMath', 'SqrtFromMath']
+        for sc_name in sc_names:
+            for extension in ('.nef', '.manifest.json'):
+                if os.path.isfile(os.path.join(OUTPUT_DIR, sc_name + extension)):
+                    os.remove(os.path.join(OUTPUT_DIR, sc_name + extension))
+
+        logs = self.get_cli_log()
+
+        self.assertTrue('Building 2 smart contracts with 2 workers' in logs.output[0])
+        for sc_name in sc_names:
+            self.assertTrue(any(f'Compiled {sc_name}.py in ' in log for log in logs.output),
+                            msg=f'Something went wrong when compiling {sc_name}.py')
+            self.assertTrue(os.path.isfile(os.path.join(OUTPUT_DIR, f'{sc_name}.nef')))
+            self.assertTrue(os.path.isfile(os.path.join(OUTPUT_DIR, f'{sc_name}.manifest.json')))
+        self.assertTrue('Built 2 of 2 smart contracts in ' in logs.output[-1])
+
+    @neo3_boa_cli('build', get_path_from_boa3_test('test_sc', 'math_test'), '-o', OUTPUT_DIR, '-j', '1')
+    def test_cli_build_with_errors(self):
+        logs, system_exit = self.get_cli_log(get_exit_code=True)
+
+        self.assertEqual(self.EXIT_CODE_ERROR, system_exit.exception.code)
+        self.assertTrue('Building 5 smart contracts with 1 worker' in logs.output[0])
+        self.assertTrue(any("Unresolved reference 'sqrt'" in log for log in logs.output))
+        self.assertTrue(any('Could not compile NoImport.py' in log for log in logs.output))
+        self.assertTrue('Built 4 of 5 smart contracts in ' in logs.output[-1])
+        self.assertTrue(logs.output[-1].endswith('failed: NoImport.py'))
+
+    @neo3_boa_cli('build', get_path_from_boa3_test('test_sc', 'math_test', 'NotFound*.py'))
+    def test_cli_build_no_contracts(self):
+        logs, system_exit = self.get_cli_log(get_exit_code=True)
+
+        self.assertEqual(self.EXIT_CODE_ERROR, system_exit.exception.code)
+        self.assertTrue('No smart contracts found in ' in logs.output[-1])
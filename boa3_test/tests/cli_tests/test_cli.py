@@ -11,7 +11,7 @@ class TestCli(BoaCliTest):
         cli_output, _, system_exit = self.get_cli_output(get_exit_code=True)
 
         self.assertEqual(self.EXIT_CODE_SUCCESS, system_exit.exception.code)
-        self.assertIn('usage: neo3-boa [-h] [-v] {compile}', cli_output)
+        self.assertIn('usage: neo3-boa [-h] [-v] {compile,build,serve}', cli_output)
         self.assertIn(f'neo3-boa by COZ - version {constants.BOA_VERSION}', cli_output)
         self.assertIn('Write smart contracts for Neo3 in Python', cli_output)
 
@@ -22,9 +22,9 @@ class TestCli(BoaCliTest):
         self.assertEqual(self.EXIT_CODE_SUCCESS, system_exit.exception.code)
         self.assertIn(f'neo3-boa {constants.BOA_VERSION}', cli_output)
 
-    @neo3_boa_cli('build')
+    @neo3_boa_cli('deploy')
     def test_cli_wrong_syntax(self):
         _, cli_output, system_exit = self.get_cli_output(get_exit_code=True)
 
         self.assertEqual(self.EXIT_CODE_CLI_SYNTAX_ERROR, system_exit.exception.code)
-        self.assertIn("invalid choice: 'build'", cli_output)
+        self.assertIn("invalid choice: 'deploy'", cli_output)
@@ -1,4 +1,7 @@
+import json
 import os.path
+import tempfile
+from unittest.mock import patch
 
 from boa3_test.tests.cli_tests.cli_test import BoaCliTest  # needs to be the first import to avoid circular imports
 
@@ -18,7 +21,8 @@ class TestCliCompile(BoaCliTest):
         self.assertIn('usage: neo3-boa compile [-h] [-db] '
                       '[--project-path PROJECT_PATH] [-e ENV] '
                       '[-o NEF_OUTPUT] [--no-failfast] '
-                      '[--log-level LOG_LEVEL] '
+                      '[--log-level LOG_LEVEL] [--cache] [-w] '
+                      '[--profile [PROFILE_OUTPUT]] '
                       'input',
                       cli_output)
 
@@ -79,6 +83,65 @@ class TestCliCompile(BoaCliTest):
         self.assertTrue(os.path.isfile(debug_info_path),
                         msg=f'{debug_info_path} not found')
 
+    @neo3_boa_cli('compile', get_path_from_boa3_test('test_sc', 'boa_built_in_methods_test', 'Env.py'),
+                  '--cache')
+    def test_cli_compile_with_cache(self):
+        sc_nef_name = 'Env.nef'
+        nef_path = get_path_from_boa3_test('test_sc', 'boa_built_in_methods_test', sc_nef_name)
+        manifest_path = nef_path.replace('nef', 'manifest.json')
+
+        if os.path.isfile(nef_path):
+            os.remove(nef_path)
+        if os.path.isfile(manifest_path):
+            os.remove(manifest_path)
+
+        with tempfile.TemporaryDirectory() as cache_home, patch.dict(os.environ, {'XDG_CACHE_HOME': cache_home}):
+            logs = self.get_cli_log()
+            cached_results = os.listdir(os.path.join(cache_home, 'neo3-boa', 'results'))
+
+        self.assertEqual(1, len(cached_results))
+
+        self.assertEqual(3, len(logs.output))
+        self.assertTrue(f'neo3-boa v{constants.BOA_VERSION}\tPython {constants.SYS_VERSION}' in logs.output[0])
+        self.assertTrue('Started compiling' in logs.output[1])
+        self.assertTrue(f'Wrote {sc_nef_name} to ' in logs.output[-1],
+                        msg=f'Something went wrong when compiling {sc_nef_name}')
+        self.assertTrue(os.path.isfile(nef_path),
+                        msg=f'{nef_path} not found')
+        self.assertTrue(os.path.isfile(manifest_path),
+                        msg=f'{manifest_path} not found')
+
+    @neo3_boa_cli('compile', get_path_from_boa3_test('test_sc', 'boa_built_in_methods_test', 'Env.py'),
+                  '--profile')
+    def test_cli_compile_profile(self):
+        sc_nef_name = 'Env.nef'
+        nef_path = get_path_from_boa3_test('test_sc', 'boa_built_in_methods_test', sc_nef_name)
+        profile_path = nef_path.replace('.nef', '.profile.json')
+
+        if os.path.isfile(nef_path):
+            os.remove(nef_path)
+        if os.path.isfile(profile_path):
+            os.remove(profile_path)
+
+        logs = self.get_cli_log()
+
+        self.assertEqual(4, len(logs.output))
+        self.assertTrue(f'Wrote {sc_nef_name} to ' in logs.output[-2],
+                        msg=f'Something went wrong when compiling {sc_nef_name}')
+        self.assertTrue(f'Wrote profile to {profile_path}' in logs.output[-1])
+        self.assertTrue(os.path.isfile(nef_path),
+                        msg=f'{nef_path} not found')
+        self.assertTrue(os.path.isfile(profile_path),
+                        msg=f'{profile_path} not found')
+
+        with open(profile_path) as profile_file:
+            profile = json.load(profile_file)
+
+        self.assertGreater(profile['total_time'], 0)
+        for phase in ('parse', 'ModuleAnalyser', 'TypeAnalyser', 'VisitorCodeGenerator', 'FileGenerator.nef'):
+            self.assertIn(phase, profile['phases'])
+            self.assertGreaterEqual(profile['phases'][phase]['calls'], 1)
+
     @neo3_boa_cli('compile', get_path_from_boa3_test('test_sc', 'boa_built_in_methods_test', 'Env.py'),
                   '-o', get_path_from_boa3_test('test_cli', 'smart_contract.nef', get_unique=True))
     def test_cli_compile_new_output_path(self):
@@ -0,0 +1,172 @@
+import io
+import json
+import os
+import socket
+import tempfile
+import threading
+from unittest.mock import patch
+
+from boa3_test.tests.cli_tests.cli_test import BoaCliTest  # needs to be the first import to avoid circular imports
+
+from boa3.internal import constants
+from boa3.internal.analyser.moduleanalysiscache import ModuleAnalysisCache
+from boa3.internal.compiler.compilationserver import CompilationServer
+from boa3_test.tests.cli_tests.utils import neo3_boa_cli, get_path_from_boa3_test
+
+
+def requests_input(*requests: dict):
+    return patch('sys.stdin', io.StringIO(''.join(json.dumps(request) + '\n' for request in requests)))
+
+
+class TestCliServe(BoaCliTest):
+
+    @neo3_boa_cli('serve', '-h')
+    def test_cli_serve_help(self):
+        cli_output, _, system_exit = self.get_cli_output(get_exit_code=True)
+
+        self.assertEqual(self.EXIT_CODE_SUCCESS, system_exit.exception.code)
+        self.assertIn('usage: neo3-boa serve [-h] [--socket SOCKET] [-j JOBS] [--cache]', cli_output)
+
+    @neo3_boa_cli('serve', '-j', '2')
+    def test_cli_serve_compile(self):
+        path = get_path_from_boa3_test('test_sc', 'math_test', 'SqrtFromMath.py')
+        with requests_input({'jsonrpc': '2.0', 'id': 1, 'method': 'version'},
+                            {'jsonrpc': '2.0', 'id': 2, 'method': 'compile', 'params': {'path': path}},
+                            {'jsonrpc': '2.0', 'id': 3, 'method': 'shutdown'},
+                            {'jsonrpc': '2.0', 'id': 4, 'method': 'version'}):
+            cli_output, _ = self.get_cli_output()
+
+        self.assertIn(f'"id": 1, "result": {{"version": "{constants.BOA_VERSION}"', cli_output)
+        self.assertIn('"id": 2, "result": {"success": true, "nef": "', cli_output)
+        self.assertIn('"manifest": {"name": "SqrtFromMath"', cli_output)
+        # the shutdown is answered after the pending requests and the next requests are not read
+        self.assertTrue(cli_output.endswith('"id": 3, "result": null}'))
+        self.assertNotIn('"id": 4', cli_output)
+
+    @neo3_boa_cli('serve', '-j', '1')
+    def test_cli_serve_compile_error(self):
+        path = get_path_from_boa3_test('test_sc', 'math_test', 'NoImport.py')
+        with requests_input({'jsonrpc': '2.0', 'id': 1, 'method': 'compile', 'params': {'path': path}},
+                            {'jsonrpc': '2.0', 'id': 2, 'method': 'compile', 'params': {'path': 'NotFound.py'}},
+                            {'jsonrpc': '2.0', 'id': 3, 'method': 'build'}):
+            cli_output, _ = self.get_cli_output()
+
+        self.assertIn('"id": 1, "result": {"success": false, "diagnostics": [{"severity": "error", '
+                      '"type": "UnresolvedReference", "message": "6:11 - Unresolved reference \'sqrt\'', cli_output)
+        self.assertIn('"id": 2, "error": {"code": -32602, "message": "File not found: NotFound.py"}', cli_output)
+        self.assertIn('"id": 3, "error": {"code": -32601, "message": "Method not found: build"}', cli_output)
+
+    def get_socket_path(self) -> str:
+        socket_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(socket_dir.cleanup)
+        return os.path.join(socket_dir.name, 'neo3-boa.sock')
+
+    def start_unix_socket_server(self, socket_path: str) -> threading.Thread:
+        server_thread = threading.Thread(target=CompilationServer(jobs=1).serve_unix_socket, args=(socket_path,),
+                                         daemon=True)
+        server_thread.start()
+
+        for _ in range(1000):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                try:
+                    client.connect(socket_path)
+                    break
+                except OSError:
+                    # the server isn't listening yet
+                    server_thread.join(0.01)
+        return server_thread
+
+    def send_requests(self, socket_path: str, *requests: dict) -> list:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            client.sendall(''.join(json.dumps(request) + '\n' for request in requests).encode())
+            with client.makefile('r') as responses:
+                return [json.loads(responses.readline()) for _ in requests]
+
+    def test_serve_unix_socket(self):
+        socket_path = self.get_socket_path()
+        server_thread = self.start_unix_socket_server(socket_path)
+
+        responses = self.send_requests(socket_path,
+                                       {'jsonrpc': '2.0', 'id': 1, 'method': 'version'},
+                                       {'jsonrpc': '2.0', 'id': 2, 'method': 'shutdown'})
+        server_thread.join(10)
+
+        self.assertEqual(constants.BOA_VERSION, responses[0]['result']['version'])
+        self.assertEqual({'jsonrpc': '2.0', 'id': 2, 'result': None}, responses[1])
+        self.assertFalse(server_thread.is_alive())
+        self.assertFalse(os.path.exists(socket_path))
+
+    def test_serve_unix_socket_stale_socket(self):
+        socket_path = self.get_socket_path()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale_socket:
+            # the file of a socket that isn't listening anymore
+            stale_socket.bind(socket_path)
+
+        server_thread = self.start_unix_socket_server(socket_path)
+        responses = self.send_requests(socket_path, {'jsonrpc': '2.0', 'id': 1, 'method': 'shutdown'})
+        server_thread.join(10)
+
+        self.assertEqual({'jsonrpc': '2.0', 'id': 1, 'result': None}, responses[0])
+        self.assertFalse(os.path.exists(socket_path))
+
+    def test_serve_unix_socket_path_is_not_a_socket(self):
+        socket_path = self.get_socket_path()
+        with open(socket_path, 'w') as file:
+            file.write('not a socket')
+
+        with self.assertRaises(FileExistsError):
+            CompilationServer(jobs=1).serve_unix_socket(socket_path)
+
+        with open(socket_path) as file:
+            self.assertEqual('not a socket', file.read())
+
+    def test_serve_unix_socket_used_by_other_server(self):
+        socket_path = self.get_socket_path()
+        server_thread = self.start_unix_socket_server(socket_path)
+
+        with self.assertRaises(FileExistsError):
+            CompilationServer(jobs=1).serve_unix_socket(socket_path)
+
+        # the socket of the running server isn't removed
+        responses = self.send_requests(socket_path, {'jsonrpc': '2.0', 'id': 1, 'method': 'shutdown'})
+        server_thread.join(10)
+        self.assertEqual({'jsonrpc': '2.0', 'id': 1, 'result': None}, responses[0])
+
+    def test_serve_unix_socket_replaced_socket_file(self):
+        socket_path = self.get_socket_path()
+        server_thread = self.start_unix_socket_server(socket_path)
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            # other process replaces the socket file while the server is running
+            os.remove(socket_path)
+            with open(socket_path, 'w') as file:
+                file.write('other file')
+
+            client.sendall((json.dumps({'jsonrpc': '2.0', 'id': 1, 'method': 'shutdown'}) + '\n').encode())
+            with client.makefile('r') as responses:
+                self.assertEqual({'jsonrpc': '2.0', 'id': 1, 'result': None}, json.loads(responses.readline()))
+        server_thread.join(10)
+
+        # only the socket created by the server is removed when it stops
+        self.assertFalse(server_thread.is_alive())
+        with open(socket_path) as file:
+            self.assertEqual('other file', file.read())
+
+    def test_serve_compile_reuses_imported_modules_analysis(self):
+        path = get_path_from_boa3_test('test_sc', 'import_test', 'FromImportUserModule.py')
+        server = CompilationServer(jobs=1)
+        analysis_cache = ModuleAnalysisCache.instance()
+        request = {'jsonrpc': '2.0', 'id': 1, 'method': 'compile', 'params': {'path': path}}
+
+        with server._start_executor():
+            first_response = server.handle_request(request)
+            hits, misses = analysis_cache.hits, analysis_cache.misses
+            second_response = server.handle_request(request)
+
+        self.assertTrue(first_response['result']['success'])
+        self.assertEqual(first_response['result']['nef'], second_response['result']['nef'])
+        # the imported module is analysed only once, the next requests use the analysis from the cache
+        self.assertEqual(misses, analysis_cache.misses)
+        self.assertGreater(analysis_cache.hits, hits)
@@ -1068,8 +1068,6 @@ class TestArithmetic(BoaTest):
             + Opcode.LDARG0
             + Opcode.LDARG1
             + self.byte_str_mult
-            + Opcode.STARG0
-            + Opcode.LDARG0
             + Opcode.RET
         )
 
@@ -1152,8 +1150,6 @@ class TestArithmetic(BoaTest):
             + Opcode.LDARG1
             + self.byte_str_mult
             + Opcode.CONVERT + Type.str.stack_item
-            + Opcode.STARG0
-            + Opcode.LDARG0
             + Opcode.RET
         )
 
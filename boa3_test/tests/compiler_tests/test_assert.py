@@ -183,6 +183,27 @@ class TestAssert(BoaTest):
             + Opcode.RET
         )
 
+        path = self.get_contract_path('AssertWithStrFunctionMessage.py')
+        output = self.compile(path, optimize=False)
+        self.assertEqual(expected_output, output)
+
+    def test_assert_with_str_function_message_code_optimization(self):
+        assert_msg = String('a must be greater than zero').to_bytes()
+
+        expected_output = (
+            Opcode.INITSLOT     # function signature
+            + b'\x00'
+            + b'\x01'
+            + Opcode.LDARG0
+            + Opcode.PUSH0
+            + Opcode.GT
+            + Opcode.PUSHDATA1  # message() is evaluated during compile time
+            + Integer(len(assert_msg)).to_byte_array() + assert_msg
+            + Opcode.ASSERTMSG
+            + Opcode.LDARG0     # return a
+            + Opcode.RET        # message() isn't called anymore, so it's not generated
+        )
+
         path = self.get_contract_path('AssertWithStrFunctionMessage.py')
         output = self.compile(path)
         self.assertEqual(expected_output, output)
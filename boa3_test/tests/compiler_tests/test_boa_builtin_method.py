@@ -66,7 +66,7 @@ class TestBoaBuiltinMethod(BoaTest):
             + b'\x02'
             + Opcode.LDARG0
             + Opcode.JMPIFNOT   # if check:
-            + Integer(11).to_byte_array(signed=True, min_length=1)
+            + Integer(10).to_byte_array(signed=True, min_length=1)
             + Opcode.LDARG1
             + Opcode.DUP
             + Opcode.ISTYPE + StackItemType.ByteString
@@ -74,7 +74,6 @@ class TestBoaBuiltinMethod(BoaTest):
             + Integer(3).to_byte_array(signed=True, min_length=1)
             + Opcode.ABORT
             + Opcode.ABORTMSG   # abort('abort was called')
-            + Opcode.DROP
             + Opcode.PUSHINT8
             + number_123        # return 123
             + Opcode.RET
@@ -27,9 +27,7 @@ class TestBuiltinMethod(BoaTest):
             + Opcode.STLOC0
             + Opcode.LDLOC0     # b = len(a)
             + Opcode.SIZE
-            + Opcode.STLOC1
-            + Opcode.LDLOC1     # return b
-            + Opcode.RET
+            + Opcode.RET        # return b
         )
         path = self.get_contract_path('LenTuple.py')
         output = self.compile(path)
@@ -63,9 +61,7 @@ class TestBuiltinMethod(BoaTest):
             + Opcode.STLOC0
             + Opcode.LDLOC0     # b = len(a)
             + Opcode.SIZE
-            + Opcode.STLOC1
-            + Opcode.LDLOC1     # return b
-            + Opcode.RET
+            + Opcode.RET        # return b
         )
         path = self.get_contract_path('LenList.py')
         output = self.compile(path)
@@ -97,10 +93,7 @@ class TestBuiltinMethod(BoaTest):
             + Integer(len(byte_input)).to_byte_array()
             + byte_input
             + Opcode.STLOC0
-            + Opcode.PUSHDATA1            # push the bytes
-            + Integer(len(byte_input)).to_byte_array()
-            + byte_input
-            + Opcode.SIZE
+            + Opcode.PUSH11               # len(a) is evaluated during compile time
             + Opcode.RET
         )
         path = self.get_contract_path('LenString.py')
@@ -0,0 +1,152 @@
+from boa3_test.tests.boa_test import BoaTest  # needs to be the first import to avoid circular imports
+
+from boa3.internal.compiler.codegenerator.codeblockgraph import CodeBlockGraph
+from boa3.internal.neo.vm.TryCode import TryCode
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+
+
+class TestCodeBlockGraph(BoaTest):
+
+    def test_build_blocks(self):
+        jump = VMCode(OpcodeInfo.JMPIF)
+        codes = [
+            VMCode(OpcodeInfo.PUSHT),
+            jump,
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.RET),
+            VMCode(OpcodeInfo.PUSH2),
+            VMCode(OpcodeInfo.RET),
+        ]
+        jump.set_target(codes[4])
+
+        graph = CodeBlockGraph(codes)
+
+        self.assertEqual([codes[:2], codes[2:4], codes[4:]], [block.codes for block in graph.blocks])
+        self.assertEqual(codes, graph.codes)
+        self.assertIs(codes[4], graph.get_target(jump))
+
+    def test_remove_emptied_block(self):
+        jump = VMCode(OpcodeInfo.JMPIF)
+        second_jump = VMCode(OpcodeInfo.JMP)
+        codes = [
+            VMCode(OpcodeInfo.PUSHT),
+            jump,
+            VMCode(OpcodeInfo.PUSH1),
+            second_jump,
+            VMCode(OpcodeInfo.PUSH2),
+            VMCode(OpcodeInfo.DROP),
+            VMCode(OpcodeInfo.RET),
+        ]
+        jump.set_target(codes[4])
+        second_jump.set_target(codes[6])
+
+        graph = CodeBlockGraph(codes)
+        graph.remove_codes(codes[4:6])
+
+        # the jump to the emptied block targets the first instruction of the next block
+        self.assertTrue(any(block.is_empty for block in graph.blocks))
+        self.assertIs(codes[6], graph.get_target(jump))
+        self.assertIs(codes[6], graph.get_target(second_jump))
+        self.assertIs(codes[6], graph.get_next_code(second_jump))
+
+        self.assertEqual(codes[:4] + codes[6:], graph.linearize())
+        self.assertIs(codes[6], jump.target)
+        self.assertIs(codes[6], second_jump.target)
+
+    def test_remove_first_code_of_block(self):
+        jump = VMCode(OpcodeInfo.JMPIF)
+        codes = [
+            VMCode(OpcodeInfo.PUSHT),
+            jump,
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.RET),
+            VMCode(OpcodeInfo.NOP),
+            VMCode(OpcodeInfo.PUSH2),
+            VMCode(OpcodeInfo.RET),
+        ]
+        jump.set_target(codes[4])
+
+        graph = CodeBlockGraph(codes)
+        graph.remove_codes([codes[4]])
+
+        self.assertIs(codes[5], graph.get_target(jump))
+        self.assertEqual(codes[:4] + codes[5:], graph.linearize())
+        self.assertIs(codes[5], jump.target)
+
+    def test_set_target_in_the_middle_of_block(self):
+        jump = VMCode(OpcodeInfo.JMPIF)
+        codes = [
+            VMCode(OpcodeInfo.PUSHT),
+            jump,
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.PUSH2),
+            VMCode(OpcodeInfo.RET),
+        ]
+        jump.set_target(codes[4])
+
+        graph = CodeBlockGraph(codes)
+        graph.set_target(jump, codes[3])
+
+        # the block is split, so the target is the first instruction of a block
+        self.assertIsNot(graph.get_block(codes[2]), graph.get_block(codes[3]))
+        self.assertIs(codes[3], graph.get_target(jump))
+        self.assertEqual(codes, graph.linearize())
+        self.assertIs(codes[3], jump.target)
+
+    def test_replace_jump_target(self):
+        jump = VMCode(OpcodeInfo.JMPIF)
+        codes = [
+            VMCode(OpcodeInfo.PUSHT),
+            jump,
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.RET),
+        ]
+        jump.set_target(codes[3])
+        new_codes = [VMCode(OpcodeInfo.PUSH2), VMCode(OpcodeInfo.RET)]
+
+        graph = CodeBlockGraph(codes)
+        graph.replace_code(codes[3], new_codes)
+
+        # the jumps to the replaced instruction target the first new instruction
+        self.assertIs(new_codes[0], graph.get_target(jump))
+        self.assertEqual(codes[:3] + new_codes, graph.linearize())
+        self.assertIs(new_codes[0], jump.target)
+
+    def test_remove_emptied_block_in_try(self):
+        end_try = VMCode(OpcodeInfo.ENDTRY)
+        end_except = VMCode(OpcodeInfo.ENDTRY)
+        codes = [
+            VMCode(OpcodeInfo.NOP),
+            None,  # try
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.DROP),
+            end_try,
+            VMCode(OpcodeInfo.DROP),  # except
+            end_except,
+            VMCode(OpcodeInfo.NOP),  # finally
+            VMCode(OpcodeInfo.ENDFINALLY),
+            VMCode(OpcodeInfo.NOP),
+            VMCode(OpcodeInfo.RET),
+        ]
+        try_code = TryCode(codes[5], codes[7])
+        codes[1] = try_code
+        end_try.set_target(codes[9])
+        end_except.set_target(codes[9])
+
+        graph = CodeBlockGraph(codes)
+        self.assertEqual([codes[:2], codes[2:5], codes[5:7], codes[7:9], codes[9:]],
+                         [block.codes for block in graph.blocks])
+
+        graph.remove_codes([codes[2], codes[3], codes[9]])
+
+        # the ends of the try target the next block with instructions, and the handlers are kept
+        self.assertIs(codes[10], graph.get_target(end_try))
+        self.assertIs(codes[10], graph.get_target(end_except))
+        self.assertIs(end_try, graph.get_next_code(try_code))
+
+        self.assertEqual(codes[:2] + codes[4:9] + codes[10:], graph.linearize())
+        self.assertIs(codes[10], end_try.target)
+        self.assertIs(codes[10], end_except.target)
+        self.assertIs(codes[5], try_code.except_start_code)
+        self.assertIs(codes[7], try_code.finally_start_code)
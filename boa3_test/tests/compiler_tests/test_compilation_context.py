@@ -0,0 +1,82 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from boa3_test.tests.boa_test import BoaTest  # needs to be the first import to avoid circular imports
+
+from boa3.internal import constants
+from boa3.internal.compiler.compiler import Compiler
+from boa3.internal.exception.NotLoadedException import NotLoadedException
+
+
+class RecordsHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append(record)
+
+
+class TestCompilationContext(BoaTest):
+    default_folder: str = 'test_sc'
+
+    def test_compile_in_parallel_threads(self):
+        paths = [
+            self.get_contract_path('boa3_test/examples', 'amm.py'),
+            self.get_contract_path('boa3_test/examples', 'htlc.py'),
+            self.get_contract_path('boa3_test/examples', 'ico.py'),
+            self.get_contract_path('boa3_test/examples', 'nep17.py'),
+            self.get_contract_path('boa3_test/examples', 'wrapped_neo.py'),
+            self.get_contract_path('import_test', 'FromImportUserModule.py'),
+            self.get_contract_path('import_test', 'FromImportWithGlobalVariables.py'),
+            self.get_contract_path('import_test', 'ImportModuleWithInit.py'),
+            self.get_contract_path('function_test', 'CallReturnFunctionWithoutArgs.py'),
+            self.get_contract_path('list_test', 'ListSlicingWithStride.py'),
+        ]
+        expected_outputs = [self.compile(path) for path in paths]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            # each contract is compiled more than once, so the same contract is compiled in different threads too
+            outputs = list(executor.map(self.compile, paths * 3))
+
+        for index, output in enumerate(outputs):
+            self.assertEqual(expected_outputs[index % len(paths)], output, paths[index % len(paths)])
+
+    def test_log_level_of_parallel_compilations(self):
+        info_path = self.get_contract_path('import_test', 'FromImportUserModule.py')
+        error_path = self.get_contract_path('import_test', 'ImportModuleWithInit.py')
+
+        def compile_with_log_level(args):
+            path, log_level = args
+            return Compiler().compile(path, log_level=log_level)
+
+        logger = logging.getLogger(constants.BOA_LOGGING_NAME)
+        logger_level = logger.level
+        handler = RecordsHandler()
+        logger.addHandler(handler)
+        try:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(compile_with_log_level, [(info_path, 'INFO'), (error_path, 'ERROR')] * 6))
+        finally:
+            logger.removeHandler(handler)
+
+        # each compilation logs only the records of its own level, even if other compilations have lower levels
+        import_records = [record.getMessage() for record in handler.records if record.levelno == logging.INFO
+                          and record.getMessage().startswith('Importing')]
+        self.assertGreater(len(import_records), 0)
+        for message in import_records:
+            self.assertIn('FromImportUserModule.py', message)
+        self.assertEqual(logger_level, logger.level)
+
+    def test_log_level_restored_after_failed_compilation(self):
+        path = self.get_contract_path('import_test', 'ImportNotExistingMethod.py')
+        logger = logging.getLogger(constants.BOA_LOGGING_NAME)
+        logger_level = logger.level
+
+        with self.assertRaises(NotLoadedException):
+            Compiler().compile(path, log=False, log_level='INFO')
+        self.assertEqual(logger_level, logger.level)
+
+        with self.assertRaises(ValueError):
+            Compiler().compile(path, log_level='NOT_A_LEVEL')
+        self.assertEqual(logger_level, logger.level)
@@ -0,0 +1,216 @@
+import os
+import tempfile
+from unittest.mock import patch
+
+from boa3_test.tests.boa_test import BoaTest  # needs to be the first import to avoid circular imports
+
+from boa3.boa3 import Boa3
+from boa3.internal.analyser.analyser import Analyser
+from boa3.internal.compiler.compilationwatcher import CompilationWatcher
+from boa3.internal.exception.InvalidPathException import InvalidPathException
+
+
+class StopWatching(Exception):
+    pass
+
+
+class TestCompilationWatcher(BoaTest):
+
+    def setUp(self):
+        super().setUp()
+        project_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(project_dir.cleanup)
+        self.project_dir = os.path.realpath(project_dir.name)
+
+        self.write_file('shared.py', 'def shared_value() -> int:\n'
+                                     '    return 1\n')
+        self.write_file('helper.py', 'def helper_value() -> int:\n'
+                                     '    return 2\n')
+        self.write_file('WithSharedAndHelper.py', 'from boa3.builtin.compile_time import public\n'
+                                                  'from helper import helper_value\n'
+                                                  'from shared import shared_value\n'
+                                                  '\n'
+                                                  '\n'
+                                                  '@public\n'
+                                                  'def Main() -> int:\n'
+                                                  '    return shared_value() + helper_value()\n')
+        self.write_file('WithShared.py', 'from boa3.builtin.compile_time import public\n'
+                                         'from shared import shared_value\n'
+                                         '\n'
+                                         '\n'
+                                         '@public\n'
+                                         'def Main() -> int:\n'
+                                         '    return shared_value()\n')
+        self.write_file('WithoutImports.py', 'from boa3.builtin.compile_time import public\n'
+                                             '\n'
+                                             '\n'
+                                             '@public\n'
+                                             'def Main() -> int:\n'
+                                             '    return 3\n')
+
+    def get_path(self, file_name: str) -> str:
+        return os.path.join(self.project_dir, file_name)
+
+    def write_file(self, file_name: str, content: str):
+        path = self.get_path(file_name)
+        previous_mtime = os.stat(path).st_mtime_ns if os.path.isfile(path) else 0
+        with open(path, 'w') as file:
+            file.write(content)
+        # the file system may not change the modification time if the file is written in the same clock tick
+        mtime = max(os.stat(path).st_mtime_ns, previous_mtime + 1_000_000_000)
+        os.utime(path, ns=(mtime, mtime))
+
+    def get_watcher(self, *file_names: str, **kwargs) -> CompilationWatcher:
+        entries = {self.get_path(file_name): self.get_path(file_name.replace('.py', '.nef'))
+                   for file_name in file_names}
+        return CompilationWatcher(entries, self.project_dir, log=False, **kwargs)
+
+    def test_compile_all(self):
+        watcher = self.get_watcher('WithSharedAndHelper.py', 'WithShared.py', 'WithoutImports.py')
+        results = watcher.compile_all()
+
+        self.assertEqual({self.get_path('WithSharedAndHelper.py'): None,
+                          self.get_path('WithShared.py'): None,
+                          self.get_path('WithoutImports.py'): None},
+                         results)
+        for file_name in ('WithSharedAndHelper', 'WithShared', 'WithoutImports'):
+            self.assertTrue(os.path.isfile(self.get_path(f'{file_name}.nef')))
+            self.assertTrue(os.path.isfile(self.get_path(f'{file_name}.manifest.json')))
+
+        self.assertEqual(sorted(self.get_path(file_name) for file_name in ('WithSharedAndHelper.py', 'WithShared.py',
+                                                                           'WithoutImports.py', 'shared.py',
+                                                                           'helper.py')),
+                         watcher.watched_files)
+
+    def test_get_changed_files(self):
+        watcher = self.get_watcher('WithSharedAndHelper.py', 'WithShared.py')
+        watcher.compile_all()
+        self.assertEqual(set(), watcher.get_changed_files())
+
+        self.write_file('helper.py', 'def helper_value() -> int:\n'
+                                     '    return 20\n')
+        self.assertEqual({self.get_path('helper.py')}, watcher.get_changed_files())
+
+        os.remove(self.get_path('shared.py'))
+        self.assertEqual({self.get_path('helper.py'), self.get_path('shared.py')}, watcher.get_changed_files())
+
+    def test_update_without_changes(self):
+        watcher = self.get_watcher('WithSharedAndHelper.py', 'WithShared.py', 'WithoutImports.py')
+        watcher.compile_all()
+
+        self.assertEqual({}, watcher.update())
+
+    def test_update_changed_entry(self):
+        watcher = self.get_watcher('WithSharedAndHelper.py', 'WithShared.py', 'WithoutImports.py')
+        watcher.compile_all()
+
+        self.write_file('WithoutImports.py', 'from boa3.builtin.compile_time import public\n'
+                                             '\n'
+                                             '\n'
+                                             '@public\n'
+                                             'def Main() -> int:\n'
+                                             '    return 30\n')
+        self.assertEqual({self.get_path('WithoutImports.py'): None}, watcher.update())
+        # the state of the changed file is saved when it's compiled
+        self.assertEqual({}, watcher.update())
+
+    def test_update_changed_imported_module(self):
+        watcher = self.get_watcher('WithSharedAndHelper.py', 'WithShared.py', 'WithoutImports.py')
+        watcher.compile_all()
+        with open(self.get_path('WithShared.nef'), 'rb') as nef_file:
+            with_shared_nef = nef_file.read()
+
+        self.write_file('helper.py', 'def helper_value() -> int:\n'
+                                     '    return 20\n')
+        with patch.object(Analyser, 'analyse', wraps=Analyser.analyse) as analyse:
+            results = watcher.update()
+
+        # only the entry that imports the changed module is compiled again
+        self.assertEqual({self.get_path('WithSharedAndHelper.py'): None}, results)
+        with open(self.get_path('WithShared.nef'), 'rb') as nef_file:
+            self.assertEqual(with_shared_nef, nef_file.read())
+
+        # the module that wasn't changed isn't analysed again
+        analysed_files = [os.path.realpath(call.args[0]) for call in analyse.call_args_list]
+        self.assertIn(self.get_path('helper.py'), analysed_files)
+        self.assertNotIn(self.get_path('shared.py'), analysed_files)
+
+        self.write_file('shared.py', 'def shared_value() -> int:\n'
+                                     '    return 10\n')
+        results = watcher.update()
+        self.assertEqual({self.get_path('WithSharedAndHelper.py'): None,
+                          self.get_path('WithShared.py'): None},
+                         results)
+
+    def test_update_new_imported_module(self):
+        watcher = self.get_watcher('WithoutImports.py')
+        watcher.compile_all()
+        self.assertEqual([self.get_path('WithoutImports.py')], watcher.watched_files)
+
+        self.write_file('WithoutImports.py', 'from boa3.builtin.compile_time import public\n'
+                                             'from shared import shared_value\n'
+                                             '\n'
+                                             '\n'
+                                             '@public\n'
+                                             'def Main() -> int:\n'
+                                             '    return shared_value()\n')
+        self.assertEqual({self.get_path('WithoutImports.py'): None}, watcher.update())
+        self.assertEqual(sorted([self.get_path('WithoutImports.py'), self.get_path('shared.py')]),
+                         watcher.watched_files)
+
+        self.write_file('shared.py', 'def shared_value() -> int:\n'
+                                     '    return 10\n')
+        self.assertEqual({self.get_path('WithoutImports.py'): None}, watcher.update())
+
+    def test_update_failed_compilation(self):
+        watcher = self.get_watcher('WithShared.py')
+        watcher.compile_all()
+        watched_files = watcher.watched_files
+
+        self.write_file('shared.py', 'def shared_value() -> int:\n'
+                                     '    return 1 +\n')
+        results = watcher.update()
+        self.assertIsInstance(results[self.get_path('WithShared.py')], Exception)
+        # the files of the last successful analysis are still watched, so fixing the module compiles the entry again
+        self.assertEqual(watched_files, watcher.watched_files)
+        self.assertEqual({}, watcher.update())
+
+        self.write_file('shared.py', 'def shared_value() -> int:\n'
+                                     '    return 100\n')
+        self.assertEqual({self.get_path('WithShared.py'): None}, watcher.update())
+
+    def test_boa3_watch(self):
+        compiled = []
+        sleep_calls = []
+
+        def on_compile(path, error):
+            compiled.append((path, error))
+
+        def sleep(poll_interval):
+            sleep_calls.append(poll_interval)
+            if len(sleep_calls) == 1:
+                self.write_file('shared.py', 'def shared_value() -> int:\n'
+                                             '    return 10\n')
+            elif len(sleep_calls) > 2:
+                raise StopWatching
+
+        paths = [self.get_path('WithSharedAndHelper.py'), self.get_path('WithShared.py'),
+                 self.get_path('WithoutImports.py')]
+        with patch('boa3.internal.compiler.compilationwatcher.time.sleep', side_effect=sleep):
+            with self.assertRaises(StopWatching):
+                Boa3.watch(paths, root_folder=self.project_dir, show_errors=False,
+                           poll_interval=0.5, on_compile=on_compile)
+
+        self.assertEqual([0.5, 0.5, 0.5], sleep_calls)
+        self.assertEqual([(path, None) for path in paths]
+                         + [(self.get_path('WithSharedAndHelper.py'), None), (self.get_path('WithShared.py'), None)],
+                         compiled)
+        self.assertTrue(os.path.isfile(self.get_path('WithoutImports.nef')))
+
+    def test_boa3_watch_invalid_path(self):
+        with self.assertRaises(InvalidPathException):
+            Boa3.watch(self.get_path('shared.txt'))
+
+        with self.assertRaises(InvalidPathException):
+            Boa3.watch([self.get_path('WithShared.py'), self.get_path('WithoutImports.py')],
+                       output_path=self.get_path('Output.nef'))
@@ -338,9 +338,7 @@ class TestDict(BoaTest):
             + Opcode.STLOC0
             + Opcode.LDLOC0  # b = a.keys()
             + Opcode.KEYS
-            + Opcode.STLOC1
-            + Opcode.LDLOC1  # return b
-            + Opcode.RET
+            + Opcode.RET     # return b
         )
 
         path = self.get_contract_path('KeysDict.py')
@@ -393,9 +391,7 @@ class TestDict(BoaTest):
             + Opcode.STLOC0
             + Opcode.LDLOC0  # b = a.keys()
             + Opcode.KEYS
-            + Opcode.STLOC1
-            + Opcode.LDLOC1  # return b
-            + Opcode.RET
+            + Opcode.RET     # return b
         )
 
         path = self.get_contract_path('MismatchedTypeKeysDict.py')
@@ -448,9 +444,7 @@ class TestDict(BoaTest):
             + Opcode.STLOC0
             + Opcode.LDLOC0  # b = a.values()
             + Opcode.VALUES
-            + Opcode.STLOC1
-            + Opcode.LDLOC1  # return b
-            + Opcode.RET
+            + Opcode.RET     # return b
         )
 
         path = self.get_contract_path('ValuesDict.py')
@@ -503,9 +497,7 @@ class TestDict(BoaTest):
             + Opcode.STLOC0
             + Opcode.LDLOC0  # b = a.values()
             + Opcode.VALUES
-            + Opcode.STLOC1
-            + Opcode.LDLOC1  # return b
-            + Opcode.RET
+            + Opcode.RET     # return b
         )
 
         path = self.get_contract_path('MismatchedTypeValuesDict.py')
@@ -315,9 +315,7 @@ class TestFor(BoaTest):
             + Opcode.LDLOC0     # a = a + 1
             + Opcode.PUSH1
             + Opcode.ADD
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # return a
-            + Opcode.RET
+            + Opcode.RET        # return a
         )
 
         path = self.get_contract_path('ForElse.py')
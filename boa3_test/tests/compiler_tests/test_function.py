@@ -362,7 +362,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('CallReturnFunctionWithoutArgs.py')
-        output = self.compile(path)
+        output = self.compile(path, optimize=False)
         self.assertEqual(expected_output, output)
 
         path, _ = self.get_deploy_file_paths(path)
@@ -380,6 +380,17 @@ class TestFunction(BoaTest):
         for x in range(len(invokes)):
             self.assertEqual(expected_results[x], invokes[x].result)
 
+    def test_call_function_without_args_code_optimization(self):
+        expected_output = (
+            Opcode.PUSH1  # return a, the call is evaluated and the unused variable is removed
+            + Opcode.RET
+            # TestFunction isn't called anymore, so it's not generated
+        )
+
+        path = self.get_contract_path('CallReturnFunctionWithoutArgs.py')
+        output = self.compile(path)
+        self.assertEqual(expected_output, output)
+
     def test_call_void_function_with_literal_args(self):
         called_function_address = Integer(4).to_byte_array(min_length=1, signed=True)
 
@@ -401,7 +412,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('CallVoidFunctionWithLiteralArgs.py')
-        output = self.compile(path)
+        output = self.compile(path, optimize=False)
         self.assertEqual(expected_output, output)
 
         path, _ = self.get_deploy_file_paths(path)
@@ -443,7 +454,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('CallReturnFunctionWithLiteralArgs.py')
-        output = self.compile(path)
+        output = self.compile(path, optimize=False)
         self.assertEqual(expected_output, output)
 
         path, _ = self.get_deploy_file_paths(path)
@@ -461,6 +472,77 @@ class TestFunction(BoaTest):
         for x in range(len(invokes)):
             self.assertEqual(expected_results[x], invokes[x].result)
 
+    def test_call_void_function_with_literal_args_code_optimization(self):
+        called_function_address = Integer(4).to_byte_array(min_length=1, signed=True)
+
+        expected_output = (
+            Opcode.CALL  # TestAdd(1, 2), the arguments are the same in every call, so they're propagated to TestAdd
+            + called_function_address
+            + Opcode.PUSHT  # return True
+            + Opcode.RET
+            + Opcode.NOP  # TestAdd, c = a + b is removed because c is never used
+            + Opcode.RET  # return
+        )
+
+        path = self.get_contract_path('CallVoidFunctionWithLiteralArgs.py')
+        output = self.compile(path)
+        self.assertEqual(expected_output, output)
+
+    def test_call_function_with_literal_args_code_optimization(self):
+        expected_output = (
+            Opcode.PUSH3  # return a, the call is evaluated and the unused variable is removed
+            + Opcode.RET
+            # TestAdd isn't called anymore, so it's not generated
+        )
+
+        path = self.get_contract_path('CallReturnFunctionWithLiteralArgs.py')
+        output = self.compile(path)
+        self.assertEqual(expected_output, output)
+
+    def test_call_function_with_some_literal_args_code_optimization(self):
+        first_call_address = Integer(7).to_byte_array(min_length=1, signed=True)
+        second_call_address = Integer(4).to_byte_array(min_length=1, signed=True)
+
+        expected_output = (
+            Opcode.INITSLOT  # Main
+            + b'\x00'
+            + b'\x02'
+            + Opcode.LDARG0  # TestAdd(10, x), a is 10 in every call, so it isn't pushed
+            + Opcode.CALL
+            + first_call_address
+            + Opcode.LDARG1  # TestAdd(10, y)
+            + Opcode.CALL
+            + second_call_address
+            + Opcode.ADD
+            + Opcode.RET
+            + Opcode.INITSLOT  # TestAdd, only b is an argument
+            + b'\x00'
+            + b'\x01'
+            + Opcode.PUSHINT8 + Integer(20).to_byte_array()  # return c + b, c is replaced by a * 2
+            + Opcode.LDARG0
+            + Opcode.ADD
+            + Opcode.RET
+        )
+
+        path = self.get_contract_path('CallFunctionWithSomeLiteralArgs.py')
+        output = self.compile(path)
+        self.assertEqual(expected_output, output)
+
+        path, _ = self.get_deploy_file_paths(path)
+        runner = BoaTestRunner(runner_id=self.method_name())
+
+        invokes = []
+        expected_results = []
+
+        invokes.append(runner.call_contract(path, 'Main', 1, 2))
+        expected_results.append(43)
+
+        runner.execute()
+        self.assertEqual(VMState.HALT, runner.vm_state, msg=runner.error)
+
+        for x in range(len(invokes)):
+            self.assertEqual(expected_results[x], invokes[x].result)
+
     def test_call_void_function_with_variable_args(self):
         called_function_address = Integer(4).to_byte_array(min_length=1, signed=True)
 
@@ -489,7 +571,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('CallVoidFunctionWithVariableArgs.py')
-        output = self.compile(path)
+        output = self.compile(path, optimize=False)
         self.assertEqual(expected_output, output)
 
         path, _ = self.get_deploy_file_paths(path)
@@ -535,7 +617,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('CallReturnFunctionWithVariableArgs.py')
-        output = self.compile(path)
+        output = self.compile(path, optimize=False)
         self.assertEqual(expected_output, output)
 
         path, _ = self.get_deploy_file_paths(path)
@@ -579,7 +661,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('CallReturnFunctionOnReturn.py')
-        output = self.compile(path)
+        output = self.compile(path, optimize=False)
         self.assertEqual(expected_output, output)
 
         path, _ = self.get_deploy_file_paths(path)
@@ -635,7 +717,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('CallFunctionWithoutVariables.py')
-        output = self.compile(path)
+        output = self.compile(path, optimize=False)
         self.assertEqual(expected_output, output)
 
         path, _ = self.get_deploy_file_paths(path)
@@ -678,7 +760,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('CallFunctionWrittenBefore.py')
-        output = self.compile(path)
+        output = self.compile(path, optimize=False)
         self.assertEqual(expected_output, output)
 
         path, _ = self.get_deploy_file_paths(path)
@@ -841,7 +923,7 @@ class TestFunction(BoaTest):
             + Opcode.LDARG0  # for_sequence = arg0
             + Opcode.PUSH0  # for_index = 0
             + Opcode.JMP  # begin for
-            + Integer(19).to_byte_array(min_length=1, signed=True)
+            + Integer(18).to_byte_array(min_length=1, signed=True)
             + Opcode.OVER  # value = for_sequence[for_index]
             + Opcode.OVER
             + Opcode.DUP
@@ -858,14 +940,13 @@ class TestFunction(BoaTest):
             + Opcode.DROP
             + Opcode.LDLOC0  # return value
             + Opcode.RET
-            + Opcode.INC  # for_index = for_index + 1
             + Opcode.DUP  # if for_index < len(for_sequence)
             + Opcode.PUSH2
             + Opcode.PICK
             + Opcode.SIZE
             + Opcode.LT
             + Opcode.JMPIF
-            + Integer(-22).to_byte_array(min_length=1, signed=True)
+            + Integer(-21).to_byte_array(min_length=1, signed=True)
             + Opcode.DROP
             + Opcode.DROP
             + Opcode.PUSH5  # else
@@ -977,18 +1058,16 @@ class TestFunction(BoaTest):
             + Opcode.LDARG0  # x = arg0
             + Opcode.STLOC0
             + Opcode.JMP  # begin while
-            + Integer(8).to_byte_array(min_length=1, signed=True)
+            + Integer(6).to_byte_array(min_length=1, signed=True)
             + Opcode.LDLOC0  # x += 1
             + Opcode.PUSH1
             + Opcode.ADD
-            + Opcode.STLOC0
-            + Opcode.LDLOC0  # return x
-            + Opcode.RET
+            + Opcode.RET  # return x
             + Opcode.LDLOC0
             + Opcode.PUSH10
             + Opcode.LT
             + Opcode.JMPIF  # end while x < 10
-            + Integer(-9).to_byte_array(min_length=1, signed=True)
+            + Integer(-7).to_byte_array(min_length=1, signed=True)
             + Opcode.LDLOC0  # else
             + Opcode.RET  # return x
             + Opcode.RET
@@ -1159,7 +1238,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('FunctionWithDefaultArgument.py')
-        output = self.compile(path)
+        output = self.compile(path, optimize=False)
         self.assertEqual(expected_output, output)
 
         path, _ = self.get_deploy_file_paths(path)
@@ -1177,6 +1256,20 @@ class TestFunction(BoaTest):
         for x in range(len(invokes)):
             self.assertEqual(expected_results[x], invokes[x].result)
 
+    def test_function_with_default_argument_code_optimization(self):
+        expected_output = (
+            Opcode.PUSH11  # return x, y, the calls are evaluated and the unused variables are removed
+            + Opcode.PUSH6
+            + Opcode.PUSH2
+            + Opcode.PACK
+            + Opcode.RET
+            # add isn't called anymore, so it's not generated
+        )
+
+        path = self.get_contract_path('FunctionWithDefaultArgument.py')
+        output = self.compile(path)
+        self.assertEqual(expected_output, output)
+
     def test_function_with_only_default_arguments(self):
         expected_output = (
             Opcode.PUSH0  # defaults
@@ -1213,7 +1306,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('FunctionWithOnlyDefaultArguments.py')
-        output = self.compile(path)
+        output = self.compile(path, optimize=False)
         self.assertEqual(expected_output, output)
 
         path, _ = self.get_deploy_file_paths(path)
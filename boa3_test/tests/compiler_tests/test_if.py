@@ -27,7 +27,7 @@ class TestIf(BoaTest):
         )
 
         path = self.get_contract_path('ConstantCondition.py')
-        output = self.compile(path)
+        output = self.compile(path, optimize=False)
         self.assertEqual(expected_output, output)
 
         path, _ = self.get_deploy_file_paths(path)
@@ -45,6 +45,16 @@ class TestIf(BoaTest):
         for x in range(len(invokes)):
             self.assertEqual(expected_results[x], invokes[x].result)
 
+    def test_if_constant_condition_code_optimization(self):
+        expected_output = (
+            Opcode.PUSH2        # return a, only the if branch is kept and the unused variable is removed
+            + Opcode.RET
+        )
+
+        path = self.get_contract_path('ConstantCondition.py')
+        output = self.compile(path)
+        self.assertEqual(expected_output, output)
+
     def test_if_variable_condition(self):
         expected_output = (
             Opcode.INITSLOT
@@ -374,9 +384,7 @@ class TestIf(BoaTest):
             + Opcode.JMP        # else
             + Integer(3).to_byte_array(min_length=1, signed=True)
             + Opcode.PUSH3      # 3
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # return a
-            + Opcode.RET
+            + Opcode.RET        # return a
         )
 
         path = self.get_contract_path('IfExpVariableCondition.py')
@@ -417,9 +425,7 @@ class TestIf(BoaTest):
             + Opcode.JMP        # else
             + Integer(3).to_byte_array(min_length=1, signed=True)
             + Opcode.PUSHNULL   # None
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # return a
-            + Opcode.RET
+            + Opcode.RET        # return a
         )
 
         path = self.get_contract_path('MismatchedIfExp.py')
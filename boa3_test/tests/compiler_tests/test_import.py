@@ -1,5 +1,11 @@
+import os
+import tempfile
+from unittest.mock import patch
+
 from boa3_test.tests.boa_test import BoaTest  # needs to be the first import to avoid circular imports
 
+from boa3.internal.analyser.analyser import Analyser
+from boa3.internal.analyser.moduleanalysiscache import ModuleAnalysisCache
 from boa3.internal.exception import CompilerError
 from boa3.internal.neo.vm.opcode.Opcode import Opcode
 from boa3.internal.neo.vm.type.Integer import Integer
@@ -241,9 +247,7 @@ class TestImport(BoaTest):
             + b'\x01'
             + b'\x00'
             + Opcode.CALL
-            + Integer(7).to_byte_array(min_length=1, signed=True)
-            + Opcode.STLOC0
-            + Opcode.LDLOC0
+            + Integer(5).to_byte_array(min_length=1, signed=True)
             + Opcode.RET
             + Opcode.LDSFLD0  # return empty_list
             + Opcode.RET
@@ -283,9 +287,7 @@ class TestImport(BoaTest):
             + b'\x01'
             + b'\x00'
             + Opcode.CALL
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.STLOC0
-            + Opcode.LDLOC0
+            + Integer(3).to_byte_array(min_length=1, signed=True)
             + Opcode.RET
             + Opcode.NEWARRAY0  # imported function
             + Opcode.RET  # return
@@ -320,9 +322,7 @@ class TestImport(BoaTest):
             + b'\x01'
             + b'\x00'
             + Opcode.CALL
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.STLOC0
-            + Opcode.LDLOC0
+            + Integer(3).to_byte_array(min_length=1, signed=True)
             + Opcode.RET
             + Opcode.NEWARRAY0  # imported function
             + Opcode.RET  # return
@@ -593,3 +593,50 @@ class TestImport(BoaTest):
     def test_import_boa_invalid_package(self):
         path = self.get_contract_path('ImportBoaInvalidPackage.py')
         self.assertCompilerLogs(CompilerError.UnresolvedReference, path)
+
+    def test_import_user_module_analysis_cache(self):
+        path = self.get_contract_path('FromImportUserModule.py')
+        analysis_cache = ModuleAnalysisCache.instance()
+        expected_output = self.compile(path)
+
+        hits, misses = analysis_cache.hits, analysis_cache.misses
+        with patch.object(Analyser, 'analyse', wraps=Analyser.analyse) as analyse:
+            output = self.compile(path)
+
+        self.assertEqual(expected_output, output)
+        # only the compiled file is analysed, the imported module is copied from the cache
+        self.assertEqual(1, analyse.call_count)
+        self.assertEqual(path, analyse.call_args.args[0])
+        self.assertEqual(misses, analysis_cache.misses)
+        self.assertGreater(analysis_cache.hits, hits)
+
+    def test_import_user_module_analysis_cache_changed_module(self):
+        with tempfile.TemporaryDirectory() as project_dir:
+            path = os.path.join(project_dir, 'Main.py')
+            module_path = os.path.join(project_dir, 'imported_module.py')
+            with open(path, 'w') as contract_file:
+                contract_file.write('from boa3.builtin.compile_time import public\n'
+                                    'from imported_module import value\n'
+                                    '\n'
+                                    '\n'
+                                    '@public\n'
+                                    'def Main() -> int:\n'
+                                    '    return value()\n')
+            with open(module_path, 'w') as module_file:
+                module_file.write('def value() -> int:\n'
+                                  '    return 1\n')
+
+            analysis_cache = ModuleAnalysisCache.instance()
+            output = self.compile(path, root_folder=project_dir)
+            self.assertEqual(output, self.compile(path, root_folder=project_dir))
+
+            with open(module_path, 'w') as module_file:
+                module_file.write('def value() -> int:\n'
+                                  '    return 2\n')
+
+            misses = analysis_cache.misses
+            changed_output = self.compile(path, root_folder=project_dir)
+            # the changed module is analysed again
+            self.assertEqual(misses + 1, analysis_cache.misses)
+            self.assertNotEqual(output, changed_output)
+            self.assertIn(Opcode.PUSH2, changed_output)
@@ -377,8 +377,6 @@ class TestContractInterop(BoaTest):
             Opcode.INITSLOT
             + b'\x01\x01'
             + Opcode.LDARG0
-            + Opcode.STLOC0
-            + Opcode.LDLOC0
             + Opcode.RET
         )
 
@@ -419,8 +417,6 @@ class TestContractInterop(BoaTest):
             Opcode.INITSLOT
             + b'\x01\x01'
             + Opcode.LDARG0
-            + Opcode.STLOC0
-            + Opcode.LDLOC0
             + Opcode.RET
         )
 
@@ -565,8 +561,7 @@ class TestContractInterop(BoaTest):
             + Opcode.LDARG0
             + Opcode.DUP
             + Opcode.ISNULL
-            + Opcode.NOT
-            + Opcode.JMPIFNOT
+            + Opcode.JMPIF
             + Integer(11).to_byte_array(min_length=1)
             + Opcode.CONVERT
             + StackItemType.ByteString
@@ -4,7 +4,6 @@ from boa3_test.tests.boa_test import BoaTest  # needs to be the first import to
 
 from boa3.internal.exception import CompilerError
 from boa3.internal.model.builtin.interop.interop import Interop
-from boa3.internal.model.type.type import Type
 from boa3.internal.neo.vm.opcode.Opcode import Opcode
 from boa3.internal.neo.vm.type.Integer import Integer
 from boa3.internal.neo.vm.type.String import String
@@ -19,10 +18,8 @@ class TestCryptoInterop(BoaTest):
     ecpoint_init = (
         Opcode.DUP
         + Opcode.ISNULL
-        + Opcode.NOT
-        + Opcode.JMPIFNOT
-        + Integer(11).to_byte_array(min_length=1)
-        + Opcode.CONVERT + Type.bytes.stack_item
+        + Opcode.JMPIF
+        + Integer(9).to_byte_array(min_length=1)
         + Opcode.DUP
         + Opcode.SIZE
         + Opcode.PUSHINT8 + Integer(33).to_byte_array(signed=True)
@@ -484,8 +484,6 @@ class TestRuntimeInterop(BoaTest):
             Opcode.INITSLOT
             + b'\x01\x01'
             + Opcode.LDARG0
-            + Opcode.STLOC0
-            + Opcode.LDLOC0
             + Opcode.RET
         )
 
@@ -519,8 +517,6 @@ class TestRuntimeInterop(BoaTest):
             Opcode.INITSLOT
             + b'\x01\x01'
             + Opcode.LDARG0
-            + Opcode.STLOC0
-            + Opcode.LDLOC0
             + Opcode.RET
         )
 
@@ -583,8 +579,6 @@ class TestRuntimeInterop(BoaTest):
             Opcode.INITSLOT
             + b'\x01\x01'
             + Opcode.LDARG0
-            + Opcode.STLOC0
-            + Opcode.LDLOC0
             + Opcode.RET
         )
 
@@ -616,8 +610,6 @@ class TestRuntimeInterop(BoaTest):
             Opcode.INITSLOT
             + b'\x01\x01'
             + Opcode.LDARG0
-            + Opcode.STLOC0
-            + Opcode.LDLOC0
             + Opcode.RET
         )
 
@@ -649,8 +641,6 @@ class TestRuntimeInterop(BoaTest):
             Opcode.INITSLOT
             + b'\x01\x01'
             + Opcode.LDARG0
-            + Opcode.STLOC0
-            + Opcode.LDLOC0
             + Opcode.RET
         )
 
@@ -723,8 +713,6 @@ class TestRuntimeInterop(BoaTest):
             Opcode.INITSLOT
             + b'\x01\x01'
             + Opcode.LDARG0
-            + Opcode.STLOC0
-            + Opcode.LDLOC0
             + Opcode.RET
         )
 
@@ -763,8 +751,6 @@ class TestRuntimeInterop(BoaTest):
             Opcode.INITSLOT
             + b'\x01\x01'
             + Opcode.LDARG0
-            + Opcode.STLOC0
-            + Opcode.LDLOC0
             + Opcode.RET
         )
 
@@ -22,9 +22,7 @@ class TestList(BoaTest):
             + Opcode.PUSH1
             + Opcode.PUSH3      # array length
             + Opcode.PACK
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # return a
-            + Opcode.RET
+            + Opcode.RET        # return a
         )
 
         path = self.get_contract_path('IntList.py')
@@ -1427,9 +1425,7 @@ class TestList(BoaTest):
             + Opcode.REVERSE3
             + Opcode.SWAP
             + Opcode.REMOVE
-            + Opcode.STLOC1
-            + Opcode.LDLOC1     # return b
-            + Opcode.RET
+            + Opcode.RET        # return b
         )
         path = self.get_contract_path('PopList.py')
         output = self.compile(path)
@@ -1523,9 +1519,7 @@ class TestList(BoaTest):
             + Opcode.REVERSE3
             + Opcode.SWAP
             + Opcode.REMOVE
-            + Opcode.STLOC1
-            + Opcode.LDLOC1     # return b
-            + Opcode.RET
+            + Opcode.RET        # return b
         )
         path = self.get_contract_path('PopListLiteralArgument.py')
         output = self.compile(path)
@@ -1571,9 +1565,7 @@ class TestList(BoaTest):
             + Opcode.REVERSE3
             + Opcode.SWAP
             + Opcode.REMOVE
-            + Opcode.STLOC1
-            + Opcode.LDLOC1     # return b
-            + Opcode.RET
+            + Opcode.RET        # return b
         )
         path = self.get_contract_path('PopListLiteralNegativeArgument.py')
         output = self.compile(path)
@@ -1618,9 +1610,7 @@ class TestList(BoaTest):
             + Opcode.REVERSE3
             + Opcode.SWAP
             + Opcode.REMOVE
-            + Opcode.STLOC1
-            + Opcode.LDLOC1     # return b
-            + Opcode.RET
+            + Opcode.RET        # return b
         )
         path = self.get_contract_path('PopListVariableArgument.py')
         output = self.compile(path)
@@ -1702,9 +1692,7 @@ class TestList(BoaTest):
             + Opcode.REVERSE3
             + Opcode.SWAP
             + Opcode.REMOVE
-            + Opcode.STLOC1
-            + Opcode.LDLOC1     # return b
-            + Opcode.RET
+            + Opcode.RET        # return b
         )
         path = self.get_contract_path('PopListMismatchedTypeResult.py')
         output = self.assertCompilerLogs(CompilerWarning.TypeCasting, path)
@@ -0,0 +1,286 @@
+from typing import List
+
+from boa3_test.tests.boa_test import BoaTest  # needs to be the first import to avoid circular imports
+
+from boa3.internal.compiler.codegenerator.codeblockgraph import CodeBlockGraph
+from boa3.internal.compiler.codegenerator.methodinliner import MethodInliner
+from boa3.internal.model.method import Method
+from boa3.internal.neo.vm.CallCode import CallCode
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+from boa3.internal.neo.vm.type.Integer import Integer
+from boa3.internal.neo3.vm import VMState
+from boa3_test.tests.test_drive.testrunner.boa_test_runner import BoaTestRunner
+
+
+class TestMethodInliner(BoaTest):
+    default_folder: str = 'test_sc/function_test'
+
+    def get_method(self, codes: List[VMCode], is_public: bool = False) -> Method:
+        method = Method(is_public=is_public)
+        method.init_bytecode = codes[0]
+        method.end_bytecode = codes[-1]
+        return method
+
+    def get_caller_codes(self, callee: Method) -> List[VMCode]:
+        # the first instruction of a method isn't inlined, because it's the target of the calls to the method
+        return [VMCode(OpcodeInfo.PUSH1), CallCode(callee), VMCode(OpcodeInfo.RET)]
+
+    def test_inline_function_with_args(self):
+        expected_output = (
+            Opcode.INITSLOT  # Main
+            + b'\x02'
+            + b'\x02'
+            + Opcode.LDARG1  # return TestAdd(a, b), the call is inlined
+            + Opcode.LDARG0
+            + Opcode.STLOC0
+            + Opcode.STLOC1
+            + Opcode.LDLOC0  # return a + b
+            + Opcode.LDLOC1
+            + Opcode.ADD
+            + Opcode.RET
+        )
+
+        path = self.get_contract_path('InlineFunctionWithArgs.py')
+        output = self.compile(path)
+        self.assertEqual(expected_output, output)
+
+        path, _ = self.get_deploy_file_paths(path)
+        runner = BoaTestRunner(runner_id=self.method_name())
+
+        invokes = []
+        expected_results = []
+
+        invokes.append(runner.call_contract(path, 'Main', 1, 2))
+        expected_results.append(3)
+        invokes.append(runner.call_contract(path, 'Main', 10, -4))
+        expected_results.append(6)
+
+        runner.execute()
+        self.assertEqual(VMState.HALT, runner.vm_state, msg=runner.error)
+
+        for x in range(len(invokes)):
+            self.assertEqual(expected_results[x], invokes[x].result)
+
+    def test_inline_function_called_twice(self):
+        call_address = Integer(8).to_byte_array(min_length=1, signed=True)
+        second_call_address = Integer(4).to_byte_array(min_length=1, signed=True)
+
+        expected_output = (
+            Opcode.INITSLOT  # Main
+            + b'\x00'
+            + b'\x02'
+            + Opcode.LDARG1  # return TestAdd(a, b) * TestAdd(b, 1)
+            + Opcode.LDARG0
+            + Opcode.CALL  # the inlined calls would be bigger than the calls, so none is inlined
+            + call_address
+            + Opcode.PUSH1
+            + Opcode.LDARG1
+            + Opcode.CALL
+            + second_call_address
+            + Opcode.MUL
+            + Opcode.RET
+            + Opcode.INITSLOT  # TestAdd
+            + b'\x00'
+            + b'\x02'
+            + Opcode.LDARG0
+            + Opcode.LDARG1
+            + Opcode.ADD
+            + Opcode.RET
+        )
+
+        path = self.get_contract_path('InlineFunctionCalledTwice.py')
+        output = self.compile(path)
+        self.assertEqual(expected_output, output)
+
+        path, _ = self.get_deploy_file_paths(path)
+        runner = BoaTestRunner(runner_id=self.method_name())
+
+        invokes = []
+        expected_results = []
+
+        invokes.append(runner.call_contract(path, 'Main', 1, 2))
+        expected_results.append(9)
+
+        runner.execute()
+        self.assertEqual(VMState.HALT, runner.vm_state, msg=runner.error)
+
+        for x in range(len(invokes)):
+            self.assertEqual(expected_results[x], invokes[x].result)
+
+    def test_inline_public_function(self):
+        call_address = Integer(3).to_byte_array(min_length=1, signed=True)
+
+        expected_output = (
+            Opcode.INITSLOT  # Main
+            + b'\x00'
+            + b'\x02'
+            + Opcode.LDARG1  # return TestAdd(a, b)
+            + Opcode.LDARG0
+            + Opcode.CALL  # public methods aren't removed, so the inlined call would make the bytecode bigger
+            + call_address
+            + Opcode.RET
+            + Opcode.INITSLOT  # TestAdd
+            + b'\x00'
+            + b'\x02'
+            + Opcode.LDARG0
+            + Opcode.LDARG1
+            + Opcode.ADD
+            + Opcode.RET
+        )
+
+        path = self.get_contract_path('InlinePublicFunction.py')
+        output = self.compile(path)
+        self.assertEqual(expected_output, output)
+
+        path, _ = self.get_deploy_file_paths(path)
+        runner = BoaTestRunner(runner_id=self.method_name())
+
+        invokes = []
+        expected_results = []
+
+        invokes.append(runner.call_contract(path, 'Main', 1, 2))
+        expected_results.append(3)
+        invokes.append(runner.call_contract(path, 'TestAdd', 1, 2))
+        expected_results.append(3)
+
+        runner.execute()
+        self.assertEqual(VMState.HALT, runner.vm_state, msg=runner.error)
+
+        for x in range(len(invokes)):
+            self.assertEqual(expected_results[x], invokes[x].result)
+
+    def test_inline_function_bigger_than_max_size(self):
+        path = self.get_contract_path('InlineFunctionBiggerThanMaxSize.py')
+        output = self.compile(path)
+
+        # Polynomial is called only once, but its body is bigger than the max size
+        self.assertEqual(Opcode.CALL, output[5:6])
+        self.assertEqual(2, output.count(Opcode.INITSLOT))
+
+        path, _ = self.get_deploy_file_paths(path)
+        runner = BoaTestRunner(runner_id=self.method_name())
+
+        invokes = []
+        expected_results = []
+
+        invokes.append(runner.call_contract(path, 'Main', 1, 2))
+        expected_results.append(15)
+
+        runner.execute()
+        self.assertEqual(VMState.HALT, runner.vm_state, msg=runner.error)
+
+        for x in range(len(invokes)):
+            self.assertEqual(expected_results[x], invokes[x].result)
+
+    def test_inline_function_with_locals(self):
+        call_address = Integer(3).to_byte_array(min_length=1, signed=True)
+
+        expected_output = (
+            Opcode.INITSLOT  # Main
+            + b'\x00'
+            + b'\x02'
+            + Opcode.LDARG1  # return TestAdd(a, b)
+            + Opcode.LDARG0
+            + Opcode.CALL  # the local variables are cleared in each call, so TestAdd isn't inlined
+            + call_address
+            + Opcode.RET
+            + Opcode.INITSLOT  # TestAdd
+            + b'\x01'
+            + b'\x02'
+            + Opcode.LDARG0  # c = a + b
+            + Opcode.LDARG1
+            + Opcode.ADD
+            + Opcode.STLOC0
+            + Opcode.LDLOC0  # return c * c
+            + Opcode.LDLOC0
+            + Opcode.MUL
+            + Opcode.RET
+        )
+
+        path = self.get_contract_path('InlineFunctionWithLocals.py')
+        output = self.compile(path)
+        self.assertEqual(expected_output, output)
+
+        path, _ = self.get_deploy_file_paths(path)
+        runner = BoaTestRunner(runner_id=self.method_name())
+
+        invokes = []
+        expected_results = []
+
+        invokes.append(runner.call_contract(path, 'Main', 1, 2))
+        expected_results.append(9)
+
+        runner.execute()
+        self.assertEqual(VMState.HALT, runner.vm_state, msg=runner.error)
+
+        for x in range(len(invokes)):
+            self.assertEqual(expected_results[x], invokes[x].result)
+
+    def test_inline_function_with_try(self):
+        path = self.get_contract_path('InlineFunctionWithTry.py')
+        output = self.compile(path)
+
+        # the try is relative to the method's context, so Divide isn't inlined
+        self.assertEqual(Opcode.CALL, output[5:6])
+        self.assertEqual(2, output.count(Opcode.INITSLOT))
+
+        path, _ = self.get_deploy_file_paths(path)
+        runner = BoaTestRunner(runner_id=self.method_name())
+
+        invokes = []
+        expected_results = []
+
+        invokes.append(runner.call_contract(path, 'Main', 7, 2))
+        expected_results.append(3)
+        invokes.append(runner.call_contract(path, 'Main', 7, 0))
+        expected_results.append(0)
+
+        runner.execute()
+        self.assertEqual(VMState.HALT, runner.vm_state, msg=runner.error)
+
+        for x in range(len(invokes)):
+            self.assertEqual(expected_results[x], invokes[x].result)
+
+    def test_inline_max_size(self):
+        for max_size, is_inlined in ((2, False), (3, True)):
+            callee_codes = [VMCode(OpcodeInfo.NOP), VMCode(OpcodeInfo.NOP), VMCode(OpcodeInfo.PUSH0),
+                            VMCode(OpcodeInfo.RET)]
+            callee = self.get_method(callee_codes)
+            caller_codes = self.get_caller_codes(callee)
+            caller = self.get_method(caller_codes, is_public=True)
+
+            graph = CodeBlockGraph(caller_codes + callee_codes)
+            statistics = MethodInliner(graph, [caller, callee], max_size=max_size).inline()
+
+            if is_inlined:
+                # the copy is bigger than the call, but it's the only call, so the method is removed
+                self.assertEqual([Opcode.PUSH1, Opcode.NOP, Opcode.NOP, Opcode.PUSH0, Opcode.RET],
+                                 [code.opcode for code in graph.codes])
+                self.assertIsNone(callee.init_bytecode)
+                self.assertEqual(1, statistics['inlined calls'])
+                self.assertEqual(1, statistics['removed methods'])
+                # the prices of CALL and RET, multiplied by the default execution fee factor
+                self.assertEqual(512 * 30, statistics['inlined method in method (GAS)'])
+            else:
+                self.assertEqual(caller_codes + callee_codes, graph.codes)
+                self.assertEqual({}, statistics)
+
+    def test_inline_method_with_pusha(self):
+        for opcode_info, is_inlined in ((OpcodeInfo.PUSH0, True), (OpcodeInfo.PUSHA, False)):
+            callee_codes = [VMCode(opcode_info), VMCode(OpcodeInfo.RET)]
+            if opcode_info is OpcodeInfo.PUSHA:
+                callee_codes[0].set_target(callee_codes[1])
+            callee = self.get_method(callee_codes)
+            caller_codes = self.get_caller_codes(callee)
+            caller = self.get_method(caller_codes, is_public=True)
+
+            graph = CodeBlockGraph(caller_codes + callee_codes)
+            MethodInliner(graph, [caller, callee], max_size=16).inline()
+
+            if is_inlined:
+                self.assertEqual([Opcode.PUSH1, Opcode.PUSH0, Opcode.RET], [code.opcode for code in graph.codes])
+            else:
+                # the pointer would still target the code of the method, that is removed once it isn't called
+                self.assertEqual(caller_codes + callee_codes, graph.codes)
@@ -22,9 +22,7 @@ class TestMultipleExpressions(BoaTest):
             + Opcode.LDARG0     # c = a + b
             + Opcode.LDARG1
             + Opcode.ADD
-            + Opcode.STLOC2
-            + Opcode.LDLOC2     # return c
-            + Opcode.RET
+            + Opcode.RET        # return c
         )
 
         path = self.get_contract_path('arithmetic_test', 'MultipleExpressionsInLine.py')
@@ -173,9 +171,7 @@ class TestMultipleExpressions(BoaTest):
             + Opcode.LDLOC0
             + Opcode.SIZE
             + Opcode.ADD
-            + Opcode.STLOC2
-            + Opcode.LDLOC2     # return count
-            + Opcode.RET
+            + Opcode.RET        # return count
         )
 
         path = self.get_contract_path('tuple_test', 'MultipleExpressionsInLine.py')
@@ -225,9 +221,7 @@ class TestMultipleExpressions(BoaTest):
             + Opcode.LDLOC0
             + Opcode.SIZE
             + Opcode.ADD
-            + Opcode.STLOC2
-            + Opcode.LDLOC2     # return count
-            + Opcode.RET
+            + Opcode.RET        # return count
         )
 
         path = self.get_contract_path('list_test', 'MultipleExpressionsInLine.py')
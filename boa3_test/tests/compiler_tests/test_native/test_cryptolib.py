@@ -4,7 +4,6 @@ from boa3_test.tests.boa_test import BoaTest  # needs to be the first import to
 
 from boa3.internal import constants
 from boa3.internal.exception import CompilerError
-from boa3.internal.model.type.type import Type
 from boa3.internal.neo.vm.opcode.Opcode import Opcode
 from boa3.internal.neo.vm.type.Integer import Integer
 from boa3.internal.neo3.contracts.namedcurve import NamedCurve
@@ -17,10 +16,8 @@ class TestCryptoLibClass(BoaTest):
     ecpoint_init = (
         Opcode.DUP
         + Opcode.ISNULL
-        + Opcode.NOT
-        + Opcode.JMPIFNOT
-        + Integer(11).to_byte_array(min_length=1)
-        + Opcode.CONVERT + Type.bytes.stack_item
+        + Opcode.JMPIF
+        + Integer(9).to_byte_array(min_length=1)
         + Opcode.DUP
         + Opcode.SIZE
         + Opcode.PUSHINT8 + Integer(33).to_byte_array(signed=True)
@@ -0,0 +1,198 @@
+from typing import Dict, List
+
+from boa3_test.tests.boa_test import BoaTest  # needs to be the first import to avoid circular imports
+
+from boa3.internal.compiler.codegenerator.engine.executionscript import ExecutionScript
+from boa3.internal.compiler.codegenerator.engine.neoengine import NeoEngine
+from boa3.internal.neo.vm.TryCode import TryCode
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+from boa3.internal.neo.vm.type.StackItem import StackItemType
+from boa3.internal.neo3.vm import VMState
+
+
+class TestNeoEngine(BoaTest):
+
+    def get_addresses(self, codes: List[VMCode]) -> Dict[VMCode, int]:
+        addresses = {}
+        address = 0
+        for code in codes:
+            addresses[code] = address
+            # the jumps have their short size, so the addresses don't depend on their targets
+            address += len(code.info.opcode) + code.info.data_len
+        return addresses
+
+    def get_engine(self, codes: List[VMCode], entry_points: List[VMCode]) -> NeoEngine:
+        addresses = self.get_addresses(codes)
+        engine = NeoEngine()
+        engine.load_script(ExecutionScript({address: code for code, address in addresses.items()}, []),
+                           [addresses[code] for code in entry_points])
+        return engine
+
+    def test_balanced_stack(self):
+        jump = VMCode(OpcodeInfo.JMPIF)
+        codes = [
+            VMCode(OpcodeInfo.PUSHT),
+            jump,
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.RET),
+            VMCode(OpcodeInfo.PUSH2),
+            VMCode(OpcodeInfo.RET),
+        ]
+        jump.set_target(codes[4])
+        addresses = self.get_addresses(codes)
+
+        engine = self.get_engine(codes, [codes[0]])
+        executed = engine.execute(0)
+
+        self.assertEqual(set(addresses.values()), executed)
+        state = engine.get_state(0)
+        self.assertEqual(VMState.HALT, state.vm_state)
+        self.assertTrue(state.is_balanced)
+        self.assertEqual(1, state.return_count)
+        self.assertEqual([], state.errors)
+
+    def test_stack_depth_mismatch(self):
+        jump = VMCode(OpcodeInfo.JMPIF)
+        codes = [
+            VMCode(OpcodeInfo.PUSHT),
+            jump,
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.RET),
+        ]
+        # the return is reached with an empty stack if it jumps and with one item if it doesn't
+        jump.set_target(codes[3])
+        addresses = self.get_addresses(codes)
+
+        engine = self.get_engine(codes, [codes[0]])
+        engine.execute(0)
+
+        state = engine.get_state(0)
+        self.assertEqual(VMState.FAULT, state.vm_state)
+        self.assertFalse(state.is_balanced)
+        self.assertEqual(['stack depth mismatch, 0 and 1 items at address {0}'.format(addresses[codes[3]])],
+                         state.errors)
+        # the depth isn't known after the paths with different depths are joined
+        self.assertIsNone(engine.get_stack(addresses[codes[3]]))
+
+    def test_stack_underflow(self):
+        codes = [
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.ADD),
+            VMCode(OpcodeInfo.RET),
+        ]
+
+        engine = self.get_engine(codes, [codes[0]])
+        engine.execute(0)
+
+        state = engine.get_state(0)
+        self.assertEqual(VMState.FAULT, state.vm_state)
+        self.assertEqual(['stack underflow, 2 items expected but 1 found at address 1'], state.errors)
+
+    def test_code_after_not_returning_call(self):
+        call = VMCode(OpcodeInfo.CALL)
+        codes = [
+            call,
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.RET),
+            VMCode(OpcodeInfo.ABORT),  # the called method never returns
+        ]
+        call.set_target(codes[3])
+        addresses = self.get_addresses(codes)
+
+        engine = self.get_engine(codes, [codes[0]])
+        executed = engine.execute(0)
+
+        self.assertEqual({addresses[codes[0]], addresses[codes[3]]}, executed)
+        self.assertIsNone(engine.get_stack(addresses[codes[1]]))
+        self.assertFalse(engine.get_state(addresses[codes[3]]).returns)
+
+    def test_code_after_returning_call(self):
+        call = VMCode(OpcodeInfo.CALL)
+        codes = [
+            call,
+            VMCode(OpcodeInfo.RET),
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.RET),
+        ]
+        call.set_target(codes[2])
+        addresses = self.get_addresses(codes)
+
+        engine = self.get_engine(codes, [codes[0]])
+        executed = engine.execute(0)
+
+        self.assertEqual(set(addresses.values()), executed)
+        # the item returned by the called method is in the stack after the call
+        self.assertEqual(1, engine.get_state(0).return_count)
+        self.assertEqual(1, len(engine.get_stack(addresses[codes[1]])))
+
+    def test_try_handlers_are_reachable(self):
+        end_try = VMCode(OpcodeInfo.ENDTRY)
+        end_except = VMCode(OpcodeInfo.ENDTRY)
+        codes = [
+            VMCode(OpcodeInfo.NOP),
+            None,  # try
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.DROP),
+            end_try,
+            VMCode(OpcodeInfo.DROP),  # except, drops the exception
+            end_except,
+            VMCode(OpcodeInfo.NOP),  # finally
+            VMCode(OpcodeInfo.ENDFINALLY),
+            VMCode(OpcodeInfo.RET),
+        ]
+        codes[1] = TryCode(codes[5], codes[7])
+        end_try.set_target(codes[9])
+        end_except.set_target(codes[9])
+        addresses = self.get_addresses(codes)
+
+        engine = self.get_engine(codes, [codes[0]])
+        executed = engine.execute(0)
+
+        self.assertEqual(set(addresses.values()), executed)
+        state = engine.get_state(0)
+        self.assertEqual(VMState.HALT, state.vm_state)
+        # the exception is in the stack when the except starts
+        self.assertEqual(1, len(engine.get_stack(addresses[codes[5]])))
+        self.assertEqual(0, len(engine.get_stack(addresses[codes[7]])))
+
+    def test_unknown_stack_after_calla(self):
+        codes = [
+            VMCode(OpcodeInfo.PUSHNULL),
+            VMCode(OpcodeInfo.CALLA),
+            VMCode(OpcodeInfo.DROP),
+            VMCode(OpcodeInfo.RET),
+        ]
+        addresses = self.get_addresses(codes)
+
+        engine = self.get_engine(codes, [codes[0]])
+        executed = engine.execute(0)
+
+        # the called method isn't known, so the stack isn't simulated after it, but the next instructions still run
+        self.assertEqual(set(addresses.values()), executed)
+        self.assertEqual(1, len(engine.get_stack(addresses[codes[1]])))
+        self.assertIsNone(engine.get_stack(addresses[codes[2]]))
+
+        state = engine.get_state(0)
+        self.assertEqual(VMState.HALT, state.vm_state)
+        self.assertTrue(state.is_balanced)
+        self.assertIsNone(state.return_count)
+
+    def test_unknown_stack_after_unknown_opcode(self):
+        codes = [
+            VMCode(OpcodeInfo.NEWARRAY0),
+            VMCode(OpcodeInfo.UNPACK),  # the number of items in the array isn't known
+            VMCode(OpcodeInfo.DROP),
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.CONVERT, StackItemType.Integer),
+            VMCode(OpcodeInfo.RET),
+        ]
+        addresses = self.get_addresses(codes)
+
+        engine = self.get_engine(codes, [codes[0]])
+        engine.execute(0)
+
+        self.assertEqual(StackItemType.Array, engine.get_stack(addresses[codes[1]])[-1].type)
+        for code in codes[2:]:
+            self.assertIsNone(engine.get_stack(addresses[code]))
+        self.assertTrue(engine.get_state(0).is_balanced)
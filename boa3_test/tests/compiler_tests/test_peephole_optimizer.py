@@ -0,0 +1,237 @@
+from typing import Dict, List, Tuple
+
+from boa3_test.tests.boa_test import BoaTest  # needs to be the first import to avoid circular imports
+
+from boa3.internal.compiler.codegenerator.codeblockgraph import CodeBlockGraph
+from boa3.internal.compiler.codegenerator.peepholeoptimizer import PeepholeOptimizer
+from boa3.internal.model.method import Method
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+from boa3.internal.neo.vm.type.StackItem import StackItemType
+
+
+class TestPeepholeOptimizer(BoaTest):
+
+    def optimize(self, codes: List[VMCode],
+                 known_types: Dict[VMCode, StackItemType] = None) -> Tuple[List[VMCode], Dict[str, int]]:
+        """
+        Optimizes the instructions of a single method. The first and the last instructions are the boundaries of the
+        method, so they are never removed.
+        """
+        method = Method()
+        method.init_bytecode = codes[0]
+        method.end_bytecode = codes[-1]
+
+        graph = CodeBlockGraph(codes)
+        statistics = PeepholeOptimizer(graph, [method], known_types=known_types).optimize()
+        return graph.linearize(), statistics
+
+    def assertOpcodes(self, expected_opcodes: List[Opcode], codes: List[VMCode]):
+        self.assertEqual(expected_opcodes, [code.opcode for code in codes])
+
+    def test_jump_threading(self):
+        jump = VMCode(OpcodeInfo.JMPIF)
+        second_jump = VMCode(OpcodeInfo.JMP)
+        codes = [
+            VMCode(OpcodeInfo.PUSHT),
+            jump,
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.RET),
+            second_jump,
+            VMCode(OpcodeInfo.PUSH2),
+            VMCode(OpcodeInfo.RET),
+        ]
+        jump.set_target(second_jump)
+        second_jump.set_target(codes[-1])
+
+        optimized, statistics = self.optimize(codes)
+
+        self.assertEqual(codes, optimized)
+        self.assertIs(codes[-1], jump.target)
+        self.assertEqual({'jump threading': 1}, statistics)
+
+    def test_jump_to_next(self):
+        jump = VMCode(OpcodeInfo.JMP)
+        codes = [
+            VMCode(OpcodeInfo.NOP),
+            jump,
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.RET),
+        ]
+        jump.set_target(codes[2])
+
+        optimized, statistics = self.optimize(codes)
+
+        self.assertOpcodes([Opcode.NOP, Opcode.PUSH1, Opcode.RET], optimized)
+        self.assertEqual({'jump to next': 1}, statistics)
+
+    def test_dead_store_before_return(self):
+        codes = [
+            VMCode(OpcodeInfo.NOP),
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.STLOC0),
+            VMCode(OpcodeInfo.LDLOC0),
+            VMCode(OpcodeInfo.RET),
+        ]
+
+        optimized, statistics = self.optimize(codes)
+
+        self.assertOpcodes([Opcode.NOP, Opcode.PUSH1, Opcode.RET], optimized)
+        self.assertEqual({'dead store before return': 1}, statistics)
+
+    def test_dead_store_of_duplicated_value_before_return(self):
+        codes = [
+            VMCode(OpcodeInfo.NOP),
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.DUP),
+            VMCode(OpcodeInfo.STARG0),
+            VMCode(OpcodeInfo.RET),
+        ]
+
+        optimized, statistics = self.optimize(codes)
+
+        self.assertOpcodes([Opcode.NOP, Opcode.PUSH1, Opcode.RET], optimized)
+        self.assertEqual({'dead store before return': 1}, statistics)
+
+    def test_store_of_static_field_before_return(self):
+        codes = [
+            VMCode(OpcodeInfo.NOP),
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.DUP),
+            VMCode(OpcodeInfo.STSFLD0),
+            VMCode(OpcodeInfo.RET),
+        ]
+
+        optimized, statistics = self.optimize(codes)
+
+        # the static fields are kept after the method returns
+        self.assertEqual(codes, optimized)
+        self.assertEqual({}, statistics)
+
+    def test_push_and_drop(self):
+        codes = [
+            VMCode(OpcodeInfo.NOP),
+            VMCode(OpcodeInfo.LDARG0),
+            VMCode(OpcodeInfo.DROP),
+            VMCode(OpcodeInfo.RET),
+        ]
+
+        optimized, statistics = self.optimize(codes)
+
+        self.assertOpcodes([Opcode.NOP, Opcode.RET], optimized)
+        self.assertEqual({'push and drop': 1}, statistics)
+
+    def test_push_and_drop_jump_target(self):
+        jump = VMCode(OpcodeInfo.JMPIF)
+        codes = [
+            VMCode(OpcodeInfo.PUSHT),
+            jump,
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.DROP),
+            VMCode(OpcodeInfo.RET),
+        ]
+        jump.set_target(codes[3])
+
+        optimized, statistics = self.optimize(codes)
+
+        # the drop can be executed without the push, so both are kept
+        self.assertEqual(codes, optimized)
+        self.assertEqual({}, statistics)
+
+    def test_negated_jump(self):
+        jump = VMCode(OpcodeInfo.JMPIF)
+        codes = [
+            VMCode(OpcodeInfo.LDARG0),
+            VMCode(OpcodeInfo.NOT),
+            jump,
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.RET),
+        ]
+        jump.set_target(codes[-1])
+
+        optimized, statistics = self.optimize(codes)
+
+        self.assertOpcodes([Opcode.LDARG0, Opcode.JMPIFNOT, Opcode.PUSH1, Opcode.RET], optimized)
+        self.assertIs(codes[-1], jump.target)
+        self.assertEqual({'negated jump': 1}, statistics)
+
+    def test_redundant_convert(self):
+        codes = [
+            VMCode(OpcodeInfo.LDARG0),
+            VMCode(OpcodeInfo.LDARG1),
+            VMCode(OpcodeInfo.ADD),
+            VMCode(OpcodeInfo.CONVERT, StackItemType.Integer),
+            VMCode(OpcodeInfo.RET),
+        ]
+
+        optimized, statistics = self.optimize(codes)
+
+        self.assertOpcodes([Opcode.LDARG0, Opcode.LDARG1, Opcode.ADD, Opcode.RET], optimized)
+        self.assertEqual({'redundant convert': 1}, statistics)
+
+    def test_redundant_convert_with_known_type(self):
+        for known_type, is_removed in ((StackItemType.Integer, True), (StackItemType.ByteString, False)):
+            convert = VMCode(OpcodeInfo.CONVERT, StackItemType.Integer)
+            codes = [
+                VMCode(OpcodeInfo.LDARG0),
+                convert,
+                VMCode(OpcodeInfo.RET),
+            ]
+
+            # the type of the argument is only known from the execution of the method
+            optimized, statistics = self.optimize(codes, known_types={convert: known_type})
+
+            if is_removed:
+                self.assertOpcodes([Opcode.LDARG0, Opcode.RET], optimized)
+                self.assertEqual({'redundant convert': 1}, statistics)
+            else:
+                self.assertEqual(codes, optimized)
+                self.assertEqual({}, statistics)
+
+    def test_constant_type_check(self):
+        for checked_type, expected_opcode in ((StackItemType.Integer, Opcode.PUSHT),
+                                              (StackItemType.ByteString, Opcode.PUSHF)):
+            codes = [
+                VMCode(OpcodeInfo.NOP),
+                VMCode(OpcodeInfo.PUSH1),
+                VMCode(OpcodeInfo.ISTYPE, checked_type),
+                VMCode(OpcodeInfo.RET),
+            ]
+
+            optimized, statistics = self.optimize(codes)
+
+            self.assertOpcodes([Opcode.NOP, expected_opcode, Opcode.RET], optimized)
+            self.assertEqual({'constant type check': 1}, statistics)
+
+    def test_store_and_load(self):
+        codes = [
+            VMCode(OpcodeInfo.NOP),
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.STLOC, b'\x07'),
+            VMCode(OpcodeInfo.LDLOC, b'\x07'),
+            VMCode(OpcodeInfo.INC),
+            VMCode(OpcodeInfo.RET),
+        ]
+
+        optimized, statistics = self.optimize(codes)
+
+        self.assertOpcodes([Opcode.NOP, Opcode.PUSH1, Opcode.DUP, Opcode.STLOC, Opcode.INC, Opcode.RET], optimized)
+        self.assertEqual(b'\x07', optimized[3].data)
+        self.assertEqual({'store and load': 1}, statistics)
+
+    def test_store_and_load_short_opcodes(self):
+        codes = [
+            VMCode(OpcodeInfo.NOP),
+            VMCode(OpcodeInfo.PUSH1),
+            VMCode(OpcodeInfo.STLOC0),
+            VMCode(OpcodeInfo.LDLOC0),
+            VMCode(OpcodeInfo.INC),
+            VMCode(OpcodeInfo.RET),
+        ]
+
+        optimized, statistics = self.optimize(codes)
+
+        # DUP; STLOC0 has the same size as STLOC0; LDLOC0, so it isn't changed
+        self.assertEqual(codes, optimized)
+        self.assertEqual({}, statistics)
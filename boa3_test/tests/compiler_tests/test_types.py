@@ -4,10 +4,13 @@ from boa3_test.tests.boa_test import BoaTest  # needs to be the first import to
 
 from boa3.internal.analyser.analyser import Analyser
 from boa3.internal.analyser.typeanalyser import TypeAnalyser
+from boa3.internal.compiler.compilationcontext import CompilationContext
+from boa3.internal.model.type.annotation.optionaltype import OptionalType
 from boa3.internal.model.type.annotation.uniontype import UnionType
 from boa3.internal.model.type.collection.sequence.mutable.listtype import ListType
 from boa3.internal.model.type.collection.sequence.tupletype import TupleType
 from boa3.internal.model.type.type import Type
+from boa3.internal.model.type.typerelationcache import TypeRelationCache
 
 
 class TestTypes(BoaTest):
@@ -244,3 +247,104 @@ class TestTypes(BoaTest):
         union_type = Type.union.build(Type.any)
         self.assertFalse(optional_type.is_type_of(union_type))
         self.assertTrue(union_type.is_type_of(optional_type))
+
+    def test_type_relation_cache_hits_and_misses(self):
+        cache = TypeRelationCache()
+
+        self.assertTrue(cache.is_type_of(Type.int, Type.bool))
+        self.assertEqual((0, 1), (cache.hits, cache.misses))
+        self.assertTrue(cache.is_type_of(Type.int, Type.bool))
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+        # the relations are found by the order of the types
+        self.assertFalse(cache.is_type_of(Type.bool, Type.int))
+        self.assertEqual((1, 2), (cache.hits, cache.misses))
+
+        # only the relations between types are cached
+        self.assertTrue(cache.is_type_of(Type.int, 10))
+        self.assertEqual((1, 2), (cache.hits, cache.misses))
+        self.assertEqual(2, len(cache))
+
+        computed = []
+
+        def compute(*types):
+            computed.append(types)
+            return Type.int
+
+        self.assertEqual(Type.int, cache.get_result('generic_type', (Type.int, Type.bool), compute))
+        self.assertEqual(Type.int, cache.get_result('generic_type', (Type.int, Type.bool), compute))
+        self.assertEqual([(Type.int, Type.bool)], computed)
+
+        cache.clear()
+        self.assertEqual((0, 0, 0), (cache.hits, cache.misses, len(cache)))
+
+    def test_type_relation_cache_max_size(self):
+        cache = TypeRelationCache(max_size=2)
+
+        cache.is_type_of(Type.int, Type.bool)
+        cache.is_type_of(Type.int, Type.str)
+        cache.is_type_of(Type.int, Type.bytes)
+        self.assertEqual(2, len(cache))
+
+        # the oldest result was removed, so it's computed again
+        cache.is_type_of(Type.int, Type.bytes)
+        self.assertEqual((1, 3), (cache.hits, cache.misses))
+        cache.is_type_of(Type.int, Type.bool)
+        self.assertEqual((1, 4), (cache.hits, cache.misses))
+        self.assertEqual(2, len(cache))
+
+    def test_type_relation_cache_per_context(self):
+        context = CompilationContext()
+        other_context = CompilationContext()
+
+        with context.activate():
+            type_relations = CompilationContext.current().type_relations
+            union_type = Type.int.union_type(Type.str)
+            self.assertIs(union_type, Type.int.union_type(Type.str))
+            self.assertEqual((1, 1), (type_relations.hits, type_relations.misses))
+
+        with other_context.activate():
+            other_type_relations = CompilationContext.current().type_relations
+            self.assertIsNot(type_relations, other_type_relations)
+
+            other_union_type = Type.int.union_type(Type.str)
+            self.assertEqual(union_type, other_union_type)
+            self.assertEqual((0, 1), (other_type_relations.hits, other_type_relations.misses))
+
+        # the relations of a context aren't changed by the other contexts
+        self.assertIs(type_relations, context.type_relations)
+        self.assertEqual((1, 1), (type_relations.hits, type_relations.misses))
+
+    def test_interned_collection_types(self):
+        context = CompilationContext()
+        other_context = CompilationContext()
+
+        with context.activate():
+            list_type = Type.list.build_collection(Type.int)
+            dict_type = Type.dict.build_collection(Type.str, list_type)
+            union_type = Type.union.build({Type.int, Type.str})
+
+            # the types built from equal values are the same object in the compilation
+            self.assertIs(list_type, Type.list.build_collection(Type.int))
+            self.assertIs(list_type, Type.list.build_collection([Type.int]))
+            self.assertIs(dict_type, Type.dict.build_collection(Type.str, Type.list.build_collection(Type.int)))
+            self.assertIs(union_type, Type.union.build({Type.str, Type.int}))
+            self.assertIsNot(list_type, Type.list.build_collection(Type.str))
+
+            # equal types of different classes aren't replaced by each other
+            optional_union_type = Type.union.build({Type.int, Type.none})
+            optional_type = Type.optional.build(Type.int)
+            self.assertEqual(optional_union_type, optional_type)
+            self.assertIs(UnionType, type(optional_union_type))
+            self.assertIs(OptionalType, type(optional_type))
+
+        with other_context.activate():
+            other_list_type = Type.list.build_collection(Type.int)
+
+            # each compilation has its own types
+            self.assertEqual(list_type, other_list_type)
+            self.assertIsNot(list_type, other_list_type)
+            self.assertIs(other_list_type, Type.list.build_collection(Type.int))
+
+        self.assertIs(list_type, context.interned_types[(type(list_type), list_type)])
+        self.assertIs(other_list_type, other_context.interned_types[(type(other_list_type), other_list_type)])
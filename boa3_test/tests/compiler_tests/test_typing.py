@@ -17,9 +17,7 @@ class TestTyping(BoaTest):
             + b'\x01'
             + b'\x01'
             + Opcode.LDARG0     # x = cast(int, value)
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # return x
-            + Opcode.RET
+            + Opcode.RET        # return x
         )
 
         path = self.get_contract_path('CastToInt.py')
@@ -32,9 +30,7 @@ class TestTyping(BoaTest):
             + b'\x01'
             + b'\x01'
             + Opcode.LDARG0     # x = cast(str, value)
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # return x
-            + Opcode.RET
+            + Opcode.RET        # return x
         )
 
         path = self.get_contract_path('CastToStr.py')
@@ -47,9 +43,7 @@ class TestTyping(BoaTest):
             + b'\x01'
             + b'\x01'
             + Opcode.LDARG0     # x = cast(list, value)
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # return x
-            + Opcode.RET
+            + Opcode.RET        # return x
         )
 
         path = self.get_contract_path('CastToList.py')
@@ -79,9 +73,7 @@ class TestTyping(BoaTest):
             + b'\x01'
             + b'\x01'
             + Opcode.LDARG0     # x = cast(dict, value)
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # return x
-            + Opcode.RET
+            + Opcode.RET        # return x
         )
 
         path = self.get_contract_path('CastToDict.py')
@@ -139,9 +131,7 @@ class TestTyping(BoaTest):
             + b'\x01'
             + b'\x01'
             + Opcode.LDARG0     # x = cast(Transaction, value)
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # return x
-            + Opcode.RET
+            + Opcode.RET        # return x
         )
 
         path = self.get_contract_path('CastToTransaction.py')
@@ -315,8 +315,6 @@ class TestVariable(BoaTest):
             + b'\x01'
             + b'\x01'
             + Opcode.LDARG0
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # variable address
             + Opcode.RET
         )
 
@@ -554,6 +552,116 @@ class TestVariable(BoaTest):
         for x in range(len(invokes)):
             self.assertEqual(expected_results[x], invokes[x].result)
 
+    def test_global_assignment_in_if(self):
+        expected_output = (
+            Opcode.LDSFLD0      # get_a
+            + Opcode.RET        # return a
+            + Opcode.CALL       # Main
+            + Integer(-2).to_byte_array(min_length=1, signed=True)
+            + Opcode.RET        # return get_a()
+            + Opcode.INITSSLOT  # global variables
+            + b'\x01'           # number of globals
+            + Opcode.PUSH1
+            + Opcode.STSFLD0    # a = 1
+            + Opcode.PUSHT      # if a > 0
+            + Opcode.JMPIFNOT
+            + Integer(4).to_byte_array(min_length=1, signed=True)
+            + Opcode.PUSH2
+            + Opcode.STSFLD0    # a = 2
+            + Opcode.RET
+        )
+        path = self.get_contract_path('GlobalAssignmentInIf.py')
+        output = self.compile(path)
+        self.assertEqual(expected_output, output)
+
+        # the value of a global variable reassigned in a block isn't known during compile time
+        output = self.compile(path, optimize=False)
+        self.assertEqual(expected_output, output)
+
+        path, _ = self.get_deploy_file_paths(path)
+        runner = BoaTestRunner(runner_id=self.method_name())
+
+        invokes = []
+        expected_results = []
+
+        invokes.append(runner.call_contract(path, 'Main'))
+        expected_results.append(2)
+
+        runner.execute()
+        self.assertEqual(VMState.HALT, runner.vm_state, msg=runner.error)
+
+        for x in range(len(invokes)):
+            self.assertEqual(expected_results[x], invokes[x].result)
+
+    def test_global_assignment_in_for(self):
+        expected_output = (
+            Opcode.LDSFLD0      # get_a
+            + Opcode.RET        # return a
+            + Opcode.CALL       # Main
+            + Integer(-2).to_byte_array(min_length=1, signed=True)
+            + Opcode.RET        # return get_a()
+            + Opcode.INITSSLOT  # global variables
+            + b'\x02'           # number of globals
+            + Opcode.PUSH1
+            + Opcode.STSFLD0    # a = 1
+            + Opcode.PUSH2      # for x in [1, 2]
+            + Opcode.PUSH1
+            + Opcode.PUSH2
+            + Opcode.PACK
+            + Opcode.PUSH0      # for_index = 0
+            + Opcode.JMP
+            + Integer(19).to_byte_array(min_length=1, signed=True)
+            + Opcode.OVER       # x = for_sequence[for_index]
+            + Opcode.OVER
+            + Opcode.DUP
+            + Opcode.SIGN
+            + Opcode.PUSHM1
+            + Opcode.JMPNE
+            + Integer(5).to_byte_array(min_length=1, signed=True)
+            + Opcode.OVER
+            + Opcode.SIZE
+            + Opcode.ADD
+            + Opcode.PICKITEM
+            + Opcode.STSFLD1
+            + Opcode.LDSFLD0    # a = a + x
+            + Opcode.LDSFLD1
+            + Opcode.ADD
+            + Opcode.STSFLD0
+            + Opcode.INC        # for_index += 1
+            + Opcode.DUP        # if for_index < len(for_sequence)
+            + Opcode.PUSH2
+            + Opcode.PICK
+            + Opcode.SIZE
+            + Opcode.LT
+            + Opcode.JMPIF      # end while for_index < len(for_sequence)
+            + Integer(-22).to_byte_array(min_length=1, signed=True)
+            + Opcode.DROP
+            + Opcode.DROP
+            + Opcode.RET
+        )
+        path = self.get_contract_path('GlobalAssignmentInFor.py')
+        output = self.compile(path)
+        self.assertEqual(expected_output, output)
+
+        # the value of a global variable reassigned in a block isn't known during compile time
+        output = self.compile(path, optimize=False)
+        self.assertEqual(expected_output, output)
+
+        path, _ = self.get_deploy_file_paths(path)
+        runner = BoaTestRunner(runner_id=self.method_name())
+
+        invokes = []
+        expected_results = []
+
+        invokes.append(runner.call_contract(path, 'Main'))
+        expected_results.append(4)
+
+        runner.execute()
+        self.assertEqual(VMState.HALT, runner.vm_state, msg=runner.error)
+
+        for x in range(len(invokes)):
+            self.assertEqual(expected_results[x], invokes[x].result)
+
     def test_global_tuple_multiple_assignments(self):
         path = self.get_contract_path('GlobalAssignmentWithTuples.py')
         self.assertCompilerLogs(CompilerError.NotSupportedOperation, path)
@@ -827,6 +935,13 @@ class TestVariable(BoaTest):
 
     def test_assign_local_shadowing_global_with_arg_value(self):
         expected_output = (
+            Opcode.INITSLOT     # function signature
+            + b'\x01'
+            + b'\x01'
+            + Opcode.LDARG0     # b = a  // this b is not the global b
+            + Opcode.RET        # the local variable is discarded when returning
+        )
+        expected_output_no_optimization = (
             Opcode.INITSLOT     # function signature
             + b'\x01'
             + b'\x01'
@@ -834,9 +949,6 @@ class TestVariable(BoaTest):
             + Opcode.STLOC0
             + Opcode.LDLOC0     # variable address
             + Opcode.RET
-        )
-        expected_output_no_optimization = (
-            expected_output
             + Opcode.INITSSLOT  # global variables
             + b'\x01'           # number of globals
             + Opcode.PUSH0      # b = 0
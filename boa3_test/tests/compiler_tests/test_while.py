@@ -36,7 +36,7 @@ class TestWhile(BoaTest):
         )
 
         path = self.get_contract_path('ConstantCondition.py')
-        output = self.compile(path)
+        output = self.compile(path, optimize=False)
         self.assertEqual(expected_output, output)
 
         path, _ = self.get_deploy_file_paths(path)
@@ -54,6 +54,16 @@ class TestWhile(BoaTest):
         for x in range(len(invokes)):
             self.assertEqual(expected_results[x], invokes[x].result)
 
+    def test_while_constant_condition_code_optimization(self):
+        expected_output = (
+            Opcode.PUSH0        # return a, the loop is removed because it never runs and the unused variable too
+            + Opcode.RET
+        )
+
+        path = self.get_contract_path('ConstantCondition.py')
+        output = self.compile(path)
+        self.assertEqual(expected_output, output)
+
     def test_while_variable_condition(self):
         jmpif_address = Integer(12).to_byte_array(min_length=1, signed=True)
         jmp_address = Integer(-11).to_byte_array(min_length=1, signed=True)
@@ -163,7 +173,7 @@ class TestWhile(BoaTest):
         )
 
         path = self.get_contract_path('WhileElse.py')
-        output = self.compile(path)
+        output = self.compile(path, optimize=False)
         self.assertEqual(expected_output, output)
 
         path, _ = self.get_deploy_file_paths(path)
@@ -181,6 +191,16 @@ class TestWhile(BoaTest):
         for x in range(len(invokes)):
             self.assertEqual(expected_results[x], invokes[x].result)
 
+    def test_while_else_code_optimization(self):
+        expected_output = (
+            Opcode.PUSH1        # return a, only the else branch is kept and the unused variable is removed
+            + Opcode.RET
+        )
+
+        path = self.get_contract_path('WhileElse.py')
+        output = self.compile(path)
+        self.assertEqual(expected_output, output)
+
     def test_while_relational_condition(self):
         jmpif_address = Integer(10).to_byte_array(min_length=1, signed=True)
         jmp_address = Integer(-11).to_byte_array(min_length=1, signed=True)